@@ -355,6 +355,67 @@ export class NotificationsController {
     );
   }
 
+  @Public()
+  @Post('internal/push-by-users')
+  @ApiOperation({
+    summary:
+      'Internal: send Expo + web push to many users in one call (trusted callers e.g. notify-agents Lambda)',
+  })
+  @ApiBody({
+    schema: {
+      type: 'object',
+      required: ['pushes'],
+      properties: {
+        pushes: {
+          type: 'array',
+          maxItems: 100,
+          items: {
+            type: 'object',
+            required: ['userId', 'title', 'body'],
+            properties: {
+              userId: { type: 'string', format: 'uuid' },
+              title: { type: 'string' },
+              body: { type: 'string' },
+              data: { type: 'object', additionalProperties: true },
+            },
+          },
+        },
+      },
+    },
+  })
+  @ApiResponse({
+    status: 200,
+    description: 'Push sends attempted; results are in request order',
+  })
+  @ApiResponse({ status: 401, description: 'Invalid or missing internal key' })
+  async internalPushByUsers(
+    @Body()
+    body: {
+      pushes?: Array<{
+        userId?: string;
+        title?: string;
+        body?: string;
+        data?: Record<string, unknown>;
+      }>;
+    },
+    @Headers('x-rendasua-internal-key') internalKey?: string
+  ): Promise<{
+    success: boolean;
+    results: Array<{ userId: string; success: boolean; error?: string }>;
+    error?: string;
+  }> {
+    const expected =
+      this.configService.get<Configuration['notificationsInternal']>(
+        'notificationsInternal'
+      )?.apiKey ?? '';
+    if (!expected || internalKey !== expected) {
+      throw new UnauthorizedException();
+    }
+    return this.notificationsService.sendInternalPushByUserIds(
+      body?.pushes ?? []
+    );
+  }
+
   @Public()
   @Post('internal/whatsapp-template')
   @ApiOperation({
@@ -4495,6 +4495,42 @@ export class NotificationsService {
     return this.runInternalPushDelivery(uid, title, body, data);
   }
 
+  async sendInternalPushByUserIds(
+    pushes: Array<{
+      userId?: string;
+      title?: string;
+      body?: string;
+      data?: Record<string, unknown>;
+    }>
+  ): Promise<{
+    success: boolean;
+    results: Array<{ userId: string; success: boolean; error?: string }>;
+    error?: string;
+  }> {
+    if (!Array.isArray(pushes) || pushes.length > 100) {
+      return {
+        success: false,
+        results: [],
+        error: 'pushes must be an array of at most 100 entries',
+      };
+    }
+    const results = await Promise.all(
+      pushes.map(async (push) => {
+        const userId = push?.userId?.trim() ?? '';
+        const res = await this.sendInternalPushByUserId(
+          userId,
+          push?.title ?? '',
+          push?.body ?? '',
+          push?.data
+        );
+        return res.error
+          ? { userId, success: res.success, error: res.error }
+          : { userId, success: res.success };
+      })
+    );
+    return { success: results.every((r) => r.success), results };
+  }
+
   private async runInternalPushDelivery(
     userId: string,
     title: string,
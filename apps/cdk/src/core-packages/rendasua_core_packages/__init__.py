@@ -15,3 +15,26 @@ intended to remain lightweight while centralising shared logic such as:
 
 __version__ = "0.1.1"
 
+# Subpackages are imported on first attribute access (PEP 562), so
+# ``import rendasua_core_packages`` stays free of pydantic, requests and boto3.
+_SUBPACKAGES = (
+    "commission_handler",
+    "hasura_client",
+    "models",
+    "notification_handler",
+    "secrets_manager",
+    "utilities",
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBPACKAGES))
+
@@ -4,24 +4,70 @@ Shared commission calculation helpers.
 Over time, the pure commission calculation logic from the order-status
 Lambda will be centralised here so that other Lambdas can reuse it via
 the core-packages Lambda layer.
+
+The NumPy batch calculator (``calculate_commissions_batch`` and its column
+types) is loaded on first access so the per-order Lambdas do not import
+NumPy.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
+import importlib
+
 from .types import (
     CommissionConfig,
     Partner,
     CommissionOrder,
     CommissionBreakdown,
+    CommissionLeg,
 )
 from .calculator import calculate_commissions
-from .distributor import distribute_commissions
+from .distributor import commission_legs, distribute_commissions, pay_commissions
+
+if TYPE_CHECKING:
+    from .batch import (
+        CommissionBreakdownColumns,
+        CommissionOrderColumns,
+        PartnerPercentages,
+        calculate_commissions_batch,
+    )
+
+# Public name -> submodule loaded on first access
+_LAZY_ATTRIBUTES = {
+    "CommissionBreakdownColumns": "batch",
+    "CommissionOrderColumns": "batch",
+    "PartnerPercentages": "batch",
+    "calculate_commissions_batch": "batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 __all__ = [
     "CommissionConfig",
     "Partner",
     "CommissionOrder",
     "CommissionBreakdown",
+    "CommissionLeg",
     "calculate_commissions",
+    "commission_legs",
     "distribute_commissions",
+    "pay_commissions",
+    # Batch calculator
+    "CommissionBreakdownColumns",
+    "CommissionOrderColumns",
+    "PartnerPercentages",
+    "calculate_commissions_batch",
 ]
 
 
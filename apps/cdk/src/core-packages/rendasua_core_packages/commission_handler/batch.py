@@ -0,0 +1,220 @@
+"""
+Vectorized commission calculation over many orders at once.
+
+``calculate_commissions_batch`` computes the same breakdowns as
+``calculator.calculate_commissions`` for columnar inputs (one NumPy array
+per order field, per config field and per partner percentage) in a single
+pass, for finance reconciliation and what-if simulations over historical
+orders.
+
+Results are bit-for-bit identical to the scalar path: every expression is
+evaluated in the same order on float64, and partner shares are added one
+partner column at a time (starting from 0.0) exactly like
+``_sum_partner_commission`` — never with ``np.sum``, whose pairwise
+summation rounds differently.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Mapping, Sequence, Union
+
+import numpy as np
+
+from rendasua_core_packages.models import Partner
+
+from .types import (
+    CommissionConfig,
+    CommissionOrder,
+    CommissionBreakdown,
+    BaseDeliveryFeeBreakdown,
+    PerKmDeliveryFeeBreakdown,
+    ItemCommissionBreakdown,
+    OrderSubtotalBreakdown,
+)
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+# One CommissionConfig for every order, or one array per CommissionConfig field
+ConfigColumns = Union[CommissionConfig, Mapping[str, ArrayLike]]
+
+
+@dataclass
+class CommissionOrderColumns:
+    """The order fields the calculator reads, one array per field."""
+    base_delivery_fee: np.ndarray
+    per_km_delivery_fee: np.ndarray
+    subtotal: np.ndarray
+    is_agent_verified: np.ndarray
+    first_order_delivery_fee_promo: np.ndarray
+
+    def __post_init__(self) -> None:
+        for name in ("base_delivery_fee", "per_km_delivery_fee", "subtotal"):
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        for name in ("is_agent_verified", "first_order_delivery_fee_promo"):
+            setattr(self, name, np.asarray(getattr(self, name), dtype=bool))
+
+    def __len__(self) -> int:
+        return len(self.subtotal)
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[CommissionOrder]) -> "CommissionOrderColumns":
+        orders = list(orders)
+        return cls(
+            base_delivery_fee=[order.base_delivery_fee for order in orders],
+            per_km_delivery_fee=[order.per_km_delivery_fee for order in orders],
+            subtotal=[order.subtotal for order in orders],
+            is_agent_verified=[
+                bool(order.assigned_agent and order.assigned_agent.is_verified) for order in orders
+            ],
+            first_order_delivery_fee_promo=[order.first_order_delivery_fee_promo for order in orders],
+        )
+
+
+@dataclass
+class PartnerPercentages:
+    """
+    Partner commission percentages, one column per partner.
+
+    Arrays have shape ``(partners,)`` when every order shares the same
+    partners, or ``(orders, partners)`` for per-order partner sets (pad
+    absent partners with 0, which leaves the sums unchanged).
+    """
+    base_delivery_fee_commission: np.ndarray
+    per_km_delivery_fee_commission: np.ndarray
+    item_commission: np.ndarray
+
+    def __post_init__(self) -> None:
+        for item in fields(self):
+            setattr(self, item.name, np.asarray(getattr(self, item.name), dtype=np.float64))
+
+    @classmethod
+    def from_partners(cls, partners: Iterable[Partner]) -> "PartnerPercentages":
+        partners = list(partners)
+        return cls(**{
+            item.name: [getattr(partner, item.name, 0.0) for partner in partners]
+            for item in fields(cls)
+        })
+
+
+@dataclass
+class CommissionBreakdownColumns:
+    """``CommissionBreakdown`` for every order, one array per amount."""
+    base_delivery_agent: np.ndarray
+    base_delivery_partner: np.ndarray
+    base_delivery_rendasua: np.ndarray
+    per_km_delivery_agent: np.ndarray
+    per_km_delivery_partner: np.ndarray
+    per_km_delivery_rendasua: np.ndarray
+    item_partner: np.ndarray
+    item_rendasua: np.ndarray
+    order_subtotal_business: np.ndarray
+    order_subtotal_rendasua: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.order_subtotal_business)
+
+    def breakdown(self, index: int) -> CommissionBreakdown:
+        """The scalar ``CommissionBreakdown`` of one order."""
+        value = {item.name: float(getattr(self, item.name)[index]) for item in fields(self)}
+        return CommissionBreakdown(
+            base_delivery_fee=BaseDeliveryFeeBreakdown(
+                agent=value["base_delivery_agent"],
+                partner=value["base_delivery_partner"],
+                rendasua=value["base_delivery_rendasua"],
+            ),
+            per_km_delivery_fee=PerKmDeliveryFeeBreakdown(
+                agent=value["per_km_delivery_agent"],
+                partner=value["per_km_delivery_partner"],
+                rendasua=value["per_km_delivery_rendasua"],
+            ),
+            item_commission=ItemCommissionBreakdown(
+                partner=value["item_partner"],
+                rendasua=value["item_rendasua"],
+            ),
+            order_subtotal=OrderSubtotalBreakdown(
+                business=value["order_subtotal_business"],
+                rendasua=value["order_subtotal_rendasua"],
+            ),
+        )
+
+    def totals(self) -> Dict[str, float]:
+        """Column sums, e.g. to reconcile against commission_payouts."""
+        return {item.name: float(getattr(self, item.name).sum()) for item in fields(self)}
+
+
+def _config_column(config: ConfigColumns, name: str, size: int) -> np.ndarray:
+    value: Any = getattr(config, name) if isinstance(config, CommissionConfig) else config[name]
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (size,))
+
+
+def _sum_partner_commission(amount: np.ndarray, percentages: np.ndarray) -> np.ndarray:
+    # Same evaluation order as calculator._sum_partner_commission
+    columns = percentages.T if percentages.ndim == 2 else percentages[:, None]
+    value = np.zeros_like(amount)
+    for percentage in columns:
+        value = value + (amount * percentage) / 100
+    return value
+
+
+def calculate_commissions_batch(
+    orders: CommissionOrderColumns,
+    config: ConfigColumns,
+    partners: PartnerPercentages,
+) -> CommissionBreakdownColumns:
+    """
+    Commission breakdowns of many orders in one vectorized pass.
+
+    Args:
+        orders: Order columns (see ``CommissionOrderColumns.from_orders``)
+        config: One config for all orders, or per-order config columns
+        partners: Partner percentages (see ``PartnerPercentages.from_partners``)
+
+    Returns:
+        CommissionBreakdownColumns; ``result.breakdown(i)`` equals
+        ``calculate_commissions`` for order ``i``
+    """
+    size = len(orders)
+    verified = orders.is_agent_verified
+    promo = orders.first_order_delivery_fee_promo
+
+    # Base delivery fee (first-order promo: partners first, agent gets the rest)
+    base_fee = orders.base_delivery_fee
+    base_partner = _sum_partner_commission(base_fee, partners.base_delivery_fee_commission)
+    base_agent_commission = np.where(
+        verified,
+        _config_column(config, "verified_agent_base_delivery_commission", size),
+        _config_column(config, "unverified_agent_base_delivery_commission", size),
+    )
+    base_agent = (base_fee * base_agent_commission) / 100
+    promo_agent = base_fee - base_partner
+    base_agent = np.where(promo, np.where(promo_agent > 0.0, promo_agent, 0.0), base_agent)
+    base_rendasua = np.where(promo, 0.0, base_fee - base_agent - base_partner)
+
+    # Per-km delivery fee
+    per_km_fee = orders.per_km_delivery_fee
+    per_km_agent_commission = np.where(
+        verified,
+        _config_column(config, "verified_agent_per_km_delivery_commission", size),
+        _config_column(config, "unverified_agent_per_km_delivery_commission", size),
+    )
+    per_km_agent = (per_km_fee * per_km_agent_commission) / 100
+    per_km_partner = _sum_partner_commission(per_km_fee, partners.per_km_delivery_fee_commission)
+    per_km_rendasua = per_km_fee - per_km_agent - per_km_partner
+
+    # Item commission and order subtotal
+    item_percentage = _config_column(config, "rendasua_item_commission_percentage", size)
+    rendasua_item_amount = (orders.subtotal * item_percentage) / 100
+    item_partner = _sum_partner_commission(rendasua_item_amount, partners.item_commission)
+    item_rendasua = rendasua_item_amount - item_partner
+    subtotal_business = orders.subtotal - rendasua_item_amount
+
+    return CommissionBreakdownColumns(
+        base_delivery_agent=base_agent,
+        base_delivery_partner=base_partner,
+        base_delivery_rendasua=base_rendasua,
+        per_km_delivery_agent=per_km_agent,
+        per_km_delivery_partner=per_km_partner,
+        per_km_delivery_rendasua=per_km_rendasua,
+        item_partner=item_partner,
+        item_rendasua=item_rendasua,
+        order_subtotal_business=subtotal_business,
+        order_subtotal_rendasua=rendasua_item_amount,
+    )
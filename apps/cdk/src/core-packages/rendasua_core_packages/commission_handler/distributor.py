@@ -9,6 +9,7 @@ from rendasua_core_packages.hasura_client import (
 from .types import (
     CommissionOrder,
     CommissionBreakdown,
+    CommissionLeg,
     BaseDeliveryFeeBreakdown,
     PerKmDeliveryFeeBreakdown,
     ItemCommissionBreakdown,
@@ -149,157 +150,248 @@ def pay_commission(
         return None
 
 
-def process_base_delivery_fee_commissions(
-    client: HasuraClient,
+def _pay_legs(client: HasuraClient, order: CommissionOrder, legs: List[CommissionLeg]) -> None:
+    for leg in legs:
+        pay_commission(
+            client=client,
+            order=order,
+            recipient_user_id=leg.recipient_user_id,
+            recipient_type=leg.recipient_type,
+            commission_type=leg.commission_type,
+            amount=leg.amount,
+            currency=order.currency,
+            commission_percentage=leg.commission_percentage,
+            business_location_id=leg.business_location_id,
+        )
+
+
+def base_delivery_fee_legs(
     order: CommissionOrder,
     breakdown: BaseDeliveryFeeBreakdown,
     rendasua_hq_user: User,
     partners: List[Partner],
-) -> None:
-    """
-    Process base delivery fee commission payments.
-    
-    Args:
-        client: HasuraClient instance
-        order: Commission order
-        breakdown: Base delivery fee breakdown
-        rendasua_hq_user: RendaSua HQ user
-        partners: List of active partners
-    """
-    # Pay agent
+) -> List[CommissionLeg]:
+    """Agent, partner and RendaSua HQ legs of the base delivery fee."""
+    legs = []
     if order.assigned_agent and breakdown.agent > 0:
-        pay_commission(
-            client=client,
-            order=order,
+        legs.append(CommissionLeg(
             recipient_user_id=order.assigned_agent.user_id,
             recipient_type="agent",
             commission_type="base_delivery_fee",
             amount=breakdown.agent,
-            currency=order.currency,
-        )
-    
-    # Pay partners
+        ))
     for partner in partners:
         partner_amount = (order.base_delivery_fee * partner.base_delivery_fee_commission) / 100
         if partner_amount > 0:
-            pay_commission(
-                client=client,
-                order=order,
+            legs.append(CommissionLeg(
                 recipient_user_id=partner.user_id,
                 recipient_type="partner",
                 commission_type="base_delivery_fee",
                 amount=partner_amount,
-                currency=order.currency,
                 commission_percentage=partner.base_delivery_fee_commission,
-            )
-    
-    # Pay RendaSua HQ
+            ))
     if breakdown.rendasua > 0:
-        pay_commission(
-            client=client,
-            order=order,
+        legs.append(CommissionLeg(
             recipient_user_id=rendasua_hq_user.id,
             recipient_type="rendasua",
             commission_type="base_delivery_fee",
             amount=breakdown.rendasua,
-            currency=order.currency,
-        )
+        ))
+    return legs
 
 
-def process_per_km_delivery_fee_commissions(
-    client: HasuraClient,
+def per_km_delivery_fee_legs(
     order: CommissionOrder,
     breakdown: PerKmDeliveryFeeBreakdown,
     rendasua_hq_user: User,
     partners: List[Partner],
-) -> None:
-    """
-    Process per-km delivery fee commission payments.
-    
-    Args:
-        client: HasuraClient instance
-        order: Commission order
-        breakdown: Per-km delivery fee breakdown
-        rendasua_hq_user: RendaSua HQ user
-        partners: List of active partners
-    """
-    # Pay agent
+) -> List[CommissionLeg]:
+    """Agent, partner and RendaSua HQ legs of the per-km delivery fee."""
+    legs = []
     if order.assigned_agent and breakdown.agent > 0:
-        pay_commission(
-            client=client,
-            order=order,
+        legs.append(CommissionLeg(
             recipient_user_id=order.assigned_agent.user_id,
             recipient_type="agent",
             commission_type="per_km_delivery_fee",
             amount=breakdown.agent,
-            currency=order.currency,
-        )
-    
-    # Pay partners
+        ))
     for partner in partners:
         partner_amount = (order.per_km_delivery_fee * partner.per_km_delivery_fee_commission) / 100
         if partner_amount > 0:
-            pay_commission(
-                client=client,
-                order=order,
+            legs.append(CommissionLeg(
                 recipient_user_id=partner.user_id,
                 recipient_type="partner",
                 commission_type="per_km_delivery_fee",
                 amount=partner_amount,
-                currency=order.currency,
                 commission_percentage=partner.per_km_delivery_fee_commission,
-            )
-    
-    # Pay RendaSua HQ
+            ))
     if breakdown.rendasua > 0:
-        pay_commission(
-            client=client,
-            order=order,
+        legs.append(CommissionLeg(
             recipient_user_id=rendasua_hq_user.id,
             recipient_type="rendasua",
             commission_type="per_km_delivery_fee",
             amount=breakdown.rendasua,
-            currency=order.currency,
-        )
+        ))
+    return legs
 
 
-def process_item_commissions(
-    client: HasuraClient,
+def item_commission_legs(
     order: CommissionOrder,
     breakdown: ItemCommissionBreakdown,
     rendasua_hq_user: User,
     partners: List[Partner],
     rendasua_item_commission_percentage: float,
-) -> None:
-    """
-    Process item commission payments using location or app default commission percentage.
-    """
+) -> List[CommissionLeg]:
+    """Partner and RendaSua HQ legs of the item commission."""
+    legs = []
     for partner in partners:
         rendasua_item_amount = (order.subtotal * rendasua_item_commission_percentage) / 100
         partner_amount = (rendasua_item_amount * partner.item_commission) / 100
         if partner_amount > 0:
-            pay_commission(
-                client=client,
-                order=order,
+            legs.append(CommissionLeg(
                 recipient_user_id=partner.user_id,
                 recipient_type="partner",
                 commission_type="item_sale",
                 amount=partner_amount,
-                currency=order.currency,
                 commission_percentage=partner.item_commission,
-            )
-    
-    # Pay RendaSua HQ
+            ))
     if breakdown.rendasua > 0:
-        pay_commission(
-            client=client,
-            order=order,
+        legs.append(CommissionLeg(
             recipient_user_id=rendasua_hq_user.id,
             recipient_type="rendasua",
             commission_type="item_sale",
             amount=breakdown.rendasua,
-            currency=order.currency,
-        )
+        ))
+    return legs
+
+
+def order_subtotal_legs(order: CommissionOrder, breakdown: OrderSubtotalBreakdown) -> List[CommissionLeg]:
+    """Business leg: the subtotal share paid into the location account (or legacy business account)."""
+    if breakdown.business <= 0:
+        return []
+    return [CommissionLeg(
+        recipient_user_id=order.business_user_id,
+        recipient_type="business",
+        commission_type="order_subtotal",
+        amount=breakdown.business,
+        business_location_id=order.business_location_id,
+    )]
+
+
+def commission_legs(
+    order: CommissionOrder,
+    breakdown: CommissionBreakdown,
+    rendasua_hq_user: User,
+    partners: List[Partner],
+    rendasua_item_commission_percentage: float,
+) -> List[CommissionLeg]:
+    """Every payment of an order's commission distribution, in payment order."""
+    return [
+        *base_delivery_fee_legs(order, breakdown.base_delivery_fee, rendasua_hq_user, partners),
+        *per_km_delivery_fee_legs(order, breakdown.per_km_delivery_fee, rendasua_hq_user, partners),
+        *item_commission_legs(
+            order, breakdown.item_commission, rendasua_hq_user, partners, rendasua_item_commission_percentage
+        ),
+        *order_subtotal_legs(order, breakdown.order_subtotal),
+    ]
+
+
+def pay_commissions(
+    client: HasuraClient,
+    order: CommissionOrder,
+    legs: List[CommissionLeg],
+) -> Optional[List[str]]:
+    """
+    Pay all legs in four requests at most.
+
+    Skips orders that already have commission payouts (redelivered events),
+    resolves every recipient account with one query (creating the missing
+    ones with one insert), then posts all transactions, balance increments
+    and commission_payouts rows in one mutation.
+
+    Returns:
+        Account transaction IDs in leg order (the existing ones if the order
+        was already paid), None if nothing was paid
+    """
+    from rendasua_core_packages.hasura_client.commission_service import (
+        get_posted_commission_transaction_ids,
+        post_commission_payouts,
+        resolve_commission_accounts,
+    )
+
+    posted = get_posted_commission_transaction_ids(client, order.id)
+    if posted is None:
+        return None
+    if posted:
+        log_info("Commissions already paid for order", order_id=order.id, payouts=len(posted))
+        return posted
+
+    legs = [leg for leg in legs if leg.amount > 0]
+    account_ids = resolve_commission_accounts(
+        client,
+        order.currency,
+        [(leg.recipient_user_id, leg.business_location_id) for leg in legs],
+    )
+    if account_ids is None:
+        log_error("Accounts not resolved for commission payments", order_id=order.id)
+        return None
+    return post_commission_payouts(client, order.id, order.order_number, order.currency, legs, account_ids)
+
+
+def process_base_delivery_fee_commissions(
+    client: HasuraClient,
+    order: CommissionOrder,
+    breakdown: BaseDeliveryFeeBreakdown,
+    rendasua_hq_user: User,
+    partners: List[Partner],
+) -> None:
+    """
+    Process base delivery fee commission payments.
+    
+    Args:
+        client: HasuraClient instance
+        order: Commission order
+        breakdown: Base delivery fee breakdown
+        rendasua_hq_user: RendaSua HQ user
+        partners: List of active partners
+    """
+    _pay_legs(client, order, base_delivery_fee_legs(order, breakdown, rendasua_hq_user, partners))
+
+
+def process_per_km_delivery_fee_commissions(
+    client: HasuraClient,
+    order: CommissionOrder,
+    breakdown: PerKmDeliveryFeeBreakdown,
+    rendasua_hq_user: User,
+    partners: List[Partner],
+) -> None:
+    """
+    Process per-km delivery fee commission payments.
+    
+    Args:
+        client: HasuraClient instance
+        order: Commission order
+        breakdown: Per-km delivery fee breakdown
+        rendasua_hq_user: RendaSua HQ user
+        partners: List of active partners
+    """
+    _pay_legs(client, order, per_km_delivery_fee_legs(order, breakdown, rendasua_hq_user, partners))
+
+
+def process_item_commissions(
+    client: HasuraClient,
+    order: CommissionOrder,
+    breakdown: ItemCommissionBreakdown,
+    rendasua_hq_user: User,
+    partners: List[Partner],
+    rendasua_item_commission_percentage: float,
+) -> None:
+    """
+    Process item commission payments using location or app default commission percentage.
+    """
+    _pay_legs(client, order, item_commission_legs(
+        order, breakdown, rendasua_hq_user, partners, rendasua_item_commission_percentage
+    ))
 
 
 def process_order_subtotal_payment(
@@ -310,18 +402,7 @@ def process_order_subtotal_payment(
     """
     Process order subtotal payment to the business location account (or legacy business account).
     """
-    if breakdown.business <= 0:
-        return
-    pay_commission(
-        client=client,
-        order=order,
-        recipient_user_id=order.business_user_id,
-        recipient_type="business",
-        commission_type="order_subtotal",
-        amount=breakdown.business,
-        currency=order.currency,
-        business_location_id=order.business_location_id,
-    )
+    _pay_legs(client, order, order_subtotal_legs(order, breakdown))
 
 
 def distribute_commissions(
@@ -344,9 +425,7 @@ def distribute_commissions(
         # Import here to avoid circular imports
         from rendasua_core_packages.hasura_client.commission_service import (
             get_commission_order,
-            get_commission_configs,
-            get_active_partners,
-            get_rendasua_hq_user,
+            get_commission_reference_data,
         )
         
         # Fetch order
@@ -357,14 +436,11 @@ def distribute_commissions(
                 "error": f"Order {order_id} not found",
             }
         
-        # Fetch commission configuration (with location override when present)
-        config = get_commission_configs(client, order.business_location_id)
-        
-        # Fetch active partners
-        partners = get_active_partners(client)
-        
-        # Fetch RendaSua HQ user
-        rendasua_hq_user = get_rendasua_hq_user(client)
+        # Fetch commission configuration (with location override when present),
+        # active partners and the RendaSua HQ user in a single batched request
+        config, partners, rendasua_hq_user = get_commission_reference_data(
+            client, order.business_location_id
+        )
         if not rendasua_hq_user:
             return {
                 "success": False,
@@ -380,40 +456,21 @@ def distribute_commissions(
             order_number=order.order_number,
         )
         
-        # Process base delivery fee commissions
-        process_base_delivery_fee_commissions(
-            client,
-            order,
-            breakdown.base_delivery_fee,
-            rendasua_hq_user,
-            partners,
-        )
-        
-        # Process per-km delivery fee commissions
-        process_per_km_delivery_fee_commissions(
-            client,
+        # Pay every leg: one account lookup, one insert for missing accounts
+        # and one mutation for all transactions, balances and payout rows
+        legs = commission_legs(
             order,
-            breakdown.per_km_delivery_fee,
-            rendasua_hq_user,
-            partners,
-        )
-        
-        # Process item commissions (use same % as in config for consistency)
-        process_item_commissions(
-            client,
-            order,
-            breakdown.item_commission,
+            breakdown,
             rendasua_hq_user,
             partners,
             config.rendasua_item_commission_percentage,
         )
-        
-        # Process order subtotal payment
-        process_order_subtotal_payment(
-            client,
-            order,
-            breakdown.order_subtotal,
-        )
+        transaction_ids = pay_commissions(client, order, legs)
+        if transaction_ids is None:
+            return {
+                "success": False,
+                "error": f"Failed to pay commissions for order {order.order_number}",
+            }
         
         log_info(
             "Commission distribution completed successfully",
@@ -425,6 +482,7 @@ def distribute_commissions(
             "success": True,
             "message": f"Commissions distributed for order {order.order_number}",
             "order_id": order_id,
+            "payouts": len(transaction_ids),
         }
         
     except Exception as e:
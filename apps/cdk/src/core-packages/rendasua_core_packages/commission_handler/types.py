@@ -73,3 +73,14 @@ class CommissionBreakdown(BaseModel):
     order_subtotal: OrderSubtotalBreakdown
 
 
+
+
+class CommissionLeg(BaseModel):
+    """One commission payment: a deposit to the recipient plus its commission_payouts row."""
+    recipient_user_id: str
+    recipient_type: str
+    commission_type: str
+    amount: float
+    commission_percentage: Optional[float] = None
+    # Set for the business leg: pay into the location-scoped account
+    business_location_id: Optional[str] = None
@@ -4,61 +4,273 @@ Domain-specific Hasura client helpers.
 This package provides a small, shared wrapper around Hasura's GraphQL
 API plus service modules that operate on specific domains such as
 accounts, locations, and users.
+
+Everything is loaded lazily (PEP 562): ``from rendasua_core_packages.hasura_client
+import get_order_with_location`` imports ``orders_service`` (and what it
+needs) on first access, not every service module. Loading a service module
+registers its operations with ``query_registry``;
+``register_all_operations`` loads them all (e.g. to export the allow-list).
 """
 
-from .base import HasuraClient, HasuraClientConfig
-from .logging import log_info, log_error
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List, Set
 
-# Order-related functions
-from .orders_service import (
-    get_order_with_location,
-    get_complete_order_details,
-    get_order_details_for_notification,
-    get_order_business_location_country,
-    get_platform_order_lifecycle_counts,
-)
+import importlib
 
-# Order hold-related functions
-from .order_holds_service import (
-    get_or_create_order_hold,
-    update_order_hold_status,
-)
+from . import query_registry
 
-# Account-related functions
-from .accounts_service import (
-    get_account_by_user_and_currency,
-    register_account_transaction,
-    determine_transaction_balance_update,
-)
+if TYPE_CHECKING:
+    from .base import (
+        HasuraClient,
+        HasuraClientConfig,
+    )
+    from .async_client import (
+        AsyncHasuraClient,
+        gather_bounded,
+    )
+    from .transport import (
+        configure_transport,
+        get_transport_stats,
+        reset_transport_stats,
+    )
+    from .logging import (
+        log_info,
+        log_error,
+    )
+    from .orders_service import (
+        get_order_with_location,
+        get_complete_order_details,
+        get_order_details_for_notification,
+        get_order_business_location_country,
+        get_platform_order_lifecycle_counts,
+        get_order_details_with_lifecycle_counts,
+    )
+    from .order_holds_service import (
+        get_or_create_order_hold,
+        update_order_hold_status,
+    )
+    from .accounts_service import (
+        get_account_by_user_and_currency,
+        register_account_transaction,
+        determine_transaction_balance_update,
+    )
+    from .ledger_service import (
+        LedgerPosting,
+        HoldStatusChange,
+        PostingResult,
+        JournalResult,
+        post_journal,
+    )
+    from .transactions_service import register_cancellation_fee_transactions
+    from .config_service import get_cancellation_fee_config
+    from .reference_data import (
+        ReferenceData,
+        ReferenceDataCache,
+        get_reference_data_cache,
+        invalidate_reference_data,
+    )
+    from .location_service import (
+        get_all_agent_locations,
+        get_agent_locations_near,
+        get_agent_location_table,
+    )
+    from .agent_location_table import (
+        AgentLocationRow,
+        AgentLocationTable,
+    )
+    from .agent_location_cache import (
+        AgentLocationCache,
+        AgentLocationDelta,
+        get_agent_location_cache,
+    )
+    from .geocode_cache import (
+        GeocodeCache,
+        geocode_address_cached,
+        get_geocode_cache,
+    )
+    from .geocoding_backfill import (
+        GeocodingBackfillResult,
+        backfill_missing_coordinates,
+        geocode_addresses,
+        persist_coordinates_bulk,
+        prewarm_address_coordinates,
+    )
+    from .road_distance import (
+        RoadDistance,
+        RoadDistanceService,
+        get_road_distance_service,
+    )
+    from .commission_service import (
+        get_commission_configs,
+        get_active_partners,
+        get_rendasua_hq_user,
+        get_commission_reference_data,
+        get_commission_order,
+        audit_commission_payout,
+        resolve_commission_accounts,
+        post_commission_payouts,
+        get_posted_commission_transaction_ids,
+    )
+    from .async_services import (
+        get_order_details_for_notification_async,
+        get_platform_order_lifecycle_counts_async,
+        create_pending_agent_notification_async,
+        get_pending_agent_notifications_async,
+        update_notification_status_async,
+        get_account_by_user_and_currency_async,
+        get_all_agent_locations_async,
+    )
 
-# Transaction-related functions
-from .transactions_service import (
-    register_cancellation_fee_transactions,
-)
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    # Base client
+    "HasuraClient": "base",
+    "HasuraClientConfig": "base",
+    # Async client
+    "AsyncHasuraClient": "async_client",
+    "gather_bounded": "async_client",
+    # Transport
+    "configure_transport": "transport",
+    "get_transport_stats": "transport",
+    "reset_transport_stats": "transport",
+    # Logging
+    "log_info": "logging",
+    "log_error": "logging",
+    # Orders
+    "get_order_with_location": "orders_service",
+    "get_complete_order_details": "orders_service",
+    "get_order_details_for_notification": "orders_service",
+    "get_order_business_location_country": "orders_service",
+    "get_platform_order_lifecycle_counts": "orders_service",
+    "get_order_details_with_lifecycle_counts": "orders_service",
+    # Order holds
+    "get_or_create_order_hold": "order_holds_service",
+    "update_order_hold_status": "order_holds_service",
+    # Accounts
+    "get_account_by_user_and_currency": "accounts_service",
+    "register_account_transaction": "accounts_service",
+    "determine_transaction_balance_update": "accounts_service",
+    # Ledger journals
+    "LedgerPosting": "ledger_service",
+    "HoldStatusChange": "ledger_service",
+    "PostingResult": "ledger_service",
+    "JournalResult": "ledger_service",
+    "post_journal": "ledger_service",
+    # Transactions
+    "register_cancellation_fee_transactions": "transactions_service",
+    # Configuration
+    "get_cancellation_fee_config": "config_service",
+    # Reference data
+    "ReferenceData": "reference_data",
+    "ReferenceDataCache": "reference_data",
+    "get_reference_data_cache": "reference_data",
+    "invalidate_reference_data": "reference_data",
+    # Locations
+    "get_all_agent_locations": "location_service",
+    "get_agent_locations_near": "location_service",
+    "get_agent_location_table": "location_service",
+    "AgentLocationRow": "agent_location_table",
+    "AgentLocationTable": "agent_location_table",
+    "AgentLocationCache": "agent_location_cache",
+    "AgentLocationDelta": "agent_location_cache",
+    "get_agent_location_cache": "agent_location_cache",
+    # Geocoding cache
+    "GeocodeCache": "geocode_cache",
+    "geocode_address_cached": "geocode_cache",
+    "get_geocode_cache": "geocode_cache",
+    "GeocodingBackfillResult": "geocoding_backfill",
+    "backfill_missing_coordinates": "geocoding_backfill",
+    "geocode_addresses": "geocoding_backfill",
+    "persist_coordinates_bulk": "geocoding_backfill",
+    "prewarm_address_coordinates": "geocoding_backfill",
+    # Road distances
+    "RoadDistance": "road_distance",
+    "RoadDistanceService": "road_distance",
+    "get_road_distance_service": "road_distance",
+    # Commissions
+    "get_commission_configs": "commission_service",
+    "get_active_partners": "commission_service",
+    "get_rendasua_hq_user": "commission_service",
+    "get_commission_reference_data": "commission_service",
+    "get_commission_order": "commission_service",
+    "audit_commission_payout": "commission_service",
+    "resolve_commission_accounts": "commission_service",
+    "post_commission_payouts": "commission_service",
+    "get_posted_commission_transaction_ids": "commission_service",
+    # Async services
+    "get_order_details_for_notification_async": "async_services",
+    "get_platform_order_lifecycle_counts_async": "async_services",
+    "create_pending_agent_notification_async": "async_services",
+    "get_pending_agent_notifications_async": "async_services",
+    "update_notification_status_async": "async_services",
+    "get_account_by_user_and_currency_async": "async_services",
+    "get_all_agent_locations_async": "async_services",
+}
 
-# Configuration-related functions
-from .config_service import (
-    get_cancellation_fee_config,
+# Modules whose GraphQL operations belong in the registry / allow-list
+_SERVICE_MODULES = (
+    "accounts_service",
+    "agent_location_cache",
+    "commission_service",
+    "config_service",
+    "geocode_cache",
+    "geocoding_backfill",
+    "ledger_service",
+    "location_service",
+    "mobile_payment_transactions_service",
+    "order_holds_service",
+    "orders_service",
+    "reference_data",
+    "road_distance",
+    "transactions_service",
+    "user_service",
 )
 
-# Location-related functions
-from .location_service import (
-    get_all_agent_locations,
-)
 
-# Commission-related functions
-from .commission_service import (
-    get_commission_configs,
-    get_active_partners,
-    get_rendasua_hq_user,
-    get_commission_order,
-    audit_commission_payout,
-)
+_registered_modules: Set[str] = set()
+
+
+def _load_module(module_name: str) -> ModuleType:
+    module = importlib.import_module(f".{module_name}", __name__)
+    if module_name in _SERVICE_MODULES and module_name not in _registered_modules:
+        query_registry.register_module_operations(module)
+        _registered_modules.add(module_name)
+    return module
+
+
+def register_all_operations() -> int:
+    """Load every service module and register its operations; returns the total registered."""
+    for module_name in _SERVICE_MODULES:
+        _load_module(module_name)
+    return len(query_registry.registered_operations())
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        if name in _SERVICE_MODULES:
+            return _load_module(name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_load_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Base client
     "HasuraClient",
     "HasuraClientConfig",
+    # Async client
+    "AsyncHasuraClient",
+    "gather_bounded",
+    # Transport
+    "configure_transport",
+    "get_transport_stats",
+    "reset_transport_stats",
     # Logging
     "log_info",
     "log_error",
@@ -68,6 +280,7 @@ __all__ = [
     "get_order_details_for_notification",
     "get_order_business_location_country",
     "get_platform_order_lifecycle_counts",
+    "get_order_details_with_lifecycle_counts",
     # Order holds
     "get_or_create_order_hold",
     "update_order_hold_status",
@@ -75,18 +288,61 @@ __all__ = [
     "get_account_by_user_and_currency",
     "register_account_transaction",
     "determine_transaction_balance_update",
+    # Ledger journals
+    "LedgerPosting",
+    "HoldStatusChange",
+    "PostingResult",
+    "JournalResult",
+    "post_journal",
     # Transactions
     "register_cancellation_fee_transactions",
     # Configuration
     "get_cancellation_fee_config",
+    # Reference data
+    "ReferenceData",
+    "ReferenceDataCache",
+    "get_reference_data_cache",
+    "invalidate_reference_data",
     # Locations
     "get_all_agent_locations",
+    "get_agent_locations_near",
+    "get_agent_location_table",
+    "AgentLocationRow",
+    "AgentLocationTable",
+    "AgentLocationCache",
+    "AgentLocationDelta",
+    "get_agent_location_cache",
+    # Geocoding cache
+    "GeocodeCache",
+    "geocode_address_cached",
+    "get_geocode_cache",
+    "GeocodingBackfillResult",
+    "backfill_missing_coordinates",
+    "geocode_addresses",
+    "persist_coordinates_bulk",
+    "prewarm_address_coordinates",
+    # Road distances
+    "RoadDistance",
+    "RoadDistanceService",
+    "get_road_distance_service",
     # Commissions
     "get_commission_configs",
     "get_active_partners",
     "get_rendasua_hq_user",
+    "get_commission_reference_data",
     "get_commission_order",
     "audit_commission_payout",
+    "resolve_commission_accounts",
+    "post_commission_payouts",
+    "get_posted_commission_transaction_ids",
+    # Async services
+    "get_order_details_for_notification_async",
+    "get_platform_order_lifecycle_counts_async",
+    "create_pending_agent_notification_async",
+    "get_pending_agent_notifications_async",
+    "update_notification_status_async",
+    "get_account_by_user_and_currency_async",
+    "get_all_agent_locations_async",
+    # Operation registry
+    "register_all_operations",
 ]
-
-
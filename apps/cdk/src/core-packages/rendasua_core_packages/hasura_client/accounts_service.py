@@ -7,13 +7,104 @@ in the order-status Lambda's hasura_client module.
 """
 
 from typing import Optional
-import datetime
 from rendasua_core_packages.models import Account, TransactionInfo, BalanceUpdate
 from rendasua_core_packages.utilities import parse_datetime
 from .base import HasuraClient, HasuraClientConfig
 from .logging import log_info, log_error
 
 
+LEGACY_ACCOUNT_QUERY = """
+query GetUserAccount($userId: uuid!, $currency: currency_enum!) {
+  accounts(
+    where: {
+      user_id: { _eq: $userId }
+      currency: { _eq: $currency }
+      business_location_id: { _is_null: true }
+      is_active: { _eq: true }
+    }
+  ) {
+    id
+    user_id
+    currency
+    available_balance
+    withheld_balance
+    total_balance
+    is_active
+    created_at
+    updated_at
+  }
+}
+"""
+
+CREATE_LEGACY_ACCOUNT_MUTATION = """
+mutation CreateAccount($userId: uuid!, $currency: currency_enum!) {
+  insert_accounts_one(object: {
+    user_id: $userId,
+    currency: $currency,
+    available_balance: 0,
+    withheld_balance: 0,
+    is_active: true
+  }) {
+    id
+    user_id
+    currency
+    available_balance
+    withheld_balance
+    total_balance
+    is_active
+    created_at
+    updated_at
+  }
+}
+"""
+
+LOCATION_ACCOUNT_QUERY = """
+query GetUserAccountByLocation($userId: uuid!, $currency: currency_enum!, $businessLocationId: uuid!) {
+  accounts(
+    where: {
+      user_id: { _eq: $userId }
+      currency: { _eq: $currency }
+      business_location_id: { _eq: $businessLocationId }
+      is_active: { _eq: true }
+    }
+  ) {
+    id
+    user_id
+    currency
+    available_balance
+    withheld_balance
+    total_balance
+    is_active
+    created_at
+    updated_at
+  }
+}
+"""
+
+CREATE_LOCATION_ACCOUNT_MUTATION = """
+mutation CreateAccount($userId: uuid!, $currency: currency_enum!, $businessLocationId: uuid!) {
+  insert_accounts_one(object: {
+    user_id: $userId,
+    currency: $currency,
+    business_location_id: $businessLocationId,
+    available_balance: 0,
+    withheld_balance: 0,
+    is_active: true
+  }) {
+    id
+    user_id
+    currency
+    available_balance
+    withheld_balance
+    total_balance
+    is_active
+    created_at
+    updated_at
+  }
+}
+"""
+
+
 def get_account_by_user_and_currency(
     user_id: str,
     currency: str,
@@ -58,57 +149,14 @@ def _get_or_create_legacy_account(
     hasura_endpoint: str,
     hasura_admin_secret: str,
 ) -> Optional[Account]:
-    query = """
-    query GetUserAccount($userId: uuid!, $currency: currency_enum!) {
-      accounts(
-        where: {
-          user_id: { _eq: $userId }
-          currency: { _eq: $currency }
-          business_location_id: { _is_null: true }
-          is_active: { _eq: true }
-        }
-      ) {
-        id
-        user_id
-        currency
-        available_balance
-        withheld_balance
-        total_balance
-        is_active
-        created_at
-        updated_at
-      }
-    }
-    """
-    mutation = """
-    mutation CreateAccount($userId: uuid!, $currency: currency_enum!) {
-      insert_accounts_one(object: {
-        user_id: $userId,
-        currency: $currency,
-        available_balance: 0,
-        withheld_balance: 0,
-        is_active: true
-      }) {
-        id
-        user_id
-        currency
-        available_balance
-        withheld_balance
-        total_balance
-        is_active
-        created_at
-        updated_at
-      }
-    }
-    """
     return _get_or_create_account_impl(
         user_id=user_id,
         currency=currency,
         hasura_endpoint=hasura_endpoint,
         hasura_admin_secret=hasura_admin_secret,
-        query=query,
+        query=LEGACY_ACCOUNT_QUERY,
         query_vars={"userId": user_id, "currency": currency},
-        mutation=mutation,
+        mutation=CREATE_LEGACY_ACCOUNT_MUTATION,
         mutation_vars={"userId": user_id, "currency": currency},
     )
 
@@ -120,58 +168,14 @@ def _get_or_create_account(
     hasura_admin_secret: str,
     business_location_id: str,
 ) -> Optional[Account]:
-    query = """
-    query GetUserAccountByLocation($userId: uuid!, $currency: currency_enum!, $businessLocationId: uuid!) {
-      accounts(
-        where: {
-          user_id: { _eq: $userId }
-          currency: { _eq: $currency }
-          business_location_id: { _eq: $businessLocationId }
-          is_active: { _eq: true }
-        }
-      ) {
-        id
-        user_id
-        currency
-        available_balance
-        withheld_balance
-        total_balance
-        is_active
-        created_at
-        updated_at
-      }
-    }
-    """
-    mutation = """
-    mutation CreateAccount($userId: uuid!, $currency: currency_enum!, $businessLocationId: uuid!) {
-      insert_accounts_one(object: {
-        user_id: $userId,
-        currency: $currency,
-        business_location_id: $businessLocationId,
-        available_balance: 0,
-        withheld_balance: 0,
-        is_active: true
-      }) {
-        id
-        user_id
-        currency
-        available_balance
-        withheld_balance
-        total_balance
-        is_active
-        created_at
-        updated_at
-      }
-    }
-    """
     return _get_or_create_account_impl(
         user_id=user_id,
         currency=currency,
         hasura_endpoint=hasura_endpoint,
         hasura_admin_secret=hasura_admin_secret,
-        query=query,
+        query=LOCATION_ACCOUNT_QUERY,
         query_vars={"userId": user_id, "currency": currency, "businessLocationId": business_location_id},
-        mutation=mutation,
+        mutation=CREATE_LOCATION_ACCOUNT_MUTATION,
         mutation_vars={"userId": user_id, "currency": currency, "businessLocationId": business_location_id},
     )
 
@@ -279,6 +283,68 @@ def determine_transaction_balance_update(
         raise ValueError(f"Unsupported transaction type: {transaction_type}")
 
 
+# Prefix of the error raised by the accounts_reject_overdraft trigger
+INSUFFICIENT_FUNDS_ERROR = "insufficient_funds"
+
+POST_ACCOUNT_TRANSACTION_MUTATION = """
+mutation PostAccountTransaction(
+  $availableDelta: numeric!,
+  $withheldDelta: numeric!,
+  $accountId: uuid!,
+  $amount: numeric!,
+  $transactionType: transaction_type_enum!,
+  $memo: String,
+  $referenceId: uuid
+) {
+  update_accounts(
+    where: { id: { _eq: $accountId } },
+    _inc: { available_balance: $availableDelta, withheld_balance: $withheldDelta },
+    _set: { updated_at: "now()" }
+  ) {
+    affected_rows
+    returning {
+      id
+      available_balance
+      withheld_balance
+    }
+  }
+  insert_account_transactions_one(object: {
+    account_id: $accountId,
+    amount: $amount,
+    transaction_type: $transactionType,
+    memo: $memo,
+    reference_id: $referenceId
+  }) {
+    id
+  }
+}
+"""
+
+
+def _is_insufficient_funds_error(error: Exception) -> bool:
+    """True when a mutation was aborted by the accounts_reject_overdraft trigger."""
+    return INSUFFICIENT_FUNDS_ERROR in str(error)
+
+
+def _has_sufficient_funds(
+    transaction_type: str,
+    balance_update: BalanceUpdate,
+    available_balance: float,
+    withheld_balance: float,
+) -> bool:
+    """
+    Sufficient-funds rule enforced by the accounts_reject_overdraft trigger.
+
+    Holds and debits need available balance, releases and withheld debits
+    need withheld balance; credits always pass.
+    """
+    if transaction_type == "hold" or (transaction_type != "release" and balance_update.available < 0):
+        return available_balance >= abs(balance_update.available)
+    if transaction_type == "release" or balance_update.withheld < 0:
+        return withheld_balance >= abs(balance_update.withheld)
+    return True
+
+
 def register_account_transaction(
     account_id: str,
     amount: float,
@@ -290,7 +356,13 @@ def register_account_transaction(
 ) -> Optional[str]:
     """
     Register an account transaction and update account balances.
-    
+
+    The balance change is applied with ``_inc`` in the same mutation as the
+    transaction insert, so it is one round trip and concurrent postings on
+    one account cannot overwrite each other. Sufficient funds are enforced
+    by the accounts_reject_overdraft trigger: an overdraft aborts the whole
+    mutation (no balance change, no transaction row) and None is returned.
+
     Args:
         account_id: Account ID
         amount: Transaction amount
@@ -299,125 +371,20 @@ def register_account_transaction(
         reference_id: Reference ID (e.g., order ID)
         hasura_endpoint: Hasura GraphQL endpoint
         hasura_admin_secret: Hasura admin secret
-        
+
     Returns:
         Transaction ID if successful, None otherwise
     """
-    # First, get current account
-    query = """
-    query GetAccountById($accountId: uuid!) {
-      accounts_by_pk(id: $accountId) {
-        id
-        available_balance
-        withheld_balance
-        total_balance
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
-    log_info("Fetching account for transaction", account_id=account_id, transaction_type=transaction_type)
-    
+    log_info("Posting account transaction", account_id=account_id, transaction_type=transaction_type)
+
     try:
-        data = client.execute(query, {"accountId": account_id})
-        account_data = data.get("accounts_by_pk")
-        
-        if not account_data:
-            log_error("Account not found", account_id=account_id)
-            return None
-        
-        account = Account(
-            id=account_data["id"],
-            user_id="",  # Not needed for this operation
-            currency="",  # Not needed for this operation
-            available_balance=float(account_data.get("available_balance", 0.0)),
-            withheld_balance=float(account_data.get("withheld_balance", 0.0)),
-            total_balance=float(account_data.get("total_balance", 0.0)),
-            is_active=True,  # Not needed for this operation
-            created_at=datetime.datetime.now(),
-            updated_at=datetime.datetime.now(),
-        )
-        
-        # Determine balance update
-        transaction_info = determine_transaction_balance_update(transaction_type, amount)
-        balance_update = transaction_info.balanceUpdate
-        
-        # Calculate new balances (handle None values by defaulting to 0)
-        current_available = account.available_balance or 0
-        current_withheld = account.withheld_balance or 0
-        new_available = current_available + balance_update.available
-        new_withheld = current_withheld + balance_update.withheld
-        new_total = new_available + new_withheld
-        
-        # Validate sufficient funds before processing transaction
-        # For hold transactions, check available balance
-        if transaction_type == "hold":
-            if current_available < abs(balance_update.available):
-                log_error(
-                    "Insufficient available balance for hold transaction",
-                    account_id=account_id,
-                    available_balance=current_available,
-                    required_amount=abs(balance_update.available),
-                )
-                return None
-        
-        # For release transactions, check withheld balance
-        elif transaction_type == "release":
-            if current_withheld < abs(balance_update.withheld):
-                log_error(
-                    "Insufficient withheld balance for release transaction",
-                    account_id=account_id,
-                    withheld_balance=current_withheld,
-                    required_amount=abs(balance_update.withheld),
-                )
-                return None
-        
-        # For other debit transactions that decrease available balance, check available balance
-        elif balance_update.available < 0:
-            if current_available < abs(balance_update.available):
-                log_error(
-                    "Insufficient available balance for transaction",
-                    account_id=account_id,
-                    available_balance=current_available,
-                    required_amount=abs(balance_update.available),
-                )
-                return None
-        
-        # For other transactions that decrease withheld balance, check withheld balance
-        elif balance_update.withheld < 0:
-            if current_withheld < abs(balance_update.withheld):
-                log_error(
-                    "Insufficient withheld balance for transaction",
-                    account_id=account_id,
-                    withheld_balance=current_withheld,
-                    required_amount=abs(balance_update.withheld),
-                )
-                return None
-        
-        # Insert transaction
-        mutation = """
-        mutation InsertTransaction(
-          $accountId: uuid!,
-          $amount: numeric!,
-          $transactionType: transaction_type_enum!,
-          $memo: String,
-          $referenceId: uuid
-        ) {
-          insert_account_transactions_one(object: {
-            account_id: $accountId,
-            amount: $amount,
-            transaction_type: $transactionType,
-            memo: $memo,
-            reference_id: $referenceId
-          }) {
-            id
-          }
-        }
-        """
-        
-        transaction_data = client.execute(
-            mutation,
+        balance_update = determine_transaction_balance_update(transaction_type, amount).balanceUpdate
+        data = client.execute(
+            POST_ACCOUNT_TRANSACTION_MUTATION,
             {
+                "availableDelta": balance_update.available,
+                "withheldDelta": balance_update.withheld,
                 "accountId": account_id,
                 "amount": amount,
                 "transactionType": transaction_type.lower(),
@@ -425,47 +392,32 @@ def register_account_transaction(
                 "referenceId": reference_id,
             },
         )
-        
-        transaction_id = transaction_data.get("insert_account_transactions_one", {}).get("id")
-        
-        if not transaction_id:
-            log_error("Failed to insert transaction", account_id=account_id)
-            return None
-        
-        # Update account balances
-        update_mutation = """
-        mutation UpdateAccountBalances(
-          $accountId: uuid!,
-          $availableBalance: numeric!,
-          $withheldBalance: numeric!
-        ) {
-          update_accounts_by_pk(
-            pk_columns: { id: $accountId },
-            _set: {
-              available_balance: $availableBalance,
-              withheld_balance: $withheldBalance,
-              updated_at: "now()"
-            }
-          ) {
-            id
-          }
-        }
-        """
-        
-        client.execute(
-            update_mutation,
-            {
-                "accountId": account_id,
-                "availableBalance": new_available,
-                "withheldBalance": new_withheld,
-            },
-        )
-        
-        log_info("Transaction registered successfully", account_id=account_id, transaction_id=transaction_id, transaction_type=transaction_type)
-        return transaction_id
-        
     except Exception as e:
-        log_error("Error registering transaction", error=e, account_id=account_id)
+        if _is_insufficient_funds_error(e):
+            log_error(
+                "Insufficient balance for transaction",
+                account_id=account_id,
+                transaction_type=transaction_type,
+                required_amount=amount,
+            )
+        else:
+            log_error("Error registering transaction", error=e, account_id=account_id)
+        return None
+
+    transaction_id = (data.get("insert_account_transactions_one") or {}).get("id")
+    update = data.get("update_accounts") or {}
+    if not transaction_id:
+        log_error("Failed to insert transaction", account_id=account_id)
         return None
 
+    balances = (update.get("returning") or [{}])[0]
+    log_info(
+        "Transaction registered successfully",
+        account_id=account_id,
+        transaction_id=transaction_id,
+        transaction_type=transaction_type,
+        available_balance=balances.get("available_balance"),
+        withheld_balance=balances.get("withheld_balance"),
+    )
+    return transaction_id
 
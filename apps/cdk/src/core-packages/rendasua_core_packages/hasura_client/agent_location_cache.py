@@ -0,0 +1,254 @@
+"""
+Warm-container cache of available agent locations.
+
+The first ``refresh`` in a container loads every available agent. Later
+refreshes send one batched request with two parts:
+
+* the rows whose ``updated_at`` is at or after the last high-water mark
+  (agents that moved), and
+* the ids of all currently available agents (a cheap tombstone check:
+  cached agents missing from it became unavailable and are dropped; ids
+  that are not cached yet are fetched by id).
+
+Nested agent/user details are not versioned by ``agent_locations.updated_at``,
+so the cache reloads fully once it is older than ``max_age_seconds``
+(``AGENT_LOCATION_CACHE_MAX_AGE_SECONDS``, default 900).
+
+Rows are kept as returned by Hasura and served as an ``AgentLocationTable``
+(rebuilt only after a change), so no models are built for agents that are
+never notified.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import os
+import threading
+import time
+
+from rendasua_core_packages.utilities import parse_datetime
+from .agent_location_table import AgentLocationRow, AgentLocationTable
+from .base import HasuraClient, HasuraClientConfig
+from .logging import log_info, log_error
+from .location_service import (
+    AGENT_LOCATION_FIELDS_FRAGMENT,
+    AGENT_LOCATIONS_QUERY,
+)
+
+
+DEFAULT_MAX_AGE_SECONDS = 900.0
+
+AGENT_LOCATIONS_UPDATED_SINCE_QUERY = """
+query GetAgentLocationsUpdatedSince($since: timestamptz!) {
+  agent_locations(
+    where: {
+      agent: { is_available: { _eq: true } }
+      updated_at: { _gte: $since }
+    }
+  ) {
+    ...AgentLocationFields
+  }
+}
+""" + AGENT_LOCATION_FIELDS_FRAGMENT
+
+AVAILABLE_AGENT_IDS_QUERY = """
+query GetAvailableAgentIds {
+  agent_locations(where: { agent: { is_available: { _eq: true } } }) {
+    agent_id
+  }
+}
+"""
+
+AGENT_LOCATIONS_BY_AGENT_IDS_QUERY = """
+query GetAgentLocationsByAgentIds($agentIds: [uuid!]!) {
+  agent_locations(where: { agent_id: { _in: $agentIds } }) {
+    ...AgentLocationFields
+  }
+}
+""" + AGENT_LOCATION_FIELDS_FRAGMENT
+
+
+@dataclass
+class AgentLocationDelta:
+    """What changed in the cache during one refresh."""
+
+    full_reload: bool = False
+    upserted: AgentLocationTable = field(default_factory=AgentLocationTable)
+    removed: List[str] = field(default_factory=list)
+
+
+@dataclass
+class AgentLocationCacheStats:
+    full_loads: int = 0
+    delta_syncs: int = 0
+    # Agents served from the cache without re-fetching
+    hits: int = 0
+    # Agents fetched from Hasura
+    misses: int = 0
+    delta_rows: int = 0
+    tombstones: int = 0
+    last_delta_size: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "full_loads": self.full_loads,
+            "delta_syncs": self.delta_syncs,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "delta_rows": self.delta_rows,
+            "tombstones": self.tombstones,
+            "last_delta_size": self.last_delta_size,
+        }
+
+
+class AgentLocationCache:
+    def __init__(self, max_age_seconds: Optional[float] = None) -> None:
+        if max_age_seconds is None:
+            max_age_seconds = float(
+                os.environ.get("AGENT_LOCATION_CACHE_MAX_AGE_SECONDS", DEFAULT_MAX_AGE_SECONDS)
+            )
+        self.max_age_seconds = max_age_seconds
+        self.stats = AgentLocationCacheStats()
+        self._lock = threading.Lock()
+        self._rows: Dict[str, dict] = {}
+        self._table: Optional[AgentLocationTable] = None
+        self._high_water: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def table(self) -> AgentLocationTable:
+        """Current agent locations as a columnar table."""
+        table = self._table
+        if table is None:
+            table = self._table = AgentLocationTable.from_rows(self._rows.values())
+        return table
+
+    def locations(self) -> List[AgentLocationRow]:
+        return list(self.table())
+
+    def invalidate(self) -> None:
+        """Drop everything; the next refresh does a full load."""
+        with self._lock:
+            self._rows.clear()
+            self._table = None
+            self._high_water = None
+            self._loaded_at = None
+
+    def _advance_high_water(self, rows: List[dict]) -> None:
+        newest = None
+        newest_raw = None
+        for row in rows:
+            raw = row.get("updated_at")
+            parsed = parse_datetime(raw)
+            if parsed is not None and (newest is None or parsed > newest):
+                newest, newest_raw = parsed, raw
+        current = parse_datetime(self._high_water) if self._high_water else None
+        if newest is not None and (current is None or newest > current):
+            self._high_water = newest_raw
+
+    def _needs_full_load(self) -> bool:
+        if self._high_water is None or self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at >= self.max_age_seconds
+
+    def refresh(self, hasura_endpoint: str, hasura_admin_secret: str) -> AgentLocationDelta:
+        """
+        Bring the cache up to date and report what changed.
+
+        On errors the cache keeps its previous contents and an empty delta
+        is returned, so callers keep working with slightly stale data.
+        """
+        client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+        with self._lock:
+            try:
+                if self._needs_full_load():
+                    return self._full_load(client)
+                return self._delta_sync(client)
+            except Exception as e:
+                log_error("Error refreshing agent location cache", error=e)
+                return AgentLocationDelta()
+
+    def _full_load(self, client: HasuraClient) -> AgentLocationDelta:
+        log_info("Agent location cache: full load")
+        data = client.execute(AGENT_LOCATIONS_QUERY, {})
+        rows = data.get("agent_locations", [])
+
+        self._rows = {row["agent_id"]: row for row in rows}
+        self._table = None
+        self._high_water = None
+        self._advance_high_water(rows)
+        self._loaded_at = time.monotonic()
+
+        self.stats.full_loads += 1
+        self.stats.misses += len(self._rows)
+        self.stats.last_delta_size = len(self._rows)
+        log_info("Agent location cache loaded", agents=len(self._rows))
+        return AgentLocationDelta(full_reload=True, upserted=self.table())
+
+    def _delta_sync(self, client: HasuraClient) -> AgentLocationDelta:
+        changed_data, ids_data = client.batch([
+            (AGENT_LOCATIONS_UPDATED_SINCE_QUERY, {"since": self._high_water}),
+            (AVAILABLE_AGENT_IDS_QUERY, {}),
+        ])
+        changed_rows = changed_data.get("agent_locations", [])
+        available_ids = {row["agent_id"] for row in ids_data.get("agent_locations", [])}
+
+        changed_ids = {row["agent_id"] for row in changed_rows}
+        # Agents that became available again without moving are not in the
+        # delta (their updated_at is old) and must be fetched explicitly.
+        returning_ids = sorted(available_ids - changed_ids - set(self._rows))
+        if returning_ids:
+            returning_data = client.execute(
+                AGENT_LOCATIONS_BY_AGENT_IDS_QUERY, {"agentIds": returning_ids}
+            )
+            changed_rows = changed_rows + returning_data.get("agent_locations", [])
+
+        # ``_gte`` re-delivers the rows sitting exactly on the high-water mark
+        # (so concurrent writes with the same timestamp are never missed);
+        # those are already cached and are not reported as changes.
+        upserted = AgentLocationTable()
+        for row in changed_rows:
+            cached = self._rows.get(row["agent_id"])
+            if cached is not None and cached.get("updated_at") == row.get("updated_at"):
+                continue
+            self._rows[row["agent_id"]] = row
+            upserted.append(row)
+
+        removed = [agent_id for agent_id in self._rows if agent_id not in available_ids]
+        for agent_id in removed:
+            del self._rows[agent_id]
+        if len(upserted) or removed:
+            self._table = None
+
+        self._advance_high_water(changed_rows)
+
+        self.stats.delta_syncs += 1
+        self.stats.misses += len(upserted)
+        self.stats.hits += max(0, len(self._rows) - len(upserted))
+        self.stats.delta_rows += len(upserted)
+        self.stats.tombstones += len(removed)
+        self.stats.last_delta_size = len(upserted) + len(removed)
+        log_info(
+            "Agent location cache delta applied",
+            upserted=len(upserted),
+            removed=len(removed),
+            agents=len(self._rows),
+        )
+        return AgentLocationDelta(upserted=upserted, removed=removed)
+
+
+_cache: Optional[AgentLocationCache] = None
+
+
+def get_agent_location_cache() -> AgentLocationCache:
+    """Container-wide cache instance (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = AgentLocationCache()
+    return _cache
@@ -0,0 +1,240 @@
+"""
+Columnar container for agent locations.
+
+``AgentLocationTable`` keeps one column per field (coordinates in
+``array('d')`` buffers, ids and contact details in plain lists) instead of
+one ``AgentLocation`` + ``Agent`` + ``User`` model per agent. Building it
+does no datetime parsing and no model construction; rows are exposed as
+lightweight ``AgentLocationRow`` views that build the nested models only
+when a caller actually touches ``row.agent`` (e.g. to send a notification).
+
+Coordinates can be handed straight to ``haversine_matrix`` (NumPy reads
+the ``array('d')`` buffers without copying).
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from rendasua_core_packages.models import Agent, AgentLocation, User
+from rendasua_core_packages.utilities import distance, parse_datetime
+
+
+class AgentLocationRow:
+    """Read-only view of one row of an ``AgentLocationTable``."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "AgentLocationTable", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"AgentLocationRow(agent_id={self.agent_id!r}, latitude={self.latitude}, longitude={self.longitude})"
+
+    @property
+    def id(self) -> str:
+        return self._table.location_ids[self._index]
+
+    @property
+    def agent_id(self) -> str:
+        return self._table.agent_ids[self._index]
+
+    @property
+    def latitude(self) -> float:
+        return self._table.latitudes[self._index]
+
+    @property
+    def longitude(self) -> float:
+        return self._table.longitudes[self._index]
+
+    @property
+    def created_at(self):
+        return parse_datetime(self._table.created_at[self._index])
+
+    @property
+    def updated_at(self):
+        return parse_datetime(self._table.updated_at[self._index])
+
+    @property
+    def user(self) -> Optional[User]:
+        table, i = self._table, self._index
+        if table.user_ids[i] is None:
+            return None
+        # Nested timestamps are not kept in the table
+        return User.model_construct(
+            id=table.user_ids[i],
+            email=table.emails[i],
+            phone_number=table.phone_numbers[i],
+            first_name=table.first_names[i],
+            last_name=table.last_names[i],
+            identifier=table.identifiers[i],
+            preferred_language=table.preferred_languages[i],
+            created_at=None,
+            updated_at=None,
+        )
+
+    @property
+    def agent(self) -> Agent:
+        table, i = self._table, self._index
+        return Agent.model_construct(
+            id=table.agent_ids[i],
+            user_id=table.user_ids[i],
+            created_at=None,
+            updated_at=None,
+            user=self.user,
+        )
+
+    def to_agent_location(self) -> AgentLocation:
+        """Full ``AgentLocation`` model for this row."""
+        return AgentLocation(
+            id=self.id,
+            agent_id=self.agent_id,
+            latitude=self.latitude,
+            longitude=self.longitude,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            agent=self.agent,
+        )
+
+
+class AgentLocationTable:
+    """
+    Agent locations stored column by column.
+
+    Columns are parallel: index ``i`` of every column describes the same
+    agent. ``updated_at``/``created_at`` hold the raw ``timestamptz``
+    strings from Hasura.
+    """
+
+    __slots__ = (
+        "location_ids",
+        "agent_ids",
+        "latitudes",
+        "longitudes",
+        "created_at",
+        "updated_at",
+        "user_ids",
+        "emails",
+        "phone_numbers",
+        "first_names",
+        "last_names",
+        "identifiers",
+        "preferred_languages",
+        "_positions",
+    )
+
+    def __init__(self) -> None:
+        self.location_ids: List[str] = []
+        self.agent_ids: List[str] = []
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.created_at: List[Optional[str]] = []
+        self.updated_at: List[Optional[str]] = []
+        self.user_ids: List[Optional[str]] = []
+        self.emails: List[Optional[str]] = []
+        self.phone_numbers: List[Optional[str]] = []
+        self.first_names: List[Optional[str]] = []
+        self.last_names: List[Optional[str]] = []
+        self.identifiers: List[Optional[str]] = []
+        self.preferred_languages: List[Optional[str]] = []
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "AgentLocationTable":
+        """Build a table from ``AgentLocationFields`` rows as returned by Hasura."""
+        table = cls()
+        for row in rows:
+            table.append(row)
+        return table
+
+    def append(self, row: dict) -> None:
+        agent = row.get("agent") or {}
+        user = agent.get("user") or {}
+        self.location_ids.append(row.get("id", ""))
+        self.agent_ids.append(row["agent_id"])
+        self.latitudes.append(float(row["latitude"]))
+        self.longitudes.append(float(row["longitude"]))
+        self.created_at.append(row.get("created_at"))
+        self.updated_at.append(row.get("updated_at"))
+        self.user_ids.append(user.get("id", agent.get("user_id")))
+        self.emails.append(user.get("email"))
+        self.phone_numbers.append(user.get("phone_number"))
+        self.first_names.append(user.get("first_name"))
+        self.last_names.append(user.get("last_name"))
+        self.identifiers.append(user.get("identifier"))
+        self.preferred_languages.append(user.get("preferred_language"))
+        self._positions = None
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def __getitem__(self, index: int) -> AgentLocationRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("AgentLocationTable index out of range")
+        return AgentLocationRow(self, index)
+
+    def __iter__(self) -> Iterator[AgentLocationRow]:
+        for index in range(len(self)):
+            yield AgentLocationRow(self, index)
+
+    def index_of(self, agent_id: str) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {agent_id: i for i, agent_id in enumerate(self.agent_ids)}
+        return self._positions.get(agent_id)
+
+    def row_for(self, agent_id: str) -> Optional[AgentLocationRow]:
+        index = self.index_of(agent_id)
+        return AgentLocationRow(self, index) if index is not None else None
+
+    def coordinates(self) -> Tuple[Sequence[float], Sequence[float]]:
+        """Latitude and longitude columns (NumPy views when NumPy is installed)."""
+        if distance.np is not None:
+            return (
+                distance.np.frombuffer(self.latitudes, dtype="float64"),
+                distance.np.frombuffer(self.longitudes, dtype="float64"),
+            )
+        return self.latitudes, self.longitudes
+
+    def distances_to(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        dtype: str = "float64",
+    ):
+        """``haversine_matrix`` of every agent (rows) to every point (columns)."""
+        agent_lats, agent_lons = self.coordinates()
+        return distance.haversine_matrix(agent_lats, agent_lons, lats, lons, dtype=dtype)
+
+    def nearby_points(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        radius_km: float,
+    ) -> List[List[int]]:
+        """For each agent, the indices of the points within ``radius_km``."""
+        if not len(self) or not len(lats):
+            return [[] for _ in range(len(self))]
+        agent_lats, agent_lons = self.coordinates()
+        mask = distance.within_radius(agent_lats, agent_lons, lats, lons, radius_km)
+        return distance.nearby_indices(mask)
+
+    def nearby(
+        self, lat: float, lon: float, radius_km: float
+    ) -> List[Tuple[AgentLocationRow, float]]:
+        """Agents within ``radius_km`` of (lat, lon) with distances, nearest first."""
+        if not len(self):
+            return []
+        distances = self.distances_to([lat], [lon])
+        matches = [
+            (AgentLocationRow(self, index), float(row[0]))
+            for index, row in enumerate(distances)
+            if row[0] <= radius_km
+        ]
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+    def to_agent_locations(self) -> List[AgentLocation]:
+        """Full ``AgentLocation`` models for every row."""
+        return [row.to_agent_location() for row in self]
@@ -0,0 +1,108 @@
+"""
+Asyncio front-end for the Hasura client.
+
+``AsyncHasuraClient`` exposes awaitable ``execute``/``batch`` so Lambdas can
+overlap independent Hasura calls with ``asyncio.gather``. Requests are
+dispatched on a small thread pool over the same pooled keep-alive session
+the synchronous client uses (see ``transport``), so both clients share
+connections and transport statistics and no extra HTTP dependency is
+needed in the Lambda layer. The pool is sized to the transport's
+per-host connection limit, so concurrent requests never open connections
+that the pool would then have to discard.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+import asyncio
+import os
+import threading
+
+from .base import HasuraClient, HasuraClientConfig, Operation
+from .transport import get_transport_config
+
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 8
+
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_size = 0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared I/O executor, resizing it if the transport pool changed."""
+    global _executor, _executor_size
+    size = get_transport_config().pool_size
+    if _executor is None or _executor_size != size:
+        with _executor_lock:
+            if _executor is None or _executor_size != size:
+                old_executor = _executor
+                _executor = ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix="hasura-io"
+                )
+                _executor_size = size
+                if old_executor is not None:
+                    old_executor.shutdown(wait=False)
+    return _executor
+
+
+class AsyncHasuraClient:
+    def __init__(self, config: HasuraClientConfig) -> None:
+        self._sync = HasuraClient(config)
+
+    @classmethod
+    def from_env(cls) -> "AsyncHasuraClient":
+        endpoint = os.environ.get("GRAPHQL_ENDPOINT", "")
+        admin_secret = os.environ.get("HASURA_GRAPHQL_ADMIN_SECRET", "")
+        return cls(HasuraClientConfig(endpoint=endpoint, admin_secret=admin_secret))
+
+    async def _run(self, func, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args))
+
+    async def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return await self._run(self._sync.execute, query, variables, timeout)
+
+    async def batch(
+        self,
+        operations: Sequence[Operation],
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._run(self._sync.batch, operations, timeout)
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Await ``awaitables`` with at most ``limit`` in flight at once.
+
+    Results are returned in input order, like ``asyncio.gather``. With
+    ``return_exceptions=True`` failures are returned in place instead of
+    cancelling the remaining work.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(_bounded(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions,
+    )
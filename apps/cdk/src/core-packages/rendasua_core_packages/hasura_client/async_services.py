@@ -0,0 +1,264 @@
+"""
+Async counterparts of the order, account, location and notification services.
+
+Each function mirrors the synchronous version of the same name (without the
+``_async`` suffix): same arguments, same return values and the same
+error handling. Query strings and response parsing are imported from the
+synchronous modules so the two variants cannot drift apart.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from rendasua_core_packages.models import Account, AgentLocation, OrderAgentNotification
+from rendasua_core_packages.models import fast as fast_models
+from .async_client import AsyncHasuraClient
+from .base import HasuraClientConfig
+from .logging import log_info, log_error
+from .accounts_service import (
+    LEGACY_ACCOUNT_QUERY,
+    CREATE_LEGACY_ACCOUNT_MUTATION,
+    LOCATION_ACCOUNT_QUERY,
+    CREATE_LOCATION_ACCOUNT_MUTATION,
+    _account_from_data,
+)
+from .location_service import AGENT_LOCATIONS_QUERY, _agent_locations_from_data
+from .orders_service import (
+    ORDER_FOR_NOTIFICATION_QUERY,
+    PLATFORM_ORDER_LIFECYCLE_COUNTS_QUERY,
+    CREATE_PENDING_AGENT_NOTIFICATION_MUTATION,
+    PENDING_AGENT_NOTIFICATIONS_QUERY,
+    UPDATE_NOTIFICATION_STATUS_MUTATION,
+    _format_order_notification_data,
+    _lifecycle_counts_from_data,
+    _notification_status_variables,
+    _notifications_from_data,
+)
+
+
+def _client(hasura_endpoint: str, hasura_admin_secret: str) -> AsyncHasuraClient:
+    return AsyncHasuraClient(
+        HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Orders
+# ---------------------------------------------------------------------------
+
+
+async def get_order_details_for_notification_async(
+    order_id: str,
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> Optional[Dict[str, Any]]:
+    """Async version of ``get_order_details_for_notification``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Fetching order details for notification", order_id=order_id)
+
+    try:
+        data = await client.execute(ORDER_FOR_NOTIFICATION_QUERY, {"orderId": order_id})
+        order_data = data.get("orders_by_pk")
+
+        if not order_data:
+            log_error("Order not found", order_id=order_id)
+            return None
+
+        notification_data = _format_order_notification_data(order_data)
+
+        log_info("Order details for notification fetched successfully", order_id=order_id)
+        return notification_data
+
+    except Exception as e:
+        log_error("Error fetching order details for notification", error=e, order_id=order_id)
+        return None
+
+
+async def get_platform_order_lifecycle_counts_async(
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+) -> Optional[Dict[str, int]]:
+    """Async version of ``get_platform_order_lifecycle_counts``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Fetching platform order lifecycle counts")
+    try:
+        data = await client.execute(PLATFORM_ORDER_LIFECYCLE_COUNTS_QUERY, {})
+        return _lifecycle_counts_from_data(data)
+    except Exception as e:
+        log_error("Error fetching platform order lifecycle counts", error=e)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Agent notifications
+# ---------------------------------------------------------------------------
+
+
+async def create_pending_agent_notification_async(
+    order_id: str,
+    notification_type: str,
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> Optional[str]:
+    """Async version of ``create_pending_agent_notification``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Creating pending agent notification", order_id=order_id, notification_type=notification_type)
+
+    try:
+        data = await client.execute(CREATE_PENDING_AGENT_NOTIFICATION_MUTATION, {
+            "orderId": order_id,
+            "notificationType": notification_type
+        })
+        notification_data = data.get("insert_order_agent_notifications_one")
+
+        if not notification_data:
+            log_info("Notification record already exists or was not created", order_id=order_id)
+            return None
+
+        notification_id = notification_data.get("id")
+        log_info("Pending agent notification created", order_id=order_id, notification_id=notification_id)
+        return notification_id
+
+    except Exception as e:
+        log_error("Error creating pending agent notification", error=e, order_id=order_id)
+        return None
+
+
+async def get_pending_agent_notifications_async(
+    notification_type: str,
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    fast: Optional[bool] = None
+) -> List[OrderAgentNotification]:
+    """Async version of ``get_pending_agent_notifications``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Fetching pending agent notifications", notification_type=notification_type)
+
+    try:
+        data = await client.execute(PENDING_AGENT_NOTIFICATIONS_QUERY, {"notificationType": notification_type})
+        notifications_data = data.get("order_agent_notifications", [])
+        log_info("Fetched pending notifications", count=len(notifications_data), notification_type=notification_type)
+
+        notifications = _notifications_from_data(
+            notifications_data,
+            fast_models.fast_models_enabled() if fast is None else fast,
+        )
+
+        log_info("Parsed notifications into objects", count=len(notifications), notification_type=notification_type)
+        return notifications
+
+    except Exception as e:
+        log_error("Error fetching pending agent notifications", error=e, notification_type=notification_type)
+        return []
+
+
+async def update_notification_status_async(
+    notification_id: str,
+    status: str,
+    error_message: Optional[str],
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> bool:
+    """Async version of ``update_notification_status``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Updating notification status", notification_id=notification_id, status=status)
+
+    try:
+        variables = _notification_status_variables(notification_id, status, error_message)
+        data = await client.execute(UPDATE_NOTIFICATION_STATUS_MUTATION, variables)
+        updated = data.get("update_order_agent_notifications_by_pk")
+
+        if not updated:
+            log_error("Notification not found for update", notification_id=notification_id)
+            return False
+
+        log_info("Notification status updated", notification_id=notification_id, status=status)
+        return True
+
+    except Exception as e:
+        log_error("Error updating notification status", error=e, notification_id=notification_id)
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Accounts
+# ---------------------------------------------------------------------------
+
+
+async def get_account_by_user_and_currency_async(
+    user_id: str,
+    currency: str,
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    business_location_id: Optional[str] = None,
+) -> Optional[Account]:
+    """Async version of ``get_account_by_user_and_currency``; creates the account if missing."""
+    if business_location_id:
+        query = LOCATION_ACCOUNT_QUERY
+        mutation = CREATE_LOCATION_ACCOUNT_MUTATION
+        variables = {"userId": user_id, "currency": currency, "businessLocationId": business_location_id}
+    else:
+        query = LEGACY_ACCOUNT_QUERY
+        mutation = CREATE_LEGACY_ACCOUNT_MUTATION
+        variables = {"userId": user_id, "currency": currency}
+
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Fetching account", user_id=user_id, currency=currency)
+
+    try:
+        data = await client.execute(query, variables)
+        accounts_data = data.get("accounts", [])
+
+        if accounts_data:
+            account = _account_from_data(accounts_data[0])
+            log_info("Account found", user_id=user_id, account_id=account.id)
+            return account
+
+        log_info("Account not found, creating new one", user_id=user_id, currency=currency)
+        create_data = await client.execute(mutation, variables)
+        account_data = create_data.get("insert_accounts_one")
+
+        if not account_data:
+            log_error("Failed to create account", user_id=user_id)
+            return None
+
+        account = _account_from_data(account_data)
+        log_info("Account created successfully", user_id=user_id, account_id=account.id)
+        return account
+
+    except Exception as e:
+        log_error("Error with account", error=e, user_id=user_id)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Locations
+# ---------------------------------------------------------------------------
+
+
+async def get_all_agent_locations_async(
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    fast: Optional[bool] = None
+) -> List[AgentLocation]:
+    """Async version of ``get_all_agent_locations``."""
+    client = _client(hasura_endpoint, hasura_admin_secret)
+    log_info("Fetching all agent locations from Hasura")
+
+    try:
+        data = await client.execute(AGENT_LOCATIONS_QUERY, {})
+        agent_locations_data = data.get("agent_locations", [])
+
+        log_info("Agent locations fetched from Hasura", count=len(agent_locations_data))
+
+        agent_locations = _agent_locations_from_data(
+            agent_locations_data,
+            fast_models.fast_models_enabled() if fast is None else fast,
+        )
+
+        log_info("Agent locations parsed successfully", count=len(agent_locations))
+
+        return agent_locations
+
+    except Exception as e:
+        log_error("Error fetching agent locations", error=e)
+        return []
@@ -4,21 +4,36 @@ Lightweight Hasura GraphQL client used by Lambda functions.
 The client is intentionally minimal: it knows how to execute parametrised
 queries and mutations with the correct admin secret and exposes a small
 set of helpers that higher-level domain services can build on.
+
+All clients share the pooled session from ``transport``, so constructing
+a new ``HasuraClient`` per call is cheap and does not open a new
+connection. Query text is taken from ``query_registry`` (compact form, or
+a persisted-query hash when enabled).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import os
+
 import requests
 
+from . import query_registry
+from .transport import post_json
+
 
 @dataclass
 class HasuraClientConfig:
     endpoint: str
     admin_secret: str
+    # Per-request timeout in seconds; None uses the transport default.
+    timeout: Optional[float] = None
+
+
+# A single GraphQL operation: (query, variables)
+Operation = Tuple[str, Optional[Dict[str, Any]]]
 
 
 class HasuraClient:
@@ -31,26 +46,102 @@ class HasuraClient:
         admin_secret = os.environ.get("HASURA_GRAPHQL_ADMIN_SECRET", "")
         return cls(HasuraClientConfig(endpoint=endpoint, admin_secret=admin_secret))
 
-    def execute(
-        self,
-        query: str,
-        variables: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        payload = {"query": query, "variables": variables or {}}
-        headers = {
+    def _headers(self) -> Dict[str, str]:
+        return {
             "Content-Type": "application/json",
             "x-hasura-admin-secret": self._config.admin_secret,
         }
-        response = requests.post(
+
+    def _post(self, payload: Any, timeout: Optional[float]) -> Any:
+        response = post_json(
             self._config.endpoint,
-            json=payload,
-            headers=headers,
-            timeout=10,
+            payload,
+            headers=self._headers(),
+            timeout=timeout if timeout is not None else self._config.timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        return response.json()
+
+    def _send(
+        self,
+        operations: Sequence[Operation],
+        timeout: Optional[float],
+        as_batch: bool,
+    ) -> Any:
+        """
+        POST operations using registered (compact) query text.
+
+        In persisted-query mode only hash references are sent first; if the
+        server rejects any of them the request is repeated once with the
+        full text.
+        """
+        persisted = query_registry.persisted_queries_active()
+        payloads = [
+            query_registry.build_request(query, variables, persisted=persisted)
+            for query, variables in operations
+        ]
+        if not persisted:
+            return self._post(payloads if as_batch else payloads[0], timeout)
+
+        try:
+            data = self._post(payloads if as_batch else payloads[0], timeout)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is None or status >= 500:
+                raise
+            data, rejection = None, query_registry.REJECTED_UNSUPPORTED
+        else:
+            responses = data if isinstance(data, list) else [data]
+            rejections = [
+                query_registry.persisted_query_rejection(response)
+                for response in responses
+            ]
+            rejection = next((r for r in rejections if r), None)
+
+        query_registry.record_persisted_result(rejection)
+        if rejection is None:
+            return data
+
+        payloads = [
+            query_registry.build_request(query, variables, include_hash=True)
+            for query, variables in operations
+        ]
+        return self._post(payloads if as_batch else payloads[0], timeout)
+
+    def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        data = self._send([(query, variables)], timeout, as_batch=False)
         if "errors" in data:
             raise RuntimeError(f"Hasura error: {data['errors']}")
         return data.get("data", {})
 
+    def batch(
+        self,
+        operations: Sequence[Operation],
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several independent operations in a single HTTP round trip.
 
+        Uses Hasura's batched request format (a JSON array of operation
+        objects). Results are returned in the same
+        order as ``operations``; like ``execute``, any operation error
+        raises ``RuntimeError``.
+        """
+        if not operations:
+            return []
+        results = self._send(operations, timeout, as_batch=True)
+        if not isinstance(results, list) or len(results) != len(operations):
+            raise RuntimeError(f"Unexpected Hasura batch response: {results}")
+        errors = {
+            index: result["errors"]
+            for index, result in enumerate(results)
+            if "errors" in result
+        }
+        if errors:
+            raise RuntimeError(f"Hasura error in batch operations {errors}")
+        return [result.get("data", {}) for result in results]
@@ -5,15 +5,17 @@ This module provides functions for fetching commission-related data from Hasura,
 including commission configurations, partners, HQ user, and commission orders.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 import datetime
 from rendasua_core_packages.models import Partner, User, Order, CommissionPayout, Agent, Business
 from rendasua_core_packages.utilities import parse_datetime
 from .base import HasuraClient
 from .logging import log_info, log_error
+from .reference_data import get_reference_data_cache
 from rendasua_core_packages.commission_handler.types import (
     CommissionConfig,
     CommissionOrder as CommissionOrderType,
+    CommissionLeg,
     AssignedAgent,
 )
 from rendasua_core_packages.commission_handler.business_account_type import (
@@ -21,6 +23,228 @@ from rendasua_core_packages.commission_handler.business_account_type import (
 )
 
 
+DELIVERY_COMMISSION_CONFIG_KEYS = (
+    "unverified_agent_base_delivery_commission",
+    "verified_agent_base_delivery_commission",
+    "unverified_agent_per_km_delivery_commission",
+    "verified_agent_per_km_delivery_commission",
+)
+
+DELIVERY_COMMISSION_CONFIGS_QUERY = """
+query GetDeliveryCommissionConfigs {
+  application_configurations(
+    where: {
+      config_key: { _in: [
+        "unverified_agent_base_delivery_commission",
+        "verified_agent_base_delivery_commission",
+        "unverified_agent_per_km_delivery_commission",
+        "verified_agent_per_km_delivery_commission"
+      ]}
+    }
+  ) {
+    config_key
+    number_value
+  }
+}
+"""
+
+BUSINESS_LOCATION_ACCOUNT_TYPE_QUERY = """
+query GetBusinessLocationAccountType($id: uuid!) {
+  business_locations_by_pk(id: $id) {
+    business {
+      id
+      account_type
+      business_locations(
+        where: { is_active: { _eq: true } }
+        order_by: { is_primary: desc }
+      ) {
+        address { country }
+      }
+      business_addresses {
+        address { country }
+      }
+    }
+  }
+}
+"""
+
+ACTIVE_PARTNERS_QUERY = """
+query GetActivePartners {
+  partners(where: { is_active: { _eq: true } }) {
+    id
+    user_id
+    company_name
+    base_delivery_fee_commission
+    per_km_delivery_fee_commission
+    item_commission
+    is_active
+    created_at
+    updated_at
+  }
+}
+"""
+
+RENDASUA_HQ_USER_QUERY = """
+query GetRendasuaHQUser {
+  users(where: { email: { _eq: "hq@rendasua.com" } }) {
+    id
+    user_type_id
+    identifier
+    first_name
+    last_name
+    email
+    phone_number
+    created_at
+    updated_at
+  }
+}
+"""
+
+
+POSTED_COMMISSION_PAYOUTS_QUERY = """
+query GetPostedCommissionPayouts($orderId: uuid!) {
+  commission_payouts(where: { order_id: { _eq: $orderId } }) {
+    id
+    account_transaction_id
+  }
+}
+"""
+
+COMMISSION_ACCOUNTS_QUERY = """
+query GetCommissionAccounts($where: accounts_bool_exp!) {
+  accounts(where: $where) {
+    id
+    user_id
+    business_location_id
+  }
+}
+"""
+
+CREATE_COMMISSION_ACCOUNTS_MUTATION = """
+mutation CreateCommissionAccounts($objects: [accounts_insert_input!]!) {
+  insert_accounts(objects: $objects) {
+    returning {
+      id
+      user_id
+      business_location_id
+    }
+  }
+}
+"""
+
+POST_COMMISSION_PAYOUTS_MUTATION = """
+mutation PostCommissionPayouts(
+  $updates: [accounts_updates!]!,
+  $payouts: [commission_payouts_insert_input!]!
+) {
+  update_accounts_many(updates: $updates) {
+    affected_rows
+  }
+  insert_commission_payouts(objects: $payouts) {
+    returning {
+      id
+      account_transaction_id
+    }
+  }
+}
+"""
+
+# (user_id, business_location_id or None for the legacy account)
+AccountKey = Tuple[str, Optional[str]]
+
+
+def _default_commission_config() -> CommissionConfig:
+    return CommissionConfig(
+        rendasua_item_commission_percentage=get_commission_for_business_account_type(),
+        unverified_agent_base_delivery_commission=50.0,
+        verified_agent_base_delivery_commission=0.0,
+        unverified_agent_per_km_delivery_commission=80.0,
+        verified_agent_per_km_delivery_commission=20.0,
+    )
+
+
+def _item_commission_from_location_data(loc_data: dict) -> float:
+    """Resolve item commission from business account type + business primary country."""
+    business = (loc_data.get("business_locations_by_pk") or {}).get(
+        "business"
+    ) or {}
+    account_type = business.get("account_type")
+    country_code = None
+    for loc in business.get("business_locations") or []:
+        country = (loc.get("address") or {}).get("country")
+        if country:
+            country_code = country
+            break
+    if not country_code:
+        for row in business.get("business_addresses") or []:
+            country = (row.get("address") or {}).get("country")
+            if country:
+                country_code = country
+                break
+    return get_commission_for_business_account_type(account_type, country_code)
+
+
+def _commission_config_from_data(
+    data: dict,
+    rendasua_item_commission_percentage: float,
+) -> CommissionConfig:
+    config_map = {}
+    for config in data.get("application_configurations", []):
+        config_map[config["config_key"]] = config["number_value"]
+
+    return CommissionConfig(
+        rendasua_item_commission_percentage=rendasua_item_commission_percentage,
+        unverified_agent_base_delivery_commission=config_map.get(
+            "unverified_agent_base_delivery_commission", 50.0
+        ),
+        verified_agent_base_delivery_commission=config_map.get(
+            "verified_agent_base_delivery_commission", 0.0
+        ),
+        unverified_agent_per_km_delivery_commission=config_map.get(
+            "unverified_agent_per_km_delivery_commission", 80.0
+        ),
+        verified_agent_per_km_delivery_commission=config_map.get(
+            "verified_agent_per_km_delivery_commission", 20.0
+        ),
+    )
+
+
+def _partners_from_data(data: dict) -> List[Partner]:
+    partners = []
+    for partner_data in data.get("partners", []):
+        partner = Partner(
+            id=partner_data["id"],
+            user_id=partner_data["user_id"],
+            company_name=partner_data["company_name"],
+            base_delivery_fee_commission=float(partner_data["base_delivery_fee_commission"]),
+            per_km_delivery_fee_commission=float(partner_data["per_km_delivery_fee_commission"]),
+            item_commission=float(partner_data["item_commission"]),
+            is_active=partner_data.get("is_active", True),
+            created_at=parse_datetime(partner_data.get("created_at")),
+            updated_at=parse_datetime(partner_data.get("updated_at")),
+        )
+        partners.append(partner)
+    return partners
+
+
+def _hq_user_from_data(data: dict) -> Optional[User]:
+    users_data = data.get("users", [])
+    if not users_data:
+        return None
+    user_data = users_data[0]
+    return User(
+        id=user_data["id"],
+        user_type_id=user_data.get("user_type_id"),
+        identifier=user_data["identifier"],
+        first_name=user_data["first_name"],
+        last_name=user_data["last_name"],
+        email=user_data["email"],
+        phone_number=user_data.get("phone_number"),
+        created_at=parse_datetime(user_data.get("created_at")),
+        updated_at=parse_datetime(user_data.get("updated_at")),
+    )
+
+
 def get_commission_configs(
     client: HasuraClient,
     business_location_id: Optional[str] = None,
@@ -39,104 +263,28 @@ def get_commission_configs(
     Returns:
         CommissionConfig with values from database or defaults
     """
-    query = """
-    query GetDeliveryCommissionConfigs {
-      application_configurations(
-        where: {
-          config_key: { _in: [
-            "unverified_agent_base_delivery_commission",
-            "verified_agent_base_delivery_commission",
-            "unverified_agent_per_km_delivery_commission",
-            "verified_agent_per_km_delivery_commission"
-          ]}
-        }
-      ) {
-        config_key
-        number_value
-      }
-    }
-    """
-
     log_info("Fetching commission configurations")
 
     try:
-        data = client.execute(query)
-        configs_data = data.get("application_configurations", [])
-
-        config_map = {}
-        for config in configs_data:
-            config_map[config["config_key"]] = config["number_value"]
+        data = client.execute(DELIVERY_COMMISSION_CONFIGS_QUERY)
 
         # Resolve item commission from business account type + business primary country
         # (aligned with account-type API / Nest commissions.service)
         rendasua_item_commission_percentage = get_commission_for_business_account_type()
 
         if business_location_id:
-            loc_query = """
-            query GetBusinessLocationAccountType($id: uuid!) {
-              business_locations_by_pk(id: $id) {
-                business {
-                  id
-                  account_type
-                  business_locations(
-                    where: { is_active: { _eq: true } }
-                    order_by: { is_primary: desc }
-                  ) {
-                    address { country }
-                  }
-                  business_addresses {
-                    address { country }
-                  }
-                }
-              }
-            }
-            """
-            loc_data = client.execute(loc_query, {"id": business_location_id})
-            business = (loc_data.get("business_locations_by_pk") or {}).get(
-                "business"
-            ) or {}
-            account_type = business.get("account_type")
-            country_code = None
-            for loc in business.get("business_locations") or []:
-                country = (loc.get("address") or {}).get("country")
-                if country:
-                    country_code = country
-                    break
-            if not country_code:
-                for row in business.get("business_addresses") or []:
-                    country = (row.get("address") or {}).get("country")
-                    if country:
-                        country_code = country
-                        break
-            rendasua_item_commission_percentage = (
-                get_commission_for_business_account_type(account_type, country_code)
+            loc_data = client.execute(
+                BUSINESS_LOCATION_ACCOUNT_TYPE_QUERY, {"id": business_location_id}
+            )
+            rendasua_item_commission_percentage = _item_commission_from_location_data(
+                loc_data
             )
 
-        return CommissionConfig(
-            rendasua_item_commission_percentage=rendasua_item_commission_percentage,
-            unverified_agent_base_delivery_commission=config_map.get(
-                "unverified_agent_base_delivery_commission", 50.0
-            ),
-            verified_agent_base_delivery_commission=config_map.get(
-                "verified_agent_base_delivery_commission", 0.0
-            ),
-            unverified_agent_per_km_delivery_commission=config_map.get(
-                "unverified_agent_per_km_delivery_commission", 80.0
-            ),
-            verified_agent_per_km_delivery_commission=config_map.get(
-                "verified_agent_per_km_delivery_commission", 20.0
-            ),
-        )
+        return _commission_config_from_data(data, rendasua_item_commission_percentage)
 
     except Exception as e:
         log_error("Error fetching commission configs", error=e)
-        return CommissionConfig(
-            rendasua_item_commission_percentage=get_commission_for_business_account_type(),
-            unverified_agent_base_delivery_commission=50.0,
-            verified_agent_base_delivery_commission=0.0,
-            unverified_agent_per_km_delivery_commission=80.0,
-            verified_agent_per_km_delivery_commission=20.0,
-        )
+        return _default_commission_config()
 
 
 def get_active_partners(client: HasuraClient) -> List[Partner]:
@@ -149,42 +297,11 @@ def get_active_partners(client: HasuraClient) -> List[Partner]:
     Returns:
         List of active Partner objects
     """
-    query = """
-    query GetActivePartners {
-      partners(where: { is_active: { _eq: true } }) {
-        id
-        user_id
-        company_name
-        base_delivery_fee_commission
-        per_km_delivery_fee_commission
-        item_commission
-        is_active
-        created_at
-        updated_at
-      }
-    }
-    """
-    
     log_info("Fetching active partners")
     
     try:
-        data = client.execute(query)
-        partners_data = data.get("partners", [])
-        
-        partners = []
-        for partner_data in partners_data:
-            partner = Partner(
-                id=partner_data["id"],
-                user_id=partner_data["user_id"],
-                company_name=partner_data["company_name"],
-                base_delivery_fee_commission=float(partner_data["base_delivery_fee_commission"]),
-                per_km_delivery_fee_commission=float(partner_data["per_km_delivery_fee_commission"]),
-                item_commission=float(partner_data["item_commission"]),
-                is_active=partner_data.get("is_active", True),
-                created_at=parse_datetime(partner_data.get("created_at")),
-                updated_at=parse_datetime(partner_data.get("updated_at")),
-            )
-            partners.append(partner)
+        data = client.execute(ACTIVE_PARTNERS_QUERY)
+        partners = _partners_from_data(data)
         
         log_info("Active partners fetched", count=len(partners))
         return partners
@@ -204,45 +321,16 @@ def get_rendasua_hq_user(client: HasuraClient) -> Optional[User]:
     Returns:
         User if found, None otherwise
     """
-    query = """
-    query GetRendasuaHQUser {
-      users(where: { email: { _eq: "hq@rendasua.com" } }) {
-        id
-        user_type_id
-        identifier
-        first_name
-        last_name
-        email
-        phone_number
-        created_at
-        updated_at
-      }
-    }
-    """
-    
     log_info("Fetching RendaSua HQ user")
     
     try:
-        data = client.execute(query)
-        users_data = data.get("users", [])
+        data = client.execute(RENDASUA_HQ_USER_QUERY)
+        hq_user = _hq_user_from_data(data)
         
-        if not users_data:
+        if not hq_user:
             log_error("RendaSua HQ user not found")
             return None
         
-        user_data = users_data[0]
-        hq_user = User(
-            id=user_data["id"],
-            user_type_id=user_data.get("user_type_id"),
-            identifier=user_data["identifier"],
-            first_name=user_data["first_name"],
-            last_name=user_data["last_name"],
-            email=user_data["email"],
-            phone_number=user_data.get("phone_number"),
-            created_at=parse_datetime(user_data.get("created_at")),
-            updated_at=parse_datetime(user_data.get("updated_at")),
-        )
-        
         log_info("RendaSua HQ user fetched", user_id=hq_user.id)
         return hq_user
         
@@ -251,6 +339,107 @@ def get_rendasua_hq_user(client: HasuraClient) -> Optional[User]:
         return None
 
 
+def get_commission_reference_data(
+    client: HasuraClient,
+    business_location_id: Optional[str] = None,
+) -> Tuple[CommissionConfig, List[Partner], Optional[User]]:
+    """
+    Fetch commission configs, active partners and the HQ user in one round trip.
+
+    Configs, partners and the HQ user come from the container's
+    reference-data snapshot (see ``reference_data``); only the business
+    location's account type is queried per call. Without a snapshot they
+    are fetched as below.
+
+    The lookups are independent, so they are sent as a single Hasura batch
+    request. If the batch fails, each lookup is retried on its own, and a
+    lookup whose rows cannot be parsed gets its default, so the per-lookup
+    defaults of the individual functions still apply.
+
+    Args:
+        client: HasuraClient instance
+        business_location_id: Optional business location ID for item commission
+
+    Returns:
+        (CommissionConfig, active partners, HQ user or None)
+    """
+    reference_data = get_reference_data_cache().get(client)
+    if reference_data is not None:
+        rendasua_item_commission_percentage = get_commission_for_business_account_type()
+        if business_location_id:
+            try:
+                rendasua_item_commission_percentage = _item_commission_from_location_data(
+                    client.execute(BUSINESS_LOCATION_ACCOUNT_TYPE_QUERY, {"id": business_location_id})
+                )
+            except Exception as e:
+                log_error("Error fetching business account type, using default item commission", error=e)
+        config = _commission_config_from_data(
+            {"application_configurations": [
+                row for key in DELIVERY_COMMISSION_CONFIG_KEYS
+                for row in reference_data.configuration_rows(key)
+            ]},
+            rendasua_item_commission_percentage,
+        )
+        log_info(
+            "Commission reference data served from cache",
+            version=reference_data.version,
+            partners=len(reference_data.partners),
+            hq_user_found=reference_data.hq_user is not None,
+        )
+        return config, list(reference_data.partners), reference_data.hq_user
+
+    log_info("Fetching commission reference data (batched)")
+
+    operations = [
+        (DELIVERY_COMMISSION_CONFIGS_QUERY, None),
+        (ACTIVE_PARTNERS_QUERY, None),
+        (RENDASUA_HQ_USER_QUERY, None),
+    ]
+    if business_location_id:
+        operations.append(
+            (BUSINESS_LOCATION_ACCOUNT_TYPE_QUERY, {"id": business_location_id})
+        )
+
+    try:
+        results = client.batch(operations)
+    except Exception as e:
+        log_error("Batched commission reference fetch failed, falling back", error=e)
+        return (
+            get_commission_configs(client, business_location_id),
+            get_active_partners(client),
+            get_rendasua_hq_user(client),
+        )
+
+    # Malformed rows fall back to the same defaults as the individual lookups
+    try:
+        rendasua_item_commission_percentage = get_commission_for_business_account_type()
+        if business_location_id:
+            rendasua_item_commission_percentage = _item_commission_from_location_data(
+                results[3]
+            )
+        config = _commission_config_from_data(results[0], rendasua_item_commission_percentage)
+    except Exception as e:
+        log_error("Error parsing commission configs", error=e)
+        config = _default_commission_config()
+    try:
+        partners = _partners_from_data(results[1])
+    except Exception as e:
+        log_error("Error parsing partners", error=e)
+        partners = []
+    try:
+        hq_user = _hq_user_from_data(results[2])
+    except Exception as e:
+        log_error("Error parsing HQ user", error=e)
+        hq_user = None
+
+    log_info(
+        "Commission reference data fetched",
+        partners=len(partners),
+        hq_user_found=hq_user is not None,
+    )
+    return config, partners, hq_user
+
+
 def get_commission_order(client: HasuraClient, order_id: str) -> Optional[CommissionOrderType]:
     """
     Fetch order with all commission-related fields.
@@ -438,3 +627,156 @@ def audit_commission_payout(
         log_error("Error auditing commission payout", error=e, order_id=order_id)
         return None
 
+
+def resolve_commission_accounts(
+    client: HasuraClient,
+    currency: str,
+    keys: Sequence[AccountKey],
+) -> Optional[Dict[AccountKey, str]]:
+    """
+    Account IDs for every (user_id, business_location_id) key, creating missing ones.
+
+    One query finds the existing active accounts (legacy accounts have no
+    business_location_id); the missing ones are created with one insert.
+
+    Returns:
+        Mapping of key to account ID, None if error
+    """
+    wanted = list(dict.fromkeys(keys))
+    if not wanted:
+        return {}
+
+    scopes: List[Dict[str, Any]] = [{
+        "business_location_id": {"_is_null": True},
+        "user_id": {"_in": sorted({user_id for user_id, location_id in wanted if not location_id})},
+    }]
+    for location_id in sorted({location_id for _, location_id in wanted if location_id}):
+        scopes.append({
+            "business_location_id": {"_eq": location_id},
+            "user_id": {"_in": sorted({user_id for user_id, key_location in wanted if key_location == location_id})},
+        })
+    where = {"currency": {"_eq": currency}, "is_active": {"_eq": True}, "_or": scopes}
+
+    log_info("Resolving commission accounts", currency=currency, accounts=len(wanted))
+    try:
+        data = client.execute(COMMISSION_ACCOUNTS_QUERY, {"where": where})
+        account_ids: Dict[AccountKey, str] = {}
+        for row in data.get("accounts", []):
+            account_ids.setdefault((row["user_id"], row.get("business_location_id")), row["id"])
+
+        missing = [key for key in wanted if key not in account_ids]
+        if missing:
+            log_info("Creating missing commission accounts", count=len(missing))
+            objects = []
+            for user_id, location_id in missing:
+                account = {
+                    "user_id": user_id,
+                    "currency": currency,
+                    "available_balance": 0,
+                    "withheld_balance": 0,
+                    "is_active": True,
+                }
+                if location_id:
+                    account["business_location_id"] = location_id
+                objects.append(account)
+            created = client.execute(CREATE_COMMISSION_ACCOUNTS_MUTATION, {"objects": objects})
+            for row in (created.get("insert_accounts") or {}).get("returning", []):
+                account_ids[(row["user_id"], row.get("business_location_id"))] = row["id"]
+
+        unresolved = [key for key in wanted if key not in account_ids]
+        if unresolved:
+            log_error("Failed to resolve commission accounts", unresolved=unresolved)
+            return None
+        return account_ids
+
+    except Exception as e:
+        log_error("Error resolving commission accounts", error=e, currency=currency)
+        return None
+
+
+def post_commission_payouts(
+    client: HasuraClient,
+    order_id: str,
+    order_number: str,
+    currency: str,
+    legs: Sequence[CommissionLeg],
+    account_ids: Dict[AccountKey, str],
+) -> Optional[List[str]]:
+    """
+    Pay every commission leg in one mutation.
+
+    Each leg becomes a balance ``_inc`` on its account and a
+    commission_payouts row whose account transaction is created through the
+    ``account_transaction`` relationship, so payouts, transactions and
+    balances commit together (or not at all).
+
+    Returns:
+        Account transaction IDs in leg order, None if error
+    """
+    if not legs:
+        return []
+
+    updates = []
+    payouts = []
+    for leg in legs:
+        account_id = account_ids[(leg.recipient_user_id, leg.business_location_id)]
+        updates.append({
+            "where": {"id": {"_eq": account_id}},
+            "_inc": {"available_balance": leg.amount, "withheld_balance": 0},
+            "_set": {"updated_at": "now()"},
+        })
+        payout = {
+            "order_id": order_id,
+            "recipient_user_id": leg.recipient_user_id,
+            "recipient_type": leg.recipient_type,
+            "commission_type": leg.commission_type,
+            "amount": leg.amount,
+            "currency": currency,
+            "account_transaction": {"data": {
+                "account_id": account_id,
+                "amount": leg.amount,
+                "transaction_type": "deposit",
+                "memo": f"Commission payment for order {order_number} ({leg.commission_type})",
+                "reference_id": order_id,
+            }},
+        }
+        if leg.commission_percentage is not None:
+            payout["commission_percentage"] = leg.commission_percentage
+        payouts.append(payout)
+
+    log_info("Posting commission payouts", order_id=order_id, legs=len(legs))
+    try:
+        data = client.execute(POST_COMMISSION_PAYOUTS_MUTATION, {"updates": updates, "payouts": payouts})
+    except Exception as e:
+        log_error("Error posting commission payouts", error=e, order_id=order_id)
+        return None
+
+    # The mutation has committed: report a mismatch but never fail (a retry would pay twice)
+    affected = [(row or {}).get("affected_rows", 0) for row in data.get("update_accounts_many") or []]
+    returning = (data.get("insert_commission_payouts") or {}).get("returning", [])
+    if len(returning) != len(legs) or affected.count(1) != len(legs):
+        log_error(
+            "Unexpected commission payout result",
+            order_id=order_id,
+            legs=len(legs),
+            payouts=len(returning),
+            updated_accounts=sum(affected),
+        )
+    transaction_ids = [row.get("account_transaction_id") for row in returning]
+    log_info("Commission payouts posted", order_id=order_id, legs=len(legs))
+    return transaction_ids
+
+
+def get_posted_commission_transaction_ids(client: HasuraClient, order_id: str) -> Optional[List[str]]:
+    """
+    Account transaction IDs of the commission payouts already posted for an order.
+
+    Returns:
+        The IDs (empty list if the order has no payouts yet), None if error
+    """
+    try:
+        data = client.execute(POSTED_COMMISSION_PAYOUTS_QUERY, {"orderId": order_id})
+    except Exception as e:
+        log_error("Error fetching posted commission payouts", error=e, order_id=order_id)
+        return None
+    return [row.get("account_transaction_id") for row in data.get("commission_payouts", [])]
@@ -2,6 +2,7 @@
 from typing import Optional
 from .base import HasuraClient, HasuraClientConfig
 from .logging import log_info, log_error
+from .reference_data import get_reference_data_cache
 
 
 def get_cancellation_fee_config(
@@ -11,6 +12,9 @@ def get_cancellation_fee_config(
 ) -> Optional[float]:
     """
     Get cancellation fee configuration for a country.
+
+    Served from the container's reference-data snapshot; queried directly
+    only when no snapshot can be loaded.
     
     Args:
         country_code: Country code (e.g., 'GA', 'CM')
@@ -37,6 +41,17 @@ def get_cancellation_fee_config(
     """
     
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    reference_data = get_reference_data_cache().get(client)
+    if reference_data is not None:
+        fee = reference_data.config_number("cancellation_fee", country_code)
+        log_info(
+            "Cancellation fee config resolved from reference data",
+            country_code=country_code,
+            fee=fee,
+            version=reference_data.version,
+        )
+        return fee
+
     log_info("Fetching cancellation fee config", country_code=country_code)
     
     try:
@@ -0,0 +1,364 @@
+"""
+Tiered geocoding cache.
+
+``GeocodeCache.geocode`` looks an address up in three tiers, keyed by
+``normalized_address_key``:
+
+1. an in-process LRU (survives warm Lambda invocations),
+2. the ``google_geocode_cache`` table in Hasura,
+3. the Google Geocoding API.
+
+``google_geocode_cache`` is keyed by coordinates (the backend uses it for
+reverse geocoding), so forward lookups tag rows with the address keys that
+resolved to them (``response_data.address_keys``) and query with
+``_contains``. Rows written here use the same ``response_data`` shape as
+the backend (formatted_address, city, state, country, postal_code).
+
+Negative results (Google ``ZERO_RESULTS``) are cached in-process only; the
+table requires coordinates. Transient failures (quota, network) are never
+cached.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import os
+import threading
+import time
+
+from rendasua_core_packages.models import Address, Coordinates
+from rendasua_core_packages.utilities import TokenBucket, normalized_address_key
+from rendasua_core_packages.utilities.address import format_full_address
+from rendasua_core_packages.utilities.geocoding import (
+    NOT_FOUND_STATUSES,
+    coordinates_from_result,
+    geocode_address_string,
+)
+from .base import HasuraClient, HasuraClientConfig
+from .logging import log_info, log_error
+
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 3600
+
+GEOCODE_CACHE_BY_ADDRESS_QUERY = """
+query GetGeocodeCacheByAddress($match: jsonb!) {
+  google_geocode_cache(
+    where: {
+      response_data: { _contains: $match }
+      expires_at: { _gt: "now()" }
+    }
+    limit: 1
+  ) {
+    id
+    latitude
+    longitude
+    expires_at
+  }
+}
+"""
+
+GEOCODE_CACHE_BY_COORDINATES_QUERY = """
+query GetGeocodeCacheByCoordinates($lat: numeric!, $lng: numeric!) {
+  google_geocode_cache(
+    where: { latitude: { _eq: $lat }, longitude: { _eq: $lng } }
+    limit: 1
+  ) {
+    id
+    response_data
+  }
+}
+"""
+
+INSERT_GEOCODE_CACHE_MUTATION = """
+mutation InsertGeocodeCache($object: google_geocode_cache_insert_input!) {
+  insert_google_geocode_cache_one(
+    object: $object
+    on_conflict: {
+      constraint: google_geocode_cache_latitude_longitude_key
+      update_columns: []
+    }
+  ) {
+    id
+  }
+}
+"""
+
+UPDATE_GEOCODE_CACHE_RESPONSE_MUTATION = """
+mutation UpdateGeocodeCacheResponse($id: uuid!, $responseData: jsonb!) {
+  update_google_geocode_cache_by_pk(
+    pk_columns: { id: $id }
+    _set: { response_data: $responseData }
+  ) {
+    id
+  }
+}
+"""
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _address_component(components: List[dict], types: List[str]) -> str:
+    for component in components:
+        if any(t in component.get("types", []) for t in types):
+            return component.get("long_name", "")
+    return ""
+
+
+def _response_data_from_result(result: Dict[str, Any], address_key: str) -> Dict[str, Any]:
+    """Backend-compatible ``response_data`` plus the forward-lookup key."""
+    components = result.get("address_components", [])
+    return {
+        "formatted_address": result.get("formatted_address", ""),
+        "city": _address_component(components, ["locality", "sublocality"]),
+        "state": _address_component(components, ["administrative_area_level_1"]),
+        "country": _address_component(components, ["country"]),
+        "postal_code": _address_component(components, ["postal_code"]),
+        "address_keys": [address_key],
+    }
+
+
+@dataclass
+class GeocodeCacheStats:
+    memory_hits: int = 0
+    negative_hits: int = 0
+    db_hits: int = 0
+    api_calls: int = 0
+    api_not_found: int = 0
+    api_errors: int = 0
+    db_errors: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.negative_hits + self.db_hits + self.api_calls
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.lookups
+        hits = self.memory_hits + self.negative_hits + self.db_hits
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "negative_hits": self.negative_hits,
+            "db_hits": self.db_hits,
+            "api_calls": self.api_calls,
+            "api_not_found": self.api_not_found,
+            "api_errors": self.api_errors,
+            "db_errors": self.db_errors,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_hit_ratio": round(self.memory_hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class GeocodeCache:
+    """
+    Address → coordinates cache in front of the Google Geocoding API.
+
+    Settings default from the environment: ``GEOCODE_CACHE_MAX_ENTRIES``
+    (2048), ``GEOCODE_CACHE_TTL_SECONDS`` (30 days, also used for rows
+    written to Hasura) and ``GEOCODE_CACHE_NEGATIVE_TTL_SECONDS`` (1 hour).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        negative_ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self.max_entries = int(
+            max_entries if max_entries is not None
+            else _env_number("GEOCODE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else _env_number("GEOCODE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        )
+        self.negative_ttl_seconds = (
+            negative_ttl_seconds if negative_ttl_seconds is not None
+            else _env_number("GEOCODE_CACHE_NEGATIVE_TTL_SECONDS", DEFAULT_NEGATIVE_TTL_SECONDS)
+        )
+        self.stats = GeocodeCacheStats()
+        self._lock = threading.Lock()
+        # key -> (coordinates or None for "not found", monotonic expiry)
+        self._entries: "OrderedDict[str, Tuple[Optional[Coordinates], float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_local(self, key: str) -> Tuple[bool, Optional[Coordinates]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            coordinates, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, coordinates
+
+    def _put_local(self, key: str, coordinates: Optional[Coordinates], ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (coordinates, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def geocode(
+        self,
+        address: Address,
+        google_maps_api_key: Optional[str],
+        hasura_endpoint: Optional[str] = None,
+        hasura_admin_secret: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Optional[Coordinates]:
+        """
+        Coordinates for ``address`` or None if it cannot be geocoded.
+
+        The Hasura tier is skipped when no endpoint is given; the Google tier
+        when no API key is given. ``rate_limiter`` only throttles Google
+        calls, cache hits are never delayed.
+        """
+        key = normalized_address_key(address)
+        if not key:
+            return None
+
+        found, coordinates = self._get_local(key)
+        if found:
+            if coordinates is None:
+                self.stats.negative_hits += 1
+            else:
+                self.stats.memory_hits += 1
+            return coordinates
+
+        client = None
+        if hasura_endpoint:
+            client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+            coordinates, remaining = self._lookup_db(client, key)
+            if coordinates is not None:
+                self.stats.db_hits += 1
+                self._put_local(key, coordinates, min(self.ttl_seconds, remaining))
+                return coordinates
+
+        if not google_maps_api_key:
+            log_error("Google Maps API key not found; geocoding skipped")
+            return None
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        self.stats.api_calls += 1
+        result, status = geocode_address_string(format_full_address(address), google_maps_api_key)
+        if result is None:
+            if status in NOT_FOUND_STATUSES:
+                self.stats.api_not_found += 1
+                self._put_local(key, None, self.negative_ttl_seconds)
+            else:
+                self.stats.api_errors += 1
+            return None
+
+        coordinates = coordinates_from_result(result)
+        self._put_local(key, coordinates, self.ttl_seconds)
+        if client is not None:
+            self._store_db(client, key, coordinates, result)
+        return coordinates
+
+    def _lookup_db(self, client: HasuraClient, key: str) -> Tuple[Optional[Coordinates], float]:
+        """(coordinates, seconds until the row expires) or (None, 0)."""
+        try:
+            data = client.execute(GEOCODE_CACHE_BY_ADDRESS_QUERY, {"match": {"address_keys": [key]}})
+        except Exception as e:
+            self.stats.db_errors += 1
+            log_error("Error reading geocode cache", error=e)
+            return None, 0.0
+        rows = data.get("google_geocode_cache", [])
+        if not rows:
+            return None, 0.0
+        row = rows[0]
+        remaining = self.ttl_seconds
+        try:
+            expires_at = datetime.fromisoformat(row["expires_at"].replace("Z", "+00:00"))
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        except (KeyError, TypeError, ValueError, AttributeError):
+            pass
+        return Coordinates(latitude=float(row["latitude"]), longitude=float(row["longitude"])), remaining
+
+    def _store_db(
+        self,
+        client: HasuraClient,
+        key: str,
+        coordinates: Coordinates,
+        result: Dict[str, Any],
+    ) -> None:
+        """Write the result to google_geocode_cache; failures only cost a future lookup."""
+        lat = round(coordinates.latitude, 8)
+        lng = round(coordinates.longitude, 8)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        try:
+            data = client.execute(INSERT_GEOCODE_CACHE_MUTATION, {
+                "object": {
+                    "latitude": lat,
+                    "longitude": lng,
+                    "response_data": _response_data_from_result(result, key),
+                    "expires_at": expires_at.isoformat(),
+                },
+            })
+            if data.get("insert_google_geocode_cache_one"):
+                return
+
+            # A row already exists for these coordinates (another address or
+            # a reverse lookup): add our key to it.
+            existing = client.execute(GEOCODE_CACHE_BY_COORDINATES_QUERY, {"lat": lat, "lng": lng})
+            rows = existing.get("google_geocode_cache", [])
+            if not rows:
+                return
+            response_data = dict(rows[0].get("response_data") or {})
+            keys = list(response_data.get("address_keys") or [])
+            if key in keys:
+                return
+            response_data["address_keys"] = keys + [key]
+            client.execute(UPDATE_GEOCODE_CACHE_RESPONSE_MUTATION, {
+                "id": rows[0]["id"],
+                "responseData": response_data,
+            })
+        except Exception as e:
+            self.stats.db_errors += 1
+            log_error("Error writing geocode cache", error=e)
+
+
+_cache: Optional[GeocodeCache] = None
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """Container-wide cache instance (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = GeocodeCache()
+    return _cache
+
+
+def geocode_address_cached(
+    address: Address,
+    google_maps_api_key: Optional[str],
+    hasura_endpoint: Optional[str] = None,
+    hasura_admin_secret: Optional[str] = None,
+) -> Optional[Coordinates]:
+    """``geocode_address`` behind the container-wide ``GeocodeCache``."""
+    cache = get_geocode_cache()
+    coordinates = cache.geocode(address, google_maps_api_key, hasura_endpoint, hasura_admin_secret)
+    log_info("Geocode cache", **cache.stats.as_dict())
+    return coordinates
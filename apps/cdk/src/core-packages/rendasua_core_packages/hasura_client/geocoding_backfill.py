@@ -0,0 +1,369 @@
+"""
+Batch geocoding for addresses without coordinates.
+
+Addresses are geocoded concurrently (bounded worker pool, token-bucket
+rate limit on Google calls) through the shared ``GeocodeCache`` and the
+results are written back with one ``update_addresses_many`` mutation per
+chunk, instead of one ``update_addresses_by_pk`` request per address.
+
+Two entry points:
+
+* ``prewarm_address_coordinates`` fills in a given list of addresses
+  (e.g. the business addresses of pending notifications) before the
+  per-order processing starts, so that path never waits on Google.
+* ``backfill_missing_coordinates`` pages through every ``addresses`` row
+  with a null latitude/longitude. ``main`` exposes it as the
+  ``rendasua-geocode-backfill`` command.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import argparse
+import json
+import os
+
+from rendasua_core_packages.models import Address, Coordinates
+from rendasua_core_packages.utilities import TokenBucket, normalized_address_key
+from .base import HasuraClient, HasuraClientConfig
+from .geocode_cache import get_geocode_cache
+from .logging import log_info, log_error
+
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RATE_PER_SECOND = 10.0
+DEFAULT_BATCH_SIZE = 100
+UPDATE_CHUNK_SIZE = 500
+
+ADDRESSES_MISSING_COORDINATES_QUERY = """
+query GetAddressesMissingCoordinates($afterId: uuid!, $limit: Int!) {
+  addresses(
+    where: {
+      id: { _gt: $afterId }
+      _or: [{ latitude: { _is_null: true } }, { longitude: { _is_null: true } }]
+    }
+    order_by: { id: asc }
+    limit: $limit
+  ) {
+    id
+    address_line_1
+    address_line_2
+    city
+    state
+    postal_code
+    country
+  }
+}
+"""
+
+UPDATE_ADDRESS_COORDINATES_MANY_MUTATION = """
+mutation UpdateAddressCoordinatesMany($updates: [addresses_updates!]!) {
+  update_addresses_many(updates: $updates) {
+    affected_rows
+  }
+}
+"""
+
+# Smallest uuid; keyset pagination starts after it
+_FIRST_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+@dataclass
+class GeocodingBackfillResult:
+    scanned: int = 0
+    geocoded: int = 0
+    not_geocoded: int = 0
+    persisted: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "scanned": self.scanned,
+            "geocoded": self.geocoded,
+            "not_geocoded": self.not_geocoded,
+            "persisted": self.persisted,
+        }
+
+
+def _addresses_from_data(rows: List[dict]) -> List[Address]:
+    return [
+        Address.model_construct(
+            id=row["id"],
+            address_line_1=row.get("address_line_1", ""),
+            address_line_2=row.get("address_line_2"),
+            city=row.get("city", ""),
+            state=row.get("state", ""),
+            postal_code=row.get("postal_code"),
+            country=row.get("country", ""),
+            latitude=None,
+            longitude=None,
+        )
+        for row in rows
+    ]
+
+
+def get_addresses_missing_coordinates(
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    limit: int = DEFAULT_BATCH_SIZE,
+    after_id: Optional[str] = None,
+) -> List[Address]:
+    """
+    Fetch up to ``limit`` addresses without coordinates, ordered by id.
+
+    Args:
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        limit: Page size
+        after_id: Only return addresses with an id greater than this (keyset paging)
+
+    Returns:
+        List of Address objects (empty on error)
+    """
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    try:
+        data = client.execute(
+            ADDRESSES_MISSING_COORDINATES_QUERY,
+            {"afterId": after_id or _FIRST_UUID, "limit": limit},
+        )
+        return _addresses_from_data(data.get("addresses", []))
+    except Exception as e:
+        log_error("Error fetching addresses missing coordinates", error=e)
+        return []
+
+
+def geocode_addresses(
+    addresses: Sequence[Address],
+    google_maps_api_key: Optional[str],
+    hasura_endpoint: Optional[str] = None,
+    hasura_admin_secret: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+) -> Dict[str, Coordinates]:
+    """
+    Geocode addresses concurrently through the shared ``GeocodeCache``.
+
+    Addresses with the same normalized text are geocoded once. At most
+    ``max_workers`` lookups run at a time and Google is called at most
+    ``rate_per_second`` times per second.
+
+    Returns:
+        address id -> coordinates for every address that could be geocoded
+    """
+    by_key: Dict[str, List[Address]] = {}
+    for address in addresses:
+        key = normalized_address_key(address)
+        if key:
+            by_key.setdefault(key, []).append(address)
+    if not by_key:
+        return {}
+
+    cache = get_geocode_cache()
+    limiter = TokenBucket(rate_per_second)
+
+    def geocode_one(address: Address) -> Optional[Coordinates]:
+        try:
+            return cache.geocode(
+                address,
+                google_maps_api_key,
+                hasura_endpoint,
+                hasura_admin_secret,
+                rate_limiter=limiter,
+            )
+        except Exception as e:
+            log_error("Error geocoding address", error=e, address_id=address.id)
+            return None
+
+    groups = list(by_key.values())
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+        results = list(executor.map(geocode_one, [group[0] for group in groups]))
+
+    coordinates_by_id: Dict[str, Coordinates] = {}
+    for group, coordinates in zip(groups, results):
+        if coordinates is None:
+            continue
+        for address in group:
+            if address.id:
+                coordinates_by_id[address.id] = coordinates
+    log_info(
+        "Addresses geocoded",
+        requested=len(addresses),
+        unique=len(groups),
+        geocoded=len(coordinates_by_id),
+        **cache.stats.as_dict(),
+    )
+    return coordinates_by_id
+
+
+def persist_coordinates_bulk(
+    coordinates_by_address_id: Dict[str, Coordinates],
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    chunk_size: int = UPDATE_CHUNK_SIZE,
+) -> int:
+    """
+    Write coordinates to ``addresses`` with one mutation per chunk.
+
+    Returns:
+        Number of address rows updated
+    """
+    if not coordinates_by_address_id:
+        return 0
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    updates = [
+        {
+            "where": {"id": {"_eq": address_id}},
+            "_set": {"latitude": coordinates.latitude, "longitude": coordinates.longitude},
+        }
+        for address_id, coordinates in coordinates_by_address_id.items()
+    ]
+    persisted = 0
+    for start in range(0, len(updates), chunk_size):
+        chunk = updates[start:start + chunk_size]
+        try:
+            data = client.execute(UPDATE_ADDRESS_COORDINATES_MANY_MUTATION, {"updates": chunk})
+            persisted += sum(
+                (result or {}).get("affected_rows", 0)
+                for result in data.get("update_addresses_many") or []
+            )
+        except Exception as e:
+            log_error("Error persisting address coordinates", error=e, chunk_size=len(chunk))
+    log_info("Address coordinates persisted", requested=len(updates), persisted=persisted)
+    return persisted
+
+
+def prewarm_address_coordinates(
+    addresses: Sequence[Address],
+    google_maps_api_key: Optional[str],
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+) -> int:
+    """
+    Geocode the addresses that lack coordinates, persist them in bulk and
+    set ``latitude``/``longitude`` on the given models in place.
+
+    Returns:
+        Number of addresses that received coordinates
+    """
+    missing = [
+        address for address in addresses
+        if address is not None and (address.latitude is None or address.longitude is None)
+    ]
+    if not missing:
+        return 0
+    coordinates_by_id = geocode_addresses(
+        missing,
+        google_maps_api_key,
+        hasura_endpoint,
+        hasura_admin_secret,
+        max_workers=max_workers,
+        rate_per_second=rate_per_second,
+    )
+    for address in missing:
+        coordinates = coordinates_by_id.get(address.id)
+        if coordinates is not None:
+            address.latitude = coordinates.latitude
+            address.longitude = coordinates.longitude
+    persist_coordinates_bulk(coordinates_by_id, hasura_endpoint, hasura_admin_secret)
+    return sum(1 for address in missing if address.id in coordinates_by_id)
+
+
+def backfill_missing_coordinates(
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    google_maps_api_key: Optional[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+    max_addresses: Optional[int] = None,
+    dry_run: bool = False,
+) -> GeocodingBackfillResult:
+    """
+    Geocode every address with a null latitude/longitude, page by page.
+
+    Addresses that cannot be geocoded keep their null coordinates and are
+    skipped by the keyset pagination, so a run always terminates.
+    With ``dry_run`` nothing is written to ``addresses``.
+    """
+    result = GeocodingBackfillResult()
+    after_id: Optional[str] = None
+    while max_addresses is None or result.scanned < max_addresses:
+        limit = batch_size
+        if max_addresses is not None:
+            limit = min(limit, max_addresses - result.scanned)
+        addresses = get_addresses_missing_coordinates(
+            hasura_endpoint, hasura_admin_secret, limit=limit, after_id=after_id
+        )
+        if not addresses:
+            break
+        after_id = addresses[-1].id
+        result.scanned += len(addresses)
+
+        coordinates_by_id = geocode_addresses(
+            addresses,
+            google_maps_api_key,
+            hasura_endpoint,
+            hasura_admin_secret,
+            max_workers=max_workers,
+            rate_per_second=rate_per_second,
+        )
+        result.geocoded += len(coordinates_by_id)
+        result.not_geocoded += len(addresses) - len(coordinates_by_id)
+        if not dry_run:
+            result.persisted += persist_coordinates_bulk(
+                coordinates_by_id, hasura_endpoint, hasura_admin_secret
+            )
+        log_info("Geocoding backfill progress", **result.as_dict())
+        if len(addresses) < limit:
+            break
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point (``rendasua-geocode-backfill``).
+
+    Credentials come from GRAPHQL_ENDPOINT, HASURA_ADMIN_SECRET and
+    GOOGLE_MAPS_API_KEY; missing secrets are read from AWS Secrets Manager
+    for ``--environment``.
+    """
+    parser = argparse.ArgumentParser(description="Geocode addresses that have no coordinates.")
+    parser.add_argument("--environment", default=os.environ.get("ENVIRONMENT", "development"))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_PER_SECOND,
+                        help="Maximum Google Geocoding calls per second")
+    parser.add_argument("--max-addresses", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    hasura_endpoint = os.environ.get("GRAPHQL_ENDPOINT")
+    if not hasura_endpoint:
+        parser.error("GRAPHQL_ENDPOINT is not set")
+    hasura_admin_secret = os.environ.get("HASURA_ADMIN_SECRET")
+    google_maps_api_key = os.environ.get("GOOGLE_MAPS_API_KEY")
+    if not hasura_admin_secret or not google_maps_api_key:
+        # boto3 is only needed when secrets are not provided directly
+        from rendasua_core_packages.secrets_manager import (
+            get_google_maps_api_key,
+            get_hasura_admin_secret,
+        )
+        hasura_admin_secret = hasura_admin_secret or get_hasura_admin_secret(args.environment)
+        google_maps_api_key = google_maps_api_key or get_google_maps_api_key(args.environment)
+
+    result = backfill_missing_coordinates(
+        hasura_endpoint,
+        hasura_admin_secret,
+        google_maps_api_key,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        rate_per_second=args.rate,
+        max_addresses=args.max_addresses,
+        dry_run=args.dry_run,
+    )
+    print(json.dumps(result.as_dict()))
+    return 0
@@ -0,0 +1,262 @@
+"""
+Ledger journals: several account postings committed as one Hasura mutation.
+
+Hasura runs all top-level fields of a mutation request in a single database
+transaction, in order. A journal is therefore one ``update_accounts_many``
+(one ``_inc`` per posting), one bulk insert of the matching
+``account_transactions`` rows and, optionally, the order hold status change
+that closes the operation — a single round trip.
+
+Rejections abort that transaction in Postgres, so nothing is ever left
+half-applied: the accounts_reject_overdraft trigger raises when a posting
+would overdraw an account, and the hold status change is an
+``order_hold_status_transitions`` insert whose trigger raises when the hold
+no longer has the expected status. Per-posting results of a rejected
+journal are worked out afterwards from the current balances.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from .accounts_service import (
+    _has_sufficient_funds,
+    _is_insufficient_funds_error,
+    determine_transaction_balance_update,
+)
+from .base import HasuraClient, HasuraClientConfig
+from .logging import log_info, log_error
+
+
+# Prefix of the error raised by the apply_order_hold_status_transition trigger
+HOLD_STATUS_CONFLICT_ERROR = "order_hold_status_conflict"
+
+POST_JOURNAL_MUTATION = """
+mutation PostJournal(
+  $updates: [accounts_updates!]!,
+  $transactions: [account_transactions_insert_input!]!
+) {
+  update_accounts_many(updates: $updates) {
+    affected_rows
+  }
+  insert_account_transactions(objects: $transactions) {
+    returning {
+      id
+    }
+  }
+}
+"""
+
+POST_JOURNAL_WITH_HOLD_MUTATION = """
+mutation PostJournalWithHold(
+  $updates: [accounts_updates!]!,
+  $transactions: [account_transactions_insert_input!]!,
+  $holdTransition: order_hold_status_transitions_insert_input!
+) {
+  insert_order_hold_status_transitions_one(object: $holdTransition) {
+    id
+  }
+  update_accounts_many(updates: $updates) {
+    affected_rows
+  }
+  insert_account_transactions(objects: $transactions) {
+    returning {
+      id
+    }
+  }
+}
+"""
+
+JOURNAL_ACCOUNT_BALANCES_QUERY = """
+query GetJournalAccountBalances($accountIds: [uuid!]!) {
+  accounts(where: { id: { _in: $accountIds } }) {
+    id
+    available_balance
+    withheld_balance
+  }
+}
+"""
+
+
+@dataclass
+class LedgerPosting:
+    """One account transaction within a journal (same arguments as register_account_transaction)."""
+    account_id: str
+    amount: float
+    transaction_type: str
+    memo: str
+    reference_id: Optional[str] = None
+    label: str = ""
+
+
+@dataclass
+class HoldStatusChange:
+    """
+    Order hold status update committed with the journal.
+
+    With ``expected_status`` the journal only commits while the hold still
+    has that status, so a redelivered event cannot post twice.
+    """
+    order_hold_id: str
+    status: str
+    expected_status: Optional[str] = None
+
+
+@dataclass
+class PostingResult:
+    posting: LedgerPosting
+    transaction_id: Optional[str] = None
+    accepted: bool = False
+
+
+@dataclass
+class JournalResult:
+    """
+    Outcome of ``post_journal``.
+
+    ``rejected`` lists the labels of postings that would overdraw their
+    account and ``hold_rejected`` is set when the hold no longer had the
+    expected status; both are empty when the request failed for another
+    reason (``error`` then holds the exception message).
+    """
+    success: bool
+    results: List[PostingResult] = field(default_factory=list)
+    hold_updated: bool = False
+    rejected: List[str] = field(default_factory=list)
+    hold_rejected: bool = False
+    error: Optional[str] = None
+
+
+def _account_update(account_id: str, available: float, withheld: float) -> Dict[str, Any]:
+    return {
+        "where": {"id": {"_eq": account_id}},
+        "_inc": {"available_balance": available, "withheld_balance": withheld},
+        "_set": {"updated_at": "now()"},
+    }
+
+
+def _rejected_postings(client: HasuraClient, postings: List[LedgerPosting]) -> List[bool]:
+    """
+    Replay ``postings`` against the current balances; False for each posting
+    that would overdraw its account (later postings see only accepted ones).
+    """
+    account_ids = sorted({posting.account_id for posting in postings})
+    try:
+        data = client.execute(JOURNAL_ACCOUNT_BALANCES_QUERY, {"accountIds": account_ids})
+    except Exception as e:
+        log_error("Failed to read balances of rejected journal", error=e, account_ids=account_ids)
+        return [False] * len(postings)
+
+    balances = {
+        row["id"]: [float(row["available_balance"]), float(row["withheld_balance"])]
+        for row in data.get("accounts", [])
+    }
+    accepted = []
+    for posting in postings:
+        balance = balances.get(posting.account_id)
+        balance_update = determine_transaction_balance_update(posting.transaction_type, posting.amount).balanceUpdate
+        ok = balance is not None and _has_sufficient_funds(posting.transaction_type, balance_update, *balance)
+        if ok:
+            balance[0] += balance_update.available
+            balance[1] += balance_update.withheld
+        accepted.append(ok)
+    return accepted
+
+
+def post_journal(
+    postings: Sequence[LedgerPosting],
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    hold_status: Optional[HoldStatusChange] = None,
+) -> JournalResult:
+    """
+    Commit ``postings`` (and optionally a hold status change) atomically.
+
+    Postings are applied in order, so several postings on one account see
+    each other's balance changes exactly as sequential
+    ``register_account_transaction`` calls would.
+
+    Args:
+        postings: Account postings, applied in order
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        hold_status: Optional order hold status change committed with them
+
+    Returns:
+        JournalResult with one PostingResult per posting; on failure nothing
+        was applied and every transaction_id is None
+    """
+    postings = list(postings)
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    log_info(
+        "Posting ledger journal",
+        postings=len(postings),
+        order_hold_id=hold_status.order_hold_id if hold_status else None,
+    )
+
+    try:
+        updates = []
+        transactions = []
+        for posting in postings:
+            balance_update = determine_transaction_balance_update(posting.transaction_type, posting.amount).balanceUpdate
+            updates.append(_account_update(posting.account_id, balance_update.available, balance_update.withheld))
+            transactions.append({
+                "account_id": posting.account_id,
+                "amount": posting.amount,
+                "transaction_type": posting.transaction_type.lower(),
+                "memo": posting.memo,
+                "reference_id": posting.reference_id,
+            })
+
+        variables: Dict[str, Any] = {"updates": updates, "transactions": transactions}
+        mutation = POST_JOURNAL_MUTATION
+        if hold_status is not None:
+            mutation = POST_JOURNAL_WITH_HOLD_MUTATION
+            variables["holdTransition"] = {
+                "order_hold_id": hold_status.order_hold_id,
+                "from_status": hold_status.expected_status,
+                "to_status": hold_status.status,
+            }
+
+        data = client.execute(mutation, variables)
+
+    except Exception as e:
+        if HOLD_STATUS_CONFLICT_ERROR in str(e):
+            log_error(
+                "Ledger journal rejected: order hold status changed",
+                order_hold_id=hold_status.order_hold_id if hold_status else None,
+                expected_status=hold_status.expected_status if hold_status else None,
+            )
+            return JournalResult(
+                success=False,
+                results=[PostingResult(posting=posting, accepted=True) for posting in postings],
+                hold_rejected=True,
+                error="Order hold status changed concurrently",
+            )
+        if _is_insufficient_funds_error(e):
+            accepted = _rejected_postings(client, postings)
+            rejected = [posting.label or posting.account_id for posting, ok in zip(postings, accepted) if not ok]
+            error = f"Insufficient balance for: {', '.join(rejected)}"
+            log_error("Ledger journal rejected", reason=error, postings=len(postings))
+            return JournalResult(
+                success=False,
+                results=[PostingResult(posting=posting, accepted=ok) for posting, ok in zip(postings, accepted)],
+                rejected=rejected,
+                error=error,
+            )
+        log_error("Error posting ledger journal", error=e, postings=len(postings))
+        return JournalResult(
+            success=False,
+            results=[PostingResult(posting=posting) for posting in postings],
+            error=str(e),
+        )
+
+    transaction_ids = [row.get("id") for row in (data.get("insert_account_transactions") or {}).get("returning", [])]
+    log_info("Ledger journal posted", postings=len(postings), transaction_ids=transaction_ids)
+    return JournalResult(
+        success=True,
+        results=[
+            PostingResult(posting=posting, transaction_id=transaction_id, accepted=True)
+            for posting, transaction_id in zip(postings, transaction_ids)
+        ],
+        hold_updated=hold_status is not None,
+    )
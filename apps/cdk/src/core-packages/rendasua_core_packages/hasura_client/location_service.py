@@ -2,17 +2,122 @@
 Location-related Hasura operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import datetime
 from rendasua_core_packages.models import AgentLocation, Agent, User
-from rendasua_core_packages.utilities import parse_datetime
+from rendasua_core_packages.models import fast as fast_models
+from rendasua_core_packages.utilities import (
+    bounding_boxes,
+    merge_bounding_boxes,
+    parse_datetime,
+)
+from .agent_location_table import AgentLocationTable
 from .base import HasuraClient, HasuraClientConfig
 from .logging import log_info, log_error
 
 
+AGENT_LOCATION_FIELDS_FRAGMENT = """
+fragment AgentLocationFields on agent_locations {
+  id
+  agent_id
+  latitude
+  longitude
+  created_at
+  updated_at
+  agent {
+    id
+    user_id
+    created_at
+    updated_at
+    user {
+      id
+      email
+      phone_number
+      first_name
+      last_name
+      identifier
+      preferred_language
+      created_at
+      updated_at
+    }
+  }
+}
+"""
+
+AGENT_LOCATIONS_QUERY = """
+query GetAgentLocations {
+  agent_locations(where: { agent: { is_available: { _eq: true } } }) {
+    ...AgentLocationFields
+  }
+}
+""" + AGENT_LOCATION_FIELDS_FRAGMENT
+
+AGENT_LOCATIONS_IN_AREA_QUERY = """
+query GetAgentLocationsInArea($where: agent_locations_bool_exp!) {
+  agent_locations(where: $where) {
+    ...AgentLocationFields
+  }
+}
+""" + AGENT_LOCATION_FIELDS_FRAGMENT
+
+
+def _agent_locations_from_data(agent_locations_data: List[dict], fast: bool = False) -> List[AgentLocation]:
+    """Build AgentLocation models (with nested agent/user) from GetAgentLocations rows."""
+    if fast:
+        return fast_models.decode_many("AgentLocation", agent_locations_data)
+    # Each agent has one location entry, so no deduplication needed
+    agent_locations = []
+
+    for loc_data in agent_locations_data:
+        # Construct Pydantic models for nested relations
+        agent_model = None
+        agent_data = loc_data.get("agent")
+
+        if agent_data:
+            # Construct User model from nested user relation
+            user_model = None
+            user_data = agent_data.get("user")
+
+            if user_data:
+                user_model = User.model_construct(
+                    id=user_data["id"],
+                    email=user_data.get("email"),
+                    phone_number=user_data.get("phone_number"),
+                    first_name=user_data["first_name"],
+                    last_name=user_data["last_name"],
+                    identifier=user_data["identifier"],
+                    preferred_language=user_data.get("preferred_language"),
+                    created_at=parse_datetime(user_data.get("created_at")),
+                    updated_at=parse_datetime(user_data.get("updated_at")),
+                )
+
+            # Construct Agent model with nested User
+            agent_model = Agent.model_construct(
+                id=agent_data["id"],
+                user_id=agent_data["user_id"],
+                created_at=parse_datetime(agent_data.get("created_at")),
+                updated_at=parse_datetime(agent_data.get("updated_at")),
+                user=user_model,
+            )
+
+        # Create AgentLocation with populated agent relation
+        agent_location = AgentLocation(
+            id=loc_data.get("id", ""),
+            agent_id=loc_data["agent_id"],
+            latitude=float(loc_data["latitude"]),
+            longitude=float(loc_data["longitude"]),
+            created_at=parse_datetime(loc_data.get("created_at")),
+            updated_at=parse_datetime(loc_data.get("updated_at")),
+            agent=agent_model,
+        )
+        agent_locations.append(agent_location)
+    return agent_locations
+
+
 def get_all_agent_locations(
     hasura_endpoint: str,
-    hasura_admin_secret: str
+    hasura_admin_secret: str,
+    fast: Optional[bool] = None
 ) -> List[AgentLocation]:
     """
     Fetch all agent locations with latest location per agent.
@@ -20,95 +125,25 @@ def get_all_agent_locations(
     Args:
         hasura_endpoint: Hasura GraphQL endpoint
         hasura_admin_secret: Hasura admin secret
+        fast: Return ``models.fast`` twins instead of Pydantic models
+            (default: ``RENDASUA_FAST_MODELS``)
         
     Returns:
         List of AgentLocation objects
     """
-    query = """
-    query GetAgentLocations {
-      agent_locations(where: { agent: { is_available: { _eq: true } } }) {
-        id
-        agent_id
-        latitude
-        longitude
-        created_at
-        updated_at
-        agent {
-          id
-          user_id
-          created_at
-          updated_at
-          user {
-            id
-            email
-            phone_number
-            first_name
-            last_name
-            identifier
-            preferred_language
-            created_at
-            updated_at
-          }
-        }
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
     log_info("Fetching all agent locations from Hasura")
     
     try:
-        data = client.execute(query, {})
+        data = client.execute(AGENT_LOCATIONS_QUERY, {})
         agent_locations_data = data.get("agent_locations", [])
         
         log_info("Agent locations fetched from Hasura", count=len(agent_locations_data))
         
-        # Each agent has one location entry, so no deduplication needed
-        agent_locations = []
-        
-        for loc_data in agent_locations_data:
-            # Construct Pydantic models for nested relations
-            agent_model = None
-            agent_data = loc_data.get("agent")
-            
-            if agent_data:
-                # Construct User model from nested user relation
-                user_model = None
-                user_data = agent_data.get("user")
-                
-                if user_data:
-                    user_model = User.model_construct(
-                        id=user_data["id"],
-                        email=user_data.get("email"),
-                        phone_number=user_data.get("phone_number"),
-                        first_name=user_data["first_name"],
-                        last_name=user_data["last_name"],
-                        identifier=user_data["identifier"],
-                        preferred_language=user_data.get("preferred_language"),
-                        created_at=parse_datetime(user_data.get("created_at")),
-                        updated_at=parse_datetime(user_data.get("updated_at")),
-                    )
-                
-                # Construct Agent model with nested User
-                agent_model = Agent.model_construct(
-                    id=agent_data["id"],
-                    user_id=agent_data["user_id"],
-                    created_at=parse_datetime(agent_data.get("created_at")),
-                    updated_at=parse_datetime(agent_data.get("updated_at")),
-                    user=user_model,
-                )
-            
-            # Create AgentLocation with populated agent relation
-            agent_location = AgentLocation(
-                id=loc_data.get("id", ""),
-                agent_id=loc_data["agent_id"],
-                latitude=float(loc_data["latitude"]),
-                longitude=float(loc_data["longitude"]),
-                created_at=parse_datetime(loc_data.get("created_at")),
-                updated_at=parse_datetime(loc_data.get("updated_at")),
-                agent=agent_model,
-            )
-            agent_locations.append(agent_location)
+        agent_locations = _agent_locations_from_data(
+            agent_locations_data,
+            fast_models.fast_models_enabled() if fast is None else fast,
+        )
         
         log_info("Agent locations parsed successfully", count=len(agent_locations))
         
@@ -119,3 +154,107 @@ def get_all_agent_locations(
         return []
 
 
+def get_agent_location_table(
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> AgentLocationTable:
+    """
+    Fetch all available agent locations as a columnar ``AgentLocationTable``.
+    
+    Same data as ``get_all_agent_locations`` without building a model per
+    row; use it when only ids, coordinates and contact details are needed.
+    
+    Args:
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        
+    Returns:
+        AgentLocationTable (empty on error)
+    """
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    log_info("Fetching agent location table from Hasura")
+    
+    try:
+        data = client.execute(AGENT_LOCATIONS_QUERY, {})
+        table = AgentLocationTable.from_rows(data.get("agent_locations", []))
+        log_info("Agent location table built", count=len(table))
+        return table
+        
+    except Exception as e:
+        log_error("Error fetching agent location table", error=e)
+        return AgentLocationTable()
+
+
+def _area_filter(
+    centers: Sequence[Tuple[float, float]],
+    radius_km: float,
+) -> Dict[str, Any]:
+    """Hasura where clause: available agents inside any centre's bounding box."""
+    boxes = merge_bounding_boxes([
+        box
+        for lat, lon in centers
+        for box in bounding_boxes(lat, lon, radius_km)
+    ])
+    return {
+        "_and": [
+            {"agent": {"is_available": {"_eq": True}}},
+            {
+                "_or": [
+                    {
+                        "latitude": {"_gte": min_lat, "_lte": max_lat},
+                        "longitude": {"_gte": min_lon, "_lte": max_lon},
+                    }
+                    for min_lat, max_lat, min_lon, max_lon in boxes
+                ]
+            },
+        ]
+    }
+
+
+def get_agent_locations_near(
+    centers: Sequence[Tuple[float, float]],
+    radius_km: float,
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> List[AgentLocation]:
+    """
+    Fetch available agent locations that may lie within ``radius_km`` of any centre.
+
+    The geo filter runs in Postgres as latitude/longitude range conditions
+    (one bounding box per centre, overlapping boxes merged), so only
+    candidate agents are transferred and parsed. Boxes are conservative:
+    callers still apply the exact haversine check to the result.
+
+    This is the one-shot lookup for callers without a warm
+    ``AgentLocationCache`` (cold starts, other Lambdas); the cache itself
+    keeps loading every available agent so its delta syncs stay complete.
+    
+    Args:
+        centers: (latitude, longitude) pairs, e.g. pending order pickup points
+        radius_km: Search radius in kilometers
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        
+    Returns:
+        List of candidate AgentLocation objects
+    """
+    if not centers:
+        return []
+
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    log_info("Fetching agent locations near centres", centers=len(centers), radius_km=radius_km)
+    
+    try:
+        data = client.execute(
+            AGENT_LOCATIONS_IN_AREA_QUERY,
+            {"where": _area_filter(centers, radius_km)},
+        )
+        agent_locations_data = data.get("agent_locations", [])
+        
+        log_info("Candidate agent locations fetched from Hasura", count=len(agent_locations_data))
+        
+        return _agent_locations_from_data(agent_locations_data)
+        
+    except Exception as e:
+        log_error("Error fetching agent locations near centres", error=e)
+        return []
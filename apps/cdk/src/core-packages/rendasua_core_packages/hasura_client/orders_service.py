@@ -1,11 +1,13 @@
 """Order-related Hasura operations."""
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 import datetime
 from datetime import timezone
 from rendasua_core_packages.models import Order, BusinessLocation, Address, Client, Business, Agent, OrderAgentNotification
-from rendasua_core_packages.utilities.geocoding import geocode_address, persist_coordinates_to_hasura
+from rendasua_core_packages.models import fast as fast_models
+from rendasua_core_packages.utilities.geocoding import persist_coordinates_to_hasura
 from rendasua_core_packages.utilities import parse_datetime
 from .base import HasuraClient, HasuraClientConfig
+from .geocode_cache import geocode_address_cached
 from .logging import log_info, log_error
 
 
@@ -13,7 +15,8 @@ def get_order_with_location(
     order_id: str,
     hasura_endpoint: str,
     hasura_admin_secret: str,
-    google_maps_api_key: Optional[str] = None
+    google_maps_api_key: Optional[str] = None,
+    fast: Optional[bool] = None
 ) -> Optional[Order]:
     """
     Fetch order with business location and address.
@@ -24,6 +27,8 @@ def get_order_with_location(
         hasura_endpoint: Hasura GraphQL endpoint
         hasura_admin_secret: Hasura admin secret
         google_maps_api_key: Google Maps API key for geocoding
+        fast: Return a ``models.fast.Order`` twin instead of the Pydantic
+            model (default: ``RENDASUA_FAST_MODELS``)
         
     Returns:
         Order object if found, None otherwise
@@ -95,8 +100,12 @@ def get_order_with_location(
             log_error("Address not found for business location", order_id=order_id)
             return None
         
+        if fast is None:
+            fast = fast_models.fast_models_enabled()
+        fast_order = fast_models.decode_order(order_data) if fast else None
+        
         # Create address object
-        address = Address(
+        address = fast_order.business_location.address if fast else Address(
             id=address_data["id"],
             address_line_1=address_data["address_line_1"],
             address_line_2=address_data.get("address_line_2"),
@@ -118,7 +127,12 @@ def get_order_with_location(
         # If coordinates are missing, geocode and persist
         if (address.latitude is None or address.longitude is None) and google_maps_api_key:
             log_info("Coordinates missing, starting geocoding", address_id=address.id)
-            coordinates = geocode_address(address, google_maps_api_key)
+            coordinates = geocode_address_cached(
+                address,
+                google_maps_api_key,
+                hasura_endpoint,
+                hasura_admin_secret
+            )
             
             if coordinates:
                 log_info(
@@ -144,6 +158,11 @@ def get_order_with_location(
             else:
                 log_error("Failed to geocode address", address_id=address.id)
         
+        if fast:
+            fast_order.business_location.address_id = fast_order.business_location.address_id or address.id
+            log_info("Order object created successfully", order_id=fast_order.id, order_number=fast_order.order_number)
+            return fast_order
+        
         address_created_at = parse_datetime(address_data.get("created_at"))
         address_updated_at = parse_datetime(address_data.get("updated_at"))
         location_created_at = parse_datetime(business_location_data.get("created_at"))
@@ -323,6 +342,145 @@ def get_complete_order_details(
         return None
 
 
+ORDER_FOR_NOTIFICATION_QUERY = """
+query GetOrderForNotification($orderId: uuid!) {
+  orders_by_pk(id: $orderId) {
+    id
+    order_number
+    current_status
+    created_at
+    subtotal
+    base_delivery_fee
+    per_km_delivery_fee
+    tax_amount
+    total_amount
+    currency
+    payment_method
+    payment_status
+    estimated_delivery_time
+    special_instructions
+    business_location {
+      name
+    }
+    client {
+      user {
+        first_name
+        last_name
+        email
+      }
+    }
+    business {
+      name
+      is_verified
+      user {
+        email
+      }
+    }
+    assigned_agent {
+      user {
+        first_name
+        last_name
+        email
+      }
+    }
+    delivery_address {
+      address_line_1
+      address_line_2
+      city
+      state
+      postal_code
+      country
+    }
+    order_items {
+      item_name
+      quantity
+      unit_price
+      total_price
+    }
+  }
+}
+"""
+
+PLATFORM_ORDER_LIFECYCLE_COUNTS_QUERY = """
+query PlatformOrderLifecycleCounts {
+  complete: orders_aggregate(where: { current_status: { _eq: complete } }) {
+    aggregate { count }
+  }
+  cancelled: orders_aggregate(where: { current_status: { _eq: cancelled } }) {
+    aggregate { count }
+  }
+}
+"""
+
+
+def _format_order_notification_data(order_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a GetOrderForNotification row into the notification payload."""
+    # Format delivery address
+    delivery_address_data = order_data.get("delivery_address", {})
+    delivery_address_parts = [
+        delivery_address_data.get("address_line_1", ""),
+        delivery_address_data.get("address_line_2", ""),
+        delivery_address_data.get("city", ""),
+        delivery_address_data.get("state", ""),
+        delivery_address_data.get("postal_code", ""),
+        delivery_address_data.get("country", ""),
+    ]
+    delivery_address = ", ".join(part for part in delivery_address_parts if part)
+    
+    # Format client name
+    client_data = order_data.get("client", {}).get("user", {})
+    client_name = f"{client_data.get('first_name', '')} {client_data.get('last_name', '')}".strip()
+    
+    # Format agent name (if exists)
+    agent_name = None
+    agent_email = None
+    assigned_agent_data = order_data.get("assigned_agent")
+    if assigned_agent_data:
+        agent_user = assigned_agent_data.get("user", {})
+        agent_name = f"{agent_user.get('first_name', '')} {agent_user.get('last_name', '')}".strip()
+        agent_email = agent_user.get("email")
+    
+    # Format order items
+    order_items = []
+    for item in order_data.get("order_items", []):
+        order_items.append({
+            "name": item.get("item_name", "Unknown Item"),
+            "quantity": item.get("quantity", 0),
+            "unitPrice": float(item.get("unit_price", 0)),
+            "totalPrice": float(item.get("total_price", 0)),
+        })
+    
+    bl_data = order_data.get("business_location") or {}
+    business_location_name = bl_data.get("name") or ""
+
+    return {
+        "orderId": order_data["id"],
+        "orderNumber": order_data.get("order_number", "Unknown"),
+        "clientName": client_name,
+        "clientEmail": client_data.get("email"),
+        "businessName": order_data.get("business", {}).get("name", "Unknown Business"),
+        "businessLocationName": business_location_name,
+        "businessEmail": order_data.get("business", {}).get("user", {}).get("email"),
+        "businessVerified": order_data.get("business", {}).get("is_verified", False),
+        "agentName": agent_name,
+        "agentEmail": agent_email,
+        "orderStatus": order_data.get("current_status", "Unknown"),
+        "orderItems": order_items,
+        "subtotal": float(order_data.get("subtotal", 0)),
+        "deliveryFee": float(order_data.get("base_delivery_fee", 0)),
+        "fastDeliveryFee": float(order_data.get("per_km_delivery_fee", 0)),
+        "taxAmount": float(order_data.get("tax_amount", 0)),
+        "totalAmount": float(order_data.get("total_amount", 0)),
+        "currency": order_data.get("currency", "USD"),
+        "paymentMethod": order_data.get("payment_method"),
+        "paymentStatus": order_data.get("payment_status"),
+        "createdAt": order_data.get("created_at"),
+        "deliveryAddress": delivery_address,
+        "estimatedDeliveryTime": order_data.get("estimated_delivery_time"),
+        "specialInstructions": order_data.get("special_instructions"),
+    }
+
+
 def get_order_details_for_notification(
     order_id: str,
     hasura_endpoint: str,
@@ -339,140 +497,18 @@ def get_order_details_for_notification(
     Returns:
         Dictionary with order details for notifications, None if not found
     """
-    query = """
-    query GetOrderForNotification($orderId: uuid!) {
-      orders_by_pk(id: $orderId) {
-        id
-        order_number
-        current_status
-        created_at
-        subtotal
-        base_delivery_fee
-        per_km_delivery_fee
-        tax_amount
-        total_amount
-        currency
-        payment_method
-        payment_status
-        estimated_delivery_time
-        special_instructions
-        business_location {
-          name
-        }
-        client {
-          user {
-            first_name
-            last_name
-            email
-          }
-        }
-        business {
-          name
-          is_verified
-          user {
-            email
-          }
-        }
-        assigned_agent {
-          user {
-            first_name
-            last_name
-            email
-          }
-        }
-        delivery_address {
-          address_line_1
-          address_line_2
-          city
-          state
-          postal_code
-          country
-        }
-        order_items {
-          item_name
-          quantity
-          unit_price
-          total_price
-        }
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
     log_info("Fetching order details for notification", order_id=order_id)
     
     try:
-        data = client.execute(query, {"orderId": order_id})
+        data = client.execute(ORDER_FOR_NOTIFICATION_QUERY, {"orderId": order_id})
         order_data = data.get("orders_by_pk")
         
         if not order_data:
             log_error("Order not found", order_id=order_id)
             return None
         
-        # Format delivery address
-        delivery_address_data = order_data.get("delivery_address", {})
-        delivery_address_parts = [
-            delivery_address_data.get("address_line_1", ""),
-            delivery_address_data.get("address_line_2", ""),
-            delivery_address_data.get("city", ""),
-            delivery_address_data.get("state", ""),
-            delivery_address_data.get("postal_code", ""),
-            delivery_address_data.get("country", ""),
-        ]
-        delivery_address = ", ".join(part for part in delivery_address_parts if part)
-        
-        # Format client name
-        client_data = order_data.get("client", {}).get("user", {})
-        client_name = f"{client_data.get('first_name', '')} {client_data.get('last_name', '')}".strip()
-        
-        # Format agent name (if exists)
-        agent_name = None
-        agent_email = None
-        assigned_agent_data = order_data.get("assigned_agent")
-        if assigned_agent_data:
-            agent_user = assigned_agent_data.get("user", {})
-            agent_name = f"{agent_user.get('first_name', '')} {agent_user.get('last_name', '')}".strip()
-            agent_email = agent_user.get("email")
-        
-        # Format order items
-        order_items = []
-        for item in order_data.get("order_items", []):
-            order_items.append({
-                "name": item.get("item_name", "Unknown Item"),
-                "quantity": item.get("quantity", 0),
-                "unitPrice": float(item.get("unit_price", 0)),
-                "totalPrice": float(item.get("total_price", 0)),
-            })
-        
-        bl_data = order_data.get("business_location") or {}
-        business_location_name = bl_data.get("name") or ""
-
-        notification_data = {
-            "orderId": order_data["id"],
-            "orderNumber": order_data.get("order_number", "Unknown"),
-            "clientName": client_name,
-            "clientEmail": client_data.get("email"),
-            "businessName": order_data.get("business", {}).get("name", "Unknown Business"),
-            "businessLocationName": business_location_name,
-            "businessEmail": order_data.get("business", {}).get("user", {}).get("email"),
-            "businessVerified": order_data.get("business", {}).get("is_verified", False),
-            "agentName": agent_name,
-            "agentEmail": agent_email,
-            "orderStatus": order_data.get("current_status", "Unknown"),
-            "orderItems": order_items,
-            "subtotal": float(order_data.get("subtotal", 0)),
-            "deliveryFee": float(order_data.get("base_delivery_fee", 0)),
-            "fastDeliveryFee": float(order_data.get("per_km_delivery_fee", 0)),
-            "taxAmount": float(order_data.get("tax_amount", 0)),
-            "totalAmount": float(order_data.get("total_amount", 0)),
-            "currency": order_data.get("currency", "USD"),
-            "paymentMethod": order_data.get("payment_method"),
-            "paymentStatus": order_data.get("payment_status"),
-            "createdAt": order_data.get("created_at"),
-            "deliveryAddress": delivery_address,
-            "estimatedDeliveryTime": order_data.get("estimated_delivery_time"),
-            "specialInstructions": order_data.get("special_instructions"),
-        }
+        notification_data = _format_order_notification_data(order_data)
         
         log_info("Order details for notification fetched successfully", order_id=order_id)
         return notification_data
@@ -489,6 +525,13 @@ def _aggregate_count(data: Dict[str, Any], alias: str) -> int:
     return int(raw) if raw is not None else 0
 
 
+def _lifecycle_counts_from_data(data: Dict[str, Any]) -> Dict[str, int]:
+    return {
+        "completedTotal": _aggregate_count(data, "complete"),
+        "cancelledTotal": _aggregate_count(data, "cancelled"),
+    }
+
+
 def get_platform_order_lifecycle_counts(
     hasura_endpoint: str,
     hasura_admin_secret: str,
@@ -497,31 +540,58 @@ def get_platform_order_lifecycle_counts(
     All-time counts of orders in terminal states (platform-wide).
     Used for Slack when an order completes.
     """
-    query = """
-    query PlatformOrderLifecycleCounts {
-      complete: orders_aggregate(where: { current_status: { _eq: complete } }) {
-        aggregate { count }
-      }
-      cancelled: orders_aggregate(where: { current_status: { _eq: cancelled } }) {
-        aggregate { count }
-      }
-    }
-    """
     client = HasuraClient(
         HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret)
     )
     log_info("Fetching platform order lifecycle counts")
     try:
-        data = client.execute(query, {})
-        return {
-            "completedTotal": _aggregate_count(data, "complete"),
-            "cancelledTotal": _aggregate_count(data, "cancelled"),
-        }
+        data = client.execute(PLATFORM_ORDER_LIFECYCLE_COUNTS_QUERY, {})
+        return _lifecycle_counts_from_data(data)
     except Exception as e:
         log_error("Error fetching platform order lifecycle counts", error=e)
         return None
 
 
+def get_order_details_with_lifecycle_counts(
+    order_id: str,
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, int]]]:
+    """
+    Fetch notification details and platform lifecycle counts in one round trip.
+
+    Both operations are sent as a single Hasura batch request. If the batch
+    fails, each part is fetched on its own so one failure does not hide the
+    other.
+
+    Returns:
+        (notification details or None, lifecycle counts or None)
+    """
+    client = HasuraClient(
+        HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret)
+    )
+    log_info("Fetching order details and lifecycle counts (batched)", order_id=order_id)
+    try:
+        order_result, counts_result = client.batch([
+            (ORDER_FOR_NOTIFICATION_QUERY, {"orderId": order_id}),
+            (PLATFORM_ORDER_LIFECYCLE_COUNTS_QUERY, {}),
+        ])
+    except Exception as e:
+        log_error("Batched order notification fetch failed, falling back", error=e, order_id=order_id)
+        return (
+            get_order_details_for_notification(order_id, hasura_endpoint, hasura_admin_secret),
+            get_platform_order_lifecycle_counts(hasura_endpoint, hasura_admin_secret),
+        )
+
+    order_data = order_result.get("orders_by_pk")
+    if not order_data:
+        log_error("Order not found", order_id=order_id)
+        details = None
+    else:
+        details = _format_order_notification_data(order_data)
+    return details, _lifecycle_counts_from_data(counts_result)
+
+
 def get_order_items_for_reserved_restore(
     order_id: str,
     hasura_endpoint: str,
@@ -777,6 +847,181 @@ def get_order_business_location_country(
         return None
 
 
+CREATE_PENDING_AGENT_NOTIFICATION_MUTATION = """
+mutation CreatePendingAgentNotification($orderId: uuid!, $notificationType: notification_type!) {
+  insert_order_agent_notifications_one(
+    object: {
+      order_id: $orderId
+      notification_type: $notificationType
+      status: pending
+    }
+    on_conflict: {
+      constraint: order_agent_notifications_order_type_unique
+      update_columns: []
+    }
+  ) {
+    id
+  }
+}
+"""
+
+PENDING_AGENT_NOTIFICATIONS_QUERY = """
+query GetPendingAgentNotifications($notificationType: notification_type!) {
+  order_agent_notifications(
+    where: {
+      status: { _eq: pending }
+      notification_type: { _eq: $notificationType }
+    }
+  ) {
+    id
+    order_id
+    notification_type
+    status
+    error_message
+    created_at
+    updated_at
+    processed_at
+    order {
+      id
+      order_number
+      current_status
+      business_location {
+        id
+        name
+        address {
+          id
+          address_line_1
+          address_line_2
+          city
+          state
+          postal_code
+          country
+          latitude
+          longitude
+        }
+      }
+    }
+  }
+}
+"""
+
+UPDATE_NOTIFICATION_STATUS_MUTATION = """
+mutation UpdateNotificationStatus(
+  $id: uuid!
+  $status: notification_status!
+  $errorMessage: String
+  $processedAt: timestamptz
+) {
+  update_order_agent_notifications_by_pk(
+    pk_columns: { id: $id }
+    _set: {
+      status: $status
+      error_message: $errorMessage
+      processed_at: $processedAt
+    }
+  ) {
+    id
+  }
+}
+"""
+
+
+UPDATE_NOTIFICATION_STATUSES_MANY_MUTATION = """
+mutation UpdateNotificationStatuses($updates: [order_agent_notifications_updates!]!) {
+  update_order_agent_notifications_many(updates: $updates) {
+    affected_rows
+  }
+}
+"""
+
+
+def _notification_status_variables(
+    notification_id: str,
+    status: str,
+    error_message: Optional[str],
+) -> Dict[str, Any]:
+    # Get current timestamp in ISO format
+    processed_at = datetime.datetime.now(timezone.utc).isoformat()
+    return {
+        "id": notification_id,
+        "status": status,
+        "errorMessage": error_message,
+        "processedAt": processed_at
+    }
+
+
+def _notifications_from_data(
+    notifications_data: List[Dict[str, Any]],
+    fast: bool = False,
+) -> List[OrderAgentNotification]:
+    """Build OrderAgentNotification objects from GetPendingAgentNotifications rows."""
+    if fast:
+        return fast_models.decode_many("OrderAgentNotification", notifications_data)
+    # Convert dicts to OrderAgentNotification objects
+    notifications = []
+    for notification_data in notifications_data:
+        try:
+            # Parse order data if present
+            order_data = notification_data.get("order")
+            order = None
+            if order_data:
+                # Create a minimal Order object with available fields
+                # Use model_construct to allow partial data
+                business_location_data = order_data.get("business_location")
+                business_location = None
+                if business_location_data:
+                    address_data = business_location_data.get("address")
+                    address = None
+                    if address_data:
+                        address = Address.model_construct(
+                            id=address_data.get("id", ""),
+                            address_line_1=address_data.get("address_line_1", ""),
+                            address_line_2=address_data.get("address_line_2"),
+                            city=address_data.get("city", ""),
+                            state=address_data.get("state", ""),
+                            postal_code=address_data.get("postal_code", ""),
+                            country=address_data.get("country", ""),
+                            latitude=address_data.get("latitude"),
+                            longitude=address_data.get("longitude"),
+                        )
+                    business_location = BusinessLocation.model_construct(
+                        id=business_location_data.get("id", ""),
+                        name=business_location_data.get("name", ""),
+                        address=address,
+                    )
+
+                order = Order.model_construct(
+                    id=order_data.get("id", ""),
+                    order_number=order_data.get("order_number", ""),
+                    current_status=order_data.get("current_status", ""),
+                    business_location=business_location,
+
+                )
+
+            # Create OrderAgentNotification object
+            notification = OrderAgentNotification.model_construct(
+                id=notification_data.get("id", ""),
+                order_id=notification_data.get("order_id", ""),
+                notification_type=notification_data.get("notification_type", ""),
+                status=notification_data.get("status", ""),
+                error_message=notification_data.get("error_message"),
+                created_at=parse_datetime(notification_data.get("created_at")),
+                updated_at=parse_datetime(notification_data.get("updated_at")),
+                processed_at=parse_datetime(notification_data.get("processed_at")),
+                order=order,
+            )
+            notifications.append(notification)
+        except Exception as e:
+            log_error(
+                "Error parsing notification data",
+                error=e,
+                notification_id=notification_data.get("id"),
+            )
+            # Continue processing other notifications
+            continue
+    return notifications
+
+
 def create_pending_agent_notification(
     order_id: str,
     notification_type: str,
@@ -795,29 +1040,11 @@ def create_pending_agent_notification(
     Returns:
         Notification ID if created successfully, None otherwise
     """
-    mutation = """
-    mutation CreatePendingAgentNotification($orderId: uuid!, $notificationType: notification_type!) {
-      insert_order_agent_notifications_one(
-        object: {
-          order_id: $orderId
-          notification_type: $notificationType
-          status: pending
-        }
-        on_conflict: {
-          constraint: order_agent_notifications_order_type_unique
-          update_columns: []
-        }
-      ) {
-        id
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
     log_info("Creating pending agent notification", order_id=order_id, notification_type=notification_type)
     
     try:
-        data = client.execute(mutation, {
+        data = client.execute(CREATE_PENDING_AGENT_NOTIFICATION_MUTATION, {
             "orderId": order_id,
             "notificationType": notification_type
         })
@@ -839,7 +1066,8 @@ def create_pending_agent_notification(
 def get_pending_agent_notifications(
     notification_type: str,
     hasura_endpoint: str,
-    hasura_admin_secret: str
+    hasura_admin_secret: str,
+    fast: Optional[bool] = None
 ) -> List[OrderAgentNotification]:
     """
     Fetch all pending agent notifications of a specific type.
@@ -848,120 +1076,24 @@ def get_pending_agent_notifications(
         notification_type: Type of notification to fetch (e.g., 'order_proximity')
         hasura_endpoint: Hasura GraphQL endpoint
         hasura_admin_secret: Hasura admin secret
+        fast: Return ``models.fast`` twins instead of Pydantic models
+            (default: ``RENDASUA_FAST_MODELS``)
         
     Returns:
         List of OrderAgentNotification objects with order details
     """
-    query = """
-    query GetPendingAgentNotifications($notificationType: notification_type!) {
-      order_agent_notifications(
-        where: {
-          status: { _eq: pending }
-          notification_type: { _eq: $notificationType }
-        }
-      ) {
-        id
-        order_id
-        notification_type
-        status
-        error_message
-        created_at
-        updated_at
-        processed_at
-        order {
-          id
-          order_number
-          current_status
-          business_location {
-            id
-            name
-            address {
-              id
-              address_line_1
-              address_line_2
-              city
-              state
-              postal_code
-              country
-              latitude
-              longitude
-            }
-          }
-        }
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
     log_info("Fetching pending agent notifications", notification_type=notification_type)
     
     try:
-        data = client.execute(query, {"notificationType": notification_type})
+        data = client.execute(PENDING_AGENT_NOTIFICATIONS_QUERY, {"notificationType": notification_type})
         notifications_data = data.get("order_agent_notifications", [])
         log_info("Fetched pending notifications", count=len(notifications_data), notification_type=notification_type)
         
-        # Convert dicts to OrderAgentNotification objects
-        notifications = []
-        for notification_data in notifications_data:
-            try:
-                # Parse order data if present
-                order_data = notification_data.get("order")
-                order = None
-                if order_data:
-                    # Create a minimal Order object with available fields
-                    # Use model_construct to allow partial data
-                    business_location_data = order_data.get("business_location")
-                    business_location = None
-                    if business_location_data:
-                        address_data = business_location_data.get("address")
-                        address = None
-                        if address_data:
-                            address = Address.model_construct(
-                                id=address_data.get("id", ""),
-                                address_line_1=address_data.get("address_line_1", ""),
-                                address_line_2=address_data.get("address_line_2"),
-                                city=address_data.get("city", ""),
-                                state=address_data.get("state", ""),
-                                postal_code=address_data.get("postal_code", ""),
-                                country=address_data.get("country", ""),
-                                latitude=address_data.get("latitude"),
-                                longitude=address_data.get("longitude"),
-                            )
-                        business_location = BusinessLocation.model_construct(
-                            id=business_location_data.get("id", ""),
-                            name=business_location_data.get("name", ""),
-                            address=address,
-                        )
-                    
-                    order = Order.model_construct(
-                        id=order_data.get("id", ""),
-                        order_number=order_data.get("order_number", ""),
-                        current_status=order_data.get("current_status", ""),
-                        business_location=business_location,
-                        
-                    )
-                
-                # Create OrderAgentNotification object
-                notification = OrderAgentNotification.model_construct(
-                    id=notification_data.get("id", ""),
-                    order_id=notification_data.get("order_id", ""),
-                    notification_type=notification_data.get("notification_type", ""),
-                    status=notification_data.get("status", ""),
-                    error_message=notification_data.get("error_message"),
-                    created_at=parse_datetime(notification_data.get("created_at")),
-                    updated_at=parse_datetime(notification_data.get("updated_at")),
-                    processed_at=parse_datetime(notification_data.get("processed_at")),
-                    order=order,
-                )
-                notifications.append(notification)
-            except Exception as e:
-                log_error(
-                    "Error parsing notification data",
-                    error=e,
-                    notification_id=notification_data.get("id"),
-                )
-                # Continue processing other notifications
-                continue
+        notifications = _notifications_from_data(
+            notifications_data,
+            fast_models.fast_models_enabled() if fast is None else fast,
+        )
         
         log_info("Parsed notifications into objects", count=len(notifications), notification_type=notification_type)
         return notifications
@@ -991,39 +1123,12 @@ def update_notification_status(
     Returns:
         True if successful, False otherwise
     """
-    mutation = """
-    mutation UpdateNotificationStatus(
-      $id: uuid!
-      $status: notification_status!
-      $errorMessage: String
-      $processedAt: timestamptz
-    ) {
-      update_order_agent_notifications_by_pk(
-        pk_columns: { id: $id }
-        _set: {
-          status: $status
-          error_message: $errorMessage
-          processed_at: $processedAt
-        }
-      ) {
-        id
-      }
-    }
-    """
-    
     client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
     log_info("Updating notification status", notification_id=notification_id, status=status)
     
     try:
-        # Get current timestamp in ISO format
-        processed_at = datetime.datetime.now(timezone.utc).isoformat()
-        variables = {
-            "id": notification_id,
-            "status": status,
-            "errorMessage": error_message,
-            "processedAt": processed_at
-        }
-        data = client.execute(mutation, variables)
+        variables = _notification_status_variables(notification_id, status, error_message)
+        data = client.execute(UPDATE_NOTIFICATION_STATUS_MUTATION, variables)
         updated = data.get("update_order_agent_notifications_by_pk")
         
         if not updated:
@@ -1037,3 +1142,69 @@ def update_notification_status(
         log_error("Error updating notification status", error=e, notification_id=notification_id)
         return False
 
+
+def _notification_statuses_updates(
+    updates: Sequence[Tuple[str, str, Optional[str]]],
+) -> List[Dict[str, Any]]:
+    # One entry per distinct (status, error_message), matching its ids with _in
+    processed_at = datetime.datetime.now(timezone.utc).isoformat()
+    ids_by_outcome: Dict[Tuple[str, Optional[str]], List[str]] = {}
+    for notification_id, status, error_message in updates:
+        ids = ids_by_outcome.setdefault((status, error_message), [])
+        if notification_id not in ids:
+            ids.append(notification_id)
+    return [
+        {
+            "where": {"id": {"_in": ids}},
+            "_set": {
+                "status": status,
+                "error_message": error_message,
+                "processed_at": processed_at,
+            },
+        }
+        for (status, error_message), ids in ids_by_outcome.items()
+    ]
+
+
+def update_notification_statuses(
+    updates: Sequence[Tuple[str, str, Optional[str]]],
+    hasura_endpoint: str,
+    hasura_admin_secret: str
+) -> int:
+    """
+    Update the status of many agent notifications in one mutation.
+    
+    Notifications sharing the same status and error message are matched
+    together with ``_in``, so a run that marks hundreds of notifications
+    complete costs a single round trip.
+    
+    Args:
+        updates: (notification_id, status, error_message) tuples
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        
+    Returns:
+        Number of notifications updated (0 on error)
+    """
+    if not updates:
+        return 0
+    
+    client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+    log_info("Updating notification statuses", count=len(updates))
+    
+    try:
+        variables = {"updates": _notification_statuses_updates(updates)}
+        data = client.execute(UPDATE_NOTIFICATION_STATUSES_MANY_MUTATION, variables)
+        results = data.get("update_order_agent_notifications_many") or []
+        updated = sum((result or {}).get("affected_rows", 0) for result in results)
+        
+        if updated < len({notification_id for notification_id, _, _ in updates}):
+            log_error("Some notifications were not found for update", requested=len(updates), updated=updated)
+        
+        log_info("Notification statuses updated", updated=updated, groups=len(results))
+        return updated
+        
+    except Exception as e:
+        log_error("Error updating notification statuses", error=e, count=len(updates))
+        return 0
+
@@ -0,0 +1,251 @@
+"""
+Registry of the GraphQL operations used by the core package.
+
+Every operation is stored once in a compact (whitespace- and
+comment-stripped) form together with a stable SHA-256 hash of that text.
+The Hasura client looks operations up here to build request payloads:
+
+* By default it sends the compact text, which is smaller on the wire.
+* With ``HASURA_PERSISTED_QUERIES=true`` it sends only the hash in the
+  Apollo persisted-query extension. If the server rejects the reference,
+  the request is repeated once with the full text (plus the hash, so
+  servers that support it can store it). When the server never accepts a
+  reference, persisted mode switches itself off for the container.
+
+Service modules are scanned when ``hasura_client`` first loads them, and
+``hasura_client.register_all_operations`` loads them all, so the registry
+also serves as the source for the Hasura allow-list (``export_allow_list``).
+Operations that were not seen at load time are registered on first use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Dict, Iterable, List, Optional
+
+import hashlib
+import os
+import re
+import threading
+
+
+ALLOW_LIST_COLLECTION = "rendasua_core_packages"
+
+_OPERATION_START = re.compile(r"^\s*(query|mutation|subscription)\b")
+_OPERATION_NAME = re.compile(r"^(?:query|mutation|subscription)\s*([_A-Za-z][_0-9A-Za-z]*)")
+_PUNCTUATORS = set("{}()[]:,=!|&@$")
+
+# The server understands references but has not stored this one yet.
+_NOT_FOUND_MARKERS = ("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+# The server cannot resolve references at all (stock Hasura reports the
+# missing "query" key as a parse failure).
+_UNSUPPORTED_MARKERS = (
+    "PersistedQueryNotSupported",
+    "PERSISTED_QUERY_NOT_SUPPORTED",
+    "parse-failed",
+)
+
+REJECTED_NOT_FOUND = "not_found"
+REJECTED_UNSUPPORTED = "unsupported"
+
+
+@dataclass(frozen=True)
+class RegisteredOperation:
+    name: Optional[str]
+    text: str
+    sha256: str
+
+
+_lock = threading.Lock()
+_by_source: Dict[str, RegisteredOperation] = {}
+_by_hash: Dict[str, RegisteredOperation] = {}
+# None: not tried yet, True: server accepted a reference, False: never accepted
+_persisted_supported: Optional[bool] = None
+
+
+def compact_operation(text: str) -> str:
+    """
+    Strip comments and insignificant whitespace from a GraphQL document.
+
+    String literals are copied verbatim; whitespace is dropped next to
+    punctuators and collapsed to a single space elsewhere.
+    """
+    out: List[str] = []
+    pending_space = False
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == '"':
+            end = i + 1
+            while end < length and text[end] != '"':
+                end += 2 if text[end] == "\\" else 1
+            if pending_space and out and out[-1][-1] not in _PUNCTUATORS:
+                out.append(" ")
+            pending_space = False
+            out.append(text[i:end + 1])
+            i = end + 1
+            continue
+        if char == "#":
+            while i < length and text[i] not in "\r\n":
+                i += 1
+            pending_space = True
+            continue
+        if char.isspace():
+            pending_space = True
+            i += 1
+            continue
+        if pending_space and out and char not in _PUNCTUATORS and out[-1][-1] not in _PUNCTUATORS:
+            out.append(" ")
+        pending_space = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def register_operation(text: str) -> RegisteredOperation:
+    """Register an operation (idempotent) and return its compact form and hash."""
+    operation = _by_source.get(text)
+    if operation is not None:
+        return operation
+
+    compact = compact_operation(text)
+    digest = hashlib.sha256(compact.encode("utf-8")).hexdigest()
+    match = _OPERATION_NAME.match(compact)
+    operation = RegisteredOperation(
+        name=match.group(1) if match else None,
+        text=compact,
+        sha256=digest,
+    )
+    with _lock:
+        operation = _by_hash.setdefault(digest, operation)
+        _by_source[text] = operation
+    return operation
+
+
+def _is_operation_text(value: Any) -> bool:
+    return isinstance(value, str) and bool(_OPERATION_START.match(value)) and "{" in value
+
+
+def _code_constants(code: CodeType) -> Iterable[Any]:
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _code_constants(const)
+        else:
+            yield const
+
+
+def register_module_operations(*modules: ModuleType) -> int:
+    """
+    Register every GraphQL operation defined in ``modules``.
+
+    Both module-level constants and string literals inside the module's
+    functions are picked up. Returns the number of operations found.
+    """
+    found = 0
+    for module in modules:
+        for value in vars(module).values():
+            candidates: Iterable[Any] = ()
+            if _is_operation_text(value):
+                candidates = (value,)
+            elif isinstance(value, FunctionType) and value.__module__ == module.__name__:
+                candidates = _code_constants(value.__code__)
+            for candidate in candidates:
+                if _is_operation_text(candidate):
+                    register_operation(candidate)
+                    found += 1
+    return found
+
+
+def registered_operations() -> List[RegisteredOperation]:
+    with _lock:
+        return sorted(_by_hash.values(), key=lambda op: (op.name or "", op.sha256))
+
+
+def export_allow_list(collection_name: str = ALLOW_LIST_COLLECTION) -> Dict[str, Any]:
+    """
+    Build a Hasura query collection containing every registered operation.
+
+    The result can be passed to the ``create_query_collection`` metadata API
+    and then added to the allow-list with ``add_collection_to_allowlist``.
+    """
+    queries = []
+    for operation in registered_operations():
+        queries.append({
+            "name": f"{operation.name or 'anonymous'}_{operation.sha256[:12]}",
+            "query": operation.text,
+        })
+    return {"name": collection_name, "definition": {"queries": queries}}
+
+
+def persisted_queries_enabled() -> bool:
+    value = os.environ.get("HASURA_PERSISTED_QUERIES", "false").strip().lower()
+    return value in ("1", "true", "yes")
+
+
+def persisted_queries_active() -> bool:
+    """True when requests should try hash-only references first."""
+    return persisted_queries_enabled() and _persisted_supported is not False
+
+
+def record_persisted_result(rejection: Optional[str]) -> None:
+    """
+    Remember whether the server accepts persisted-query references.
+
+    ``rejection`` is None for an accepted reference, otherwise one of
+    ``REJECTED_NOT_FOUND`` / ``REJECTED_UNSUPPORTED``.
+    """
+    global _persisted_supported
+    if rejection != REJECTED_UNSUPPORTED:
+        _persisted_supported = True
+    elif _persisted_supported is None:
+        # References were never accepted: stop sending them rather than
+        # paying a second round trip on every request.
+        _persisted_supported = False
+
+
+def reset_persisted_state() -> None:
+    global _persisted_supported
+    _persisted_supported = None
+
+
+def build_request(
+    query: str,
+    variables: Optional[Dict[str, Any]],
+    persisted: bool = False,
+    include_hash: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the JSON body for one operation.
+
+    ``persisted`` sends the hash reference only; ``include_hash`` adds the
+    reference alongside the full text (used when retrying a rejected
+    reference so the server can store it).
+    """
+    operation = register_operation(query)
+    payload: Dict[str, Any] = {"variables": variables or {}}
+    if not persisted:
+        payload["query"] = operation.text
+    if operation.name:
+        payload["operationName"] = operation.name
+    if persisted or include_hash:
+        payload["extensions"] = {
+            "persistedQuery": {"version": 1, "sha256Hash": operation.sha256}
+        }
+    return payload
+
+
+def persisted_query_rejection(response: Any) -> Optional[str]:
+    """Classify a response that could not resolve a hash reference, else None."""
+    if not isinstance(response, dict):
+        return None
+    for error in response.get("errors") or []:
+        extensions = error.get("extensions") or {}
+        text = f"{extensions.get('code', '')} {error.get('message', '')}"
+        if any(marker in text for marker in _NOT_FOUND_MARKERS):
+            return REJECTED_NOT_FOUND
+        if any(marker in text for marker in _UNSUPPORTED_MARKERS):
+            return REJECTED_UNSUPPORTED
+    return None
+
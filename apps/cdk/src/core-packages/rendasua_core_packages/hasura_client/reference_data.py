@@ -0,0 +1,230 @@
+"""
+Container-wide cache of rarely changing reference data.
+
+``ReferenceDataCache`` keeps one immutable ``ReferenceData`` snapshot of
+
+* ``application_configurations`` (indexed by config key and country),
+* the active partners,
+* the RendaSua HQ user,
+
+loaded with a single combined query on a miss and reused across warm
+invocations until it is older than the TTL (env REFERENCE_DATA_TTL_SECONDS,
+default 300; 0 disables caching). Each snapshot carries a ``version`` that
+only increases when the loaded content actually changed. When a reload
+fails the previous snapshot keeps being served.
+
+``invalidate_reference_data`` only expires the snapshot of the container it
+runs in; nothing calls it on configuration changes, so other warm containers
+keep their snapshot until it expires. The TTL is therefore the only bound on
+how stale reference data can be across containers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from rendasua_core_packages.models import Partner, User
+from .base import HasuraClient
+from .logging import log_info, log_error
+
+
+DEFAULT_TTL_SECONDS = 300
+
+REFERENCE_DATA_QUERY = """
+query GetReferenceData {
+  application_configurations {
+    config_key
+    country_code
+    status
+    number_value
+    updated_at
+  }
+  partners(where: { is_active: { _eq: true } }) {
+    id
+    user_id
+    company_name
+    base_delivery_fee_commission
+    per_km_delivery_fee_commission
+    item_commission
+    is_active
+    created_at
+    updated_at
+  }
+  users(where: { email: { _eq: "hq@rendasua.com" } }) {
+    id
+    user_type_id
+    identifier
+    first_name
+    last_name
+    email
+    phone_number
+    created_at
+    updated_at
+  }
+}
+"""
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    version: int
+    fingerprint: str
+    loaded_at: float
+    configurations: Dict[str, Tuple[Dict[str, Any], ...]]
+    partners: Tuple[Partner, ...]
+    hq_user: Optional[User]
+
+    def configuration_rows(self, config_key: str) -> List[Dict[str, Any]]:
+        """All application_configurations rows for ``config_key``, in load order."""
+        return list(self.configurations.get(config_key, ()))
+
+    def config_number(
+        self,
+        config_key: str,
+        country_code: Optional[str] = None,
+        status: Optional[str] = "active",
+    ) -> Optional[float]:
+        """``number_value`` of the first row matching key, country and status; None if absent."""
+        for row in self.configurations.get(config_key, ()):
+            if country_code is not None and row.get("country_code") != country_code:
+                continue
+            if status is not None and row.get("status") != status:
+                continue
+            value = row.get("number_value")
+            return float(value) if value is not None else None
+        return None
+
+
+@dataclass
+class ReferenceDataStats:
+    hits: int = 0
+    loads: int = 0
+    load_errors: int = 0
+    stale_served: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.loads + self.load_errors
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "stale_served": self.stale_served,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ReferenceDataCache:
+    """One reference-data snapshot per container, refreshed after ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None) -> None:
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else _env_number("REFERENCE_DATA_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        )
+        self.stats = ReferenceDataStats()
+        self._snapshot: Optional[ReferenceData] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _fresh(self, snapshot: Optional[ReferenceData]) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+
+    def get(self, client: HasuraClient, force_refresh: bool = False) -> Optional[ReferenceData]:
+        """
+        Current snapshot, loading it with one query when missing or expired.
+
+        Returns the previous snapshot if the reload fails, None if nothing
+        could ever be loaded.
+        """
+        snapshot = self._snapshot
+        if not force_refresh and self._fresh(snapshot):
+            self.stats.hits += 1
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if not force_refresh and self._fresh(snapshot):
+                self.stats.hits += 1
+                return snapshot
+            try:
+                data = client.execute(REFERENCE_DATA_QUERY)
+            except Exception as e:
+                self.stats.load_errors += 1
+                log_error("Error loading reference data", error=e, stale_version=snapshot.version if snapshot else None)
+                if snapshot is not None:
+                    self.stats.stale_served += 1
+                return snapshot
+            self._snapshot = self._build(data, snapshot)
+            self.stats.loads += 1
+            return self._snapshot
+
+    def _build(self, data: Dict[str, Any], previous: Optional[ReferenceData]) -> ReferenceData:
+        fingerprint = hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        if previous is not None and previous.fingerprint == fingerprint:
+            # Unchanged: keep the version (and the parsed models), restart the TTL
+            return replace(previous, loaded_at=time.monotonic())
+
+        # Import here to avoid circular imports
+        from .commission_service import _hq_user_from_data, _partners_from_data
+
+        configurations: Dict[str, List[Dict[str, Any]]] = {}
+        for row in data.get("application_configurations", []):
+            configurations.setdefault(row["config_key"], []).append(row)
+        self._version += 1
+        snapshot = ReferenceData(
+            version=self._version,
+            fingerprint=fingerprint,
+            loaded_at=time.monotonic(),
+            configurations={key: tuple(rows) for key, rows in configurations.items()},
+            partners=tuple(_partners_from_data(data)),
+            hq_user=_hq_user_from_data(data),
+        )
+        log_info(
+            "Reference data loaded",
+            version=snapshot.version,
+            configurations=sum(len(rows) for rows in snapshot.configurations.values()),
+            partners=len(snapshot.partners),
+            hq_user_found=snapshot.hq_user is not None,
+        )
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Expire the snapshot; the next ``get`` reloads it (and keeps the version if nothing changed)."""
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot = replace(self._snapshot, loaded_at=float("-inf"))
+            self.stats.invalidations += 1
+
+
+_cache: Optional[ReferenceDataCache] = None
+
+
+def get_reference_data_cache() -> ReferenceDataCache:
+    """Container-wide cache instance (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = ReferenceDataCache()
+    return _cache
+
+
+def invalidate_reference_data() -> None:
+    """Make the next lookup in this container reload configurations, partners and the HQ user."""
+    get_reference_data_cache().invalidate()
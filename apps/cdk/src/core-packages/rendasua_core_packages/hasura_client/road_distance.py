@@ -0,0 +1,412 @@
+"""
+Road distances with a two-level cache and a haversine fallback.
+
+Coordinates are snapped to cells (``DISTANCE_CACHE_CELL_DECIMALS`` decimal
+places, default 2 ≈ 1.1 km) and each cell gets a stable uuid5 id, which is
+what goes into ``google_distance_cache.origin_address_id`` /
+``destination_address_id`` (the backend stores real address ids there;
+uuid5 cell ids cannot collide with them).
+
+* ``RoadDistanceService.distances`` never calls Google: it answers from the
+  in-process LRU, then ``google_distance_cache`` (one query for all misses),
+  and falls back to the straight-line haversine distance.
+* ``RoadDistanceService.fill`` warms the cache for origins × destinations
+  with one Distance Matrix request per origin (25 destinations each) and a
+  single bulk insert.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import os
+import threading
+import time
+import uuid
+
+from rendasua_core_packages.utilities import TokenBucket, calculate_haversine_distance
+from rendasua_core_packages.utilities.distance_matrix import (
+    MAX_DESTINATIONS_PER_REQUEST,
+    request_distance_row,
+)
+from .base import HasuraClient, HasuraClientConfig
+from .logging import log_info, log_error
+
+
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_CELL_DECIMALS = 2
+
+# Namespace for cell ids stored in google_distance_cache
+CELL_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://rendasua.com/distance-cells")
+
+SOURCE_MEMORY = "memory"
+SOURCE_HASURA = "hasura"
+SOURCE_HAVERSINE = "haversine"
+
+DISTANCE_CACHE_QUERY = """
+query GetDistanceCacheCells($originIds: [uuid!]!, $destinationIds: [uuid!]!) {
+  google_distance_cache(
+    where: {
+      origin_address_id: { _in: $originIds }
+      destination_address_id: { _in: $destinationIds }
+      expires_at: { _gt: "now()" }
+    }
+  ) {
+    origin_address_id
+    destination_address_id
+    distance_value
+    duration_value
+    status
+    expires_at
+  }
+}
+"""
+
+INSERT_DISTANCE_CACHE_MUTATION = """
+mutation InsertDistanceCacheCells($entries: [google_distance_cache_insert_input!]!) {
+  insert_google_distance_cache(
+    objects: $entries
+    on_conflict: {
+      constraint: google_distance_cache_origin_address_id_destination_address_key
+      update_columns: [
+        distance_value
+        distance_text
+        duration_value
+        duration_text
+        status
+        expires_at
+      ]
+    }
+  ) {
+    affected_rows
+  }
+}
+"""
+
+LatLng = Tuple[float, float]
+# (distance in metres or None when Google found no route, duration in seconds or None)
+_CachedPair = Tuple[Optional[int], Optional[int]]
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _seconds_until(expires_at: Optional[str], default: float) -> float:
+    try:
+        expires = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+        return (expires - datetime.now(timezone.utc)).total_seconds()
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class RoadDistance:
+    distance_km: float
+    duration_seconds: Optional[int]
+    # "memory", "hasura" or "haversine" (straight line, no road data)
+    source: str
+
+    @property
+    def is_road(self) -> bool:
+        return self.source != SOURCE_HAVERSINE
+
+
+@dataclass
+class RoadDistanceStats:
+    memory_hits: int = 0
+    db_hits: int = 0
+    haversine_fallbacks: int = 0
+    api_requests: int = 0
+    api_pairs: int = 0
+    api_errors: int = 0
+    db_errors: int = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.db_hits + self.haversine_fallbacks
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "haversine_fallbacks": self.haversine_fallbacks,
+            "api_requests": self.api_requests,
+            "api_pairs": self.api_pairs,
+            "api_errors": self.api_errors,
+            "db_errors": self.db_errors,
+            "road_hit_ratio": round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+class RoadDistanceService:
+    """
+    Cell-keyed road distance cache.
+
+    Settings default from the environment: ``DISTANCE_CACHE_MAX_ENTRIES``
+    (20000 pairs), ``DISTANCE_CACHE_TTL_SECONDS`` (7 days) and
+    ``DISTANCE_CACHE_CELL_DECIMALS`` (2).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        cell_decimals: Optional[int] = None,
+    ) -> None:
+        self.max_entries = int(
+            max_entries if max_entries is not None
+            else _env_number("DISTANCE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else _env_number("DISTANCE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        )
+        self.cell_decimals = int(
+            cell_decimals if cell_decimals is not None
+            else _env_number("DISTANCE_CACHE_CELL_DECIMALS", DEFAULT_CELL_DECIMALS)
+        )
+        self.stats = RoadDistanceStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[_CachedPair, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def cell(self, point: LatLng) -> LatLng:
+        return round(point[0], self.cell_decimals), round(point[1], self.cell_decimals)
+
+    def cell_label(self, point: LatLng) -> str:
+        lat, lng = self.cell(point)
+        return f"{lat:.{self.cell_decimals}f},{lng:.{self.cell_decimals}f}"
+
+    def cell_id(self, point: LatLng) -> str:
+        return str(uuid.uuid5(CELL_NAMESPACE, self.cell_label(point)))
+
+    def _get_local(self, key: Tuple[str, str]) -> Optional[_CachedPair]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _put_local(self, key: Tuple[str, str], value: _CachedPair, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + min(ttl_seconds, self.ttl_seconds))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load_from_db(
+        self,
+        client: HasuraClient,
+        origin_ids: Iterable[str],
+        destination_ids: Iterable[str],
+    ) -> Set[Tuple[str, str]]:
+        """Copy matching google_distance_cache rows into the LRU; returns the keys found."""
+        try:
+            data = client.execute(DISTANCE_CACHE_QUERY, {
+                "originIds": sorted(set(origin_ids)),
+                "destinationIds": sorted(set(destination_ids)),
+            })
+        except Exception as e:
+            self.stats.db_errors += 1
+            log_error("Error reading distance cache", error=e)
+            return set()
+        found = set()
+        for row in data.get("google_distance_cache", []):
+            key = (row["origin_address_id"], row["destination_address_id"])
+            distance = row.get("distance_value") if row.get("status") == "OK" else None
+            self._put_local(
+                key,
+                (distance, row.get("duration_value")),
+                _seconds_until(row.get("expires_at"), self.ttl_seconds),
+            )
+            found.add(key)
+        return found
+
+    def distances(
+        self,
+        origin: LatLng,
+        destinations: Sequence[LatLng],
+        hasura_endpoint: Optional[str] = None,
+        hasura_admin_secret: Optional[str] = None,
+    ) -> List[RoadDistance]:
+        """
+        Road distance from ``origin`` to each destination, without calling Google.
+
+        Pairs not cached (or without a road route) get the haversine distance
+        with ``source == "haversine"``.
+        """
+        origin_id = self.cell_id(origin)
+        keys = [(origin_id, self.cell_id(destination)) for destination in destinations]
+        cached: Dict[Tuple[str, str], _CachedPair] = {}
+        sources: Dict[Tuple[str, str], str] = {}
+        for key in keys:
+            value = self._get_local(key)
+            if value is not None:
+                cached[key] = value
+                sources[key] = SOURCE_MEMORY
+
+        missing = [key for key in keys if key not in cached]
+        if missing and hasura_endpoint:
+            client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+            for key in self._load_from_db(client, [origin_id], [key[1] for key in missing]):
+                value = self._get_local(key)
+                if value is not None:
+                    cached[key] = value
+                    sources[key] = SOURCE_HASURA
+
+        results = []
+        for destination, key in zip(destinations, keys):
+            value = cached.get(key)
+            if value is not None and value[0] is not None:
+                if sources[key] == SOURCE_MEMORY:
+                    self.stats.memory_hits += 1
+                else:
+                    self.stats.db_hits += 1
+                results.append(RoadDistance(value[0] / 1000.0, value[1], sources[key]))
+            else:
+                self.stats.haversine_fallbacks += 1
+                results.append(RoadDistance(
+                    calculate_haversine_distance(origin[0], origin[1], destination[0], destination[1]),
+                    None,
+                    SOURCE_HAVERSINE,
+                ))
+        return results
+
+    def distance(
+        self,
+        origin: LatLng,
+        destination: LatLng,
+        hasura_endpoint: Optional[str] = None,
+        hasura_admin_secret: Optional[str] = None,
+    ) -> RoadDistance:
+        return self.distances(origin, [destination], hasura_endpoint, hasura_admin_secret)[0]
+
+    def fill(
+        self,
+        origins: Sequence[LatLng],
+        destinations: Sequence[LatLng],
+        google_maps_api_key: Optional[str],
+        hasura_endpoint: Optional[str] = None,
+        hasura_admin_secret: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> int:
+        """
+        Make sure every origin × destination cell pair is cached.
+
+        Pairs already in the LRU or ``google_distance_cache`` are skipped;
+        the rest are requested from Google, one Distance Matrix request per
+        origin cell (split every 25 destinations), and written back with a
+        single bulk insert.
+
+        Returns:
+            Number of pairs fetched from Google
+        """
+        origin_cells: Dict[str, LatLng] = {}
+        for origin in origins:
+            origin_cells.setdefault(self.cell_id(origin), self.cell(origin))
+        destination_cells: Dict[str, LatLng] = {}
+        for destination in destinations:
+            destination_cells.setdefault(self.cell_id(destination), self.cell(destination))
+        if not origin_cells or not destination_cells:
+            return 0
+
+        missing = {
+            (origin_id, destination_id)
+            for origin_id in origin_cells
+            for destination_id in destination_cells
+            if self._get_local((origin_id, destination_id)) is None
+        }
+        client = None
+        if missing and hasura_endpoint:
+            client = HasuraClient(HasuraClientConfig(endpoint=hasura_endpoint, admin_secret=hasura_admin_secret))
+            missing -= self._load_from_db(
+                client,
+                {key[0] for key in missing},
+                {key[1] for key in missing},
+            )
+        if not missing:
+            return 0
+        if not google_maps_api_key:
+            log_error("Google Maps API key not found; road distances not fetched")
+            return 0
+
+        expires_at = (datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)).isoformat()
+        entries = []
+        fetched = 0
+        for origin_id, origin_cell in origin_cells.items():
+            destination_ids = sorted(d for o, d in missing if o == origin_id)
+            for start in range(0, len(destination_ids), MAX_DESTINATIONS_PER_REQUEST):
+                chunk = destination_ids[start:start + MAX_DESTINATIONS_PER_REQUEST]
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                self.stats.api_requests += 1
+                elements, _status = request_distance_row(
+                    origin_cell,
+                    [destination_cells[d] for d in chunk],
+                    google_maps_api_key,
+                )
+                if elements is None:
+                    self.stats.api_errors += 1
+                    continue
+                for destination_id, element in zip(chunk, elements):
+                    status = element.get("status", "NOT_FOUND")
+                    distance = element.get("distance") or {}
+                    duration = element.get("duration") or {}
+                    distance_value = distance.get("value") if status == "OK" else None
+                    self._put_local(
+                        (origin_id, destination_id),
+                        (distance_value, duration.get("value")),
+                        self.ttl_seconds,
+                    )
+                    entries.append({
+                        "origin_address_id": origin_id,
+                        "destination_address_id": destination_id,
+                        "origin_address_formatted": self.cell_label(origin_cell),
+                        "destination_address_formatted": self.cell_label(destination_cells[destination_id]),
+                        "distance_value": distance_value,
+                        "distance_text": distance.get("text"),
+                        "duration_value": duration.get("value"),
+                        "duration_text": duration.get("text"),
+                        "status": status,
+                        "expires_at": expires_at,
+                    })
+                    fetched += 1
+        self.stats.api_pairs += fetched
+
+        if entries and client is not None:
+            try:
+                client.execute(INSERT_DISTANCE_CACHE_MUTATION, {"entries": entries})
+            except Exception as e:
+                self.stats.db_errors += 1
+                log_error("Error writing distance cache", error=e, entries=len(entries))
+        log_info("Road distance cache filled", pairs=fetched, **self.stats.as_dict())
+        return fetched
+
+
+_service: Optional[RoadDistanceService] = None
+
+
+def get_road_distance_service() -> RoadDistanceService:
+    """Container-wide service instance (created on first use)."""
+    global _service
+    if _service is None:
+        _service = RoadDistanceService()
+    return _service
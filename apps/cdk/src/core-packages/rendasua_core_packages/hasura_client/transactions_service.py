@@ -1,8 +1,7 @@
 """Transaction-related Hasura operations."""
 from typing import Dict, Any
-from .base import HasuraClient, HasuraClientConfig
 from .logging import log_info, log_error
-from .accounts_service import register_account_transaction
+from .ledger_service import LedgerPosting, post_journal
 
 
 def register_cancellation_fee_transactions(
@@ -17,6 +16,8 @@ def register_cancellation_fee_transactions(
 ) -> Dict[str, Any]:
     """
     Register cancellation fee transactions: debit client, credit business.
+
+    Both postings are committed as one journal, so either both apply or neither.
     
     Args:
         order_id: Order ID
@@ -39,45 +40,45 @@ def register_cancellation_fee_transactions(
         business_account_id=business_account_id,
     )
     
-    # Debit client account
-    client_debit_memo = f"Cancellation fee for order {order_number}"
-    client_transaction_id = register_account_transaction(
-        client_account_id,
-        fee_amount,
-        "fee",
-        client_debit_memo,
-        order_id,
-        hasura_endpoint,
-        hasura_admin_secret
-    )
-    
-    if not client_transaction_id:
-        log_error("Failed to register client cancellation fee transaction", order_id=order_id)
-        return {"success": False, "error": "Failed to debit client account"}
-    
-    log_info("Client cancellation fee transaction registered", order_id=order_id, transaction_id=client_transaction_id)
-    
-    # Credit business account
-    business_credit_memo = f"Cancellation fee received for order {order_number}"
-    business_transaction_id = register_account_transaction(
-        business_account_id,
-        fee_amount,
-        "deposit",
-        business_credit_memo,
-        order_id,
+    result = post_journal(
+        [
+            LedgerPosting(
+                client_account_id,
+                fee_amount,
+                "fee",
+                f"Cancellation fee for order {order_number}",
+                order_id,
+                label="client cancellation fee",
+            ),
+            LedgerPosting(
+                business_account_id,
+                fee_amount,
+                "deposit",
+                f"Cancellation fee received for order {order_number}",
+                order_id,
+                label="business cancellation fee",
+            ),
+        ],
         hasura_endpoint,
-        hasura_admin_secret
+        hasura_admin_secret,
     )
-    
-    if not business_transaction_id:
-        log_error("Failed to register business cancellation fee transaction", order_id=order_id)
+
+    if not result.success:
+        log_error("Failed to register cancellation fee transactions", order_id=order_id, error=result.error)
+        if not result.results[0].accepted:
+            return {"success": False, "error": "Failed to debit client account"}
         return {"success": False, "error": "Failed to credit business account"}
-    
-    log_info("Business cancellation fee transaction registered", order_id=order_id, transaction_id=business_transaction_id)
-    
+
+    client_transaction_id, business_transaction_id = (r.transaction_id for r in result.results)
+    log_info(
+        "Cancellation fee transactions registered",
+        order_id=order_id,
+        client_transaction_id=client_transaction_id,
+        business_transaction_id=business_transaction_id,
+    )
+
     return {
         "success": True,
         "client_transaction_id": client_transaction_id,
         "business_transaction_id": business_transaction_id,
     }
-
@@ -0,0 +1,198 @@
+"""
+Shared, pooled HTTP transport for Hasura requests.
+
+A single ``requests.Session`` lives at module level so every
+``HasuraClient`` created in a warm Lambda container reuses the same
+keep-alive connections instead of opening a fresh TCP+TLS connection per
+query. The pool counts the connections it opens so callers can confirm
+that reuse is actually happening.
+
+Configuration (environment, read on first use):
+    HASURA_HTTP_POOL_SIZE   - connections kept per host (default 10)
+    HASURA_HTTP_TIMEOUT     - default per-request timeout in seconds (default 10)
+    HASURA_HTTP_KEEP_ALIVE  - "false" to close connections after each request
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10.0
+
+
+@dataclass
+class TransportConfig:
+    pool_size: int = DEFAULT_POOL_SIZE
+    timeout: float = DEFAULT_TIMEOUT
+    keep_alive: bool = True
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        keep_alive = os.environ.get("HASURA_HTTP_KEEP_ALIVE", "true").strip().lower()
+        return cls(
+            pool_size=int(os.environ.get("HASURA_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            timeout=float(os.environ.get("HASURA_HTTP_TIMEOUT", DEFAULT_TIMEOUT)),
+            keep_alive=keep_alive not in ("0", "false", "no"),
+        )
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests that were served on an already-open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+        }
+
+
+_lock = threading.Lock()
+_stats = TransportStats()
+_config: Optional[TransportConfig] = None
+_session: Optional[requests.Session] = None
+
+
+def _record_connection_opened() -> None:
+    with _lock:
+        _stats.connections_opened += 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        _record_connection_opened()
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        _record_connection_opened()
+        super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose urllib3 pools report every (re)connect."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _build_session(config: TransportConfig) -> requests.Session:
+    session = requests.Session()
+    adapter = _CountingHTTPAdapter(
+        pool_connections=config.pool_size,
+        pool_maxsize=config.pool_size,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # requests transparently decodes gzip/deflate bodies; ask for them explicitly.
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.headers["Connection"] = "keep-alive" if config.keep_alive else "close"
+    return session
+
+
+def get_transport_config() -> TransportConfig:
+    global _config
+    if _config is None:
+        _config = TransportConfig.from_env()
+    return _config
+
+
+def get_session() -> requests.Session:
+    """Return the container-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session(get_transport_config())
+    return _session
+
+
+def configure_transport(
+    pool_size: Optional[int] = None,
+    timeout: Optional[float] = None,
+    keep_alive: Optional[bool] = None,
+) -> TransportConfig:
+    """
+    Override transport settings and rebuild the shared session.
+
+    Unspecified values keep their current (or environment) defaults.
+    Open connections in the previous pool are closed.
+    """
+    global _config, _session
+    current = get_transport_config()
+    new_config = TransportConfig(
+        pool_size=pool_size if pool_size is not None else current.pool_size,
+        timeout=timeout if timeout is not None else current.timeout,
+        keep_alive=keep_alive if keep_alive is not None else current.keep_alive,
+    )
+    with _lock:
+        old_session = _session
+        _config = new_config
+        _session = _build_session(new_config)
+    if old_session is not None:
+        old_session.close()
+    return new_config
+
+
+def post_json(
+    url: str,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> requests.Response:
+    """POST a JSON payload over the shared session."""
+    session = get_session()
+    with _lock:
+        _stats.requests += 1
+    return session.post(
+        url,
+        json=payload,
+        headers=headers,
+        timeout=timeout if timeout is not None else get_transport_config().timeout,
+    )
+
+
+def get_transport_stats() -> TransportStats:
+    """Snapshot of request and connection counters for this container."""
+    with _lock:
+        return TransportStats(
+            requests=_stats.requests,
+            connections_opened=_stats.connections_opened,
+        )
+
+
+def reset_transport_stats() -> None:
+    with _lock:
+        _stats.requests = 0
+        _stats.connections_opened = 0
@@ -6,98 +6,71 @@ package and re-exported here via the `__all__` list for convenient imports.
 
 Usage:
     from rendasua_core_packages.models import User, Order, Account
+
+Models are loaded lazily (PEP 562): importing this package is cheap, and the
+first access to a model imports its module together with every model it
+references (directly or through nested models), then resolves their forward
+references with ``model_rebuild``. A Lambda that only needs ``Order`` never
+imports ``Item``, ``Rating`` and the rest.
 """
 
-# Explicit imports of all model classes
-# Note: Relative imports (from .module) require this file to be imported as part of a package
-# Do not run this file directly - import it as: from rendasua_core_packages.models import ...
-from .Account import Account
-from .AccountTransaction import AccountTransaction
-from .BalanceUpdate import BalanceUpdate
-from .Address import Address
-from .Agent import Agent
-from .AgentAddress import AgentAddress
-from .AgentLocation import AgentLocation
-from .AirtelMoneyPayment import AirtelMoneyPayment
-from .ApplicationConfiguration import ApplicationConfiguration
-from .Brand import Brand
-from .Business import Business
-from .BusinessAddress import BusinessAddress
-from .BusinessInventory import BusinessInventory
-from .BusinessLocation import BusinessLocation
-from .Client import Client
-from .ClientAddress import ClientAddress
-from .Coordinates import Coordinates
-from .CommissionPayout import CommissionPayout
-from .CountryDeliveryConfig import CountryDeliveryConfig
-from .DeliveryConfig import DeliveryConfig
-from .DeliveryTimeSlot import DeliveryTimeSlot
-from .DeliveryTimeWindow import DeliveryTimeWindow
-from .DocumentType import DocumentType
-from .EntityType import EntityType
-from .GoogleDistanceCache import GoogleDistanceCache
-from .GoogleGeocodeCache import GoogleGeocodeCache
-from .Item import Item
-from .ItemCategory import ItemCategory
-from .ItemImage import ItemImage
-from .ItemSubCategory import ItemSubCategory
-from .MobilePaymentTransaction import MobilePaymentTransaction
-from .MtnMomoPaymentRequest import MtnMomoPaymentRequest
-from .Order import Order
-from .OrderCancellationReason import OrderCancellationReason
-from .OrderHold import OrderHold
-from .OrderItem import OrderItem
-from .OrderStatuHistory import OrderStatuHistory
-from .Partner import Partner
-from .TransactionInfo import TransactionInfo
-from .PaymentCallback import PaymentCallback
-from .Rating import Rating
-from .RatingAggregate import RatingAggregate
-from .SupportedCountryState import SupportedCountryState
-from .SupportedPaymentSystem import SupportedPaymentSystem
-from .User import User
-from .UserMessage import UserMessage
-from .UserType import UserType
-from .UserUpload import UserUpload
-from .VehicleType import VehicleType
-from .OrderAgentNotification import OrderAgentNotification
-
-# Rebuild models with forward references
-# This resolves forward references after all models are imported
-# Models are rebuilt in dependency order to ensure all referenced models are available
-Account.model_rebuild()
-AccountTransaction.model_rebuild()
-Address.model_rebuild()
-Agent.model_rebuild()
-AgentAddress.model_rebuild()
-AgentLocation.model_rebuild()
-AirtelMoneyPayment.model_rebuild()
-Business.model_rebuild()
-BusinessAddress.model_rebuild()
-BusinessInventory.model_rebuild()
-BusinessLocation.model_rebuild()
-Client.model_rebuild()
-ClientAddress.model_rebuild()
-CommissionPayout.model_rebuild()
-CountryDeliveryConfig.model_rebuild()
-DeliveryTimeWindow.model_rebuild()
-Item.model_rebuild()
-ItemImage.model_rebuild()
-ItemSubCategory.model_rebuild()
-MobilePaymentTransaction.model_rebuild()
-MtnMomoPaymentRequest.model_rebuild()
-Order.model_rebuild()
-OrderHold.model_rebuild()
-OrderItem.model_rebuild()
-OrderStatuHistory.model_rebuild()
-OrderAgentNotification.model_rebuild()
-Partner.model_rebuild()
-PaymentCallback.model_rebuild()
-Rating.model_rebuild()
-TransactionInfo.model_rebuild()
-User.model_rebuild()
-UserUpload.model_rebuild()
-VehicleType.model_rebuild()
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import importlib
+import re
+import threading
+
+if TYPE_CHECKING:
+    from .Account import Account
+    from .AccountTransaction import AccountTransaction
+    from .BalanceUpdate import BalanceUpdate
+    from .Address import Address
+    from .Agent import Agent
+    from .AgentAddress import AgentAddress
+    from .AgentLocation import AgentLocation
+    from .AirtelMoneyPayment import AirtelMoneyPayment
+    from .ApplicationConfiguration import ApplicationConfiguration
+    from .Brand import Brand
+    from .Business import Business
+    from .BusinessAddress import BusinessAddress
+    from .BusinessInventory import BusinessInventory
+    from .BusinessLocation import BusinessLocation
+    from .Client import Client
+    from .ClientAddress import ClientAddress
+    from .Coordinates import Coordinates
+    from .CommissionPayout import CommissionPayout
+    from .CountryDeliveryConfig import CountryDeliveryConfig
+    from .DeliveryConfig import DeliveryConfig
+    from .DeliveryTimeSlot import DeliveryTimeSlot
+    from .DeliveryTimeWindow import DeliveryTimeWindow
+    from .DocumentType import DocumentType
+    from .EntityType import EntityType
+    from .GoogleDistanceCache import GoogleDistanceCache
+    from .GoogleGeocodeCache import GoogleGeocodeCache
+    from .Item import Item
+    from .ItemCategory import ItemCategory
+    from .ItemImage import ItemImage
+    from .ItemSubCategory import ItemSubCategory
+    from .MobilePaymentTransaction import MobilePaymentTransaction
+    from .MtnMomoPaymentRequest import MtnMomoPaymentRequest
+    from .Order import Order
+    from .OrderCancellationReason import OrderCancellationReason
+    from .OrderHold import OrderHold
+    from .OrderItem import OrderItem
+    from .OrderStatuHistory import OrderStatuHistory
+    from .Partner import Partner
+    from .TransactionInfo import TransactionInfo
+    from .PaymentCallback import PaymentCallback
+    from .Rating import Rating
+    from .RatingAggregate import RatingAggregate
+    from .SupportedCountryState import SupportedCountryState
+    from .SupportedPaymentSystem import SupportedPaymentSystem
+    from .User import User
+    from .UserMessage import UserMessage
+    from .UserType import UserType
+    from .UserUpload import UserUpload
+    from .VehicleType import VehicleType
+    from .OrderAgentNotification import OrderAgentNotification
 
 # Explicit __all__ list
 __all__: list[str] = [
@@ -152,3 +125,56 @@ __all__: list[str] = [
     "TransactionInfo",
     "OrderAgentNotification",
 ]
+
+
+# Each model lives in the module of the same name
+_MODEL_NAMES = frozenset(__all__)
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_lock = threading.RLock()
+_loaded: Dict[str, Any] = {}
+
+
+def _referenced_models(model: Any) -> List[str]:
+    # Annotations are strings (``from __future__ import annotations``)
+    names = set()
+    for annotation in getattr(model, "__annotations__", {}).values():
+        names.update(_IDENTIFIER.findall(str(annotation)))
+    return sorted(names & _MODEL_NAMES)
+
+
+def _load(name: str) -> Any:
+    with _lock:
+        if name in _loaded:
+            return _loaded[name]
+
+        # Import the model and everything reachable from its fields
+        pending = [name]
+        new: Dict[str, Any] = {}
+        while pending:
+            current = pending.pop()
+            if current in _loaded or current in new:
+                continue
+            module = importlib.import_module(f".{current}", __name__)
+            new[current] = getattr(module, current)
+            pending.extend(_referenced_models(new[current]))
+
+        # Importing a submodule sets it as a package attribute; replace it
+        # with the class so later lookups skip __getattr__
+        _loaded.update(new)
+        globals().update(new)
+
+        namespace = dict(_loaded)
+        for model in new.values():
+            if not getattr(model, "__pydantic_complete__", True):
+                model.model_rebuild(_types_namespace=namespace)
+        return _loaded[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MODEL_NAMES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _MODEL_NAMES)
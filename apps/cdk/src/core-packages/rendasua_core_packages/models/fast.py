@@ -0,0 +1,1779 @@
+"""
+Slotted dataclass twins of the Pydantic models, with fast decoders.
+
+GENERATED by generate_models.py (``python generate_models.py --fast``);
+do not edit by hand.
+
+The twins have the same attribute names as the Pydantic models but no
+validation: ``decode_<model>(data)`` copies the fields present in a Hasura
+response row (missing ones are None), parses timestamps, keeps enum values
+as plain strings and decodes nested relationships recursively. Use them
+where many rows are parsed and read-only attribute access is all that is
+needed; service functions that support them take ``fast=True`` (or follow
+``RENDASUA_FAST_MODELS``).
+
+With RENDASUA_LAZY_DATETIMES=true, datetime fields hold a ``LazyDatetime``
+that parses the raw string on first use instead of at decode time. It is not
+a datetime subclass: ``isinstance(field, datetime)`` is False, so code that
+type-checks or serializes datetimes must use ``field.value``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import datetime
+import os
+
+from rendasua_core_packages.utilities.datetime_utils import LazyDatetime, parse_timestamptz
+
+
+def fast_models_enabled() -> bool:
+    """Default for service functions' ``fast`` switch (env RENDASUA_FAST_MODELS)."""
+    return os.environ.get("RENDASUA_FAST_MODELS", "false").lower() == "true"
+
+
+_LAZY_DATETIMES = os.environ.get("RENDASUA_LAZY_DATETIMES", "false").lower() == "true"
+
+
+def _datetime(value: Any) -> Optional[datetime.datetime]:
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    if _LAZY_DATETIMES and isinstance(value, str):
+        return LazyDatetime(value)
+    try:
+        return parse_timestamptz(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _date(value: Any) -> Optional[datetime.date]:
+    if value is None or isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(value)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _time(value: Any) -> Optional[datetime.time]:
+    if value is None or isinstance(value, datetime.time):
+        return value
+    try:
+        return datetime.time.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+@dataclass
+class Account:
+    __slots__ = ("available_balance", "created_at", "currency", "id", "is_active", "total_balance", "updated_at", "user", "user_id", "withheld_balance")
+
+    available_balance: Optional[float]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    id: Optional[str]
+    is_active: Optional[bool]
+    total_balance: Optional[float]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+    withheld_balance: Optional[float]
+
+
+def decode_account(data: Dict[str, Any]) -> Account:
+    get = data.get
+    return Account(
+        available_balance=get("available_balance"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        id=get("id"),
+        is_active=get("is_active"),
+        total_balance=get("total_balance"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+        withheld_balance=get("withheld_balance"),
+    )
+
+
+@dataclass
+class AccountTransaction:
+    __slots__ = ("account", "account_id", "amount", "created_at", "id", "memo", "reference_id", "transaction_type")
+
+    account: Optional[Account]
+    account_id: Optional[str]
+    amount: Optional[float]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    memo: Optional[str]
+    reference_id: Optional[str]
+    transaction_type: Optional[str]
+
+
+def decode_account_transaction(data: Dict[str, Any]) -> AccountTransaction:
+    get = data.get
+    return AccountTransaction(
+        account=decode_account(v) if (v := get("account")) is not None else None,
+        account_id=get("account_id"),
+        amount=get("amount"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        memo=get("memo"),
+        reference_id=get("reference_id"),
+        transaction_type=get("transaction_type"),
+    )
+
+
+@dataclass
+class BalanceUpdate:
+    __slots__ = ("available", "withheld")
+
+    available: Optional[float]
+    withheld: Optional[float]
+
+
+def decode_balance_update(data: Dict[str, Any]) -> BalanceUpdate:
+    get = data.get
+    return BalanceUpdate(
+        available=get("available"),
+        withheld=get("withheld"),
+    )
+
+
+@dataclass
+class Address:
+    __slots__ = ("address_line_1", "address_line_2", "address_type", "business_location", "city", "country", "created_at", "id", "is_primary", "latitude", "longitude", "postal_code", "state", "updated_at")
+
+    address_line_1: Optional[str]
+    address_line_2: Optional[str]
+    address_type: Optional[str]
+    business_location: Optional[BusinessLocation]
+    city: Optional[str]
+    country: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_primary: Optional[bool]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    postal_code: Optional[str]
+    state: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_address(data: Dict[str, Any]) -> Address:
+    get = data.get
+    return Address(
+        address_line_1=get("address_line_1"),
+        address_line_2=get("address_line_2"),
+        address_type=get("address_type"),
+        business_location=decode_business_location(v) if (v := get("business_location")) is not None else None,
+        city=get("city"),
+        country=get("country"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_primary=get("is_primary"),
+        latitude=get("latitude"),
+        longitude=get("longitude"),
+        postal_code=get("postal_code"),
+        state=get("state"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class Agent:
+    __slots__ = ("created_at", "id", "is_verified", "updated_at", "user", "user_id", "vehicle_type", "vehicle_type_id")
+
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_verified: Optional[bool]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+    vehicle_type: Optional[VehicleType]
+    vehicle_type_id: Optional[str]
+
+
+def decode_agent(data: Dict[str, Any]) -> Agent:
+    get = data.get
+    return Agent(
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_verified=get("is_verified"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+        vehicle_type=decode_vehicle_type(v) if (v := get("vehicle_type")) is not None else None,
+        vehicle_type_id=get("vehicle_type_id"),
+    )
+
+
+@dataclass
+class AgentAddress:
+    __slots__ = ("address", "address_id", "agent", "agent_id", "created_at", "id", "updated_at")
+
+    address: Optional[Address]
+    address_id: Optional[str]
+    agent: Optional[Agent]
+    agent_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_agent_address(data: Dict[str, Any]) -> AgentAddress:
+    get = data.get
+    return AgentAddress(
+        address=decode_address(v) if (v := get("address")) is not None else None,
+        address_id=get("address_id"),
+        agent=decode_agent(v) if (v := get("agent")) is not None else None,
+        agent_id=get("agent_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class AgentLocation:
+    __slots__ = ("agent", "agent_id", "created_at", "id", "latitude", "longitude", "updated_at")
+
+    agent: Optional[Agent]
+    agent_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_agent_location(data: Dict[str, Any]) -> AgentLocation:
+    get = data.get
+    return AgentLocation(
+        agent=decode_agent(v) if (v := get("agent")) is not None else None,
+        agent_id=get("agent_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        latitude=get("latitude"),
+        longitude=get("longitude"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class AirtelMoneyPayment:
+    __slots__ = ("amount", "callback_data", "created_at", "currency", "id", "message", "notes", "reference", "status", "transaction_id", "updated_at", "user", "user_id")
+
+    amount: Optional[str]
+    callback_data: Optional[str]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    id: Optional[str]
+    message: Optional[str]
+    notes: Optional[str]
+    reference: Optional[str]
+    status: Optional[str]
+    transaction_id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_airtel_money_payment(data: Dict[str, Any]) -> AirtelMoneyPayment:
+    get = data.get
+    return AirtelMoneyPayment(
+        amount=get("amount"),
+        callback_data=get("callback_data"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        id=get("id"),
+        message=get("message"),
+        notes=get("notes"),
+        reference=get("reference"),
+        status=get("status"),
+        transaction_id=get("transaction_id"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class ApplicationConfiguration:
+    __slots__ = ("allowed_values", "array_value", "boolean_value", "config_key", "config_name", "country_code", "created_at", "created_by", "data_type", "date_value", "description", "id", "json_value", "max_value", "min_value", "number_value", "status", "string_value", "tags", "updated_at", "updated_by", "validation_rules", "version")
+
+    allowed_values: Optional[List[str]]
+    array_value: Optional[List[str]]
+    boolean_value: Optional[bool]
+    config_key: Optional[str]
+    config_name: Optional[str]
+    country_code: Optional[str]
+    created_at: Optional[datetime.datetime]
+    created_by: Optional[str]
+    data_type: Optional[str]
+    date_value: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[str]
+    json_value: Optional[str]
+    max_value: Optional[float]
+    min_value: Optional[float]
+    number_value: Optional[float]
+    status: Optional[str]
+    string_value: Optional[str]
+    tags: Optional[List[str]]
+    updated_at: Optional[datetime.datetime]
+    updated_by: Optional[str]
+    validation_rules: Optional[str]
+    version: Optional[int]
+
+
+def decode_application_configuration(data: Dict[str, Any]) -> ApplicationConfiguration:
+    get = data.get
+    return ApplicationConfiguration(
+        allowed_values=get("allowed_values"),
+        array_value=get("array_value"),
+        boolean_value=get("boolean_value"),
+        config_key=get("config_key"),
+        config_name=get("config_name"),
+        country_code=get("country_code"),
+        created_at=_datetime(get("created_at")),
+        created_by=get("created_by"),
+        data_type=get("data_type"),
+        date_value=_datetime(get("date_value")),
+        description=get("description"),
+        id=get("id"),
+        json_value=get("json_value"),
+        max_value=get("max_value"),
+        min_value=get("min_value"),
+        number_value=get("number_value"),
+        status=get("status"),
+        string_value=get("string_value"),
+        tags=get("tags"),
+        updated_at=_datetime(get("updated_at")),
+        updated_by=get("updated_by"),
+        validation_rules=get("validation_rules"),
+        version=get("version"),
+    )
+
+
+@dataclass
+class Brand:
+    __slots__ = ("created_at", "description", "id", "name", "updated_at")
+
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[str]
+    name: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_brand(data: Dict[str, Any]) -> Brand:
+    get = data.get
+    return Brand(
+        created_at=_datetime(get("created_at")),
+        description=get("description"),
+        id=get("id"),
+        name=get("name"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class Business:
+    __slots__ = ("created_at", "id", "is_admin", "is_verified", "name", "updated_at", "user", "user_id")
+
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_admin: Optional[bool]
+    is_verified: Optional[bool]
+    name: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_business(data: Dict[str, Any]) -> Business:
+    get = data.get
+    return Business(
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_admin=get("is_admin"),
+        is_verified=get("is_verified"),
+        name=get("name"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class BusinessAddress:
+    __slots__ = ("address", "address_id", "business", "business_id", "created_at", "id", "updated_at")
+
+    address: Optional[Address]
+    address_id: Optional[str]
+    business: Optional[Business]
+    business_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_business_address(data: Dict[str, Any]) -> BusinessAddress:
+    get = data.get
+    return BusinessAddress(
+        address=decode_address(v) if (v := get("address")) is not None else None,
+        address_id=get("address_id"),
+        business=decode_business(v) if (v := get("business")) is not None else None,
+        business_id=get("business_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class BusinessInventory:
+    __slots__ = ("business_location", "business_location_id", "computed_available_quantity", "created_at", "id", "is_active", "item", "item_id", "last_restocked_at", "quantity", "reorder_point", "reorder_quantity", "reserved_quantity", "selling_price", "unit_cost", "updated_at")
+
+    business_location: Optional[BusinessLocation]
+    business_location_id: Optional[str]
+    computed_available_quantity: Optional[int]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_active: Optional[bool]
+    item: Optional[Item]
+    item_id: Optional[str]
+    last_restocked_at: Optional[datetime.datetime]
+    quantity: Optional[int]
+    reorder_point: Optional[int]
+    reorder_quantity: Optional[int]
+    reserved_quantity: Optional[int]
+    selling_price: Optional[float]
+    unit_cost: Optional[float]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_business_inventory(data: Dict[str, Any]) -> BusinessInventory:
+    get = data.get
+    return BusinessInventory(
+        business_location=decode_business_location(v) if (v := get("business_location")) is not None else None,
+        business_location_id=get("business_location_id"),
+        computed_available_quantity=get("computed_available_quantity"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_active=get("is_active"),
+        item=decode_item(v) if (v := get("item")) is not None else None,
+        item_id=get("item_id"),
+        last_restocked_at=_datetime(get("last_restocked_at")),
+        quantity=get("quantity"),
+        reorder_point=get("reorder_point"),
+        reorder_quantity=get("reorder_quantity"),
+        reserved_quantity=get("reserved_quantity"),
+        selling_price=get("selling_price"),
+        unit_cost=get("unit_cost"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class BusinessLocation:
+    __slots__ = ("address", "address_id", "business", "business_id", "created_at", "email", "id", "is_active", "is_primary", "location_type", "name", "operating_hours", "phone", "updated_at")
+
+    address: Optional[Address]
+    address_id: Optional[str]
+    business: Optional[Business]
+    business_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    email: Optional[str]
+    id: Optional[str]
+    is_active: Optional[bool]
+    is_primary: Optional[bool]
+    location_type: Optional[str]
+    name: Optional[str]
+    operating_hours: Optional[str]
+    phone: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_business_location(data: Dict[str, Any]) -> BusinessLocation:
+    get = data.get
+    return BusinessLocation(
+        address=decode_address(v) if (v := get("address")) is not None else None,
+        address_id=get("address_id"),
+        business=decode_business(v) if (v := get("business")) is not None else None,
+        business_id=get("business_id"),
+        created_at=_datetime(get("created_at")),
+        email=get("email"),
+        id=get("id"),
+        is_active=get("is_active"),
+        is_primary=get("is_primary"),
+        location_type=get("location_type"),
+        name=get("name"),
+        operating_hours=get("operating_hours"),
+        phone=get("phone"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class Client:
+    __slots__ = ("created_at", "id", "updated_at", "user", "user_id")
+
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_client(data: Dict[str, Any]) -> Client:
+    get = data.get
+    return Client(
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class ClientAddress:
+    __slots__ = ("address", "address_id", "client", "client_id", "created_at", "id", "updated_at")
+
+    address: Optional[Address]
+    address_id: Optional[str]
+    client: Optional[Client]
+    client_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_client_address(data: Dict[str, Any]) -> ClientAddress:
+    get = data.get
+    return ClientAddress(
+        address=decode_address(v) if (v := get("address")) is not None else None,
+        address_id=get("address_id"),
+        client=decode_client(v) if (v := get("client")) is not None else None,
+        client_id=get("client_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class Coordinates:
+    __slots__ = ("latitude", "longitude")
+
+    latitude: Optional[float]
+    longitude: Optional[float]
+
+
+def decode_coordinates(data: Dict[str, Any]) -> Coordinates:
+    get = data.get
+    return Coordinates(
+        latitude=get("latitude"),
+        longitude=get("longitude"),
+    )
+
+
+@dataclass
+class CommissionPayout:
+    __slots__ = ("account_transaction", "account_transaction_id", "amount", "commission_percentage", "commission_type", "created_at", "currency", "id", "order", "order_id", "recipient_type", "recipient_user", "recipient_user_id")
+
+    account_transaction: Optional[AccountTransaction]
+    account_transaction_id: Optional[str]
+    amount: Optional[float]
+    commission_percentage: Optional[float]
+    commission_type: Optional[str]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    id: Optional[str]
+    order: Optional[Order]
+    order_id: Optional[str]
+    recipient_type: Optional[str]
+    recipient_user: Optional[User]
+    recipient_user_id: Optional[str]
+
+
+def decode_commission_payout(data: Dict[str, Any]) -> CommissionPayout:
+    get = data.get
+    return CommissionPayout(
+        account_transaction=decode_account_transaction(v) if (v := get("account_transaction")) is not None else None,
+        account_transaction_id=get("account_transaction_id"),
+        amount=get("amount"),
+        commission_percentage=get("commission_percentage"),
+        commission_type=get("commission_type"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        id=get("id"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        recipient_type=get("recipient_type"),
+        recipient_user=decode_user(v) if (v := get("recipient_user")) is not None else None,
+        recipient_user_id=get("recipient_user_id"),
+    )
+
+
+@dataclass
+class CountryDeliveryConfig:
+    __slots__ = ("config_key", "config_value", "country_code", "created_at", "data_type", "delivery_config", "id", "updated_at")
+
+    config_key: Optional[str]
+    config_value: Optional[str]
+    country_code: Optional[str]
+    created_at: Optional[datetime.datetime]
+    data_type: Optional[str]
+    delivery_config: Optional[DeliveryConfig]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_country_delivery_config(data: Dict[str, Any]) -> CountryDeliveryConfig:
+    get = data.get
+    return CountryDeliveryConfig(
+        config_key=get("config_key"),
+        config_value=get("config_value"),
+        country_code=get("country_code"),
+        created_at=_datetime(get("created_at")),
+        data_type=get("data_type"),
+        delivery_config=decode_delivery_config(v) if (v := get("delivery_config")) is not None else None,
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class DeliveryConfig:
+    __slots__ = ("config_key", "created_at", "description", "id", "updated_at")
+
+    config_key: Optional[str]
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_delivery_config(data: Dict[str, Any]) -> DeliveryConfig:
+    get = data.get
+    return DeliveryConfig(
+        config_key=get("config_key"),
+        created_at=_datetime(get("created_at")),
+        description=get("description"),
+        id=get("id"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class DeliveryTimeSlot:
+    __slots__ = ("country_code", "created_at", "display_order", "end_time", "id", "is_active", "max_orders_per_slot", "slot_name", "slot_type", "start_time", "state", "updated_at")
+
+    country_code: Optional[str]
+    created_at: Optional[datetime.datetime]
+    display_order: Optional[int]
+    end_time: Optional[datetime.time]
+    id: Optional[str]
+    is_active: Optional[bool]
+    max_orders_per_slot: Optional[int]
+    slot_name: Optional[str]
+    slot_type: Optional[str]
+    start_time: Optional[datetime.time]
+    state: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_delivery_time_slot(data: Dict[str, Any]) -> DeliveryTimeSlot:
+    get = data.get
+    return DeliveryTimeSlot(
+        country_code=get("country_code"),
+        created_at=_datetime(get("created_at")),
+        display_order=get("display_order"),
+        end_time=_time(get("end_time")),
+        id=get("id"),
+        is_active=get("is_active"),
+        max_orders_per_slot=get("max_orders_per_slot"),
+        slot_name=get("slot_name"),
+        slot_type=get("slot_type"),
+        start_time=_time(get("start_time")),
+        state=get("state"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class DeliveryTimeWindow:
+    __slots__ = ("confirmedByUser", "confirmed_at", "confirmed_by", "created_at", "id", "is_confirmed", "order", "order_id", "preferred_date", "slot", "slot_id", "special_instructions", "time_slot_end", "time_slot_start", "updated_at")
+
+    confirmedByUser: Optional[User]
+    confirmed_at: Optional[datetime.datetime]
+    confirmed_by: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_confirmed: Optional[bool]
+    order: Optional[Order]
+    order_id: Optional[str]
+    preferred_date: Optional[datetime.date]
+    slot: Optional[DeliveryTimeSlot]
+    slot_id: Optional[str]
+    special_instructions: Optional[str]
+    time_slot_end: Optional[datetime.time]
+    time_slot_start: Optional[datetime.time]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_delivery_time_window(data: Dict[str, Any]) -> DeliveryTimeWindow:
+    get = data.get
+    return DeliveryTimeWindow(
+        confirmedByUser=decode_user(v) if (v := get("confirmedByUser")) is not None else None,
+        confirmed_at=_datetime(get("confirmed_at")),
+        confirmed_by=get("confirmed_by"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_confirmed=get("is_confirmed"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        preferred_date=_date(get("preferred_date")),
+        slot=decode_delivery_time_slot(v) if (v := get("slot")) is not None else None,
+        slot_id=get("slot_id"),
+        special_instructions=get("special_instructions"),
+        time_slot_end=_time(get("time_slot_end")),
+        time_slot_start=_time(get("time_slot_start")),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class DocumentType:
+    __slots__ = ("created_at", "description", "id", "name", "updated_at")
+
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[int]
+    name: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_document_type(data: Dict[str, Any]) -> DocumentType:
+    get = data.get
+    return DocumentType(
+        created_at=_datetime(get("created_at")),
+        description=get("description"),
+        id=get("id"),
+        name=get("name"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class EntityType:
+    __slots__ = ("comment", "id")
+
+    comment: Optional[str]
+    id: Optional[str]
+
+
+def decode_entity_type(data: Dict[str, Any]) -> EntityType:
+    get = data.get
+    return EntityType(
+        comment=get("comment"),
+        id=get("id"),
+    )
+
+
+@dataclass
+class GoogleDistanceCache:
+    __slots__ = ("created_at", "destination_address_formatted", "destination_address_id", "distance_text", "distance_value", "duration_text", "duration_value", "expires_at", "id", "origin_address_formatted", "origin_address_id", "status")
+
+    created_at: Optional[datetime.datetime]
+    destination_address_formatted: Optional[str]
+    destination_address_id: Optional[str]
+    distance_text: Optional[str]
+    distance_value: Optional[int]
+    duration_text: Optional[str]
+    duration_value: Optional[int]
+    expires_at: Optional[datetime.datetime]
+    id: Optional[str]
+    origin_address_formatted: Optional[str]
+    origin_address_id: Optional[str]
+    status: Optional[str]
+
+
+def decode_google_distance_cache(data: Dict[str, Any]) -> GoogleDistanceCache:
+    get = data.get
+    return GoogleDistanceCache(
+        created_at=_datetime(get("created_at")),
+        destination_address_formatted=get("destination_address_formatted"),
+        destination_address_id=get("destination_address_id"),
+        distance_text=get("distance_text"),
+        distance_value=get("distance_value"),
+        duration_text=get("duration_text"),
+        duration_value=get("duration_value"),
+        expires_at=_datetime(get("expires_at")),
+        id=get("id"),
+        origin_address_formatted=get("origin_address_formatted"),
+        origin_address_id=get("origin_address_id"),
+        status=get("status"),
+    )
+
+
+@dataclass
+class GoogleGeocodeCache:
+    __slots__ = ("created_at", "expires_at", "id", "latitude", "longitude", "response_data")
+
+    created_at: Optional[datetime.datetime]
+    expires_at: Optional[datetime.datetime]
+    id: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    response_data: Optional[str]
+
+
+def decode_google_geocode_cache(data: Dict[str, Any]) -> GoogleGeocodeCache:
+    get = data.get
+    return GoogleGeocodeCache(
+        created_at=_datetime(get("created_at")),
+        expires_at=_datetime(get("expires_at")),
+        id=get("id"),
+        latitude=get("latitude"),
+        longitude=get("longitude"),
+        response_data=get("response_data"),
+    )
+
+
+@dataclass
+class Item:
+    __slots__ = ("brand", "brand_id", "business", "business_id", "color", "created_at", "currency", "description", "estimated_delivery_time", "id", "is_active", "is_fragile", "is_perishable", "item_sub_category", "item_sub_category_id", "max_delivery_distance", "max_order_quantity", "min_order_quantity", "model", "name", "price", "requires_special_handling", "sku", "updated_at", "weight", "weight_unit", "dimensions")
+
+    brand: Optional[Brand]
+    brand_id: Optional[str]
+    business: Optional[Business]
+    business_id: Optional[str]
+    color: Optional[str]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    description: Optional[str]
+    estimated_delivery_time: Optional[int]
+    id: Optional[str]
+    is_active: Optional[bool]
+    is_fragile: Optional[bool]
+    is_perishable: Optional[bool]
+    item_sub_category: Optional[ItemSubCategory]
+    item_sub_category_id: Optional[int]
+    max_delivery_distance: Optional[int]
+    max_order_quantity: Optional[int]
+    min_order_quantity: Optional[int]
+    model: Optional[str]
+    name: Optional[str]
+    price: Optional[float]
+    requires_special_handling: Optional[bool]
+    sku: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    weight: Optional[float]
+    weight_unit: Optional[str]
+    dimensions: Optional[str]
+
+
+def decode_item(data: Dict[str, Any]) -> Item:
+    get = data.get
+    return Item(
+        brand=decode_brand(v) if (v := get("brand")) is not None else None,
+        brand_id=get("brand_id"),
+        business=decode_business(v) if (v := get("business")) is not None else None,
+        business_id=get("business_id"),
+        color=get("color"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        description=get("description"),
+        estimated_delivery_time=get("estimated_delivery_time"),
+        id=get("id"),
+        is_active=get("is_active"),
+        is_fragile=get("is_fragile"),
+        is_perishable=get("is_perishable"),
+        item_sub_category=decode_item_sub_category(v) if (v := get("item_sub_category")) is not None else None,
+        item_sub_category_id=get("item_sub_category_id"),
+        max_delivery_distance=get("max_delivery_distance"),
+        max_order_quantity=get("max_order_quantity"),
+        min_order_quantity=get("min_order_quantity"),
+        model=get("model"),
+        name=get("name"),
+        price=get("price"),
+        requires_special_handling=get("requires_special_handling"),
+        sku=get("sku"),
+        updated_at=_datetime(get("updated_at")),
+        weight=get("weight"),
+        weight_unit=get("weight_unit"),
+        dimensions=get("dimensions"),
+    )
+
+
+@dataclass
+class ItemCategory:
+    __slots__ = ("created_at", "description", "id", "name", "status", "updated_at")
+
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[int]
+    name: Optional[str]
+    status: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_item_category(data: Dict[str, Any]) -> ItemCategory:
+    get = data.get
+    return ItemCategory(
+        created_at=_datetime(get("created_at")),
+        description=get("description"),
+        id=get("id"),
+        name=get("name"),
+        status=get("status"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class ItemImage:
+    __slots__ = ("alt_text", "caption", "created_at", "display_order", "file_size", "format", "height", "id", "image_type", "image_url", "is_active", "item", "item_id", "updated_at", "uploaded_by", "uploaded_by_user", "width")
+
+    alt_text: Optional[str]
+    caption: Optional[str]
+    created_at: Optional[datetime.datetime]
+    display_order: Optional[int]
+    file_size: Optional[int]
+    format: Optional[str]
+    height: Optional[int]
+    id: Optional[str]
+    image_type: Optional[str]
+    image_url: Optional[str]
+    is_active: Optional[bool]
+    item: Optional[Item]
+    item_id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    uploaded_by: Optional[str]
+    uploaded_by_user: Optional[User]
+    width: Optional[int]
+
+
+def decode_item_image(data: Dict[str, Any]) -> ItemImage:
+    get = data.get
+    return ItemImage(
+        alt_text=get("alt_text"),
+        caption=get("caption"),
+        created_at=_datetime(get("created_at")),
+        display_order=get("display_order"),
+        file_size=get("file_size"),
+        format=get("format"),
+        height=get("height"),
+        id=get("id"),
+        image_type=get("image_type"),
+        image_url=get("image_url"),
+        is_active=get("is_active"),
+        item=decode_item(v) if (v := get("item")) is not None else None,
+        item_id=get("item_id"),
+        updated_at=_datetime(get("updated_at")),
+        uploaded_by=get("uploaded_by"),
+        uploaded_by_user=decode_user(v) if (v := get("uploaded_by_user")) is not None else None,
+        width=get("width"),
+    )
+
+
+@dataclass
+class ItemSubCategory:
+    __slots__ = ("created_at", "description", "id", "item_category", "item_category_id", "name", "status", "updated_at")
+
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    id: Optional[int]
+    item_category: Optional[ItemCategory]
+    item_category_id: Optional[int]
+    name: Optional[str]
+    status: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_item_sub_category(data: Dict[str, Any]) -> ItemSubCategory:
+    get = data.get
+    return ItemSubCategory(
+        created_at=_datetime(get("created_at")),
+        description=get("description"),
+        id=get("id"),
+        item_category=decode_item_category(v) if (v := get("item_category")) is not None else None,
+        item_category_id=get("item_category_id"),
+        name=get("name"),
+        status=get("status"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class MobilePaymentTransaction:
+    __slots__ = ("account", "account_id", "amount", "created_at", "currency", "customer_email", "customer_phone", "description", "entity_id", "error_code", "error_message", "id", "payment_entity", "payment_method", "provider", "reference", "status", "transaction_id", "transaction_type", "updated_at")
+
+    account: Optional[Account]
+    account_id: Optional[str]
+    amount: Optional[float]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    customer_email: Optional[str]
+    customer_phone: Optional[str]
+    description: Optional[str]
+    entity_id: Optional[str]
+    error_code: Optional[str]
+    error_message: Optional[str]
+    id: Optional[str]
+    payment_entity: Optional[str]
+    payment_method: Optional[str]
+    provider: Optional[str]
+    reference: Optional[str]
+    status: Optional[str]
+    transaction_id: Optional[str]
+    transaction_type: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_mobile_payment_transaction(data: Dict[str, Any]) -> MobilePaymentTransaction:
+    get = data.get
+    return MobilePaymentTransaction(
+        account=decode_account(v) if (v := get("account")) is not None else None,
+        account_id=get("account_id"),
+        amount=get("amount"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        customer_email=get("customer_email"),
+        customer_phone=get("customer_phone"),
+        description=get("description"),
+        entity_id=get("entity_id"),
+        error_code=get("error_code"),
+        error_message=get("error_message"),
+        id=get("id"),
+        payment_entity=get("payment_entity"),
+        payment_method=get("payment_method"),
+        provider=get("provider"),
+        reference=get("reference"),
+        status=get("status"),
+        transaction_id=get("transaction_id"),
+        transaction_type=get("transaction_type"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class MtnMomoPaymentRequest:
+    __slots__ = ("amount", "created_at", "currency", "external_id", "id", "payee_note", "payer_message", "status", "transaction_id", "updated_at", "user", "user_id")
+
+    amount: Optional[float]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    external_id: Optional[str]
+    id: Optional[str]
+    payee_note: Optional[str]
+    payer_message: Optional[str]
+    status: Optional[str]
+    transaction_id: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_mtn_momo_payment_request(data: Dict[str, Any]) -> MtnMomoPaymentRequest:
+    get = data.get
+    return MtnMomoPaymentRequest(
+        amount=get("amount"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        external_id=get("external_id"),
+        id=get("id"),
+        payee_note=get("payee_note"),
+        payer_message=get("payer_message"),
+        status=get("status"),
+        transaction_id=get("transaction_id"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class Order:
+    __slots__ = ("actual_delivery_time", "assigned_agent", "assigned_agent_id", "base_delivery_fee", "business", "business_id", "business_location", "business_location_id", "client", "client_id", "created_at", "currency", "current_status", "delivery_address", "delivery_address_id", "delivery_time_window", "delivery_time_window_id", "estimated_delivery_time", "fulfillment_method", "id", "order_hold", "order_number", "payment_method", "payment_source", "payment_status", "payment_timing", "per_km_delivery_fee", "preferred_delivery_time", "requires_fast_delivery", "special_instructions", "subtotal", "tax_amount", "total_amount", "updated_at", "verified_agent_delivery")
+
+    actual_delivery_time: Optional[datetime.datetime]
+    assigned_agent: Optional[Agent]
+    assigned_agent_id: Optional[str]
+    base_delivery_fee: Optional[float]
+    business: Optional[Business]
+    business_id: Optional[str]
+    business_location: Optional[BusinessLocation]
+    business_location_id: Optional[str]
+    client: Optional[Client]
+    client_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    current_status: Optional[str]
+    delivery_address: Optional[Address]
+    delivery_address_id: Optional[str]
+    delivery_time_window: Optional[DeliveryTimeWindow]
+    delivery_time_window_id: Optional[str]
+    estimated_delivery_time: Optional[datetime.datetime]
+    fulfillment_method: Optional[str]
+    id: Optional[str]
+    order_hold: Optional[OrderHold]
+    order_number: Optional[str]
+    payment_method: Optional[str]
+    payment_source: Optional[str]
+    payment_status: Optional[str]
+    payment_timing: Optional[str]
+    per_km_delivery_fee: Optional[float]
+    preferred_delivery_time: Optional[datetime.datetime]
+    requires_fast_delivery: Optional[bool]
+    special_instructions: Optional[str]
+    subtotal: Optional[float]
+    tax_amount: Optional[float]
+    total_amount: Optional[float]
+    updated_at: Optional[datetime.datetime]
+    verified_agent_delivery: Optional[bool]
+
+
+def decode_order(data: Dict[str, Any]) -> Order:
+    get = data.get
+    return Order(
+        actual_delivery_time=_datetime(get("actual_delivery_time")),
+        assigned_agent=decode_agent(v) if (v := get("assigned_agent")) is not None else None,
+        assigned_agent_id=get("assigned_agent_id"),
+        base_delivery_fee=get("base_delivery_fee"),
+        business=decode_business(v) if (v := get("business")) is not None else None,
+        business_id=get("business_id"),
+        business_location=decode_business_location(v) if (v := get("business_location")) is not None else None,
+        business_location_id=get("business_location_id"),
+        client=decode_client(v) if (v := get("client")) is not None else None,
+        client_id=get("client_id"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        current_status=get("current_status"),
+        delivery_address=decode_address(v) if (v := get("delivery_address")) is not None else None,
+        delivery_address_id=get("delivery_address_id"),
+        delivery_time_window=decode_delivery_time_window(v) if (v := get("delivery_time_window")) is not None else None,
+        delivery_time_window_id=get("delivery_time_window_id"),
+        estimated_delivery_time=_datetime(get("estimated_delivery_time")),
+        fulfillment_method=get("fulfillment_method"),
+        id=get("id"),
+        order_hold=decode_order_hold(v) if (v := get("order_hold")) is not None else None,
+        order_number=get("order_number"),
+        payment_method=get("payment_method"),
+        payment_source=get("payment_source"),
+        payment_status=get("payment_status"),
+        payment_timing=get("payment_timing"),
+        per_km_delivery_fee=get("per_km_delivery_fee"),
+        preferred_delivery_time=_datetime(get("preferred_delivery_time")),
+        requires_fast_delivery=get("requires_fast_delivery"),
+        special_instructions=get("special_instructions"),
+        subtotal=get("subtotal"),
+        tax_amount=get("tax_amount"),
+        total_amount=get("total_amount"),
+        updated_at=_datetime(get("updated_at")),
+        verified_agent_delivery=get("verified_agent_delivery"),
+    )
+
+
+@dataclass
+class OrderCancellationReason:
+    __slots__ = ("created_at", "display", "id", "rank", "updated_at", "value")
+
+    created_at: Optional[datetime.datetime]
+    display: Optional[str]
+    id: Optional[int]
+    rank: Optional[int]
+    updated_at: Optional[datetime.datetime]
+    value: Optional[str]
+
+
+def decode_order_cancellation_reason(data: Dict[str, Any]) -> OrderCancellationReason:
+    get = data.get
+    return OrderCancellationReason(
+        created_at=_datetime(get("created_at")),
+        display=get("display"),
+        id=get("id"),
+        rank=get("rank"),
+        updated_at=_datetime(get("updated_at")),
+        value=get("value"),
+    )
+
+
+@dataclass
+class OrderHold:
+    __slots__ = ("agent", "agent_hold_amount", "agent_id", "client", "client_hold_amount", "client_id", "created_at", "currency", "delivery_fees", "id", "order", "order_id", "status", "updated_at", "item_settlement_completed_at", "delivery_settlement_completed_at")
+
+    agent: Optional[Agent]
+    agent_hold_amount: Optional[float]
+    agent_id: Optional[str]
+    client: Optional[Client]
+    client_hold_amount: Optional[float]
+    client_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    currency: Optional[str]
+    delivery_fees: Optional[float]
+    id: Optional[str]
+    order: Optional[Order]
+    order_id: Optional[str]
+    status: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    item_settlement_completed_at: Optional[datetime.datetime]
+    delivery_settlement_completed_at: Optional[datetime.datetime]
+
+
+def decode_order_hold(data: Dict[str, Any]) -> OrderHold:
+    get = data.get
+    return OrderHold(
+        agent=decode_agent(v) if (v := get("agent")) is not None else None,
+        agent_hold_amount=get("agent_hold_amount"),
+        agent_id=get("agent_id"),
+        client=decode_client(v) if (v := get("client")) is not None else None,
+        client_hold_amount=get("client_hold_amount"),
+        client_id=get("client_id"),
+        created_at=_datetime(get("created_at")),
+        currency=get("currency"),
+        delivery_fees=get("delivery_fees"),
+        id=get("id"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        status=get("status"),
+        updated_at=_datetime(get("updated_at")),
+        item_settlement_completed_at=_datetime(get("item_settlement_completed_at")),
+        delivery_settlement_completed_at=_datetime(get("delivery_settlement_completed_at")),
+    )
+
+
+@dataclass
+class OrderItem:
+    __slots__ = ("business_inventory", "business_inventory_id", "created_at", "id", "item", "item_description", "item_id", "item_name", "order", "order_id", "quantity", "special_instructions", "total_price", "unit_price", "updated_at")
+
+    business_inventory: Optional[BusinessInventory]
+    business_inventory_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    item: Optional[Item]
+    item_description: Optional[str]
+    item_id: Optional[str]
+    item_name: Optional[str]
+    order: Optional[Order]
+    order_id: Optional[str]
+    quantity: Optional[int]
+    special_instructions: Optional[str]
+    total_price: Optional[float]
+    unit_price: Optional[float]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_order_item(data: Dict[str, Any]) -> OrderItem:
+    get = data.get
+    return OrderItem(
+        business_inventory=decode_business_inventory(v) if (v := get("business_inventory")) is not None else None,
+        business_inventory_id=get("business_inventory_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        item=decode_item(v) if (v := get("item")) is not None else None,
+        item_description=get("item_description"),
+        item_id=get("item_id"),
+        item_name=get("item_name"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        quantity=get("quantity"),
+        special_instructions=get("special_instructions"),
+        total_price=get("total_price"),
+        unit_price=get("unit_price"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class OrderStatuHistory:
+    __slots__ = ("changed_by_type", "changed_by_user", "changed_by_user_id", "created_at", "id", "location_address", "location_lat", "location_lng", "notes", "order", "order_id", "previous_status", "status")
+
+    changed_by_type: Optional[str]
+    changed_by_user: Optional[User]
+    changed_by_user_id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    location_address: Optional[str]
+    location_lat: Optional[float]
+    location_lng: Optional[float]
+    notes: Optional[str]
+    order: Optional[Order]
+    order_id: Optional[str]
+    previous_status: Optional[str]
+    status: Optional[str]
+
+
+def decode_order_statu_history(data: Dict[str, Any]) -> OrderStatuHistory:
+    get = data.get
+    return OrderStatuHistory(
+        changed_by_type=get("changed_by_type"),
+        changed_by_user=decode_user(v) if (v := get("changed_by_user")) is not None else None,
+        changed_by_user_id=get("changed_by_user_id"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        location_address=get("location_address"),
+        location_lat=get("location_lat"),
+        location_lng=get("location_lng"),
+        notes=get("notes"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        previous_status=get("previous_status"),
+        status=get("status"),
+    )
+
+
+@dataclass
+class Partner:
+    __slots__ = ("base_delivery_fee_commission", "company_name", "created_at", "id", "is_active", "item_commission", "per_km_delivery_fee_commission", "updated_at", "user", "user_id")
+
+    base_delivery_fee_commission: Optional[float]
+    company_name: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_active: Optional[bool]
+    item_commission: Optional[float]
+    per_km_delivery_fee_commission: Optional[float]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_partner(data: Dict[str, Any]) -> Partner:
+    get = data.get
+    return Partner(
+        base_delivery_fee_commission=get("base_delivery_fee_commission"),
+        company_name=get("company_name"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_active=get("is_active"),
+        item_commission=get("item_commission"),
+        per_km_delivery_fee_commission=get("per_km_delivery_fee_commission"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class PaymentCallback:
+    __slots__ = ("callback_data", "error_message", "id", "mobile_payment_transaction", "processed", "processed_at", "received_at", "transaction_id")
+
+    callback_data: Optional[str]
+    error_message: Optional[str]
+    id: Optional[str]
+    mobile_payment_transaction: Optional[MobilePaymentTransaction]
+    processed: Optional[bool]
+    processed_at: Optional[datetime.datetime]
+    received_at: Optional[datetime.datetime]
+    transaction_id: Optional[str]
+
+
+def decode_payment_callback(data: Dict[str, Any]) -> PaymentCallback:
+    get = data.get
+    return PaymentCallback(
+        callback_data=get("callback_data"),
+        error_message=get("error_message"),
+        id=get("id"),
+        mobile_payment_transaction=decode_mobile_payment_transaction(v) if (v := get("mobile_payment_transaction")) is not None else None,
+        processed=get("processed"),
+        processed_at=_datetime(get("processed_at")),
+        received_at=_datetime(get("received_at")),
+        transaction_id=get("transaction_id"),
+    )
+
+
+@dataclass
+class Rating:
+    __slots__ = ("comment", "created_at", "id", "is_public", "is_verified", "order_details", "order_id", "rated_entity_id", "rated_entity_type", "rater_user_details", "rater_user_id", "rating", "rating_type", "updated_at")
+
+    comment: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    is_public: Optional[bool]
+    is_verified: Optional[bool]
+    order_details: Optional[Order]
+    order_id: Optional[str]
+    rated_entity_id: Optional[str]
+    rated_entity_type: Optional[str]
+    rater_user_details: Optional[User]
+    rater_user_id: Optional[str]
+    rating: Optional[int]
+    rating_type: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_rating(data: Dict[str, Any]) -> Rating:
+    get = data.get
+    return Rating(
+        comment=get("comment"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        is_public=get("is_public"),
+        is_verified=get("is_verified"),
+        order_details=decode_order(v) if (v := get("order_details")) is not None else None,
+        order_id=get("order_id"),
+        rated_entity_id=get("rated_entity_id"),
+        rated_entity_type=get("rated_entity_type"),
+        rater_user_details=decode_user(v) if (v := get("rater_user_details")) is not None else None,
+        rater_user_id=get("rater_user_id"),
+        rating=get("rating"),
+        rating_type=get("rating_type"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class RatingAggregate:
+    __slots__ = ("average_rating", "entity_id", "entity_type", "id", "last_rating_at", "rating_1_count", "rating_2_count", "rating_3_count", "rating_4_count", "rating_5_count", "total_ratings", "updated_at")
+
+    average_rating: Optional[float]
+    entity_id: Optional[str]
+    entity_type: Optional[str]
+    id: Optional[str]
+    last_rating_at: Optional[datetime.datetime]
+    rating_1_count: Optional[int]
+    rating_2_count: Optional[int]
+    rating_3_count: Optional[int]
+    rating_4_count: Optional[int]
+    rating_5_count: Optional[int]
+    total_ratings: Optional[int]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_rating_aggregate(data: Dict[str, Any]) -> RatingAggregate:
+    get = data.get
+    return RatingAggregate(
+        average_rating=get("average_rating"),
+        entity_id=get("entity_id"),
+        entity_type=get("entity_type"),
+        id=get("id"),
+        last_rating_at=_datetime(get("last_rating_at")),
+        rating_1_count=get("rating_1_count"),
+        rating_2_count=get("rating_2_count"),
+        rating_3_count=get("rating_3_count"),
+        rating_4_count=get("rating_4_count"),
+        rating_5_count=get("rating_5_count"),
+        total_ratings=get("total_ratings"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class SupportedCountryState:
+    __slots__ = ("country_code", "country_name", "created_at", "created_by", "currency_code", "delivery_enabled", "id", "launch_date", "service_status", "state_name", "updated_at", "updated_by")
+
+    country_code: Optional[str]
+    country_name: Optional[str]
+    created_at: Optional[datetime.datetime]
+    created_by: Optional[str]
+    currency_code: Optional[str]
+    delivery_enabled: Optional[bool]
+    id: Optional[str]
+    launch_date: Optional[datetime.date]
+    service_status: Optional[str]
+    state_name: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    updated_by: Optional[str]
+
+
+def decode_supported_country_state(data: Dict[str, Any]) -> SupportedCountryState:
+    get = data.get
+    return SupportedCountryState(
+        country_code=get("country_code"),
+        country_name=get("country_name"),
+        created_at=_datetime(get("created_at")),
+        created_by=get("created_by"),
+        currency_code=get("currency_code"),
+        delivery_enabled=get("delivery_enabled"),
+        id=get("id"),
+        launch_date=_date(get("launch_date")),
+        service_status=get("service_status"),
+        state_name=get("state_name"),
+        updated_at=_datetime(get("updated_at")),
+        updated_by=get("updated_by"),
+    )
+
+
+@dataclass
+class SupportedPaymentSystem:
+    __slots__ = ("active", "country", "created_at", "id", "name", "updated_at")
+
+    active: Optional[bool]
+    country: Optional[str]
+    created_at: Optional[datetime.datetime]
+    id: Optional[str]
+    name: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_supported_payment_system(data: Dict[str, Any]) -> SupportedPaymentSystem:
+    get = data.get
+    return SupportedPaymentSystem(
+        active=get("active"),
+        country=get("country"),
+        created_at=_datetime(get("created_at")),
+        id=get("id"),
+        name=get("name"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+@dataclass
+class User:
+    __slots__ = ("agent", "business", "client", "created_at", "email", "email_verified", "first_name", "id", "identifier", "last_name", "phone_number", "phone_number_verified", "preferred_language", "updated_at", "user_type", "user_type_id")
+
+    agent: Optional[Agent]
+    business: Optional[Business]
+    client: Optional[Client]
+    created_at: Optional[datetime.datetime]
+    email: Optional[str]
+    email_verified: Optional[bool]
+    first_name: Optional[str]
+    id: Optional[str]
+    identifier: Optional[str]
+    last_name: Optional[str]
+    phone_number: Optional[str]
+    phone_number_verified: Optional[bool]
+    preferred_language: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user_type: Optional[UserType]
+    user_type_id: Optional[str]
+
+
+def decode_user(data: Dict[str, Any]) -> User:
+    get = data.get
+    return User(
+        agent=decode_agent(v) if (v := get("agent")) is not None else None,
+        business=decode_business(v) if (v := get("business")) is not None else None,
+        client=decode_client(v) if (v := get("client")) is not None else None,
+        created_at=_datetime(get("created_at")),
+        email=get("email"),
+        email_verified=get("email_verified"),
+        first_name=get("first_name"),
+        id=get("id"),
+        identifier=get("identifier"),
+        last_name=get("last_name"),
+        phone_number=get("phone_number"),
+        phone_number_verified=get("phone_number_verified"),
+        preferred_language=get("preferred_language"),
+        updated_at=_datetime(get("updated_at")),
+        user_type=decode_user_type(v) if (v := get("user_type")) is not None else None,
+        user_type_id=get("user_type_id"),
+    )
+
+
+@dataclass
+class UserMessage:
+    __slots__ = ("created_at", "entity_id", "entity_type", "entity_type_info", "id", "message", "updated_at", "user", "user_id")
+
+    created_at: Optional[datetime.datetime]
+    entity_id: Optional[str]
+    entity_type: Optional[str]
+    entity_type_info: Optional[EntityType]
+    id: Optional[str]
+    message: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_user_message(data: Dict[str, Any]) -> UserMessage:
+    get = data.get
+    return UserMessage(
+        created_at=_datetime(get("created_at")),
+        entity_id=get("entity_id"),
+        entity_type=get("entity_type"),
+        entity_type_info=decode_entity_type(v) if (v := get("entity_type_info")) is not None else None,
+        id=get("id"),
+        message=get("message"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class UserType:
+    __slots__ = ("comment", "id")
+
+    comment: Optional[str]
+    id: Optional[str]
+
+
+def decode_user_type(data: Dict[str, Any]) -> UserType:
+    get = data.get
+    return UserType(
+        comment=get("comment"),
+        id=get("id"),
+    )
+
+
+@dataclass
+class UserUpload:
+    __slots__ = ("content_type", "created_at", "document_type", "document_type_id", "file_name", "file_size", "id", "is_approved", "key", "note", "updated_at", "user", "user_id")
+
+    content_type: Optional[str]
+    created_at: Optional[datetime.datetime]
+    document_type: Optional[DocumentType]
+    document_type_id: Optional[int]
+    file_name: Optional[str]
+    file_size: Optional[int]
+    id: Optional[str]
+    is_approved: Optional[bool]
+    key: Optional[str]
+    note: Optional[str]
+    updated_at: Optional[datetime.datetime]
+    user: Optional[User]
+    user_id: Optional[str]
+
+
+def decode_user_upload(data: Dict[str, Any]) -> UserUpload:
+    get = data.get
+    return UserUpload(
+        content_type=get("content_type"),
+        created_at=_datetime(get("created_at")),
+        document_type=decode_document_type(v) if (v := get("document_type")) is not None else None,
+        document_type_id=get("document_type_id"),
+        file_name=get("file_name"),
+        file_size=get("file_size"),
+        id=get("id"),
+        is_approved=get("is_approved"),
+        key=get("key"),
+        note=get("note"),
+        updated_at=_datetime(get("updated_at")),
+        user=decode_user(v) if (v := get("user")) is not None else None,
+        user_id=get("user_id"),
+    )
+
+
+@dataclass
+class VehicleType:
+    __slots__ = ("comment", "id")
+
+    comment: Optional[str]
+    id: Optional[str]
+
+
+def decode_vehicle_type(data: Dict[str, Any]) -> VehicleType:
+    get = data.get
+    return VehicleType(
+        comment=get("comment"),
+        id=get("id"),
+    )
+
+
+@dataclass
+class TransactionInfo:
+    __slots__ = ("isCredit", "balanceUpdate")
+
+    isCredit: Optional[bool]
+    balanceUpdate: Optional[BalanceUpdate]
+
+
+def decode_transaction_info(data: Dict[str, Any]) -> TransactionInfo:
+    get = data.get
+    return TransactionInfo(
+        isCredit=get("isCredit"),
+        balanceUpdate=decode_balance_update(v) if (v := get("balanceUpdate")) is not None else None,
+    )
+
+
+@dataclass
+class OrderAgentNotification:
+    __slots__ = ("created_at", "error_message", "id", "notification_type", "order", "order_id", "processed_at", "status", "updated_at")
+
+    created_at: Optional[datetime.datetime]
+    error_message: Optional[str]
+    id: Optional[str]
+    notification_type: Optional[str]
+    order: Optional[Order]
+    order_id: Optional[str]
+    processed_at: Optional[datetime.datetime]
+    status: Optional[str]
+    updated_at: Optional[datetime.datetime]
+
+
+def decode_order_agent_notification(data: Dict[str, Any]) -> OrderAgentNotification:
+    get = data.get
+    return OrderAgentNotification(
+        created_at=_datetime(get("created_at")),
+        error_message=get("error_message"),
+        id=get("id"),
+        notification_type=get("notification_type"),
+        order=decode_order(v) if (v := get("order")) is not None else None,
+        order_id=get("order_id"),
+        processed_at=_datetime(get("processed_at")),
+        status=get("status"),
+        updated_at=_datetime(get("updated_at")),
+    )
+
+
+DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "Account": decode_account,
+    "AccountTransaction": decode_account_transaction,
+    "BalanceUpdate": decode_balance_update,
+    "Address": decode_address,
+    "Agent": decode_agent,
+    "AgentAddress": decode_agent_address,
+    "AgentLocation": decode_agent_location,
+    "AirtelMoneyPayment": decode_airtel_money_payment,
+    "ApplicationConfiguration": decode_application_configuration,
+    "Brand": decode_brand,
+    "Business": decode_business,
+    "BusinessAddress": decode_business_address,
+    "BusinessInventory": decode_business_inventory,
+    "BusinessLocation": decode_business_location,
+    "Client": decode_client,
+    "ClientAddress": decode_client_address,
+    "Coordinates": decode_coordinates,
+    "CommissionPayout": decode_commission_payout,
+    "CountryDeliveryConfig": decode_country_delivery_config,
+    "DeliveryConfig": decode_delivery_config,
+    "DeliveryTimeSlot": decode_delivery_time_slot,
+    "DeliveryTimeWindow": decode_delivery_time_window,
+    "DocumentType": decode_document_type,
+    "EntityType": decode_entity_type,
+    "GoogleDistanceCache": decode_google_distance_cache,
+    "GoogleGeocodeCache": decode_google_geocode_cache,
+    "Item": decode_item,
+    "ItemCategory": decode_item_category,
+    "ItemImage": decode_item_image,
+    "ItemSubCategory": decode_item_sub_category,
+    "MobilePaymentTransaction": decode_mobile_payment_transaction,
+    "MtnMomoPaymentRequest": decode_mtn_momo_payment_request,
+    "Order": decode_order,
+    "OrderCancellationReason": decode_order_cancellation_reason,
+    "OrderHold": decode_order_hold,
+    "OrderItem": decode_order_item,
+    "OrderStatuHistory": decode_order_statu_history,
+    "Partner": decode_partner,
+    "PaymentCallback": decode_payment_callback,
+    "Rating": decode_rating,
+    "RatingAggregate": decode_rating_aggregate,
+    "SupportedCountryState": decode_supported_country_state,
+    "SupportedPaymentSystem": decode_supported_payment_system,
+    "User": decode_user,
+    "UserMessage": decode_user_message,
+    "UserType": decode_user_type,
+    "UserUpload": decode_user_upload,
+    "VehicleType": decode_vehicle_type,
+    "TransactionInfo": decode_transaction_info,
+    "OrderAgentNotification": decode_order_agent_notification,
+}
+
+
+def decode(model_name: str, data: Optional[Dict[str, Any]]) -> Any:
+    """Decode one Hasura row into the twin named ``model_name`` (None stays None)."""
+    return None if data is None else DECODERS[model_name](data)
+
+
+def decode_many(model_name: str, rows: Optional[List[Dict[str, Any]]]) -> List[Any]:
+    """Decode a list of Hasura rows into twins named ``model_name``."""
+    decoder = DECODERS[model_name]
+    return [decoder(row) for row in rows or []]
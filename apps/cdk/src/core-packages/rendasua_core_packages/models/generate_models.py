@@ -5,6 +5,12 @@ This script introspects the Hasura GraphQL schema and generates Pydantic
 models for each table-like object type. It is designed to be idempotent:
 it will only create models that do not already exist.
 
+It then writes ``fast.py``: ``__slots__`` dataclass twins of the exported
+models plus one generated decoder per model that builds them straight from
+Hasura JSON (no validation), for hot paths that parse many rows. Run with
+``--fast`` to regenerate only ``fast.py`` from the current models (no
+Hasura access needed).
+
 Configuration:
     HASURA_GRAPHQL_ENDPOINT - HTTP endpoint for Hasura GraphQL
     HASURA_ADMIN_SECRET     - Hasura admin secret
@@ -15,11 +21,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import indent
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import datetime
+import enum
 import json
 import os
+import re
 import sys
+import typing
 
 import requests
 
@@ -384,7 +394,186 @@ def _generate_for_type(
     print(f"[generate_models] {action} model: {target.name}")
 
 
+FAST_MODULE_HEADER = '''"""
+Slotted dataclass twins of the Pydantic models, with fast decoders.
+
+GENERATED by generate_models.py (``python generate_models.py --fast``);
+do not edit by hand.
+
+The twins have the same attribute names as the Pydantic models but no
+validation: ``decode_<model>(data)`` copies the fields present in a Hasura
+response row (missing ones are None), parses timestamps, keeps enum values
+as plain strings and decodes nested relationships recursively. Use them
+where many rows are parsed and read-only attribute access is all that is
+needed; service functions that support them take ``fast=True`` (or follow
+``RENDASUA_FAST_MODELS``).
+
+With RENDASUA_LAZY_DATETIMES=true, datetime fields hold a ``LazyDatetime``
+that parses the raw string on first use instead of at decode time. It is not
+a datetime subclass: ``isinstance(field, datetime)`` is False, so code that
+type-checks or serializes datetimes must use ``field.value``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import datetime
+import os
+
+from rendasua_core_packages.utilities.datetime_utils import LazyDatetime, parse_timestamptz
+
+
+def fast_models_enabled() -> bool:
+    """Default for service functions' ``fast`` switch (env RENDASUA_FAST_MODELS)."""
+    return os.environ.get("RENDASUA_FAST_MODELS", "false").lower() == "true"
+
+
+_LAZY_DATETIMES = os.environ.get("RENDASUA_LAZY_DATETIMES", "false").lower() == "true"
+
+
+def _datetime(value: Any) -> Optional[datetime.datetime]:
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    if _LAZY_DATETIMES and isinstance(value, str):
+        return LazyDatetime(value)
+    try:
+        return parse_timestamptz(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _date(value: Any) -> Optional[datetime.date]:
+    if value is None or isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(value)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _time(value: Any) -> Optional[datetime.time]:
+    if value is None or isinstance(value, datetime.time):
+        return value
+    try:
+        return datetime.time.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+'''
+
+FAST_MODULE_FOOTER = '''
+
+DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {{
+{decoders}
+}}
+
+
+def decode(model_name: str, data: Optional[Dict[str, Any]]) -> Any:
+    """Decode one Hasura row into the twin named ``model_name`` (None stays None)."""
+    return None if data is None else DECODERS[model_name](data)
+
+
+def decode_many(model_name: str, rows: Optional[List[Dict[str, Any]]]) -> List[Any]:
+    """Decode a list of Hasura rows into twins named ``model_name``."""
+    decoder = DECODERS[model_name]
+    return [decoder(row) for row in rows or []]
+'''
+
+
+def _snake_case(class_name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
+
+
+def _fast_field(annotation: Any) -> Tuple[str, str, Optional[str]]:
+    """
+    (type hint, kind, nested model) for a Pydantic field annotation.
+
+    kind is one of: value, datetime, date, time, model, model_list.
+    """
+    is_list = False
+    node = annotation
+    while True:
+        origin = typing.get_origin(node)
+        args = [a for a in typing.get_args(node) if a is not type(None)]
+        if origin in (Union, getattr(__import__("types"), "UnionType", Union)) and len(args) == 1:
+            node = args[0]
+        elif origin in (list, List) and args:
+            is_list = True
+            node = args[0]
+        else:
+            break
+
+    if isinstance(node, type) and hasattr(node, "model_fields"):
+        hint, kind, nested = node.__name__, "model", node.__name__
+    elif node is datetime.datetime:
+        hint, kind, nested = "datetime.datetime", "datetime", None
+    elif node is datetime.date:
+        hint, kind, nested = "datetime.date", "date", None
+    elif node is datetime.time:
+        hint, kind, nested = "datetime.time", "time", None
+    elif isinstance(node, type) and issubclass(node, enum.Enum):
+        hint, kind, nested = "str", "value", None
+    elif isinstance(node, type) and node in (str, int, float, bool):
+        hint, kind, nested = node.__name__, "value", None
+    else:
+        hint, kind, nested = "Any", "value", None
+
+    if is_list:
+        hint = f"List[{hint}]"
+        if kind == "model":
+            kind = "model_list"
+    return f"Optional[{hint}]", kind, nested
+
+
+def _render_fast_model(model: Any) -> str:
+    class_name = model.__name__
+    fields = [(name, _fast_field(field.annotation)) for name, field in model.model_fields.items()]
+    lines = ["@dataclass", f"class {class_name}:"]
+    slots = ", ".join(f'"{name}"' for name, _ in fields)
+    lines.append(f"    __slots__ = ({slots}{',' if len(fields) == 1 else ''})" if fields else "    __slots__ = ()")
+    if fields:
+        lines.append("")
+        lines.extend(f"    {name}: {hint}" for name, (hint, _, _) in fields)
+    lines.extend(["", "", f"def decode_{_snake_case(class_name)}(data: Dict[str, Any]) -> {class_name}:"])
+    lines.append("    get = data.get")
+    lines.append(f"    return {class_name}(")
+    for name, (_, kind, nested) in fields:
+        if kind == "value":
+            value = f'get("{name}")'
+        elif kind in ("datetime", "date", "time"):
+            value = f'_{kind}(get("{name}"))'
+        elif kind == "model":
+            value = f'decode_{_snake_case(nested)}(v) if (v := get("{name}")) is not None else None'
+        else:
+            value = f'[decode_{_snake_case(nested)}(i) for i in v] if (v := get("{name}")) is not None else None'
+        lines.append(f"        {name}={value},")
+    lines.append("    )")
+    return "\n".join(lines)
+
+
+def render_fast_models(models: List[Any]) -> str:
+    """Source of ``fast.py`` for the given Pydantic model classes."""
+    blocks = [_render_fast_model(model) for model in models]
+    decoders = "\n".join(f'    "{m.__name__}": decode_{_snake_case(m.__name__)},' for m in models)
+    return FAST_MODULE_HEADER + "\n\n" + "\n\n\n".join(blocks) + "\n" + FAST_MODULE_FOOTER.format(decoders=decoders)
+
+
+def _write_fast_models(models_dir: Path) -> None:
+    sys.path.insert(0, str(models_dir.parents[1]))
+    from rendasua_core_packages import models as models_package
+
+    classes = [getattr(models_package, name) for name in models_package.__all__]
+    target = models_dir / "fast.py"
+    target.write_text(render_fast_models(classes), encoding="utf-8")
+    print(f"[generate_models] Wrote {len(classes)} fast models: {target.name}")
+
+
 def main() -> None:
+    models_dir = Path(__file__).resolve().parent
+    if "--fast" in sys.argv[1:]:
+        _write_fast_models(models_dir)
+        return
     try:
         endpoint = _get_env("HASURA_GRAPHQL_ENDPOINT")
         admin_secret = _get_env("HASURA_ADMIN_SECRET")
@@ -393,10 +582,10 @@ def main() -> None:
         valid_object_names = set(objects.keys())
         # Generate models in the same directory as this script
         # This ensures models are always generated in apps/cdk/src/core-packages/rendasua_core_packages/models
-        models_dir = Path(__file__).resolve().parent
         print(f"[generate_models] Generating models in: {models_dir}")
         for type_name, type_def in objects.items():
             _generate_for_type(models_dir, type_name, type_def, enums, valid_object_names)
+        _write_fast_models(models_dir)
     except Exception as exc:  # noqa: BLE001
         print(f"[generate_models] Error: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -6,10 +6,18 @@ from .agent_proximity_notifications import (
     send_aggregated_notifications_to_agents,
     send_notifications_to_nearby_agents,
 )
+from .dispatcher import (
+    ChannelStats,
+    NotificationDispatcher,
+    get_notification_dispatcher,
+)
 from .email import send_cancellation_notifications
 
 __all__ = [
     "send_cancellation_notifications",
     "send_aggregated_notifications_to_agents",
     "send_notifications_to_nearby_agents",
+    "ChannelStats",
+    "NotificationDispatcher",
+    "get_notification_dispatcher",
 ]
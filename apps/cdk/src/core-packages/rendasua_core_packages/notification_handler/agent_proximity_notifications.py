@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from rendasua_core_packages.models import AgentLocation, Order
 from rendasua_core_packages.secrets_manager import get_resend_api_key
 from rendasua_core_packages.utilities import format_full_address
 
-from .nest_push_client import send_push_via_nest_api
+from .dispatcher import (
+    CHANNEL_EMAIL,
+    CHANNEL_PUSH,
+    CHANNEL_SMS,
+    NotificationDispatcher,
+    get_notification_dispatcher,
+)
+from .nest_push_client import NestPush, send_push_via_nest_api, send_pushes_via_nest_api
 from .nest_sms_client import send_sms_via_nest_api
-from .resend_client import send_resend_template_email
+from .resend_client import (
+    ResendTemplateEmail,
+    send_resend_template_email,
+    send_resend_template_emails,
+)
 
 _SMS_BODY_MAX = 480
 
@@ -65,6 +76,12 @@ def _aggregated_message(order_count: int, radius_str: str, locale: str) -> str:
     )
 
 
+def _radius_label(proximity_radius_km: float) -> str:
+    if proximity_radius_km < 1:
+        return f"{proximity_radius_km * 1000:.0f} m"
+    return f"{proximity_radius_km:.0f} km"
+
+
 def _pick_template_id(locale: str, en_id: str, fr_id: str) -> str:
     en = (en_id or "").strip()
     fr = (fr_id or "").strip()
@@ -79,6 +96,36 @@ def _from_email() -> str:
     return os.environ.get("RESEND_FROM_EMAIL", "Rendasua <noreply@rendasua.com>")
 
 
+def _send(
+    dispatcher: Optional[NotificationDispatcher],
+    channel: str,
+    send_fn: Callable[..., Tuple[bool, str]],
+    *args: Any,
+) -> Tuple[bool, str]:
+    if dispatcher is None:
+        return send_fn(*args)
+    return dispatcher.send(channel, send_fn, *args)
+
+
+def _proximity_push(agent_location: AgentLocation, order: Order, distance_km: float) -> Optional[NestPush]:
+    """Push for an agent with a user id, else None."""
+    agent_user = agent_location.agent.user if agent_location.agent else None
+    user_push_id = (getattr(agent_user, "id", None) or "").strip() if agent_user else ""
+    if not user_push_id:
+        return None
+    locale = _normalize_language(getattr(agent_user, "preferred_language", None))
+    return NestPush(
+        user_id=user_push_id,
+        title="Nouvelle commande à proximité" if locale == "fr" else "New order nearby",
+        body=_proximity_message(_distance_label(distance_km, locale), locale),
+        data={
+            "orderId": order.id,
+            "orderNumber": str(order.order_number),
+            "url": f"/orders/{order.id}",
+        },
+    )
+
+
 def send_proximity_notification(
     agent_location: AgentLocation,
     order: Order,
@@ -86,7 +133,15 @@ def send_proximity_notification(
     resend_api_key: str,
     template_id_en: str,
     template_id_fr: str,
+    dispatcher: Optional[NotificationDispatcher] = None,
+    push_result: Optional[Tuple[bool, str]] = None,
 ) -> bool:
+    """
+    Push, then email (or SMS without an email) one agent about ``order``.
+
+    ``push_result`` is the outcome of a push already sent in bulk; when it
+    is given no push request is made here.
+    """
     log_info(
         "Preparing proximity notification",
         agent_id=agent_location.agent_id,
@@ -102,24 +157,15 @@ def send_proximity_notification(
     locale = _normalize_language(getattr(agent_user, "preferred_language", None))
     distance_str = _distance_label(distance_km, locale)
 
-    user_push_id = (getattr(agent_user, "id", None) or "").strip()
+    push = _proximity_push(agent_location, order, distance_km)
     push_sent = False
-    if user_push_id:
-        push_title = (
-            "Nouvelle commande à proximité" if locale == "fr" else "New order nearby"
-        )
-        push_body = _proximity_message(distance_str, locale)
-        push_data = {
-            "orderId": order.id,
-            "orderNumber": str(order.order_number),
-            "url": f"/orders/{order.id}",
-        }
-        ok_push, err_push = send_push_via_nest_api(
-            user_push_id, push_title, push_body, push_data
-        )
+    if push:
+        if push_result is None:
+            push_result = _send(dispatcher, CHANNEL_PUSH, send_push_via_nest_api, *push)
+        ok_push, err_push = push_result
         push_sent = ok_push
         if ok_push:
-            log_info("Proximity push sent via Nest", user_id=user_push_id)
+            log_info("Proximity push sent via Nest", user_id=push.user_id)
         else:
             log_error("Proximity push via Nest failed", error=None, detail=err_push)
 
@@ -149,7 +195,10 @@ def send_proximity_notification(
             "businessAddress": business_address,
             "currentYear": datetime.now().year,
         }
-        ok, err = send_resend_template_email(
+        ok, err = _send(
+            dispatcher,
+            CHANNEL_EMAIL,
+            send_resend_template_email,
             resend_api_key,
             _from_email(),
             agent_email,
@@ -164,7 +213,7 @@ def send_proximity_notification(
 
     if agent_phone:
         body = (f"Rendasua — {_proximity_message(distance_str, locale)}")[:_SMS_BODY_MAX]
-        ok, err = send_sms_via_nest_api(agent_phone, body)
+        ok, err = _send(dispatcher, CHANNEL_SMS, send_sms_via_nest_api, agent_phone, body)
         if ok:
             log_info("Proximity SMS sent via Nest", agent_id=agent_location.agent_id)
             return True
@@ -194,18 +243,49 @@ def send_notifications_to_nearby_agents(
             "Resend API key not available — email sends skipped; SMS-only agents may still notify",
             environment=environment,
         )
-    sent = 0
-    for agent_location, dist in zip(agent_locations, distances):
-        if send_proximity_notification(
-            agent_location,
+    dispatcher = get_notification_dispatcher()
+    stats_before = dispatcher.snapshot()
+    pairs = list(zip(agent_locations, distances))
+
+    # All pushes in bulk first; each agent's task then only does email/SMS
+    pushes: List[NestPush] = []
+    push_owner: List[int] = []
+    for index, (agent_location, dist) in enumerate(pairs):
+        push = _proximity_push(agent_location, order, dist)
+        if push:
+            pushes.append(push)
+            push_owner.append(index)
+    push_results: List[Optional[Tuple[bool, str]]] = [None] * len(pairs)
+    if pushes:
+        def single_push(push: NestPush) -> Tuple[bool, str]:
+            dispatcher.acquire(CHANNEL_PUSH)
+            return send_push_via_nest_api(*push)
+
+        bulk_results = send_pushes_via_nest_api(
+            pushes,
+            fallback=lambda chunk: dispatcher.map(single_push, chunk, default=(False, "Push task failed")),
+            before_request=lambda: dispatcher.acquire(CHANNEL_PUSH),
+        )
+        for index, result in zip(push_owner, bulk_results):
+            dispatcher.record(CHANNEL_PUSH, result[0])
+            push_results[index] = result
+
+    results = dispatcher.map(
+        lambda index: send_proximity_notification(
+            pairs[index][0],
             order,
-            dist,
+            pairs[index][1],
             api_key,
             template_id_en,
             template_id_fr,
-        ):
-            sent += 1
-    log_info("Batch complete", sent=sent, total=len(agent_locations))
+            dispatcher,
+            push_results[index],
+        ),
+        list(range(len(pairs))),
+        default=False,
+    )
+    sent = sum(1 for ok in results if ok)
+    log_info("Batch complete", sent=sent, total=len(agent_locations), channels=dispatcher.stats(since=stats_before))
     print(f"Sent {sent} out of {len(agent_locations)} notifications")
     return sent
 
@@ -217,6 +297,7 @@ def send_aggregated_proximity_notification(
     resend_api_key: str,
     template_id_en: str,
     template_id_fr: str,
+    dispatcher: Optional[NotificationDispatcher] = None,
 ) -> bool:
     if not (template_id_en or template_id_fr):
         log_error("Summary template ids missing")
@@ -228,11 +309,7 @@ def send_aggregated_proximity_notification(
     agent_email = (agent_user.email or "").strip() if agent_user.email else ""
     agent_phone = (getattr(agent_user, "phone_number", None) or "").strip()
     locale = _normalize_language(getattr(agent_user, "preferred_language", None))
-    if proximity_radius_km < 1:
-        radius_str = f"{proximity_radius_km * 1000:.0f} m"
-    else:
-        radius_str = f"{proximity_radius_km:.0f} km"
-    agg_line = _aggregated_message(order_count, radius_str, locale)
+    agg_line = _aggregated_message(order_count, _radius_label(proximity_radius_km), locale)
 
     if agent_email:
         if not resend_api_key:
@@ -245,7 +322,10 @@ def send_aggregated_proximity_notification(
             "message": agg_line,
             "currentYear": datetime.now().year,
         }
-        ok, err = send_resend_template_email(
+        ok, err = _send(
+            dispatcher,
+            CHANNEL_EMAIL,
+            send_resend_template_email,
             resend_api_key,
             _from_email(),
             agent_email,
@@ -259,7 +339,7 @@ def send_aggregated_proximity_notification(
 
     if agent_phone:
         body = (f"Rendasua — {agg_line}")[:_SMS_BODY_MAX]
-        ok, err = send_sms_via_nest_api(agent_phone, body)
+        ok, err = _send(dispatcher, CHANNEL_SMS, send_sms_via_nest_api, agent_phone, body)
         if ok:
             log_info("Aggregated proximity SMS sent via Nest", agent_id=agent_location.agent_id)
             return True
@@ -270,6 +350,31 @@ def send_aggregated_proximity_notification(
     return False
 
 
+def _aggregated_email(
+    agent_location: AgentLocation,
+    order_count: int,
+    proximity_radius_km: float,
+    template_id_en: str,
+    template_id_fr: str,
+) -> Optional[ResendTemplateEmail]:
+    """Summary email for an agent with an email address, else None."""
+    agent_user = agent_location.agent.user if agent_location.agent else None
+    agent_email = (agent_user.email or "").strip() if agent_user and agent_user.email else ""
+    if not agent_email:
+        return None
+    locale = _normalize_language(getattr(agent_user, "preferred_language", None))
+    agent_name = f"{agent_user.first_name} {agent_user.last_name}".strip() or "Agent"
+    return ResendTemplateEmail(
+        to_email=agent_email,
+        template_id=_pick_template_id(locale, template_id_en, template_id_fr),
+        variables={
+            "recipientName": agent_name,
+            "message": _aggregated_message(order_count, _radius_label(proximity_radius_km), locale),
+            "currentYear": datetime.now().year,
+        },
+    )
+
+
 def send_aggregated_notifications_to_agents(
     agent_locations: List[AgentLocation],
     agent_order_counts: Dict[str, int],
@@ -288,19 +393,55 @@ def send_aggregated_notifications_to_agents(
     if not template_id_en and not template_id_fr:
         log_error("Summary template ids not configured; skipping aggregated sends")
         return 0
-    sent = 0
-    for loc in agent_locations:
-        count = agent_order_counts.get(loc.agent_id, 0)
-        if count == 0:
-            continue
-        if send_aggregated_proximity_notification(
-            loc,
-            count,
+    dispatcher = get_notification_dispatcher()
+    stats_before = dispatcher.snapshot()
+    eligible = [loc for loc in agent_locations if agent_order_counts.get(loc.agent_id, 0)]
+
+    # Emails go out through the Resend batch endpoint; everyone else (SMS,
+    # or no Resend key) is handled one agent per task.
+    emails: List[ResendTemplateEmail] = []
+    email_indices: List[int] = []
+    others: List[int] = []
+    for index, loc in enumerate(eligible):
+        email = _aggregated_email(
+            loc, agent_order_counts[loc.agent_id], proximity_radius_km, template_id_en, template_id_fr
+        ) if api_key else None
+        if email:
+            emails.append(email)
+            email_indices.append(index)
+        else:
+            others.append(index)
+
+    results = [False] * len(eligible)
+    for index, ok in zip(others, dispatcher.map(
+        lambda i: send_aggregated_proximity_notification(
+            eligible[i],
+            agent_order_counts[eligible[i].agent_id],
             proximity_radius_km,
             api_key,
             template_id_en,
             template_id_fr,
-        ):
-            sent += 1
+            dispatcher,
+        ),
+        others,
+        default=False,
+    )):
+        results[index] = ok
+
+    if emails:
+        email_results = send_resend_template_emails(
+            api_key,
+            _from_email(),
+            emails,
+            before_request=lambda: dispatcher.acquire(CHANNEL_EMAIL),
+        )
+        for index, (ok, err) in zip(email_indices, email_results):
+            dispatcher.record(CHANNEL_EMAIL, ok)
+            results[index] = ok
+            if not ok:
+                log_error("Aggregated send failed", error=None, agent_id=eligible[index].agent_id, detail=err)
+
+    sent = sum(1 for ok in results if ok)
+    log_info("Aggregated batch complete", sent=sent, channels=dispatcher.stats(since=stats_before))
     print(f"Sent {sent} out of {len(agent_locations)} aggregated notifications")
     return sent
@@ -0,0 +1,197 @@
+"""
+Concurrent, rate-limited delivery for agent notifications.
+
+Each agent's notification (push, then email or SMS) is one task; tasks run
+on a bounded thread pool and every outbound call goes through the token
+bucket of its channel, so a few hundred agents finish in seconds while
+staying inside the Resend and Nest rate limits.
+
+Env (per container, read when the dispatcher is created):
+  NOTIFY_MAX_WORKERS — worker threads per batch (default 16)
+  NOTIFY_PUSH_RATE_PER_SECOND — Nest push calls per second (default 20)
+  NOTIFY_EMAIL_RATE_PER_SECOND — Resend calls per second (default 2, Resend's default limit)
+  NOTIFY_SMS_RATE_PER_SECOND — Nest SMS calls per second (default 5)
+A rate of 0 disables limiting for that channel.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from rendasua_core_packages.utilities import TokenBucket
+
+CHANNEL_PUSH = "push"
+CHANNEL_EMAIL = "email"
+CHANNEL_SMS = "sms"
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_CHANNEL_RATES: Dict[str, float] = {
+    CHANNEL_PUSH: 20.0,
+    CHANNEL_EMAIL: 2.0,
+    CHANNEL_SMS: 5.0,
+}
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class ChannelStats:
+    sent: int = 0
+    failed: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        attempts = self.sent + self.failed + self.errors
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "errors": self.errors,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "success_ratio": round(self.sent / attempts, 4) if attempts else 0.0,
+        }
+
+    def since(self, earlier: "ChannelStats") -> "ChannelStats":
+        """Counters accumulated after the ``earlier`` snapshot."""
+        return ChannelStats(
+            sent=self.sent - earlier.sent,
+            failed=self.failed - earlier.failed,
+            errors=self.errors - earlier.errors,
+            wait_seconds=self.wait_seconds - earlier.wait_seconds,
+        )
+
+
+class NotificationDispatcher:
+    """
+    Bounded worker pool with one token bucket per channel.
+
+    ``map`` runs a task per item and returns the results in input order;
+    inside a task, ``send`` performs one channel call (anything returning
+    the ``(ok, error)`` tuple the Nest and Resend clients use).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        channel_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_workers = max(1, int(
+            max_workers if max_workers is not None
+            else _env_number("NOTIFY_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        ))
+        rates = dict(channel_rates) if channel_rates is not None else {
+            channel: _env_number(f"NOTIFY_{channel.upper()}_RATE_PER_SECOND", rate)
+            for channel, rate in DEFAULT_CHANNEL_RATES.items()
+        }
+        self._limiters: Dict[str, TokenBucket] = {
+            channel: TokenBucket(rate) for channel, rate in rates.items()
+        }
+        self._stats: Dict[str, ChannelStats] = {channel: ChannelStats() for channel in rates}
+        self._lock = threading.Lock()
+
+    def _channel_stats(self, channel: str) -> ChannelStats:
+        with self._lock:
+            if channel not in self._stats:
+                self._stats[channel] = ChannelStats()
+            return self._stats[channel]
+
+    def acquire(self, channel: str) -> None:
+        """Block until ``channel`` allows one more call."""
+        limiter = self._limiters.get(channel)
+        if limiter is None:
+            return
+        started = time.monotonic()
+        limiter.acquire()
+        waited = time.monotonic() - started
+        stats = self._channel_stats(channel)
+        with self._lock:
+            stats.wait_seconds += waited
+
+    def record(self, channel: str, ok: bool, error: bool = False) -> None:
+        """Count one delivery outcome for ``channel``."""
+        outcome = "errors" if error else ("sent" if ok else "failed")
+        stats = self._channel_stats(channel)
+        with self._lock:
+            setattr(stats, outcome, getattr(stats, outcome) + 1)
+
+    def send(
+        self,
+        channel: str,
+        send_fn: Callable[..., Tuple[bool, str]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[bool, str]:
+        """Wait for a ``channel`` token, call ``send_fn`` and count the outcome."""
+        self.acquire(channel)
+        try:
+            ok, err = send_fn(*args, **kwargs)
+        except Exception as e:
+            self.record(channel, False, error=True)
+            return False, str(e)
+        self.record(channel, ok)
+        return ok, err
+
+    def map(self, task: Callable[[T], R], items: Sequence[T], default: R = None) -> List[R]:
+        """
+        Run ``task`` for every item on the worker pool.
+
+        Results come back in the order of ``items``; a task that raises
+        yields ``default``.
+        """
+        if not items:
+            return []
+
+        def run(item: T) -> R:
+            try:
+                return task(item)
+            except Exception as e:
+                print(f"[ERROR] [dispatcher] Notification task failed | error={e}")
+                return default
+
+        if self.max_workers == 1 or len(items) == 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(run, items))
+
+    def snapshot(self) -> Dict[str, ChannelStats]:
+        """Copy of the per-channel counters, to pass to ``stats(since=...)`` later."""
+        with self._lock:
+            return {channel: replace(stats) for channel, stats in self._stats.items()}
+
+    def stats(self, since: Optional[Dict[str, ChannelStats]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Per-channel counters since the dispatcher was created, or since the
+        ``since`` snapshot (the dispatcher is shared by warm invocations, so
+        a batch logs its own share this way).
+        """
+        with self._lock:
+            if since is None:
+                return {channel: stats.as_dict() for channel, stats in self._stats.items()}
+            return {
+                channel: stats.since(since.get(channel, ChannelStats())).as_dict()
+                for channel, stats in self._stats.items()
+            }
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Container-wide dispatcher (rate limits hold across warm invocations)."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher()
+    return _dispatcher
@@ -4,9 +4,45 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import requests
+
+# Entries per POST /api/notifications/internal/push-by-users (Nest caps at 100)
+NEST_PUSH_BATCH_LIMIT = 100
+# Gateway answers: the request never reached the backend, so nothing was sent
+_GATEWAY_ERROR_STATUSES = (502, 503, 504)
+
+
+class NestPush(NamedTuple):
+    user_id: str
+    title: str
+    body: str
+    data: Dict[str, str]
+
+
+# Kept-alive connection pool for bulk pushes, shared across warm invocations
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# Set once the backend answers 404 on the bulk route (older deployment)
+_bulk_route_missing = False
+
+
+def _nest_config() -> Tuple[str, str]:
+    base = (os.environ.get("BACKEND_INTERNAL_API_BASE_URL") or "").strip().rstrip("/")
+    api_key = (os.environ.get("NOTIFICATIONS_INTERNAL_API_KEY") or "").strip()
+    return base, api_key
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+        return _session
 
 
 def send_push_via_nest_api(
@@ -22,8 +58,7 @@ def send_push_via_nest_api(
       BACKEND_INTERNAL_API_BASE_URL — e.g. https://dev.api.rendasua.com (no trailing slash)
       NOTIFICATIONS_INTERNAL_API_KEY — must match Nest NOTIFICATIONS_INTERNAL_API_KEY
     """
-    base = (os.environ.get("BACKEND_INTERNAL_API_BASE_URL") or "").strip().rstrip("/")
-    api_key = (os.environ.get("NOTIFICATIONS_INTERNAL_API_KEY") or "").strip()
+    base, api_key = _nest_config()
     if not base or not api_key:
         return (
             False,
@@ -65,3 +100,105 @@ def send_push_via_nest_api(
         return False, f"HTTP {e.code}: {err_body}"
     except Exception as e:
         return False, str(e)
+
+
+def _post_push_batch(
+    base: str,
+    api_key: str,
+    pushes: Sequence[NestPush],
+) -> Tuple[Optional[List[Tuple[bool, str]]], int, str, bool]:
+    """
+    One bulk request: (results or None, HTTP status, error, resendable).
+
+    ``resendable`` is True only when the backend cannot have sent any of the
+    pushes (no connection, or a gateway response), so resending them one by
+    one cannot notify an agent twice.
+    """
+    payload = {
+        "pushes": [
+            {"userId": push.user_id, "title": push.title, "body": push.body, "data": push.data}
+            for push in pushes
+        ]
+    }
+    try:
+        response = _get_session().post(
+            f"{base}/api/notifications/internal/push-by-users",
+            json=payload,
+            headers={"X-Rendasua-Internal-Key": api_key},
+            timeout=30,
+        )
+    except requests.ConnectionError as exc:
+        # Includes connect timeouts: the request never reached the backend
+        return None, 0, str(exc), True
+    except requests.RequestException as exc:
+        # Read timeouts and the like: the backend may still be sending
+        return None, 0, str(exc), False
+    if response.status_code not in (200, 201):
+        error = response.text[:500] or f"HTTP {response.status_code}"
+        return None, response.status_code, error, response.status_code in _GATEWAY_ERROR_STATUSES
+    try:
+        parsed = response.json() or {}
+    except ValueError:
+        return None, response.status_code, "Invalid JSON response", False
+    entries = parsed.get("results")
+    if not isinstance(entries, list) or len(entries) != len(pushes):
+        error = str(parsed.get("error") or "Unexpected bulk push response")
+        return None, response.status_code, error, False
+    return [
+        (True, "") if entry.get("success") is True
+        else (False, str(entry.get("error") or "Push send failed"))
+        for entry in entries
+    ], response.status_code, "", False
+
+
+def send_pushes_via_nest_api(
+    pushes: Sequence[NestPush],
+    fallback: Optional[Callable[[Sequence[NestPush]], List[Tuple[bool, str]]]] = None,
+    before_request: Optional[Callable[[], Any]] = None,
+) -> List[Tuple[bool, str]]:
+    """
+    POST /api/notifications/internal/push-by-users in batches of
+    ``NEST_PUSH_BATCH_LIMIT`` over a kept-alive connection.
+
+    A chunk whose bulk request provably sent nothing (connection error,
+    connect timeout, 502/503/504) is handed to ``fallback`` (default:
+    ``send_push_via_nest_api`` one after the other). Any other failure, such
+    as a read timeout, may have been delivered, so the chunk is reported as
+    failed instead of being sent twice. If the backend does not have the
+    bulk route yet (404), every later chunk in the container goes to
+    ``fallback`` directly.
+    ``before_request`` is called before every bulk request.
+
+    Returns one ``(ok, error)`` per push, in input order.
+    """
+    global _bulk_route_missing
+    if fallback is None:
+        def fallback(chunk: Sequence[NestPush]) -> List[Tuple[bool, str]]:
+            return [send_push_via_nest_api(*push) for push in chunk]
+
+    base, api_key = _nest_config()
+    if not base or not api_key:
+        error = "BACKEND_INTERNAL_API_BASE_URL or NOTIFICATIONS_INTERNAL_API_KEY not configured"
+        return [(False, error)] * len(pushes)
+
+    results: List[Tuple[bool, str]] = []
+    for start in range(0, len(pushes), NEST_PUSH_BATCH_LIMIT):
+        chunk = pushes[start:start + NEST_PUSH_BATCH_LIMIT]
+        if not _bulk_route_missing:
+            if before_request:
+                before_request()
+            chunk_results, status, error, resendable = _post_push_batch(base, api_key, chunk)
+            if chunk_results is not None:
+                results.extend(chunk_results)
+                continue
+            if status == 404:
+                print("Nest bulk push route not available, falling back to single pushes")
+                _bulk_route_missing = True
+            elif resendable:
+                print(f"Nest bulk push not delivered, sending chunk one by one | status={status} error={error}")
+            else:
+                print(f"Nest bulk push failed, not resending chunk | status={status} error={error}")
+                results.extend([(False, f"Bulk push failed: {error}")] * len(chunk))
+                continue
+        results.extend(fallback(chunk))
+    return results
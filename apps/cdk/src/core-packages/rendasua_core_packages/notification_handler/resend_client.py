@@ -3,11 +3,30 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import requests
 
 RESEND_EMAILS_URL = "https://api.resend.com/emails"
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+# Resend accepts at most 100 emails per batch request
+RESEND_BATCH_LIMIT = 100
+# Longest Retry-After we wait for before giving up on a rate-limited batch
+RESEND_MAX_RETRY_AFTER_SECONDS = 5.0
+
+
+class ResendTemplateEmail(NamedTuple):
+    to_email: str
+    template_id: str
+    variables: Dict[str, Any]
+
+
+class ResendBatchResponse(NamedTuple):
+    results: Optional[List[Tuple[bool, str]]]
+    status: int
+    error: str
+    retry_after: Optional[float] = None
 
 
 def _serialize_variables(variables: Dict[str, Any]) -> Dict[str, str]:
@@ -21,6 +40,17 @@ def _serialize_variables(variables: Dict[str, Any]) -> Dict[str, str]:
     return out
 
 
+def _email_payload(from_email: str, to_email: str, template_id: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "from": from_email,
+        "to": [to_email],
+        "template": {
+            "id": template_id,
+            "variables": _serialize_variables(variables),
+        },
+    }
+
+
 def send_resend_template_email(
     api_key: str,
     from_email: str,
@@ -30,14 +60,7 @@ def send_resend_template_email(
 ) -> tuple[bool, str]:
     if not (api_key and from_email and to_email and template_id):
         return False, "missing required fields"
-    payload = {
-        "from": from_email,
-        "to": [to_email],
-        "template": {
-            "id": template_id,
-            "variables": _serialize_variables(variables),
-        },
-    }
+    payload = _email_payload(from_email, to_email, template_id, variables)
     try:
         response = requests.post(
             RESEND_EMAILS_URL,
@@ -54,3 +77,118 @@ def send_resend_template_email(
         return True, ""
     body = response.text[:500] if response.text else ""
     return False, f"status={response.status_code} body={body}"
+
+
+def _retry_after_seconds(response: Any) -> Optional[float]:
+    try:
+        return max(float(response.headers.get("retry-after")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def send_resend_template_email_batch(
+    api_key: str,
+    from_email: str,
+    emails: Sequence[ResendTemplateEmail],
+) -> ResendBatchResponse:
+    """
+    One POST /emails/batch for up to ``RESEND_BATCH_LIMIT`` template emails.
+
+    Uses permissive validation, so an invalid recipient fails on its own
+    instead of rejecting the whole batch. ``results`` holds one
+    ``(ok, error)`` per email in input order, or is None when the request
+    itself was rejected (``status`` is 0 when no response came back;
+    ``retry_after`` is set from the header of a 429).
+    """
+    if len(emails) > RESEND_BATCH_LIMIT:
+        raise ValueError(f"At most {RESEND_BATCH_LIMIT} emails per batch")
+    if not (api_key and from_email):
+        return ResendBatchResponse(None, 0, "missing required fields")
+    payload = [
+        _email_payload(from_email, email.to_email, email.template_id, email.variables)
+        for email in emails
+    ]
+    try:
+        response = requests.post(
+            RESEND_BATCH_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "x-batch-validation": "permissive",
+            },
+            data=json.dumps(payload),
+            timeout=30,
+        )
+    except requests.RequestException as exc:
+        return ResendBatchResponse(None, 0, str(exc))
+    if not 200 <= response.status_code < 300:
+        body = response.text[:500] if response.text else ""
+        retry_after = _retry_after_seconds(response) if response.status_code == 429 else None
+        return ResendBatchResponse(None, response.status_code, f"status={response.status_code} body={body}", retry_after)
+    try:
+        parsed = response.json() or {}
+    except ValueError:
+        return ResendBatchResponse(None, response.status_code, "Invalid JSON response")
+    errors = {
+        error.get("index"): str(error.get("message") or "rejected")
+        for error in parsed.get("errors") or []
+    }
+    results: List[Tuple[bool, str]] = []
+    for index, email in enumerate(emails):
+        if not (email.to_email and email.template_id):
+            results.append((False, "missing required fields"))
+        elif index in errors:
+            results.append((False, errors[index]))
+        else:
+            results.append((True, ""))
+    return ResendBatchResponse(results, response.status_code, "")
+
+
+def send_resend_template_emails(
+    api_key: str,
+    from_email: str,
+    emails: Sequence[ResendTemplateEmail],
+    before_request: Optional[Callable[[], Any]] = None,
+) -> List[Tuple[bool, str]]:
+    """
+    Send many template emails with as few requests as possible.
+
+    Emails go out in batches of ``RESEND_BATCH_LIMIT``. A rate-limited batch
+    (429) is retried once after its Retry-After (at most
+    ``RESEND_MAX_RETRY_AFTER_SECONDS``) and otherwise fails as a whole;
+    sending it one email at a time would only add requests to a throttled
+    API. A batch rejected for any other reason is retried one email at a
+    time. ``before_request`` is called before every HTTP request (e.g. to
+    take a rate-limit token).
+
+    Returns one ``(ok, error)`` per email, in input order.
+    """
+    results: List[Tuple[bool, str]] = []
+    for start in range(0, len(emails), RESEND_BATCH_LIMIT):
+        chunk = emails[start:start + RESEND_BATCH_LIMIT]
+        if before_request:
+            before_request()
+        response = send_resend_template_email_batch(api_key, from_email, chunk)
+        if response.status == 429:
+            retry_after = response.retry_after if response.retry_after is not None else 1.0
+            if retry_after <= RESEND_MAX_RETRY_AFTER_SECONDS:
+                print(f"Resend batch rate limited, retrying in {retry_after}s")
+                time.sleep(retry_after)
+                if before_request:
+                    before_request()
+                response = send_resend_template_email_batch(api_key, from_email, chunk)
+        chunk_results = response.results
+        if chunk_results is None and response.status == 429:
+            print(f"Resend batch still rate limited, failing {len(chunk)} emails: {response.error}")
+            chunk_results = [(False, response.error)] * len(chunk)
+        elif chunk_results is None:
+            print(f"Resend batch rejected, sending {len(chunk)} emails one by one: {response.error}")
+            chunk_results = []
+            for email in chunk:
+                if before_request:
+                    before_request()
+                chunk_results.append(send_resend_template_email(
+                    api_key, from_email, email.to_email, email.template_id, email.variables
+                ))
+        results.extend(chunk_results)
+    return results
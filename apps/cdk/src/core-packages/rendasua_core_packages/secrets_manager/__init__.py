@@ -10,6 +10,10 @@ from .client import (
     get_hasura_admin_secret,
     get_google_maps_api_key,
     get_resend_api_key,
+    invalidate_secret,
+    get_secrets_cache,
+    SecretsCache,
+    SecretsCacheStats,
 )
 
 __all__ = [
@@ -17,6 +21,11 @@ __all__ = [
     "get_hasura_admin_secret",
     "get_google_maps_api_key",
     "get_resend_api_key",
+    # Cache
+    "invalidate_secret",
+    "get_secrets_cache",
+    "SecretsCache",
+    "SecretsCacheStats",
 ]
 
 
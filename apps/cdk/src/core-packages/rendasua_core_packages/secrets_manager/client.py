@@ -3,12 +3,25 @@ AWS Secrets Manager helper functions used across Lambdas.
 
 This module centralises secret retrieval so that all functions share
 the same logging and error-handling behaviour.
+
+Secrets are cached per container: one boto3 client is reused, each secret
+is fetched at most once per ``SECRETS_CACHE_TTL_SECONDS`` (default 300),
+and a secret read during the last ``SECRETS_CACHE_REFRESH_AHEAD_SECONDS``
+(default 60) of its TTL is refreshed in the background while the cached
+value is served.
 """
 
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
 import json
+import os
+import threading
+import time
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_REFRESH_AHEAD_SECONDS = 60.0
 
 
 def _format_context(**kwargs) -> str:
@@ -29,9 +42,29 @@ def _log_error(message: str, error: Exception | None = None, **kwargs) -> None:
     print(f"[ERROR] [secrets_manager] {message}{suffix}")
 
 
-def get_secret(secret_name: str) -> Dict[str, str]:
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+_boto_client: Any = None
+_boto_client_lock = threading.Lock()
+
+
+def _get_client() -> Any:
+    """Secrets Manager client shared by the container."""
+    global _boto_client
+    with _boto_client_lock:
+        if _boto_client is None:
+            _boto_client = boto3.client("secretsmanager")
+        return _boto_client
+
+
+def _fetch_secret(secret_name: str) -> Dict[str, str]:
     _log_info("Retrieving secret from Secrets Manager", secret_name=secret_name)
-    client = boto3.client("secretsmanager")
+    client = _get_client()
     try:
         response = client.get_secret_value(SecretId=secret_name)
         if "SecretString" not in response:
@@ -49,6 +82,138 @@ def get_secret(secret_name: str) -> Dict[str, str]:
         raise
 
 
+@dataclass
+class SecretsCacheStats:
+    hits: int = 0
+    fetches: int = 0
+    background_refreshes: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        lookups = self.hits + self.fetches
+        return {
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "background_refreshes": self.background_refreshes,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class SecretsCache:
+    """
+    TTL cache of secret bundles keyed by secret name.
+
+    Expired (or missing) secrets are fetched synchronously; a secret within
+    ``refresh_ahead_seconds`` of expiry is returned from the cache and
+    refreshed on a background thread (one refresh per secret at a time).
+    A failed background refresh keeps the cached value until it expires.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        refresh_ahead_seconds: Optional[float] = None,
+    ) -> None:
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else _env_number("SECRETS_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        )
+        self.refresh_ahead_seconds = min(
+            self.ttl_seconds,
+            refresh_ahead_seconds if refresh_ahead_seconds is not None
+            else _env_number("SECRETS_CACHE_REFRESH_AHEAD_SECONDS", DEFAULT_REFRESH_AHEAD_SECONDS),
+        )
+        self.stats = SecretsCacheStats()
+        self._lock = threading.Lock()
+        # secret name -> (secrets, fetched at monotonic time)
+        self._entries: Dict[str, Tuple[Dict[str, str], float]] = {}
+        self._refreshing: set = set()
+
+    def get(self, secret_name: str, force_refresh: bool = False) -> Dict[str, str]:
+        """Secret bundle for ``secret_name`` (a copy; callers may mutate it)."""
+        now = time.monotonic()
+        refresh_in_background = False
+        with self._lock:
+            entry = None if force_refresh else self._entries.get(secret_name)
+            if entry is not None:
+                secrets, fetched_at = entry
+                age = now - fetched_at
+                if age < self.ttl_seconds:
+                    self.stats.hits += 1
+                    if age >= self.ttl_seconds - self.refresh_ahead_seconds and secret_name not in self._refreshing:
+                        self._refreshing.add(secret_name)
+                        refresh_in_background = True
+                else:
+                    entry = None
+            if entry is None:
+                self.stats.fetches += 1
+
+        if entry is not None:
+            if refresh_in_background:
+                threading.Thread(
+                    target=self._refresh, args=(secret_name,), name=f"secret-refresh-{secret_name}", daemon=True
+                ).start()
+            return dict(entry[0])
+
+        try:
+            secrets = _fetch_secret(secret_name)
+        except Exception:
+            with self._lock:
+                self.stats.errors += 1
+            raise
+        with self._lock:
+            self._entries[secret_name] = (secrets, time.monotonic())
+        return dict(secrets)
+
+    def _refresh(self, secret_name: str) -> None:
+        try:
+            secrets = _fetch_secret(secret_name)
+            with self._lock:
+                self._entries[secret_name] = (secrets, time.monotonic())
+                self.stats.background_refreshes += 1
+        except Exception:  # noqa: BLE001
+            with self._lock:
+                self.stats.errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(secret_name)
+
+    def invalidate(self, secret_name: Optional[str] = None) -> None:
+        """Drop one secret (or all) so the next read goes to Secrets Manager."""
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(secret_name, None)
+
+
+_cache: Optional[SecretsCache] = None
+
+
+def get_secrets_cache() -> SecretsCache:
+    """Container-wide secrets cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = SecretsCache()
+    return _cache
+
+
+def get_secret(secret_name: str, force_refresh: bool = False) -> Dict[str, str]:
+    """
+    Secret bundle ``secret_name`` as a dict, served from the container cache.
+
+    Raises:
+        Exception: If Secrets Manager cannot return the secret
+    """
+    return get_secrets_cache().get(secret_name, force_refresh=force_refresh)
+
+
+def invalidate_secret(secret_name: Optional[str] = None) -> None:
+    """Forget a cached secret (all secrets when ``secret_name`` is None)."""
+    get_secrets_cache().invalidate(secret_name)
+
+
 def get_hasura_admin_secret(environment: str) -> str:
     """
     Get Hasura admin secret from Secrets Manager.
@@ -1,18 +1,90 @@
 """
 Utility functions for common operations.
+
+Loaded lazily (PEP 562): each helper's module is imported on first access,
+so e.g. ``parse_datetime`` does not pull in ``requests``, numpy or the
+models.
 """
 
-from .address import format_full_address
-from .geocoding import geocode_address, persist_coordinates_to_hasura
-from .distance import calculate_haversine_distance, format_distance
-from .datetime_utils import parse_datetime
+from typing import TYPE_CHECKING, Any, List
+
+import importlib
+
+if TYPE_CHECKING:
+    from .address import format_full_address, normalized_address_key
+    from .geocoding import geocode_address, persist_coordinates_to_hasura
+    from .distance import (
+        calculate_haversine_distance,
+        format_distance,
+        haversine_matrix,
+        within_radius,
+        nearby_indices,
+        bounding_boxes,
+        merge_bounding_boxes,
+    )
+    from .spatial_index import GeoGridIndex
+    from .rate_limit import TokenBucket
+    from .datetime_utils import (
+        parse_datetime,
+        parse_timestamptz,
+        strict_datetimes_enabled,
+        LazyDatetime,
+        lazy_datetime,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    "format_full_address": "address",
+    "normalized_address_key": "address",
+    "geocode_address": "geocoding",
+    "persist_coordinates_to_hasura": "geocoding",
+    "calculate_haversine_distance": "distance",
+    "format_distance": "distance",
+    "haversine_matrix": "distance",
+    "within_radius": "distance",
+    "nearby_indices": "distance",
+    "bounding_boxes": "distance",
+    "merge_bounding_boxes": "distance",
+    "GeoGridIndex": "spatial_index",
+    "TokenBucket": "rate_limit",
+    "parse_datetime": "datetime_utils",
+    "parse_timestamptz": "datetime_utils",
+    "strict_datetimes_enabled": "datetime_utils",
+    "LazyDatetime": "datetime_utils",
+    "lazy_datetime": "datetime_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "format_full_address",
+    "normalized_address_key",
     "geocode_address",
     "persist_coordinates_to_hasura",
     "calculate_haversine_distance",
     "format_distance",
+    "haversine_matrix",
+    "within_radius",
+    "nearby_indices",
+    "bounding_boxes",
+    "merge_bounding_boxes",
+    "GeoGridIndex",
+    "TokenBucket",
     "parse_datetime",
+    "parse_timestamptz",
+    "strict_datetimes_enabled",
+    "LazyDatetime",
+    "lazy_datetime",
 ]
-
@@ -27,3 +27,12 @@ def format_full_address(address: Address) -> str:
     ]
     return " ".join(part for part in address_parts if part)
 
+
+
+def normalized_address_key(address: Address) -> str:
+    """
+    Cache key for an address: ``format_full_address`` case-folded, with
+    commas dropped and whitespace collapsed, so trivially different
+    spellings of the same address share one key.
+    """
+    return " ".join(format_full_address(address).replace(",", " ").casefold().split())
@@ -1,25 +1,162 @@
 """
 Datetime utility functions for parsing and formatting datetime strings.
+
+Hasura returns ``timestamptz`` values in one fixed ISO-8601 shape
+(``2026-01-05T10:00:00.123456+00:00``), and the same values repeat across
+rows (bulk updates share ``updated_at``, nested users and agents come back
+once per order). ``parse_timestamptz`` therefore tries the C
+``fromisoformat`` on the raw string first, only normalizes what older
+Pythons reject (``Z``, 1-5 digit fractions, ``+HH`` offsets), and keeps the
+results in an LRU (size from RENDASUA_DATETIME_CACHE_SIZE, default 4096).
+
+``LazyDatetime`` skips parsing until a value is actually used.
+
+Env:
+  RENDASUA_STRICT_DATETIMES — default for ``parse_datetime(strict=...)``
+  RENDASUA_DATETIME_CACHE_SIZE — parsed values kept per container
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Union
 import datetime
+import os
+import re
+
+_FRACTION = re.compile(r"\.(\d+)")
+_SHORT_OFFSET = re.compile(r"([+-]\d\d)$")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def strict_datetimes_enabled() -> bool:
+    """Default for ``parse_datetime``'s ``strict`` switch (env RENDASUA_STRICT_DATETIMES)."""
+    return os.environ.get("RENDASUA_STRICT_DATETIMES", "false").lower() == "true"
+
+
+def _normalize(value: str) -> str:
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    value = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value, count=1)
+    return _SHORT_OFFSET.sub(r"\1:00", value)
 
 
-def parse_datetime(dt_str: Optional[str]) -> datetime.datetime:
+@lru_cache(maxsize=max(0, int(_env_number("RENDASUA_DATETIME_CACHE_SIZE", 4096))))
+def parse_timestamptz(value: str) -> datetime.datetime:
+    """
+    Parse a Hasura ``timestamptz`` (or any ISO-8601 datetime) string.
+
+    Results are memoized; datetimes are immutable, so sharing them is safe.
+
+    Raises:
+        ValueError: if ``value`` is not an ISO-8601 datetime
+        TypeError: if ``value`` is not a string
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.datetime.fromisoformat(_normalize(value))
+
+
+def parse_datetime(dt_str: Optional[str], strict: Optional[bool] = None) -> datetime.datetime:
     """
     Parse datetime string to datetime object.
-    
+
     Args:
         dt_str: Optional datetime string to parse
-        
+        strict: Raise on malformed input instead of returning the current
+            time. Defaults to RENDASUA_STRICT_DATETIMES.
+
     Returns:
-        datetime.datetime object. Returns current time if dt_str is None or parsing fails.
+        datetime.datetime object. Returns current time if dt_str is None, or
+        if parsing fails and strict mode is off.
+
+    Raises:
+        ValueError: in strict mode, if dt_str is not an ISO-8601 datetime
     """
     if not dt_str:
         return datetime.datetime.now()
     try:
-        return datetime.datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-    except:
+        return parse_timestamptz(dt_str)
+    except (TypeError, ValueError) as e:
+        if strict if strict is not None else strict_datetimes_enabled():
+            raise ValueError(f"Invalid datetime {dt_str!r}") from e
         return datetime.datetime.now()
 
+
+class LazyDatetime:
+    """
+    Raw timestamp string that is parsed on first use.
+
+    Attribute access, comparisons, hashing, addition and subtraction go to
+    the parsed datetime, so most code can use it in place of one; ``raw`` is
+    the original string. It is not a datetime subclass, so
+    ``isinstance(x, datetime)`` is False; use ``.value`` where a real
+    datetime is required. Malformed input raises ValueError on first use.
+    """
+
+    __slots__ = ("raw", "_value")
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+        self._value: Optional[datetime.datetime] = None
+
+    @property
+    def value(self) -> datetime.datetime:
+        if self._value is None:
+            self._value = parse_timestamptz(self.raw)
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.value, name)
+
+    @staticmethod
+    def _unwrap(other: Any) -> Any:
+        return other.value if isinstance(other, LazyDatetime) else other
+
+    def __eq__(self, other: Any) -> bool:
+        return self.value == self._unwrap(other)
+
+    def __lt__(self, other: Any) -> bool:
+        return self.value < self._unwrap(other)
+
+    def __le__(self, other: Any) -> bool:
+        return self.value <= self._unwrap(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return self.value > self._unwrap(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return self.value >= self._unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __add__(self, other: Any) -> Any:
+        return self.value + other
+
+    def __radd__(self, other: Any) -> Any:
+        return other + self.value
+
+    def __sub__(self, other: Any) -> Any:
+        return self.value - self._unwrap(other)
+
+    def __rsub__(self, other: Any) -> Any:
+        return other - self.value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return f"LazyDatetime({self.raw!r})"
+
+
+def lazy_datetime(value: Any) -> Union[datetime.datetime, LazyDatetime, None]:
+    """Wrap a raw timestamp without parsing it; None and datetimes pass through."""
+    if not value or isinstance(value, datetime.datetime):
+        return value or None
+    return LazyDatetime(value)
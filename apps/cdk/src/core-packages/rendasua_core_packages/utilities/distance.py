@@ -1,6 +1,21 @@
 """Haversine distance calculation utilities."""
 import math
-from typing import Tuple
+from typing import Any, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships in the Lambda layer
+    np = None
+
+# Earth radius in kilometers
+EARTH_RADIUS_KM = 6371
+
+Coordinates = Union[float, Sequence[float], Any]
+
+# (min_lat, max_lat, min_lon, max_lon) in degrees
+BoundingBox = Tuple[float, float, float, float]
+
+KM_PER_DEGREE = 2 * math.pi * EARTH_RADIUS_KM / 360
 
 
 def to_radians(degrees: float) -> float:
@@ -34,8 +49,7 @@ def calculate_haversine_distance(
     Returns:
         Distance in kilometers
     """
-    # Earth radius in kilometers
-    R = 6371
+    R = EARTH_RADIUS_KM
     
     # Convert to radians
     lat1_rad = to_radians(lat1)
@@ -68,3 +82,157 @@ def format_distance(distance_km: float) -> str:
         return f"{distance_km * 1000:.0f} m"
     return f"{distance_km:.1f} km"
 
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (int, float)) or (
+        np is not None and isinstance(value, np.generic)
+    )
+
+
+def _haversine_matrix_numpy(lat_a, lon_a, lat_b, lon_b, dtype):
+    lat_a = np.asarray(lat_a, dtype=dtype).reshape(-1, 1)
+    lon_a = np.asarray(lon_a, dtype=dtype).reshape(-1, 1)
+    lat_b = np.asarray(lat_b, dtype=dtype).reshape(1, -1)
+    lon_b = np.asarray(lon_b, dtype=dtype).reshape(1, -1)
+
+    # Same operation order as calculate_haversine_distance (deg * pi / 180)
+    # so float64 results agree with the scalar path to the last few ulps.
+    lat_a_rad = lat_a * np.pi / 180
+    lat_b_rad = lat_b * np.pi / 180
+    dlat = lat_b - lat_a
+    dlat *= np.pi
+    dlat /= 180
+    dlon = lon_b - lon_a
+    dlon *= np.pi
+    dlon /= 180
+
+    np.sin(dlat / 2, out=dlat)
+    dlat **= 2
+    np.sin(dlon / 2, out=dlon)
+    dlon **= 2
+    dlon *= np.cos(lat_a_rad) * np.cos(lat_b_rad)
+    dlat += dlon  # dlat now holds the haversine term "a"
+
+    c = np.arctan2(np.sqrt(dlat), np.sqrt(1 - dlat))
+    c *= 2
+    c *= EARTH_RADIUS_KM
+    return c
+
+
+def _haversine_matrix_python(lat_a, lon_a, lat_b, lon_b) -> List[List[float]]:
+    points_b = list(zip(lat_b, lon_b))
+    return [
+        [calculate_haversine_distance(la, lo, lb, ob) for lb, ob in points_b]
+        for la, lo in zip(lat_a, lon_a)
+    ]
+
+
+def haversine_matrix(
+    lat_a: Coordinates,
+    lon_a: Coordinates,
+    lat_b: Coordinates,
+    lon_b: Coordinates,
+    dtype: str = "float64",
+):
+    """
+    Distances in kilometers between every point in A and every point in B.
+
+    Computed in one vectorized pass with NumPy when it is installed; the
+    result is an array of shape ``(len(A), len(B))`` in the requested
+    ``dtype`` ("float64" matches ``calculate_haversine_distance`` exactly,
+    "float32" halves memory at roughly metre-level precision). Without
+    NumPy a list of lists of floats is returned.
+
+    If all four arguments are scalars, the distance for that single pair
+    is returned as a float (scalar fast path).
+    """
+    if _is_scalar(lat_a) and _is_scalar(lon_a) and _is_scalar(lat_b) and _is_scalar(lon_b):
+        return calculate_haversine_distance(lat_a, lon_a, lat_b, lon_b)
+    if np is not None:
+        return _haversine_matrix_numpy(lat_a, lon_a, lat_b, lon_b, dtype)
+    return _haversine_matrix_python(lat_a, lon_a, lat_b, lon_b)
+
+
+def within_radius(
+    lat_a: Coordinates,
+    lon_a: Coordinates,
+    lat_b: Coordinates,
+    lon_b: Coordinates,
+    radius_km: float,
+    dtype: str = "float64",
+):
+    """
+    Boolean mask of the A × B pairs that are at most ``radius_km`` apart.
+
+    Same shapes and fallbacks as ``haversine_matrix``.
+    """
+    distances = haversine_matrix(lat_a, lon_a, lat_b, lon_b, dtype=dtype)
+    if isinstance(distances, float):
+        return distances <= radius_km
+    if np is not None:
+        return distances <= radius_km
+    return [[distance <= radius_km for distance in row] for row in distances]
+
+
+def nearby_indices(mask) -> List[List[int]]:
+    """For each row of a ``within_radius`` mask, the column indices that are True."""
+    if np is not None and isinstance(mask, np.ndarray):
+        rows, cols = np.nonzero(mask)
+        result: List[List[int]] = [[] for _ in range(mask.shape[0])]
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            result[row].append(col)
+        return result
+    return [[index for index, hit in enumerate(row) if hit] for row in mask]
+
+
+def bounding_boxes(lat: float, lon: float, radius_km: float) -> List[BoundingBox]:
+    """
+    Lat/lon boxes that contain every point within ``radius_km`` of (lat, lon).
+
+    Boxes are conservative (they may include points slightly outside the
+    radius). A box crossing the antimeridian is split in two; near the
+    poles the longitude range widens to the full circle.
+    """
+    lat_span = radius_km / KM_PER_DEGREE
+    min_lat = max(lat - lat_span, -90.0)
+    max_lat = min(lat + lat_span, 90.0)
+
+    cos_lat = math.cos(math.radians(min(abs(lat) + lat_span, 90.0)))
+    lon_span = radius_km / (KM_PER_DEGREE * cos_lat) if cos_lat > 1e-6 else 180.0
+    if lon_span >= 180.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+
+    min_lon = lon - lon_span
+    max_lon = lon + lon_span
+    if min_lon < -180.0:
+        return [
+            (min_lat, max_lat, -180.0, max_lon),
+            (min_lat, max_lat, min_lon + 360.0, 180.0),
+        ]
+    if max_lon > 180.0:
+        return [
+            (min_lat, max_lat, min_lon, 180.0),
+            (min_lat, max_lat, -180.0, max_lon - 360.0),
+        ]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def merge_bounding_boxes(boxes: Sequence[BoundingBox]) -> List[BoundingBox]:
+    """Merge overlapping boxes into their union so fewer boxes need checking."""
+    merged: List[BoundingBox] = []
+    for box in sorted(boxes):
+        for index, other in enumerate(merged):
+            if (
+                box[0] <= other[1] and other[0] <= box[1]
+                and box[2] <= other[3] and other[2] <= box[3]
+            ):
+                merged[index] = (
+                    min(box[0], other[0]),
+                    max(box[1], other[1]),
+                    min(box[2], other[2]),
+                    max(box[3], other[3]),
+                )
+                break
+        else:
+            merged.append(box)
+    return merged
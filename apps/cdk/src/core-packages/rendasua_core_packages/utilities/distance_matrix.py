@@ -0,0 +1,71 @@
+"""Google Maps Distance Matrix service."""
+import requests
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .geocoding import REQUEST_FAILED
+
+# Distance Matrix accepts at most 25 destinations per origin in one request
+MAX_DESTINATIONS_PER_REQUEST = 25
+
+LatLng = Tuple[float, float]
+
+
+def _format_point(point: LatLng) -> str:
+    return f"{point[0]:.6f},{point[1]:.6f}"
+
+
+def request_distance_row(
+    origin: LatLng,
+    destinations: Sequence[LatLng],
+    google_maps_api_key: str
+) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+    """
+    Road distances from one origin to up to 25 destinations (driving).
+
+    Args:
+        origin: (latitude, longitude) of the origin
+        destinations: (latitude, longitude) pairs, at most 25
+        google_maps_api_key: Google Maps API key
+
+    Returns:
+        (elements in destination order or None, Google status). Each element
+        has its own ``status`` and, when OK, ``distance``/``duration`` with
+        ``value`` (metres / seconds) and ``text``.
+    """
+    if len(destinations) > MAX_DESTINATIONS_PER_REQUEST:
+        raise ValueError(f"At most {MAX_DESTINATIONS_PER_REQUEST} destinations per request")
+
+    url = "https://maps.googleapis.com/maps/api/distancematrix/json"
+
+    params = {
+        "origins": _format_point(origin),
+        "destinations": "|".join(_format_point(point) for point in destinations),
+        "mode": "driving",
+        "key": google_maps_api_key,
+    }
+
+    try:
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = response.json()
+
+        status = data.get("status") or REQUEST_FAILED
+        if status != "OK":
+            print(f"Distance matrix failed: {status} - {data.get('error_message', 'Unknown error')}")
+            return None, status
+
+        rows = data.get("rows", [])
+        elements = rows[0].get("elements", []) if rows else []
+        if len(elements) != len(destinations):
+            print("Distance matrix returned an unexpected number of elements")
+            return None, REQUEST_FAILED
+
+        return elements, status
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error calling Google Distance Matrix API: {str(e)}")
+        return None, REQUEST_FAILED
+    except Exception as e:
+        print(f"Unexpected error during distance matrix request: {str(e)}")
+        return None, REQUEST_FAILED
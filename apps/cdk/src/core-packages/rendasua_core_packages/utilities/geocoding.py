@@ -1,28 +1,34 @@
 """Google Maps geocoding service."""
 import requests
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from rendasua_core_packages.models import Address, Coordinates
 from rendasua_core_packages.utilities import format_full_address
 
 
-def geocode_address(address: Address, google_maps_api_key: str) -> Optional[Coordinates]:
+# Google statuses meaning "this address has no coordinates" (safe to cache);
+# anything else (quota, network, server errors) is transient.
+NOT_FOUND_STATUSES = frozenset({"ZERO_RESULTS"})
+
+# Status reported when the request itself failed
+REQUEST_FAILED = "REQUEST_FAILED"
+
+
+def geocode_address_string(
+    address_string: str,
+    google_maps_api_key: str
+) -> Tuple[Optional[Dict[str, Any]], str]:
     """
-    Geocode an address using Google Maps Geocoding API.
+    Geocode a formatted address string using Google Maps Geocoding API.
     
     Args:
-        address: Address object to geocode
+        address_string: Address as produced by ``format_full_address``
         google_maps_api_key: Google Maps API key
         
     Returns:
-        Coordinates object if successful, None otherwise
+        (first geocoding result or None, Google status). The status is
+        ``REQUEST_FAILED`` when the API could not be reached, and
+        ``ZERO_RESULTS`` when Google answered OK without usable coordinates.
     """
-    if not google_maps_api_key:
-        print("Google Maps API key not found")
-        return None
-    
-    # Format address string using utility function
-    address_string = format_full_address(address)
-    
     # Google Maps Geocoding API endpoint
     url = "https://maps.googleapis.com/maps/api/geocode/json"
     
@@ -37,32 +43,58 @@ def geocode_address(address: Address, google_maps_api_key: str) -> Optional[Coor
         
         data = response.json()
         
-        if data.get("status") != "OK":
-            print(f"Geocoding failed: {data.get('status')} - {data.get('error_message', 'Unknown error')}")
-            return None
+        status = data.get("status") or REQUEST_FAILED
+        if status != "OK":
+            print(f"Geocoding failed: {status} - {data.get('error_message', 'Unknown error')}")
+            return None, status
         
         results = data.get("results", [])
         if not results:
             print("No geocoding results returned")
-            return None
+            return None, "ZERO_RESULTS"
         
         # Extract coordinates from first result
         location = results[0].get("geometry", {}).get("location", {})
-        lat = location.get("lat")
-        lng = location.get("lng")
-        
-        if lat is None or lng is None:
+        if location.get("lat") is None or location.get("lng") is None:
             print("Coordinates not found in geocoding response")
-            return None
+            return None, "ZERO_RESULTS"
         
-        return Coordinates(latitude=float(lat), longitude=float(lng))
+        return results[0], status
         
     except requests.exceptions.RequestException as e:
         print(f"Error calling Google Maps Geocoding API: {str(e)}")
-        return None
+        return None, REQUEST_FAILED
     except Exception as e:
         print(f"Unexpected error during geocoding: {str(e)}")
+        return None, REQUEST_FAILED
+
+
+def coordinates_from_result(result: Dict[str, Any]) -> Coordinates:
+    """Coordinates of a geocoding result returned by ``geocode_address_string``."""
+    location = result["geometry"]["location"]
+    return Coordinates(latitude=float(location["lat"]), longitude=float(location["lng"]))
+
+
+def geocode_address(address: Address, google_maps_api_key: str) -> Optional[Coordinates]:
+    """
+    Geocode an address using Google Maps Geocoding API.
+    
+    Args:
+        address: Address object to geocode
+        google_maps_api_key: Google Maps API key
+        
+    Returns:
+        Coordinates object if successful, None otherwise
+    """
+    if not google_maps_api_key:
+        print("Google Maps API key not found")
+        return None
+    
+    # Format address string using utility function
+    result, _status = geocode_address_string(format_full_address(address), google_maps_api_key)
+    if result is None:
         return None
+    return coordinates_from_result(result)
 
 
 def persist_coordinates_to_hasura(
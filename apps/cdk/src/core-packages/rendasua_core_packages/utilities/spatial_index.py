@@ -0,0 +1,187 @@
+"""
+In-process spatial index for radius lookups.
+
+``GeoGridIndex`` buckets points into a fixed latitude/longitude grid so a
+radius query only inspects the cells that can contain matches instead of
+every point. Exact distances for the candidates are computed with
+``haversine_matrix`` in a single pass. Points can be inserted, moved and
+removed individually, so a warm Lambda container can keep one index up to
+date across invocations instead of rebuilding it.
+"""
+
+import math
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .distance import KM_PER_DEGREE, haversine_matrix
+
+DEFAULT_CELL_SIZE_KM = 10.0
+
+Cell = Tuple[int, int]
+
+
+class GeoGridIndex:
+    """
+    Grid index of keyed points answering "which points are within R km".
+
+    ``cell_size_km`` should be in the order of the typical query radius;
+    smaller cells mean fewer candidates per cell but more cells per query.
+    """
+
+    def __init__(self, cell_size_km: float = DEFAULT_CELL_SIZE_KM) -> None:
+        if cell_size_km <= 0:
+            raise ValueError("cell_size_km must be positive")
+        self._cell_deg = cell_size_km / KM_PER_DEGREE
+        self._lon_cells = max(1, math.ceil(360 / self._cell_deg))
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._points: Dict[Hashable, Tuple[float, float, Cell]] = {}
+        self._values: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[Tuple[Hashable, float, float]],
+        cell_size_km: float = DEFAULT_CELL_SIZE_KM,
+    ) -> "GeoGridIndex":
+        index = cls(cell_size_km)
+        for key, lat, lon in points:
+            index.insert(key, lat, lon)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._points.clear()
+        self._values.clear()
+
+    def keys(self) -> List[Hashable]:
+        return list(self._points)
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        row = math.floor((lat + 90) / self._cell_deg)
+        col = math.floor((lon + 180) / self._cell_deg) % self._lon_cells
+        return row, col
+
+    def position(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        point = self._points.get(key)
+        return (point[0], point[1]) if point else None
+
+    def value(self, key: Hashable) -> Any:
+        """Payload stored with ``key`` (None if none was given)."""
+        return self._values.get(key)
+
+    def insert(self, key: Hashable, lat: float, lon: float, value: Any = None) -> None:
+        """Add a point, replacing any existing point with the same key."""
+        if key in self._points:
+            self.remove(key)
+        cell = self._cell(lat, lon)
+        self._cells.setdefault(cell, set()).add(key)
+        self._points[key] = (lat, lon, cell)
+        if value is not None:
+            self._values[key] = value
+
+    def move(self, key: Hashable, lat: float, lon: float, value: Any = None) -> bool:
+        """
+        Update a point's position (inserting it if unknown).
+
+        Returns True if the index changed.
+        """
+        point = self._points.get(key)
+        if point is None:
+            self.insert(key, lat, lon, value)
+            return True
+        if value is not None:
+            self._values[key] = value
+        if point[0] == lat and point[1] == lon:
+            return False
+        cell = self._cell(lat, lon)
+        if cell != point[2]:
+            self._discard_from_cell(key, point[2])
+            self._cells.setdefault(cell, set()).add(key)
+        self._points[key] = (lat, lon, cell)
+        return True
+
+    def remove(self, key: Hashable) -> bool:
+        point = self._points.pop(key, None)
+        if point is None:
+            return False
+        self._discard_from_cell(key, point[2])
+        self._values.pop(key, None)
+        return True
+
+    def _discard_from_cell(self, key: Hashable, cell: Cell) -> None:
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._cells[cell]
+
+    def _candidate_ranges(
+        self, lat: float, lon: float, radius_km: float
+    ) -> Tuple[range, List[int]]:
+        """Grid rows and (wrapped) columns that can hold points within the radius."""
+        lat_span = radius_km / KM_PER_DEGREE
+        min_row = math.floor((max(lat - lat_span, -90.0) + 90) / self._cell_deg)
+        max_row = math.floor((min(lat + lat_span, 90.0) + 90) / self._cell_deg)
+        rows = range(min_row, max_row + 1)
+
+        # Longitude degrees shrink with latitude; use the widest latitude in
+        # the band. Near the poles every column is a candidate.
+        widest_lat = min(abs(lat) + lat_span, 90.0)
+        cos_lat = math.cos(math.radians(widest_lat))
+        lon_span = radius_km / (KM_PER_DEGREE * cos_lat) if cos_lat > 1e-6 else 360.0
+        if 2 * lon_span >= 360:
+            return rows, list(range(self._lon_cells))
+        min_col = math.floor((lon - lon_span + 180) / self._cell_deg)
+        max_col = math.floor((lon + lon_span + 180) / self._cell_deg)
+        columns = sorted({col % self._lon_cells for col in range(min_col, max_col + 1)})
+        return rows, columns
+
+    def query_radius(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        dtype: str = "float64",
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Keys within ``radius_km`` of (lat, lon) with their distances in km.
+
+        Results are sorted by distance, nearest first.
+        """
+        rows, columns = self._candidate_ranges(lat, lon, radius_km)
+        candidates: List[Hashable] = []
+        if len(rows) * len(columns) > len(self._cells):
+            # Large radius: cheaper to walk the occupied cells.
+            wanted_columns = set(columns)
+            for (row, col), members in self._cells.items():
+                if row in rows and col in wanted_columns:
+                    candidates.extend(members)
+        else:
+            for row in rows:
+                for col in columns:
+                    members = self._cells.get((row, col))
+                    if members:
+                        candidates.extend(members)
+        if not candidates:
+            return []
+
+        points = self._points
+        distances = haversine_matrix(
+            [lat],
+            [lon],
+            [points[key][0] for key in candidates],
+            [points[key][1] for key in candidates],
+            dtype=dtype,
+        )[0]
+        matches = [
+            (key, float(distance))
+            for key, distance in zip(candidates, distances)
+            if distance <= radius_km
+        ]
+        matches.sort(key=lambda match: match[1])
+        return matches
@@ -14,11 +14,19 @@ setup(
         "pydantic>=2.0.0",
     ],
     extras_require={
+        "fast": [
+            "numpy>=1.24",
+        ],
         "dev": [
             "datamodel-code-generator>=0.25.0",
             "graphql-core>=3.2.0",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "rendasua-geocode-backfill=rendasua_core_packages.hasura_client.geocoding_backfill:main",
+        ],
+    },
     include_package_data=True,
     package_data={
         "*": ["*.py", "*.txt", "*.md"],
@@ -1,16 +1,20 @@
 """Lambda handler for processing pending agent notifications."""
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from rendasua_core_packages.hasura_client import (
     get_order_with_location,
-    get_all_agent_locations,
+    get_agent_location_cache,
+    prewarm_address_coordinates,
+    get_road_distance_service,
+    AgentLocationTable,
 )
 from rendasua_core_packages.hasura_client.orders_service import (
     get_pending_agent_notifications,
     update_notification_status,
+    update_notification_statuses,
 )
-from rendasua_core_packages.utilities import calculate_haversine_distance, format_distance
+from rendasua_core_packages.utilities import format_distance, GeoGridIndex
 from rendasua_core_packages.secrets_manager import get_hasura_admin_secret, get_google_maps_api_key
 from rendasua_core_packages.notification_handler import (
     send_aggregated_notifications_to_agents,
@@ -18,6 +22,13 @@ from rendasua_core_packages.notification_handler import (
 )
 from rendasua_core_packages.models import Order, OrderAgentNotification
 
+# Agent positions survive across warm invocations and are updated in place.
+# Only the per-notification path queries the index; the aggregated path
+# matches with AgentLocationTable.nearby_points, so the index is synced
+# lazily, when a per-notification lookup needs it.
+_agent_index = GeoGridIndex()
+_agent_index_synced = False
+
 
 def log_info(message: str, **kwargs):
     """Log info message with optional context."""
@@ -32,7 +43,80 @@ def log_error(message: str, error: Exception | None = None, **kwargs):
     print(f"[ERROR] {message}" + (f" | {context_str}" if context_str else "") + error_str)
 
 
-def process_all_notifications_aggregated(
+def refresh_agent_locations(
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    sync_index: bool = False,
+) -> AgentLocationTable:
+    """
+    Refresh the warm agent location cache, and the agent index if ``sync_index``.
+    
+    The index gets the cache's delta when it was synced on the previous
+    refresh and is rebuilt from the table otherwise.
+    
+    Returns the current available agent locations as a columnar table.
+    """
+    global _agent_index_synced
+    cache = get_agent_location_cache()
+    delta = cache.refresh(hasura_endpoint, hasura_admin_secret)
+    table = cache.table()
+    if not sync_index:
+        _agent_index_synced = False
+    elif delta.full_reload or not _agent_index_synced:
+        _agent_index.clear()
+        for agent_id, lat, lon in zip(table.agent_ids, table.latitudes, table.longitudes):
+            _agent_index.move(agent_id, lat, lon)
+        _agent_index_synced = True
+    else:
+        upserted = delta.upserted
+        for agent_id, lat, lon in zip(upserted.agent_ids, upserted.latitudes, upserted.longitudes):
+            _agent_index.move(agent_id, lat, lon)
+        for agent_id in delta.removed:
+            _agent_index.remove(agent_id)
+    log_info(
+        "Agent locations refreshed",
+        agents=len(table),
+        index_synced=_agent_index_synced,
+        full_reload=delta.full_reload,
+        upserted=len(delta.upserted),
+        removed=len(delta.removed),
+        **cache.stats.as_dict(),
+    )
+    return table
+
+
+def road_distance_enabled() -> bool:
+    return os.environ.get("ROAD_DISTANCE_ENABLED", "false").lower() == "true"
+
+
+def road_distances_within_radius(
+    origin: Tuple[float, float],
+    candidates: List[Tuple[float, float]],
+    radius_km: float,
+    google_maps_api_key: Optional[str],
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+) -> List[Optional[float]]:
+    """
+    Road distance (km) from ``origin`` to each haversine candidate, or None
+    for candidates whose road distance exceeds the radius.
+    
+    Road distances are never shorter than the straight line, so the
+    haversine candidates are a superset of the road matches. Missing pairs
+    are fetched with one Distance Matrix request for this origin; pairs
+    Google cannot route keep their haversine distance.
+    """
+    if not candidates:
+        return []
+    service = get_road_distance_service()
+    service.fill([origin], candidates, google_maps_api_key, hasura_endpoint, hasura_admin_secret)
+    return [
+        road.distance_km if road.distance_km <= radius_km else None
+        for road in service.distances(origin, candidates, hasura_endpoint, hasura_admin_secret)
+    ]
+
+
+def _aggregate_notifications(
     pending_notifications: List[OrderAgentNotification],
     hasura_endpoint: str,
     hasura_admin_secret: str,
@@ -40,10 +124,15 @@ def process_all_notifications_aggregated(
     proximity_radius_km: float,
     summary_template_id_en: str,
     summary_template_id_fr: str,
-    google_maps_api_key: Optional[str]
+    google_maps_api_key: Optional[str],
+    status_updates: List[Tuple[str, str, Optional[str]]]
 ) -> Dict[str, Any]:
     """
-    Process all pending notifications by aggregating orders per agent.
+    Aggregate pending notifications per agent and send them.
+    
+    Status changes are appended to ``status_updates`` as
+    (notification_id, status, error_message) instead of being written one
+    by one; the caller flushes them.
     
     Args:
         pending_notifications: List of pending OrderAgentNotification objects
@@ -84,13 +173,7 @@ def process_all_notifications_aggregated(
                 order_id=order_id,
                 current_status=current_status,
             )
-            update_notification_status(
-                notification_id=notification.id,
-                status="skipped",
-                error_message=f"Order status changed to {current_status}",
-                hasura_endpoint=hasura_endpoint,
-                hasura_admin_secret=hasura_admin_secret
-            )
+            status_updates.append((notification.id, "skipped", f"Order status changed to {current_status}"))
             continue
         
         # Track notification IDs for this order
@@ -117,6 +200,22 @@ def process_all_notifications_aggregated(
             "notifications_sent": 0,
         }
     
+    # Pre-warm: geocode every business address still missing coordinates in
+    # one concurrent, rate-limited batch (persisted with a single mutation),
+    # so the per-order loop below does not wait on Google one by one.
+    prewarmed = prewarm_address_coordinates(
+        [
+            order.business_location.address
+            for order in unique_orders.values()
+            if order.business_location and order.business_location.address
+        ],
+        google_maps_api_key,
+        hasura_endpoint,
+        hasura_admin_secret,
+    )
+    if prewarmed:
+        log_info("Pre-warmed business address coordinates", count=prewarmed)
+    
     # Step 2: Fetch complete order data with locations for orders missing coordinates
     valid_orders: List[Order] = []
     for order_id, order in unique_orders.items():
@@ -137,13 +236,7 @@ def process_all_notifications_aggregated(
                 log_error("Order not found or missing location", order_id=order_id)
                 # Mark related notifications as failed
                 for notif_id in notification_ids_by_order.get(order_id, []):
-                    update_notification_status(
-                        notification_id=notif_id,
-                        status="failed",
-                        error_message="Order not found or missing location",
-                        hasura_endpoint=hasura_endpoint,
-                        hasura_admin_secret=hasura_admin_secret
-                    )
+                    status_updates.append((notif_id, "failed", "Order not found or missing location"))
         else:
             valid_orders.append(order)
     
@@ -161,9 +254,9 @@ def process_all_notifications_aggregated(
         valid_orders_count=len(valid_orders),
     )
     
-    # Step 3: Fetch all agent locations
-    log_info("Fetching all agent locations")
-    agent_locations = get_all_agent_locations(
+    # Step 3: Fetch agent locations (warm cache, only changes since the last run)
+    log_info("Refreshing agent locations")
+    agent_locations = refresh_agent_locations(
         hasura_endpoint,
         hasura_admin_secret
     )
@@ -173,13 +266,7 @@ def process_all_notifications_aggregated(
         # Mark all notifications as complete (no agents available)
         for order_id, notif_ids in notification_ids_by_order.items():
             for notif_id in notif_ids:
-                update_notification_status(
-                    notification_id=notif_id,
-                    status="complete",
-                    error_message="No agents available",
-                    hasura_endpoint=hasura_endpoint,
-                    hasura_admin_secret=hasura_admin_secret
-                )
+                status_updates.append((notif_id, "complete", "No agents available"))
         return {
             "success": True,
             "status": "complete",
@@ -197,27 +284,52 @@ def process_all_notifications_aggregated(
         total_orders=len(valid_orders),
     )
     
-    for agent_location in agent_locations:
-        agent_id = agent_location.agent_id
-        nearby_order_ids = []
-        
-        for order in valid_orders:
-            order_address = order.business_location.address
-            if not order_address or order_address.latitude is None or order_address.longitude is None:
+    located_orders = [
+        order for order in valid_orders
+        if order.business_location.address
+        and order.business_location.address.latitude is not None
+        and order.business_location.address.longitude is not None
+    ]
+    
+    # One vectorized agents x orders pass over the table's coordinate columns
+    nearby_orders_per_agent = agent_locations.nearby_points(
+        [order.business_location.address.latitude for order in located_orders],
+        [order.business_location.address.longitude for order in located_orders],
+        proximity_radius_km,
+    )
+    for agent_id, order_indices in zip(agent_locations.agent_ids, nearby_orders_per_agent):
+        if order_indices:
+            agent_nearby_orders[agent_id] = [located_orders[i].id for i in order_indices]
+    
+    if road_distance_enabled() and agent_nearby_orders:
+        # Re-check the straight-line matches against road distance, per order
+        order_agents: Dict[str, List[str]] = {}
+        for agent_id, order_ids in agent_nearby_orders.items():
+            for order_id in order_ids:
+                order_agents.setdefault(order_id, []).append(agent_id)
+        road_nearby_orders: Dict[str, List[str]] = {}
+        for order in located_orders:
+            candidate_ids = order_agents.get(order.id)
+            if not candidate_ids:
                 continue
-            
-            distance = calculate_haversine_distance(
-                order_address.latitude,
-                order_address.longitude,
-                agent_location.latitude,
-                agent_location.longitude
+            candidate_rows = [agent_locations.row_for(agent_id) for agent_id in candidate_ids]
+            road_km = road_distances_within_radius(
+                (order.business_location.address.latitude, order.business_location.address.longitude),
+                [(row.latitude, row.longitude) for row in candidate_rows],
+                proximity_radius_km,
+                google_maps_api_key,
+                hasura_endpoint,
+                hasura_admin_secret,
             )
-            
-            if distance <= proximity_radius_km:
-                nearby_order_ids.append(order.id)
-        
-        if nearby_order_ids:
-            agent_nearby_orders[agent_id] = nearby_order_ids
+            for agent_id, km in zip(candidate_ids, road_km):
+                if km is not None:
+                    road_nearby_orders.setdefault(agent_id, []).append(order.id)
+        log_info(
+            "Road distance check complete",
+            straight_line_agents=len(agent_nearby_orders),
+            road_agents=len(road_nearby_orders),
+        )
+        agent_nearby_orders = road_nearby_orders
     
     log_info(
         "Distance calculation complete",
@@ -233,13 +345,7 @@ def process_all_notifications_aggregated(
         # Mark all notifications as complete
         for order_id, notif_ids in notification_ids_by_order.items():
             for notif_id in notif_ids:
-                update_notification_status(
-                    notification_id=notif_id,
-                    status="complete",
-                    error_message=f"No agents within {proximity_radius_km}km",
-                    hasura_endpoint=hasura_endpoint,
-                    hasura_admin_secret=hasura_admin_secret
-                )
+                status_updates.append((notif_id, "complete", f"No agents within {proximity_radius_km}km"))
         return {
             "success": True,
             "status": "complete",
@@ -262,8 +368,8 @@ def process_all_notifications_aggregated(
         
         # Get agent locations for agents that need notifications
         agents_to_notify = [
-            loc for loc in agent_locations 
-            if loc.agent_id in agent_nearby_orders
+            agent_locations.row_for(agent_id)
+            for agent_id in agent_nearby_orders
         ]
         
         notifications_sent = send_aggregated_notifications_to_agents(
@@ -289,13 +395,7 @@ def process_all_notifications_aggregated(
         
         for order_id in notified_order_ids:
             for notif_id in notification_ids_by_order.get(order_id, []):
-                update_notification_status(
-                    notification_id=notif_id,
-                    status="complete",
-                    error_message=None,
-                    hasura_endpoint=hasura_endpoint,
-                    hasura_admin_secret=hasura_admin_secret
-                )
+                status_updates.append((notif_id, "complete", None))
         
         return {
             "success": True,
@@ -314,13 +414,7 @@ def process_all_notifications_aggregated(
         # Mark all notifications as failed
         for order_id, notif_ids in notification_ids_by_order.items():
             for notif_id in notif_ids:
-                update_notification_status(
-                    notification_id=notif_id,
-                    status="failed",
-                    error_message=str(e),
-                    hasura_endpoint=hasura_endpoint,
-                    hasura_admin_secret=hasura_admin_secret
-                )
+                status_updates.append((notif_id, "failed", str(e)))
         return {
             "success": False,
             "status": "failed",
@@ -328,6 +422,53 @@ def process_all_notifications_aggregated(
         }
 
 
+def process_all_notifications_aggregated(
+    pending_notifications: List[OrderAgentNotification],
+    hasura_endpoint: str,
+    hasura_admin_secret: str,
+    environment: str,
+    proximity_radius_km: float,
+    summary_template_id_en: str,
+    summary_template_id_fr: str,
+    google_maps_api_key: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Process all pending notifications by aggregating orders per agent.
+    
+    Notification statuses are collected during the run and written with a
+    single bulk mutation at the end, whichever way the run finishes.
+    
+    Args:
+        pending_notifications: List of pending OrderAgentNotification objects
+        hasura_endpoint: Hasura GraphQL endpoint
+        hasura_admin_secret: Hasura admin secret
+        environment: Environment name
+        proximity_radius_km: Proximity radius in kilometers
+        summary_template_id_en: Resend template id (English summary email)
+        summary_template_id_fr: Resend template id (French summary email)
+        google_maps_api_key: Google Maps API key
+        
+    Returns:
+        Result dictionary with processing status
+    """
+    status_updates: List[Tuple[str, str, Optional[str]]] = []
+    try:
+        return _aggregate_notifications(
+            pending_notifications,
+            hasura_endpoint,
+            hasura_admin_secret,
+            environment,
+            proximity_radius_km,
+            summary_template_id_en,
+            summary_template_id_fr,
+            google_maps_api_key,
+            status_updates,
+        )
+    finally:
+        if status_updates:
+            update_notification_statuses(status_updates, hasura_endpoint, hasura_admin_secret)
+
+
 def process_notification(
     notification,
     hasura_endpoint: str,
@@ -436,11 +577,12 @@ def process_notification(
             "message": "Business location coordinates not available",
         }
     
-    # Fetch all agent locations
-    log_info("Fetching all agent locations", order_id=order_id)
-    agent_locations = get_all_agent_locations(
+    # Fetch agent locations (warm cache, only changes since the last run)
+    log_info("Refreshing agent locations", order_id=order_id)
+    agent_locations = refresh_agent_locations(
         hasura_endpoint,
-        hasura_admin_secret
+        hasura_admin_secret,
+        sync_index=True,
     )
     
     if not agent_locations:
@@ -467,20 +609,28 @@ def process_notification(
         proximity_radius_km=proximity_radius_km,
     )
     
+    agent_index = _agent_index
+    
     nearby_agents = []
     distances = []
     
-    for agent_location in agent_locations:
-        distance = calculate_haversine_distance(
-            address.latitude,
-            address.longitude,
-            agent_location.latitude,
-            agent_location.longitude
+    for agent_id, distance in agent_index.query_radius(
+        address.latitude, address.longitude, proximity_radius_km
+    ):
+        nearby_agents.append(agent_locations.row_for(agent_id))
+        distances.append(distance)
+    
+    if road_distance_enabled() and nearby_agents:
+        road_km = road_distances_within_radius(
+            (address.latitude, address.longitude),
+            [(row.latitude, row.longitude) for row in nearby_agents],
+            proximity_radius_km,
+            google_maps_api_key,
+            hasura_endpoint,
+            hasura_admin_secret,
         )
-        
-        if distance <= proximity_radius_km:
-            nearby_agents.append(agent_location)
-            distances.append(distance)
+        nearby_agents = [row for row, km in zip(nearby_agents, road_km) if km is not None]
+        distances = [km for km in road_km if km is not None]
     
     log_info(
         "Distance calculation complete",
@@ -10,19 +10,22 @@ from rendasua_core_packages.hasura_client import (
     get_order_with_location,
     get_complete_order_details,
     get_order_details_for_notification,
-    get_platform_order_lifecycle_counts,
+    get_order_details_with_lifecycle_counts,
     get_or_create_order_hold,
     get_account_by_user_and_currency,
-    register_account_transaction,
-    update_order_hold_status,
     get_cancellation_fee_config,
     get_order_business_location_country,
-    register_cancellation_fee_transactions,
+    HoldStatusChange,
+    LedgerPosting,
+    post_journal,
 )
 from rendasua_core_packages.hasura_client.orders_service import create_pending_agent_notification
 from slack_notifications import send_slack_for_order_event
 from rendasua_core_packages.secrets_manager import get_hasura_admin_secret, get_google_maps_api_key
 
+CANCELLATION_FEE_DEBIT = "client cancellation fee"
+CANCELLATION_FEE_CREDIT = "business cancellation fee"
+
 @dataclass
 class SQSEventMessage:
     """SQS event message format."""
@@ -103,13 +106,14 @@ def _send_slack_order_alert_safe(
         return
     try:
         hasura_admin_secret = get_hasura_admin_secret(environment)
-        details = get_order_details_for_notification(
-            order_id, hasura_endpoint, hasura_admin_secret
-        )
         lifecycle_totals = None
         if event_kind in ("order.completed", "order.cancelled"):
-            lifecycle_totals = get_platform_order_lifecycle_counts(
-                hasura_endpoint, hasura_admin_secret
+            details, lifecycle_totals = get_order_details_with_lifecycle_counts(
+                order_id, hasura_endpoint, hasura_admin_secret
+            )
+        else:
+            details = get_order_details_for_notification(
+                order_id, hasura_endpoint, hasura_admin_secret
             )
         send_slack_for_order_event(
             event_kind,
@@ -525,7 +529,12 @@ def process_cancellation_financials(
             log_error("Failed to get or create order hold", order_id=order_id)
             return {"success": False, "error": "Failed to get or create order hold"}
         
-        log_info("Order hold retrieved", order_id=order_id, hold_id=order_hold.id)
+        log_info("Order hold retrieved", order_id=order_id, hold_id=order_hold.id, hold_status=order_hold.status)
+
+        # Redelivered event: the holds were already released with the hold cancellation
+        if order_hold.status == "cancelled":
+            log_info("Order hold already cancelled, nothing to release", order_id=order_id, hold_id=order_hold.id)
+            return {"success": True, "cancellation_fee": 0.0}
 
         if getattr(order_hold, "item_settlement_completed_at", None):
             log_info(
@@ -533,6 +542,7 @@ def process_cancellation_financials(
                 order_id=order_id,
             )
         release_failures = []
+        postings = []
         
         # Release agent hold if agent is assigned
         agent_hold_amount = order_hold.agent_hold_amount
@@ -547,20 +557,14 @@ def process_cancellation_financials(
             
             if agent_account:
                 log_info("Releasing agent hold", order_id=order_id, amount=agent_hold_amount)
-                transaction_id = register_account_transaction(
+                postings.append(LedgerPosting(
                     agent_account.id,
                     agent_hold_amount,
                     "release",
                     f"Hold released for order {order.order_number}",
                     order_id,
-                    hasura_endpoint,
-                    hasura_admin_secret
-                )
-                if transaction_id:
-                    log_info("Agent hold released successfully", order_id=order_id, transaction_id=transaction_id)
-                else:
-                    release_failures.append("agent hold")
-                    log_error("Failed to release agent hold", order_id=order_id)
+                    label="agent hold",
+                ))
             else:
                 release_failures.append("agent hold")
                 log_error("Agent account not found", order_id=order_id, agent_user_id=agent_user_id)
@@ -613,23 +617,23 @@ def process_cancellation_financials(
                     log_error("Business account not found", order_id=order_id, business_user_id=business_user_id)
                     return {"success": False, "error": "Business account not found"}
                 
-                # Register cancellation fee transactions
-                fee_result = register_cancellation_fee_transactions(
-                    order_id,
-                    order.order_number,
+                # Cancellation fee: debit client, credit business
+                postings.append(LedgerPosting(
                     client_account.id,
+                    cancellation_fee,
+                    "fee",
+                    f"Cancellation fee for order {order.order_number}",
+                    order_id,
+                    label=CANCELLATION_FEE_DEBIT,
+                ))
+                postings.append(LedgerPosting(
                     business_account.id,
                     cancellation_fee,
-                    order.currency,
-                    hasura_endpoint,
-                    hasura_admin_secret
-                )
-                
-                if not fee_result.get("success"):
-                    log_error("Failed to register cancellation fee transactions", order_id=order_id, error=fee_result.get("error"))
-                    return {"success": False, "error": "Failed to process cancellation fee"}
-                
-                log_info("Cancellation fee transactions registered successfully", order_id=order_id)
+                    "deposit",
+                    f"Cancellation fee received for order {order.order_number}",
+                    order_id,
+                    label=CANCELLATION_FEE_CREDIT,
+                ))
         
         elif cancelled_by == "business":
             # Business cancelling - no fee to client
@@ -641,56 +645,53 @@ def process_cancellation_financials(
         
         if refund_amount > 0:
             log_info("Releasing client hold", order_id=order_id, amount=refund_amount, cancellation_fee=cancellation_fee)
-            transaction_id = register_account_transaction(
+            postings.append(LedgerPosting(
                 client_account.id,
                 refund_amount,
                 "release",
                 f"Hold released for order {order.order_number}" + (f" (cancellation fee: {cancellation_fee} deducted)" if cancellation_fee > 0 else ""),
                 order_id,
-                hasura_endpoint,
-                hasura_admin_secret
-            )
-            if transaction_id:
-                log_info("Client hold released successfully", order_id=order_id, transaction_id=transaction_id)
-            else:
-                release_failures.append("client hold")
-                log_error("Failed to release client hold", order_id=order_id)
+                label="client hold",
+            ))
         
         # Release delivery fees hold
         delivery_fees = order_hold.delivery_fees
         if delivery_fees > 0:
             log_info("Releasing delivery fees hold", order_id=order_id, amount=delivery_fees)
-            transaction_id = register_account_transaction(
+            postings.append(LedgerPosting(
                 client_account.id,
                 delivery_fees,
                 "release",
                 f"Hold released for order {order.order_number} delivery fee",
                 order_id,
-                hasura_endpoint,
-                hasura_admin_secret
-            )
-            if transaction_id:
-                log_info("Delivery fees hold released successfully", order_id=order_id, transaction_id=transaction_id)
-            else:
-                release_failures.append("delivery fees hold")
-                log_error("Failed to release delivery fees hold", order_id=order_id)
+                label="delivery fees hold",
+            ))
         
         if release_failures:
             failed_releases = ", ".join(release_failures)
             log_error("Failed to release all cancellation holds", order_id=order_id, failed_releases=failed_releases)
             return {"success": False, "error": f"Failed to release: {failed_releases}"}
 
-        # Update order hold status to cancelled
-        success = update_order_hold_status(
-            order_hold.id,
-            "cancelled",
+        # Releases, fee and the hold status change commit together or not at all
+        journal = post_journal(
+            postings,
             hasura_endpoint,
-            hasura_admin_secret
+            hasura_admin_secret,
+            hold_status=HoldStatusChange(order_hold.id, "cancelled", expected_status="active"),
         )
         
-        if not success:
-            log_error("Failed to update order hold status", order_id=order_id)
-            return {"success": False, "error": "Failed to update order hold status"}
+        if not journal.success:
+            log_error("Failed to post cancellation journal", order_id=order_id, error=journal.error)
+            if CANCELLATION_FEE_DEBIT in journal.rejected or CANCELLATION_FEE_CREDIT in journal.rejected:
+                return {"success": False, "error": "Failed to process cancellation fee"}
+            if journal.rejected:
+                return {"success": False, "error": f"Failed to release: {', '.join(journal.rejected)}"}
+            if journal.hold_rejected:
+                return {"success": False, "error": "Failed to update order hold status"}
+            return {"success": False, "error": "Failed to post cancellation transactions"}
+
+        for result in journal.results:
+            log_info("Posted cancellation transaction", order_id=order_id, posting=result.posting.label, transaction_id=result.transaction_id)
         
         log_info("Cancellation financial processing completed successfully", order_id=order_id, cancellation_fee=cancellation_fee)
         return {"success": True, "cancellation_fee": cancellation_fee}
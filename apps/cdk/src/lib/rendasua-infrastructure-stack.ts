@@ -642,6 +642,7 @@ export class RendasuaInfrastructureStack extends cdk.Stack {
           NOTIFICATIONS_INTERNAL_API_KEY:
             process.env.NOTIFICATIONS_INTERNAL_API_KEY ?? '',
           PROXIMITY_RADIUS_KM: '20',
+          ROAD_DISTANCE_ENABLED: process.env.ROAD_DISTANCE_ENABLED ?? 'false',
           RESEND_AGENT_ORDER_PROXIMITY_TEMPLATE_ID:
             'dc4461e3-4cd2-485b-8c9c-755e36205f30',
           RESEND_AGENT_ORDER_PROXIMITY_TEMPLATE_ID_FR:
@@ -0,0 +1,88 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import accounts_service
+from rendasua_core_packages.hasura_client.accounts_service import register_account_transaction
+
+
+class _FakeHasura:
+    """
+    Accounts rows; each mutation runs atomically like a Postgres transaction,
+    and an overdraft raises like the accounts_reject_overdraft trigger.
+    """
+
+    accounts = {}
+    transactions = {}
+    calls = []
+    lock = threading.Lock()
+
+    def __init__(self, _config):
+        pass
+
+    def execute(self, query, variables=None):
+        with self.lock:
+            _FakeHasura.calls.append(query)
+            if query == accounts_service.POST_ACCOUNT_TRANSACTION_MUTATION:
+                row = self.accounts[variables["accountId"]]
+                available = row["available_balance"] + variables["availableDelta"]
+                withheld = row["withheld_balance"] + variables["withheldDelta"]
+                if (available < 0 and variables["availableDelta"] < 0) or (withheld < 0 and variables["withheldDelta"] < 0):
+                    raise RuntimeError(f"Hasura error: [{{'message': 'insufficient_funds: account {row['id']}'}}]")
+                row.update(available_balance=available, withheld_balance=withheld)
+                transaction_id = f"tx-{len(self.transactions) + 1}"
+                self.transactions[transaction_id] = variables
+                return {
+                    "update_accounts": {"affected_rows": 1, "returning": [dict(row)]},
+                    "insert_account_transactions_one": {"id": transaction_id},
+                }
+        raise AssertionError("unexpected query")
+
+
+class RegisterAccountTransactionTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.accounts = {"acc-1": {"id": "acc-1", "available_balance": 100.0, "withheld_balance": 0.0}}
+        _FakeHasura.transactions = {}
+        _FakeHasura.calls = []
+        patcher = patch.object(accounts_service, "HasuraClient", _FakeHasura)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _post(self, transaction_type, amount):
+        return register_account_transaction("acc-1", amount, transaction_type, "memo", "order-1", "http://hasura", "secret")
+
+    def test_posting_is_one_round_trip(self):
+        self.assertEqual(self._post("hold", 40), "tx-1")
+        self.assertEqual(self._post("release", 15), "tx-2")
+        self.assertEqual(len(_FakeHasura.calls), 2)
+        self.assertEqual(_FakeHasura.accounts["acc-1"], {"id": "acc-1", "available_balance": 75.0, "withheld_balance": 25.0})
+
+    def test_overdraft_aborts_without_transaction(self):
+        self.assertIsNone(self._post("release", 1))
+        self.assertIsNone(self._post("payment", 150))
+        self.assertEqual(len(_FakeHasura.calls), 2)
+        self.assertEqual(_FakeHasura.transactions, {})
+        self.assertEqual(_FakeHasura.accounts["acc-1"]["available_balance"], 100.0)
+        self.assertEqual(self._post("deposit", 5), "tx-1")
+
+    def test_concurrent_debits_never_overdraw(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self._post("payment", 30))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(1 for result in results if result), 3)
+        self.assertEqual(_FakeHasura.accounts["acc-1"]["available_balance"], 10.0)
+        self.assertEqual(len(_FakeHasura.transactions), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
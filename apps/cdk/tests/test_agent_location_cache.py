@@ -0,0 +1,121 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import agent_location_cache as cache_module
+from rendasua_core_packages.hasura_client.agent_location_cache import AgentLocationCache
+
+
+def _row(agent_id, lat, lon, updated_at):
+    return {
+        "id": f"loc-{agent_id}",
+        "agent_id": agent_id,
+        "latitude": lat,
+        "longitude": lon,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": updated_at,
+        "agent": {
+            "id": agent_id,
+            "user_id": f"user-{agent_id}",
+            "user": {"id": f"user-{agent_id}", "first_name": "A", "last_name": "B",
+                     "identifier": agent_id},
+        },
+    }
+
+
+class _FakeHasura:
+    """Minimal stand-in for HasuraClient backed by an in-memory agent table."""
+
+    rows = {}
+    available = set()
+    calls = []
+
+    def __init__(self, _config):
+        pass
+
+    def _select(self, query, variables):
+        _FakeHasura.calls.append(query)
+        live = [r for a, r in self.rows.items() if a in self.available]
+        if query == cache_module.AGENT_LOCATIONS_QUERY:
+            return {"agent_locations": live}
+        if query == cache_module.AGENT_LOCATIONS_UPDATED_SINCE_QUERY:
+            since = variables["since"]
+            return {"agent_locations": [r for r in live if r["updated_at"] >= since]}
+        if query == cache_module.AVAILABLE_AGENT_IDS_QUERY:
+            return {"agent_locations": [{"agent_id": r["agent_id"]} for r in live]}
+        if query == cache_module.AGENT_LOCATIONS_BY_AGENT_IDS_QUERY:
+            ids = set(variables["agentIds"])
+            return {"agent_locations": [r for r in self.rows.values() if r["agent_id"] in ids]}
+        raise AssertionError(f"unexpected query {query}")
+
+    def execute(self, query, variables=None):
+        return self._select(query, variables or {})
+
+    def batch(self, operations):
+        return [self._select(query, variables or {}) for query, variables in operations]
+
+
+class AgentLocationCacheTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.rows = {
+            "a1": _row("a1", 0.39, 9.45, "2026-10-01T10:00:00+00:00"),
+            "a2": _row("a2", 0.40, 9.46, "2026-10-01T10:05:00+00:00"),
+            "a3": _row("a3", 4.05, 9.70, "2026-10-01T09:00:00+00:00"),
+        }
+        _FakeHasura.available = {"a1", "a2", "a3"}
+        _FakeHasura.calls = []
+        patcher = patch.object(cache_module, "HasuraClient", _FakeHasura)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = AgentLocationCache(max_age_seconds=3600)
+
+    def test_full_load_then_delta_sync(self):
+        first = self.cache.refresh("http://hasura", "secret")
+        self.assertTrue(first.full_reload)
+        self.assertEqual(len(self.cache), 3)
+
+        # a1 moves, a3 becomes unavailable; a2 is untouched
+        _FakeHasura.rows["a1"] = _row("a1", 0.50, 9.50, "2026-10-01T11:00:00+00:00")
+        _FakeHasura.available.discard("a3")
+
+        delta = self.cache.refresh("http://hasura", "secret")
+
+        self.assertFalse(delta.full_reload)
+        self.assertEqual([loc.agent_id for loc in delta.upserted], ["a1"])
+        self.assertEqual(delta.removed, ["a3"])
+        by_id = {loc.agent_id: loc for loc in self.cache.locations()}
+        self.assertEqual(sorted(by_id), ["a1", "a2"])
+        self.assertEqual(by_id["a1"].latitude, 0.50)
+
+        stats = self.cache.stats.as_dict()
+        self.assertEqual(stats["full_loads"], 1)
+        self.assertEqual(stats["delta_syncs"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["tombstones"], 1)
+        self.assertEqual(stats["last_delta_size"], 2)
+
+    def test_agent_returning_without_moving_is_fetched_by_id(self):
+        _FakeHasura.available.discard("a3")
+        self.cache.refresh("http://hasura", "secret")
+        self.assertEqual(len(self.cache), 2)
+
+        _FakeHasura.available.add("a3")
+        delta = self.cache.refresh("http://hasura", "secret")
+
+        self.assertEqual([loc.agent_id for loc in delta.upserted], ["a3"])
+        self.assertIn(cache_module.AGENT_LOCATIONS_BY_AGENT_IDS_QUERY, _FakeHasura.calls)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_expired_cache_reloads_fully(self):
+        self.cache.max_age_seconds = 0
+        self.cache.refresh("http://hasura", "secret")
+        self.assertTrue(self.cache.refresh("http://hasura", "secret").full_reload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import AgentLocationTable
+from rendasua_core_packages.hasura_client.location_service import _agent_locations_from_data
+from rendasua_core_packages.utilities import calculate_haversine_distance, distance
+
+
+def _rows(count, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"loc-{i}",
+            "agent_id": f"agent-{i}",
+            "latitude": str(rng.uniform(-1.0, 1.0)),
+            "longitude": rng.uniform(9.0, 11.0),
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-10-01T10:00:00+00:00",
+            "agent": {
+                "id": f"agent-{i}",
+                "user_id": f"user-{i}",
+                "user": {
+                    "id": f"user-{i}",
+                    "email": f"agent{i}@example.com",
+                    "phone_number": None,
+                    "first_name": "First",
+                    "last_name": f"Last{i}",
+                    "identifier": f"AG{i}",
+                    "preferred_language": "fr",
+                },
+            },
+        }
+        for i in range(count)
+    ]
+
+
+class AgentLocationTableTest(unittest.TestCase):
+    def setUp(self):
+        self.rows = _rows(60, seed=5)
+        self.table = AgentLocationTable.from_rows(self.rows)
+        self.models = _agent_locations_from_data(self.rows)
+
+    def test_row_views_match_models(self):
+        self.assertEqual(len(self.table), len(self.models))
+        for row, model in zip(self.table, self.models):
+            self.assertEqual(row.agent_id, model.agent_id)
+            self.assertEqual(row.latitude, model.latitude)
+            self.assertEqual(row.longitude, model.longitude)
+            self.assertEqual(row.updated_at, model.updated_at)
+            self.assertEqual(row.agent.user.email, model.agent.user.email)
+            self.assertEqual(row.agent.user.preferred_language, "fr")
+
+        self.assertEqual(self.table.row_for("agent-7").id, "loc-7")
+        self.assertIsNone(self.table.row_for("missing"))
+        self.assertEqual(self.table[-1].agent_id, "agent-59")
+
+    def test_proximity_matches_scalar(self):
+        lat, lon, radius = 0.1, 10.0, 60.0
+        expected = sorted(
+            (calculate_haversine_distance(lat, lon, m.latitude, m.longitude), m.agent_id)
+            for m in self.models
+            if calculate_haversine_distance(lat, lon, m.latitude, m.longitude) <= radius
+        )
+        for np_module in (distance.np, None):
+            with patch.object(distance, "np", np_module):
+                nearby = self.table.nearby(lat, lon, radius)
+                self.assertEqual([row.agent_id for row, _ in nearby], [a for _, a in expected])
+                for (_, got), (want, _) in zip(nearby, expected):
+                    self.assertAlmostEqual(got, want, places=9)
+
+                per_agent = self.table.nearby_points([lat, -0.5], [lon, 9.5], radius)
+                self.assertEqual(len(per_agent), len(self.table))
+                for row, indices in zip(self.table, per_agent):
+                    self.assertEqual(
+                        0 in indices,
+                        calculate_haversine_distance(lat, lon, row.latitude, row.longitude) <= radius,
+                    )
+
+    def test_empty_table(self):
+        table = AgentLocationTable()
+        self.assertEqual(table.nearby(0.0, 0.0, 10.0), [])
+        self.assertEqual(table.nearby_points([0.0], [0.0], 10.0), [])
+        self.assertFalse(table)
+
+
+if __name__ == "__main__":
+    unittest.main()
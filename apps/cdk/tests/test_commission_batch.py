@@ -0,0 +1,108 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.commission_handler import (
+    CommissionOrderColumns,
+    PartnerPercentages,
+    calculate_commissions,
+    calculate_commissions_batch,
+)
+from rendasua_core_packages.commission_handler.types import AssignedAgent, CommissionConfig, CommissionOrder
+
+
+def _orders(rng, count):
+    return [
+        CommissionOrder(
+            id=f"order-{i}",
+            order_number=f"ORD-{i}",
+            base_delivery_fee=round(rng.uniform(0, 5000), rng.choice([0, 2])),
+            per_km_delivery_fee=rng.uniform(0, 3000),
+            subtotal=rng.uniform(0, 250000),
+            currency="XAF",
+            assigned_agent=rng.choice([None, AssignedAgent(user_id="a", is_verified=rng.random() < 0.5)]),
+            business_user_id="b",
+            first_order_delivery_fee_promo=rng.random() < 0.2,
+        )
+        for i in range(count)
+    ]
+
+
+def _config(rng):
+    return CommissionConfig(
+        verified_agent_base_delivery_commission=rng.uniform(50, 90),
+        unverified_agent_base_delivery_commission=rng.uniform(40, 80),
+        verified_agent_per_km_delivery_commission=rng.uniform(50, 90),
+        unverified_agent_per_km_delivery_commission=rng.uniform(40, 80),
+        rendasua_item_commission_percentage=rng.uniform(3, 15),
+    )
+
+
+def _partner(rng):
+    return SimpleNamespace(
+        base_delivery_fee_commission=rng.uniform(0, 7.5),
+        per_km_delivery_fee_commission=rng.uniform(0, 7.5),
+        item_commission=rng.choice([0, 10, rng.uniform(0, 33.3)]),
+    )
+
+
+class CommissionBatchTest(unittest.TestCase):
+    def test_matches_scalar_path_exactly(self):
+        rng = random.Random(7)
+        orders = _orders(rng, 2000)
+        config = _config(rng)
+        partners = [_partner(rng) for _ in range(3)]
+
+        batch = calculate_commissions_batch(
+            CommissionOrderColumns.from_orders(orders), config, PartnerPercentages.from_partners(partners)
+        )
+
+        self.assertEqual(len(batch), len(orders))
+        for index, order in enumerate(orders):
+            self.assertEqual(batch.breakdown(index), calculate_commissions(order, config, partners))
+
+    def test_per_order_configs_and_partner_sets(self):
+        rng = random.Random(11)
+        orders = _orders(rng, 500)
+        configs = [_config(rng) for _ in orders]
+        partner_sets = [[_partner(rng) for _ in range(rng.randint(0, 4))] for _ in orders]
+
+        # Per-order partner matrix padded with zero-percentage partners
+        width = max(len(partners) for partners in partner_sets)
+        percentages = {
+            name: np.zeros((len(orders), width))
+            for name in ("base_delivery_fee_commission", "per_km_delivery_fee_commission", "item_commission")
+        }
+        for row, partners in enumerate(partner_sets):
+            for column, partner in enumerate(partners):
+                for name, matrix in percentages.items():
+                    matrix[row, column] = getattr(partner, name)
+        config_columns = {
+            name: [getattr(config, name) for config in configs] for name in CommissionConfig.model_fields
+        }
+
+        batch = calculate_commissions_batch(
+            CommissionOrderColumns.from_orders(orders), config_columns, PartnerPercentages(**percentages)
+        )
+
+        for index, order in enumerate(orders):
+            self.assertEqual(
+                batch.breakdown(index), calculate_commissions(order, configs[index], partner_sets[index])
+            )
+        self.assertAlmostEqual(
+            batch.totals()["order_subtotal_business"] + batch.totals()["order_subtotal_rendasua"],
+            sum(order.subtotal for order in orders),
+            places=2,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
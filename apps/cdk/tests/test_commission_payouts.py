@@ -0,0 +1,157 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.commission_handler import distribute_commissions
+from rendasua_core_packages.commission_handler.types import AssignedAgent, CommissionConfig, CommissionOrder
+from rendasua_core_packages.hasura_client import commission_service
+
+ORDER = CommissionOrder(
+    id="order-1",
+    order_number="ORD-1",
+    base_delivery_fee=1000.0,
+    per_km_delivery_fee=500.0,
+    subtotal=20000.0,
+    currency="XAF",
+    assigned_agent=AssignedAgent(user_id="agent-user", is_verified=True),
+    business_user_id="business-user",
+    business_location_id="location-1",
+)
+CONFIG = CommissionConfig(
+    verified_agent_base_delivery_commission=80,
+    unverified_agent_base_delivery_commission=70,
+    verified_agent_per_km_delivery_commission=80,
+    unverified_agent_per_km_delivery_commission=70,
+    rendasua_item_commission_percentage=10,
+)
+PARTNERS = [
+    SimpleNamespace(user_id=f"partner-{i}", base_delivery_fee_commission=5, per_km_delivery_fee_commission=5, item_commission=10)
+    for i in range(2)
+]
+HQ = SimpleNamespace(id="hq-user")
+
+
+class _FakeClient:
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.requests = []
+        self.payouts = []
+
+    def execute(self, query, variables=None):
+        self.requests.append(query)
+        if query == commission_service.POSTED_COMMISSION_PAYOUTS_QUERY:
+            return {"commission_payouts": [
+                {"id": f"payout-{i}", "account_transaction_id": f"tx-{i}"} for i in range(len(self.payouts))
+            ]}
+        if query == commission_service.COMMISSION_ACCOUNTS_QUERY:
+            rows = []
+            for scope in variables["where"]["_or"]:
+                location = scope["business_location_id"].get("_eq")
+                for user_id in scope["user_id"]["_in"]:
+                    if (user_id, location) in self.accounts:
+                        rows.append({"id": self.accounts[(user_id, location)]["id"], "user_id": user_id,
+                                     "business_location_id": location})
+            return {"accounts": rows}
+        if query == commission_service.CREATE_COMMISSION_ACCOUNTS_MUTATION:
+            returning = []
+            for obj in variables["objects"]:
+                key = (obj["user_id"], obj.get("business_location_id"))
+                self.accounts[key] = {"id": f"acc-{obj['user_id']}", "available_balance": 0.0}
+                returning.append({"id": self.accounts[key]["id"], "user_id": key[0], "business_location_id": key[1]})
+            return {"insert_accounts": {"returning": returning}}
+        if query == commission_service.POST_COMMISSION_PAYOUTS_MUTATION:
+            by_id = {account["id"]: account for account in self.accounts.values()}
+            for update in variables["updates"]:
+                by_id[update["where"]["id"]["_eq"]]["available_balance"] += update["_inc"]["available_balance"]
+            self.payouts = variables["payouts"]
+            return {
+                "update_accounts_many": [{"affected_rows": 1} for _ in variables["updates"]],
+                "insert_commission_payouts": {"returning": [
+                    {"id": f"payout-{i}", "account_transaction_id": f"tx-{i}"} for i in range(len(variables["payouts"]))
+                ]},
+            }
+        raise AssertionError("unexpected query")
+
+
+class DistributeCommissionsTest(unittest.TestCase):
+    def setUp(self):
+        for target, value in (
+            ("get_commission_order", lambda *_: ORDER),
+            ("get_commission_reference_data", lambda *_: (CONFIG, PARTNERS, HQ)),
+        ):
+            patcher = patch.object(commission_service, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_all_legs_paid_in_four_requests(self):
+        client = _FakeClient({
+            ("agent-user", None): {"id": "acc-agent", "available_balance": 0.0},
+            ("hq-user", None): {"id": "acc-hq", "available_balance": 0.0},
+        })
+
+        result = distribute_commissions(client, "order-1")
+
+        self.assertTrue(result["success"])
+        # agent + 2 partners + HQ for both delivery fees, 2 partners + HQ for items, business
+        self.assertEqual(result["payouts"], 12)
+        self.assertEqual(client.requests, [
+            commission_service.POSTED_COMMISSION_PAYOUTS_QUERY,
+            commission_service.COMMISSION_ACCOUNTS_QUERY,
+            commission_service.CREATE_COMMISSION_ACCOUNTS_MUTATION,
+            commission_service.POST_COMMISSION_PAYOUTS_MUTATION,
+        ])
+        balances = {key: account["available_balance"] for key, account in client.accounts.items()}
+        self.assertEqual(balances[("agent-user", None)], 800.0 + 400.0)
+        self.assertEqual(balances[("partner-0", None)], 50.0 + 25.0 + 200.0)
+        self.assertEqual(balances[("hq-user", None)], 100.0 + 50.0 + 1600.0)
+        self.assertIn(("business-user", "location-1"), client.accounts)
+
+        payout = client.payouts[0]
+        self.assertEqual(payout["recipient_type"], "agent")
+        self.assertEqual(payout["account_transaction"]["data"]["transaction_type"], "deposit")
+        self.assertEqual(payout["account_transaction"]["data"]["memo"], "Commission payment for order ORD-1 (base_delivery_fee)")
+
+    def test_redelivered_order_is_not_paid_twice(self):
+        client = _FakeClient({})
+        self.assertTrue(distribute_commissions(client, "order-1")["success"])
+        balances = {key: account["available_balance"] for key, account in client.accounts.items()}
+        client.requests = []
+
+        result = distribute_commissions(client, "order-1")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["payouts"], 12)
+        self.assertEqual(client.requests, [commission_service.POSTED_COMMISSION_PAYOUTS_QUERY])
+        self.assertEqual({key: account["available_balance"] for key, account in client.accounts.items()}, balances)
+
+    def test_unexpected_payout_result_still_reports_success(self):
+        client = _FakeClient({})
+        post = client.execute
+
+        def execute(query, variables=None):
+            data = post(query, variables)
+            if query == commission_service.POST_COMMISSION_PAYOUTS_MUTATION:
+                data["update_accounts_many"] = data["update_accounts_many"][:-1]
+            return data
+
+        client.execute = execute
+
+        self.assertTrue(distribute_commissions(client, "order-1")["success"])
+
+    def test_failed_account_resolution_pays_nothing(self):
+        client = _FakeClient({})
+        client.execute = lambda query, variables=None: (_ for _ in ()).throw(RuntimeError("boom"))
+
+        result = distribute_commissions(client, "order-1")
+
+        self.assertFalse(result["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import datetime
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.models import fast
+from rendasua_core_packages.utilities import LazyDatetime, lazy_datetime, parse_datetime, parse_timestamptz
+
+UTC = datetime.timezone.utc
+
+
+class ParseTimestamptzTest(unittest.TestCase):
+    def test_hasura_shapes(self):
+        expected = datetime.datetime(2026, 1, 5, 10, 0, 0, 120000, tzinfo=UTC)
+        for raw in (
+            "2026-01-05T10:00:00.12+00:00",
+            "2026-01-05T10:00:00.120000+00:00",
+            "2026-01-05T10:00:00.12Z",
+            "2026-01-05 10:00:00.12+00",
+        ):
+            with self.subTest(raw=raw):
+                self.assertEqual(parse_timestamptz(raw), expected)
+        offset = parse_timestamptz("2026-01-05T11:00:00+01:00")
+        self.assertEqual(offset.utcoffset(), datetime.timedelta(hours=1))
+
+    def test_repeated_values_are_memoized(self):
+        parse_timestamptz.cache_clear()
+        first = parse_timestamptz("2026-02-01T00:00:00+00:00")
+        self.assertIs(parse_timestamptz("2026-02-01T00:00:00+00:00"), first)
+        self.assertEqual(parse_timestamptz.cache_info().hits, 1)
+
+    def test_strict_mode_reports_bad_input(self):
+        with self.assertRaises(ValueError):
+            parse_datetime("05/01/2026", strict=True)
+        with patch.dict("os.environ", {"RENDASUA_STRICT_DATETIMES": "true"}):
+            with self.assertRaises(ValueError):
+                parse_datetime("not a date")
+        # Lenient default keeps the historical "now" fallback
+        before = datetime.datetime.now()
+        self.assertGreaterEqual(parse_datetime("not a date", strict=False), before)
+        self.assertGreaterEqual(parse_datetime(None, strict=True), before)
+
+
+class LazyDatetimeTest(unittest.TestCase):
+    def test_parses_on_first_use(self):
+        value = lazy_datetime("2026-01-05T10:00:00+00:00")
+        self.assertIsInstance(value, LazyDatetime)
+        self.assertIsNone(value._value)
+        self.assertEqual(value.year, 2026)
+        self.assertEqual(value, datetime.datetime(2026, 1, 5, 10, tzinfo=UTC))
+        self.assertLess(value, lazy_datetime("2026-01-06T10:00:00+00:00"))
+        self.assertEqual((value - datetime.datetime(2026, 1, 5, 9, tzinfo=UTC)).seconds, 3600)
+        later = datetime.datetime(2026, 1, 5, 11, tzinfo=UTC)
+        self.assertEqual(value + datetime.timedelta(hours=1), later)
+        self.assertEqual(datetime.timedelta(hours=1) + value, later)
+        self.assertIsNone(lazy_datetime(None))
+
+        broken = lazy_datetime("yesterday")
+        with self.assertRaises(ValueError):
+            broken.isoformat()
+
+    def test_fast_models_can_defer_parsing(self):
+        with patch.object(fast, "_LAZY_DATETIMES", True):
+            agent = fast.decode("Agent", {"id": "a", "created_at": "2026-01-05T10:00:00Z"})
+        self.assertIsInstance(agent.created_at, LazyDatetime)
+        self.assertEqual(agent.created_at.hour, 10)
+        self.assertEqual(fast.decode("Agent", {"created_at": "garbage"}).created_at, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
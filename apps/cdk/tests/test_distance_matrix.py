@@ -0,0 +1,122 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.utilities import distance
+from rendasua_core_packages.utilities.distance import (
+    bounding_boxes,
+    calculate_haversine_distance,
+    haversine_matrix,
+    merge_bounding_boxes,
+    nearby_indices,
+    within_radius,
+)
+
+
+def _points(count, seed):
+    rng = random.Random(seed)
+    lats = [rng.uniform(-4.0, 2.0) for _ in range(count)]
+    lons = [rng.uniform(8.0, 14.0) for _ in range(count)]
+    return lats, lons
+
+
+class HaversineMatrixTest(unittest.TestCase):
+    def setUp(self):
+        self.agent_lats, self.agent_lons = _points(40, seed=1)
+        self.order_lats, self.order_lons = _points(7, seed=2)
+        self.expected = [
+            [calculate_haversine_distance(la, lo, lb, ob)
+             for lb, ob in zip(self.order_lats, self.order_lons)]
+            for la, lo in zip(self.agent_lats, self.agent_lons)
+        ]
+
+    def _assert_matches_scalar(self, matrix, places):
+        self.assertEqual(len(matrix), len(self.expected))
+        for row, expected_row in zip(matrix, self.expected):
+            for value, expected in zip(row, expected_row):
+                self.assertAlmostEqual(float(value), expected, places=places)
+
+    def test_scalar_fast_path_returns_float(self):
+        result = haversine_matrix(0.39, 9.45, 0.41, 9.47)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, calculate_haversine_distance(0.39, 9.45, 0.41, 9.47))
+
+    @unittest.skipIf(distance.np is None, "numpy not installed")
+    def test_numpy_matrix_matches_scalar(self):
+        matrix = haversine_matrix(
+            self.agent_lats, self.agent_lons, self.order_lats, self.order_lons
+        )
+        self.assertEqual(matrix.shape, (40, 7))
+        self._assert_matches_scalar(matrix, places=9)
+
+        matrix32 = haversine_matrix(
+            self.agent_lats, self.agent_lons, self.order_lats, self.order_lons,
+            dtype="float32",
+        )
+        self.assertEqual(str(matrix32.dtype), "float32")
+        self._assert_matches_scalar(matrix32, places=1)
+
+    def test_pure_python_fallback_matches_scalar(self):
+        with patch.object(distance, "np", None):
+            matrix = haversine_matrix(
+                self.agent_lats, self.agent_lons, self.order_lats, self.order_lons
+            )
+            self._assert_matches_scalar(matrix, places=12)
+
+    def test_within_radius_and_nearby_indices(self):
+        radius = 150.0
+        expected = [
+            [index for index, value in enumerate(row) if value <= radius]
+            for row in self.expected
+        ]
+        mask = within_radius(
+            self.agent_lats, self.agent_lons, self.order_lats, self.order_lons, radius
+        )
+        self.assertEqual(nearby_indices(mask), expected)
+
+        with patch.object(distance, "np", None):
+            mask = within_radius(
+                self.agent_lats, self.agent_lons, self.order_lats, self.order_lons, radius
+            )
+            self.assertEqual(nearby_indices(mask), expected)
+
+
+class BoundingBoxTest(unittest.TestCase):
+    def _inside(self, boxes, lat, lon):
+        return any(
+            min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+            for min_lat, max_lat, min_lon, max_lon in boxes
+        )
+
+    def test_boxes_contain_every_point_within_radius(self):
+        rng = random.Random(3)
+        for center_lat, center_lon in [(0.39, 9.45), (60.0, 10.0), (-0.5, 179.9)]:
+            boxes = bounding_boxes(center_lat, center_lon, 25.0)
+            for _ in range(2000):
+                lat = center_lat + rng.uniform(-0.5, 0.5)
+                lon = center_lon + rng.uniform(-1.0, 1.0)
+                lon = (lon + 180.0) % 360.0 - 180.0
+                if calculate_haversine_distance(center_lat, center_lon, lat, lon) <= 25.0:
+                    self.assertTrue(self._inside(boxes, lat, lon), (lat, lon))
+
+    def test_antimeridian_box_is_split(self):
+        boxes = bounding_boxes(0.0, 179.9, 50.0)
+        self.assertEqual(len(boxes), 2)
+        self.assertTrue(all(-180.0 <= box[2] <= box[3] <= 180.0 for box in boxes))
+
+    def test_overlapping_boxes_are_merged(self):
+        merged = merge_bounding_boxes(
+            bounding_boxes(0.39, 9.45, 20.0) + bounding_boxes(0.40, 9.46, 20.0)
+            + bounding_boxes(4.05, 9.70, 20.0)
+        )
+        self.assertEqual(len(merged), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import unittest
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+MODELS_DIR = CORE_PACKAGES_DIR / "rendasua_core_packages/models"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+sys.path.insert(0, str(MODELS_DIR))
+
+import generate_models
+from rendasua_core_packages import models
+from rendasua_core_packages.models import fast
+from rendasua_core_packages.hasura_client.location_service import _agent_locations_from_data
+from rendasua_core_packages.hasura_client.orders_service import _notifications_from_data
+
+AGENT_LOCATION_ROWS = [
+    {
+        "id": f"loc-{i}",
+        "agent_id": f"agent-{i}",
+        "latitude": 0.39 + i / 100,
+        "longitude": 9.45,
+        "created_at": "2026-01-05T10:00:00.123456+00:00",
+        "updated_at": "2026-01-05T10:30:00Z",
+        "agent": {
+            "id": f"agent-{i}",
+            "user_id": f"user-{i}",
+            "created_at": "2025-12-01T08:00:00+00:00",
+            "updated_at": "2025-12-01T08:00:00+00:00",
+            "user": {
+                "id": f"user-{i}",
+                "email": f"agent{i}@example.com",
+                "phone_number": None,
+                "first_name": "Ada",
+                "last_name": "Obame",
+                "identifier": f"AG{i}",
+                "preferred_language": "fr",
+                "created_at": "2025-12-01T08:00:00+00:00",
+                "updated_at": "2025-12-01T08:00:00+00:00",
+            },
+        },
+    }
+    for i in range(3)
+]
+
+NOTIFICATION_ROW = {
+    "id": "n-1",
+    "order_id": "o-1",
+    "notification_type": "order_proximity",
+    "status": "pending",
+    "error_message": None,
+    "created_at": "2026-01-05T10:00:00+00:00",
+    "updated_at": "2026-01-05T10:00:00+00:00",
+    "processed_at": None,
+    "order": {
+        "id": "o-1",
+        "order_number": "ORD-1",
+        "current_status": "ready_for_pickup",
+        "business_location": {
+            "id": "bl-1",
+            "name": "Boutique",
+            "address": {
+                "id": "a-1", "address_line_1": "Bd Triomphal", "address_line_2": None, "city": "Libreville",
+                "state": "Estuaire", "postal_code": None, "country": "GA", "latitude": 0.4, "longitude": 9.4,
+            },
+        },
+    },
+}
+
+
+class FastModelsTest(unittest.TestCase):
+    def test_generated_module_is_up_to_date(self):
+        classes = [getattr(models, name) for name in models.__all__]
+        self.assertEqual(generate_models.render_fast_models(classes), (MODELS_DIR / "fast.py").read_text())
+
+    def test_twins_match_pydantic_agent_locations(self):
+        slow = _agent_locations_from_data(AGENT_LOCATION_ROWS)
+        quick = _agent_locations_from_data(AGENT_LOCATION_ROWS, fast=True)
+
+        for model, twin in zip(slow, quick):
+            self.assertIsInstance(twin, fast.AgentLocation)
+            for name in ("id", "agent_id", "latitude", "longitude", "created_at", "updated_at"):
+                self.assertEqual(getattr(twin, name), getattr(model, name))
+            for name in ("id", "email", "first_name", "preferred_language", "created_at"):
+                self.assertEqual(getattr(twin.agent.user, name), getattr(model.agent.user, name))
+        self.assertFalse(hasattr(quick[0], "__dict__"))
+
+    def test_twins_match_pydantic_notifications(self):
+        model = _notifications_from_data([NOTIFICATION_ROW])[0]
+        twin = _notifications_from_data([NOTIFICATION_ROW], fast=True)[0]
+
+        self.assertEqual(twin.order.business_location.address.latitude, model.order.business_location.address.latitude)
+        self.assertEqual(twin.order.current_status, model.order.current_status)
+        self.assertEqual(twin.created_at, model.created_at)
+        # Missing timestamps stay None instead of defaulting to "now"
+        self.assertIsNone(twin.processed_at)
+        self.assertIsNone(twin.order.client)
+
+    def test_enum_fields_keep_raw_values(self):
+        agent = fast.decode("Agent", {"id": "a", "vehicle_type_id": "motorcycle"})
+        self.assertEqual(agent.vehicle_type_id, "motorcycle")
+        self.assertIsNone(fast.decode("Agent", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
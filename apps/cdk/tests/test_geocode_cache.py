@@ -0,0 +1,151 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import geocode_cache as cache_module
+from rendasua_core_packages.hasura_client.geocode_cache import GeocodeCache
+from rendasua_core_packages.models import Address
+
+
+def _address(line_1, city="Libreville"):
+    return Address.model_construct(
+        id="addr-1",
+        address_line_1=line_1,
+        address_line_2=None,
+        city=city,
+        state="Estuaire",
+        country="GA",
+        postal_code=None,
+    )
+
+
+def _google_result(lat, lng):
+    return {
+        "formatted_address": "Boulevard Triomphal, Libreville, Gabon",
+        "geometry": {"location": {"lat": lat, "lng": lng}},
+        "address_components": [
+            {"long_name": "Libreville", "types": ["locality"]},
+            {"long_name": "Gabon", "types": ["country"]},
+        ],
+    }
+
+
+class _FakeHasura:
+    """google_geocode_cache held in memory; unique on (latitude, longitude)."""
+
+    rows = []
+
+    def __init__(self, _config):
+        pass
+
+    def execute(self, query, variables=None):
+        if query == cache_module.GEOCODE_CACHE_BY_ADDRESS_QUERY:
+            key = variables["match"]["address_keys"][0]
+            return {"google_geocode_cache": [
+                {**row, "expires_at": "2999-01-01T00:00:00+00:00"}
+                for row in self.rows if key in row["response_data"].get("address_keys", [])
+            ]}
+        if query == cache_module.INSERT_GEOCODE_CACHE_MUTATION:
+            obj = variables["object"]
+            if any((r["latitude"], r["longitude"]) == (obj["latitude"], obj["longitude"]) for r in self.rows):
+                return {"insert_google_geocode_cache_one": None}
+            self.rows.append({"id": f"row-{len(self.rows)}", **obj})
+            return {"insert_google_geocode_cache_one": {"id": self.rows[-1]["id"]}}
+        if query == cache_module.GEOCODE_CACHE_BY_COORDINATES_QUERY:
+            return {"google_geocode_cache": [
+                r for r in self.rows
+                if (r["latitude"], r["longitude"]) == (variables["lat"], variables["lng"])
+            ]}
+        if query == cache_module.UPDATE_GEOCODE_CACHE_RESPONSE_MUTATION:
+            for row in self.rows:
+                if row["id"] == variables["id"]:
+                    row["response_data"] = variables["responseData"]
+            return {"update_google_geocode_cache_by_pk": {"id": variables["id"]}}
+        raise AssertionError("unexpected query")
+
+
+class GeocodeCacheTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.rows = []
+        self.google_calls = []
+        self.google_answers = {}
+
+        def fake_google(address_string, _key):
+            self.google_calls.append(address_string)
+            return self.google_answers.get(address_string, (None, "ZERO_RESULTS"))
+
+        for target, replacement in (("HasuraClient", _FakeHasura), ("geocode_address_string", fake_google)):
+            patcher = patch.object(cache_module, target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tiers_memory_then_hasura_then_google(self):
+        self.google_answers["Bd Triomphal Libreville Estuaire GA"] = (_google_result(0.39, 9.45), "OK")
+        cache = GeocodeCache(max_entries=10, ttl_seconds=600, negative_ttl_seconds=60)
+
+        first = cache.geocode(_address("Bd Triomphal"), "key", "http://hasura", "secret")
+        # Same address spelled differently: in-process hit
+        second = cache.geocode(_address("bd  TRIOMPHAL,"), "key", "http://hasura", "secret")
+        self.assertEqual((first.latitude, first.longitude), (0.39, 9.45))
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.google_calls), 1)
+        self.assertEqual(_FakeHasura.rows[0]["response_data"]["city"], "Libreville")
+
+        # A cold container finds it in Hasura without calling Google
+        cold = GeocodeCache(max_entries=10, ttl_seconds=600)
+        self.assertEqual(cold.geocode(_address("Bd Triomphal"), "key", "http://hasura", "secret"), first)
+        self.assertEqual(len(self.google_calls), 1)
+
+        self.assertEqual(cache.stats.memory_hits, 1)
+        self.assertEqual(cache.stats.api_calls, 1)
+        self.assertEqual(cold.stats.db_hits, 1)
+        self.assertEqual(cache.stats.as_dict()["hit_ratio"], 0.5)
+
+    def test_same_coordinates_for_two_addresses_share_a_row(self):
+        self.google_answers["A Libreville Estuaire GA"] = (_google_result(0.4, 9.4), "OK")
+        self.google_answers["B Libreville Estuaire GA"] = (_google_result(0.4, 9.4), "OK")
+        cache = GeocodeCache(max_entries=10, ttl_seconds=600)
+        cache.geocode(_address("A"), "key", "http://hasura", "secret")
+        cache.geocode(_address("B"), "key", "http://hasura", "secret")
+
+        self.assertEqual(len(_FakeHasura.rows), 1)
+        self.assertEqual(
+            _FakeHasura.rows[0]["response_data"]["address_keys"],
+            ["a libreville estuaire ga", "b libreville estuaire ga"],
+        )
+
+    def test_negative_results_cached_but_transient_errors_are_not(self):
+        cache = GeocodeCache(max_entries=10, ttl_seconds=600, negative_ttl_seconds=60)
+        self.assertIsNone(cache.geocode(_address("Nowhere"), "key"))
+        self.assertIsNone(cache.geocode(_address("Nowhere"), "key"))
+        self.assertEqual(len(self.google_calls), 1)
+        self.assertEqual(cache.stats.negative_hits, 1)
+
+        self.google_answers["Busy Libreville Estuaire GA"] = (None, "OVER_QUERY_LIMIT")
+        cache.geocode(_address("Busy"), "key")
+        cache.geocode(_address("Busy"), "key")
+        self.assertEqual(self.google_calls.count("Busy Libreville Estuaire GA"), 2)
+        self.assertEqual(cache.stats.api_errors, 2)
+
+    def test_lru_evicts_oldest_and_ttl_expires(self):
+        for name in ("A", "B", "C"):
+            self.google_answers[f"{name} Libreville Estuaire GA"] = (_google_result(0.1, 9.0), "OK")
+        cache = GeocodeCache(max_entries=2, ttl_seconds=600)
+        for name in ("A", "B", "C"):
+            cache.geocode(_address(name), "key")
+        self.assertEqual(len(cache), 2)
+        cache.geocode(_address("A"), "key")
+        self.assertEqual(self.google_calls.count("A Libreville Estuaire GA"), 2)
+
+        with patch.object(cache_module.time, "monotonic", return_value=10 ** 9):
+            cache.geocode(_address("A"), "key")
+        self.assertEqual(self.google_calls.count("A Libreville Estuaire GA"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
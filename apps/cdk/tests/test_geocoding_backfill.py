@@ -0,0 +1,138 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import geocode_cache, geocoding_backfill
+from rendasua_core_packages.hasura_client.geocoding_backfill import (
+    backfill_missing_coordinates,
+    prewarm_address_coordinates,
+)
+from rendasua_core_packages.models import Address
+from rendasua_core_packages.utilities import TokenBucket
+
+
+def _row(index, line_1):
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "address_line_1": line_1,
+        "address_line_2": None,
+        "city": "Libreville",
+        "state": "Estuaire",
+        "postal_code": None,
+        "country": "GA",
+    }
+
+
+class _FakeHasura:
+    addresses = []
+    mutations = []
+
+    def __init__(self, _config):
+        pass
+
+    def execute(self, query, variables=None):
+        if query == geocoding_backfill.ADDRESSES_MISSING_COORDINATES_QUERY:
+            rows = [r for r in self.addresses if r["id"] > variables["afterId"] and "latitude" not in r]
+            return {"addresses": rows[:variables["limit"]]}
+        if query == geocoding_backfill.UPDATE_ADDRESS_COORDINATES_MANY_MUTATION:
+            _FakeHasura.mutations.append(variables["updates"])
+            for update in variables["updates"]:
+                for row in self.addresses:
+                    if row["id"] == update["where"]["id"]["_eq"]:
+                        row.update(update["_set"])
+            return {"update_addresses_many": [{"affected_rows": 1} for _ in variables["updates"]]}
+        if query == geocode_cache.GEOCODE_CACHE_BY_ADDRESS_QUERY:
+            return {"google_geocode_cache": []}
+        if query == geocode_cache.INSERT_GEOCODE_CACHE_MUTATION:
+            return {"insert_google_geocode_cache_one": {"id": "cache-row"}}
+        raise AssertionError("unexpected query")
+
+
+class GeocodingBackfillTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.addresses = [
+            _row(1, "Bd Triomphal"),
+            _row(2, "Rue Nowhere"),
+            _row(3, "bd triomphal"),
+            _row(4, "Quartier Louis"),
+            _row(5, "Avenue Bouet"),
+        ]
+        _FakeHasura.mutations = []
+        self.google_calls = []
+        lock = threading.Lock()
+
+        def fake_google(address_string, _key):
+            with lock:
+                self.google_calls.append(address_string)
+            if "Nowhere" in address_string:
+                return None, "ZERO_RESULTS"
+            return {"geometry": {"location": {"lat": 0.4, "lng": 9.4}}}, "OK"
+
+        for module, target, replacement in (
+            (geocode_cache, "HasuraClient", _FakeHasura),
+            (geocoding_backfill, "HasuraClient", _FakeHasura),
+            (geocode_cache, "geocode_address_string", fake_google),
+            (geocode_cache, "_cache", geocode_cache.GeocodeCache(max_entries=100)),
+        ):
+            patcher = patch.object(module, target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_backfill_pages_dedupes_and_writes_in_bulk(self):
+        result = backfill_missing_coordinates(
+            "http://hasura", "secret", "key", batch_size=3, max_workers=3, rate_per_second=0
+        )
+
+        self.assertEqual(result.as_dict(), {"scanned": 5, "geocoded": 4, "not_geocoded": 1, "persisted": 4})
+        # Addresses 1 and 3 normalize to the same key: one Google call
+        self.assertEqual(len(self.google_calls), 4)
+        # One bulk mutation per page with results
+        self.assertEqual([len(updates) for updates in _FakeHasura.mutations], [2, 2])
+        self.assertNotIn("latitude", _FakeHasura.addresses[1])
+
+    def test_dry_run_and_max_addresses(self):
+        result = backfill_missing_coordinates(
+            "http://hasura", "secret", "key", batch_size=10, max_addresses=2, dry_run=True
+        )
+        self.assertEqual(result.scanned, 2)
+        self.assertEqual(result.persisted, 0)
+        self.assertEqual(_FakeHasura.mutations, [])
+
+    def test_prewarm_sets_coordinates_in_place(self):
+        located = Address.model_construct(id="a-located", address_line_1="X", city="Libreville",
+                                          state="Estuaire", country="GA", latitude=1.0, longitude=2.0)
+        missing = Address.model_construct(id=_FakeHasura.addresses[0]["id"], address_line_1="Bd Triomphal",
+                                          address_line_2=None, city="Libreville", state="Estuaire",
+                                          country="GA", postal_code=None, latitude=None, longitude=None)
+
+        count = prewarm_address_coordinates([located, missing], "key", "http://hasura", "secret")
+
+        self.assertEqual(count, 1)
+        self.assertEqual((missing.latitude, missing.longitude), (0.4, 9.4))
+        self.assertEqual(located.latitude, 1.0)
+        self.assertEqual(len(_FakeHasura.mutations), 1)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_wait(self):
+        clock = [100.0]
+        with patch("rendasua_core_packages.utilities.rate_limit.time") as fake_time:
+            fake_time.monotonic.side_effect = lambda: clock[0]
+            fake_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+            bucket = TokenBucket(rate_per_second=2, capacity=2)
+            self.assertTrue(bucket.try_acquire())
+            self.assertTrue(bucket.try_acquire())
+            self.assertFalse(bucket.try_acquire())
+            self.assertTrue(bucket.acquire())
+            self.assertAlmostEqual(clock[0], 100.5)
+            self.assertFalse(bucket.acquire(timeout=0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import (
+    AsyncHasuraClient,
+    HasuraClientConfig,
+    configure_transport,
+    gather_bounded,
+    update_notification_status_async,
+)
+
+
+class _SlowHasuraStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        cls = _SlowHasuraStub
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        variables = payload.get("variables") or {}
+        if "status" in variables:
+            data = {"update_order_agent_notifications_by_pk": {"id": variables["id"]}}
+        else:
+            data = {"echo": variables.get("n")}
+        body = json.dumps({"data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class AsyncHasuraClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHasuraStub)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_port}/v1/graphql"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        configure_transport(pool_size=4, timeout=5, keep_alive=True)
+        _SlowHasuraStub.max_in_flight = 0
+
+    def test_gather_bounded_limits_concurrency_and_keeps_order(self):
+        client = AsyncHasuraClient(
+            HasuraClientConfig(endpoint=self.endpoint, admin_secret="secret")
+        )
+
+        async def run():
+            return await gather_bounded(
+                (client.execute("query { echo }", {"n": n}) for n in range(8)),
+                limit=3,
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual([r["echo"] for r in results], list(range(8)))
+        self.assertGreater(_SlowHasuraStub.max_in_flight, 1)
+        self.assertLessEqual(_SlowHasuraStub.max_in_flight, 3)
+
+    def test_async_service_function_matches_sync_contract(self):
+        async def run():
+            return await gather_bounded(
+                [
+                    update_notification_status_async(
+                        f"n-{i}", "complete", None, self.endpoint, "secret"
+                    )
+                    for i in range(4)
+                ]
+            )
+
+        self.assertEqual(asyncio.run(run()), [True] * 4)
+
+    def test_gather_bounded_rejects_non_positive_limit(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(gather_bounded([], limit=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import (
+    HasuraClient,
+    HasuraClientConfig,
+    configure_transport,
+    query_registry,
+    register_all_operations,
+)
+from rendasua_core_packages.hasura_client.orders_service import (
+    UPDATE_NOTIFICATION_STATUS_MUTATION,
+)
+
+
+class _PersistedQueryStub(BaseHTTPRequestHandler):
+    """Hasura stand-in; with ``supports_apq`` it behaves like an APQ cache."""
+
+    protocol_version = "HTTP/1.1"
+    supports_apq = False
+    store = {}
+    bodies = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        _PersistedQueryStub.bodies.append(payload)
+        response = self._respond(payload)
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _respond(self, payload):
+        cls = _PersistedQueryStub
+        digest = (
+            payload.get("extensions", {}).get("persistedQuery", {}).get("sha256Hash")
+        )
+        if "query" not in payload:
+            if not cls.supports_apq:
+                return {"errors": [{"extensions": {"code": "parse-failed"},
+                                    "message": 'key "query" not found'}]}
+            if digest not in cls.store:
+                return {"errors": [{"message": "PersistedQueryNotFound"}]}
+        elif digest:
+            cls.store[digest] = payload["query"]
+        return {"data": {"ok": True}}
+
+    def log_message(self, *_args):
+        pass
+
+
+class QueryRegistryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _PersistedQueryStub)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_port}/v1/graphql"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        configure_transport(pool_size=2, timeout=5, keep_alive=True)
+        query_registry.reset_persisted_state()
+        _PersistedQueryStub.store.clear()
+        _PersistedQueryStub.bodies.clear()
+
+    def _client(self):
+        return HasuraClient(
+            HasuraClientConfig(endpoint=self.endpoint, admin_secret="secret")
+        )
+
+    def test_service_operations_are_registered(self):
+        self.assertGreater(register_all_operations(), 0)
+        names = {op.name for op in query_registry.registered_operations()}
+        self.assertIn("UpdateNotificationStatus", names)
+        self.assertIn("GetCommissionOrder", names)
+
+        operation = query_registry.register_operation(UPDATE_NOTIFICATION_STATUS_MUTATION)
+        self.assertLess(len(operation.text), len(UPDATE_NOTIFICATION_STATUS_MUTATION))
+        self.assertEqual(len(operation.sha256), 64)
+
+    def test_compaction_preserves_string_literals(self):
+        text = 'query Q {\n  users(where: { email: { _eq: "a  b@c" } }) { id } # note\n}'
+        self.assertEqual(
+            query_registry.compact_operation(text),
+            'query Q{users(where:{email:{_eq:"a  b@c"}}){id}}',
+        )
+
+    @patch.dict(os.environ, {"HASURA_PERSISTED_QUERIES": "true"})
+    def test_apq_server_stores_query_after_first_miss(self):
+        _PersistedQueryStub.supports_apq = True
+        for _ in range(2):
+            self.assertEqual(self._client().execute("query Ok { ok }"), {"ok": True})
+
+        first_miss, registration, hit = _PersistedQueryStub.bodies
+        self.assertNotIn("query", first_miss)
+        self.assertIn("query", registration)
+        self.assertNotIn("query", hit)
+
+    @patch.dict(os.environ, {"HASURA_PERSISTED_QUERIES": "true"})
+    def test_falls_back_to_full_text_when_references_are_unsupported(self):
+        _PersistedQueryStub.supports_apq = False
+        for _ in range(2):
+            self.assertEqual(self._client().execute("query Ok { ok }"), {"ok": True})
+
+        # One rejected reference, then full text only.
+        self.assertEqual(len(_PersistedQueryStub.bodies), 3)
+        self.assertNotIn("query", _PersistedQueryStub.bodies[0])
+        self.assertFalse(query_registry.persisted_queries_active())
+
+    def test_export_allow_list_contains_registered_operations(self):
+        collection = query_registry.export_allow_list()
+        queries = collection["definition"]["queries"]
+        self.assertEqual(len(queries), len(query_registry.registered_operations()))
+        self.assertTrue(all(q["query"] for q in queries))
+
+
+if __name__ == "__main__":
+    unittest.main()
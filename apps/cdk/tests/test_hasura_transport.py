@@ -0,0 +1,106 @@
+import json
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import (
+    HasuraClient,
+    HasuraClientConfig,
+    configure_transport,
+    get_transport_stats,
+    reset_transport_stats,
+)
+
+
+class _HasuraStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        _HasuraStub.bodies.append(payload)
+        if isinstance(payload, list):
+            response = [{"data": {"index": i}} for i in range(len(payload))]
+        else:
+            response = {"data": {"ok": True}}
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class PooledTransportTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _HasuraStub)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_port}/v1/graphql"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        configure_transport(pool_size=2, timeout=5, keep_alive=True)
+        reset_transport_stats()
+        _HasuraStub.bodies.clear()
+
+    def _client(self):
+        return HasuraClient(
+            HasuraClientConfig(endpoint=self.endpoint, admin_secret="secret")
+        )
+
+    def test_separate_clients_share_one_connection(self):
+        for _ in range(3):
+            self.assertEqual(self._client().execute("query { ok }"), {"ok": True})
+
+        stats = get_transport_stats()
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.connections_opened, 1)
+        self.assertEqual(stats.connections_reused, 2)
+
+    def test_disabling_keep_alive_opens_a_connection_per_request(self):
+        configure_transport(keep_alive=False)
+        reset_transport_stats()
+
+        for _ in range(2):
+            self._client().execute("query { ok }")
+
+        self.assertEqual(get_transport_stats().connections_opened, 2)
+
+    def test_batch_sends_operations_in_one_request(self):
+        results = self._client().batch(
+            [("query { a }", None), ("query B($id: uuid!) { b }", {"id": "x"})]
+        )
+
+        self.assertEqual(results, [{"index": 0}, {"index": 1}])
+        self.assertEqual(get_transport_stats().requests, 1)
+        self.assertEqual(
+            _HasuraStub.bodies[0],
+            [
+                {"query": "query{a}", "variables": {}},
+                {
+                    "query": "query B($id:uuid!){b}",
+                    "operationName": "B",
+                    "variables": {"id": "x"},
+                },
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
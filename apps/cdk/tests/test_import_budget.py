@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+LAMBDA_ROOT = WORKSPACE_ROOT / "apps/cdk/src/lambda"
+
+# Cold-start budget per Lambda entry point: import wall time (ms), memory
+# allocated by the import (MB, tracemalloc) and modules that must stay
+# unloaded. Wall time depends on the machine, so it is only checked when
+# IMPORT_BUDGET_SCALE is set (1 = the budget as written, 2 = twice as loose).
+ENTRY_POINT_BUDGETS = {
+    "notify-agents": (1500, 32, ["rendasua_core_packages.models.Item", "rendasua_core_packages.hasura_client.commission_service"]),
+    "order-status-handler": (1500, 24, ["numpy", "rendasua_core_packages.models.Item"]),
+    "wait-handler": (1500, 24, ["numpy", "rendasua_core_packages.models.Item"]),
+}
+
+# boto3 is provided by the Lambda runtime; a stub keeps it out of the numbers
+_PROBE = """
+import json, sys, time, tracemalloc, types
+sys.modules.setdefault("boto3", types.ModuleType("boto3"))
+sys.path[:0] = [{core!r}, {entry!r}]
+if {trace}:
+    tracemalloc.start()
+started = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - started) * 1000
+allocated_mb = tracemalloc.get_traced_memory()[0] / 1e6 if {trace} else 0.0
+print(json.dumps({{"ms": elapsed_ms, "mb": allocated_mb, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _probe(module, entry_dir, trace):
+    code = _PROBE.format(core=str(CORE_PACKAGES_DIR), entry=str(entry_dir), module=module, trace=trace)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, cwd=str(entry_dir))
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+class ImportBudgetTest(unittest.TestCase):
+    def test_package_import_is_lazy(self):
+        result = _probe("rendasua_core_packages.hasura_client, rendasua_core_packages.models, "
+                        "rendasua_core_packages.utilities", CORE_PACKAGES_DIR, False)
+        for heavy in ("pydantic", "requests", "numpy", "rendasua_core_packages.models.Order",
+                      "rendasua_core_packages.hasura_client.orders_service"):
+            self.assertNotIn(heavy, result["modules"])
+
+    def test_lambda_entry_points_within_budget(self):
+        scale = os.environ.get("IMPORT_BUDGET_SCALE")
+        for entry, (max_ms, max_mb, forbidden) in ENTRY_POINT_BUDGETS.items():
+            with self.subTest(entry=entry):
+                entry_dir = LAMBDA_ROOT / entry
+                traced = _probe("handler", entry_dir, True)
+                self.assertLess(traced["mb"], max_mb)
+                for module in forbidden:
+                    self.assertNotIn(module, traced["modules"])
+                if scale:
+                    timed = _probe("handler", entry_dir, False)
+                    self.assertLess(timed["ms"], max_ms * float(scale))
+
+
+if __name__ == "__main__":
+    unittest.main()
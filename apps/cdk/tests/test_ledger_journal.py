@@ -0,0 +1,131 @@
+import copy
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import ledger_service
+from rendasua_core_packages.hasura_client.ledger_service import HoldStatusChange, LedgerPosting, post_journal
+
+
+
+class _FakeHasura:
+    """
+    accounts / account_transactions / order_holds. Top-level fields run in
+    order inside one transaction; the overdraft and hold-transition triggers
+    raise and roll the whole request back.
+    """
+
+    accounts = {}
+    holds = {}
+    transactions = {}
+    requests = []
+
+    def __init__(self, _config):
+        pass
+
+    def _apply(self, variables):
+        transition = variables.get("holdTransition")
+        if transition is not None:
+            hold = self.holds[transition["order_hold_id"]]
+            if transition["from_status"] and hold["status"] != transition["from_status"]:
+                raise RuntimeError(f"Hasura error: [{{'message': 'order_hold_status_conflict: hold {hold['id']}'}}]")
+            hold["status"] = transition["to_status"]
+        affected = []
+        for update in variables["updates"]:
+            row = self.accounts[update["where"]["id"]["_eq"]]
+            for column, delta in update["_inc"].items():
+                if row[column] + delta < 0 and delta < 0:
+                    raise RuntimeError(f"Hasura error: [{{'message': 'insufficient_funds: account {row['id']}'}}]")
+                row[column] += delta
+            affected.append({"affected_rows": 1})
+        returning = []
+        for transaction in variables["transactions"]:
+            transaction_id = f"tx-{len(self.transactions) + 1}"
+            self.transactions[transaction_id] = transaction
+            returning.append({"id": transaction_id})
+        return {"update_accounts_many": affected, "insert_account_transactions": {"returning": returning}}
+
+    def execute(self, query, variables=None):
+        _FakeHasura.requests.append(query)
+        if query == ledger_service.JOURNAL_ACCOUNT_BALANCES_QUERY:
+            return {"accounts": [dict(self.accounts[account_id]) for account_id in variables["accountIds"]]}
+        if query not in (ledger_service.POST_JOURNAL_MUTATION, ledger_service.POST_JOURNAL_WITH_HOLD_MUTATION):
+            raise AssertionError("unexpected query")
+        snapshot = copy.deepcopy((self.accounts, self.holds, self.transactions))
+        try:
+            return self._apply(variables)
+        except RuntimeError:
+            _FakeHasura.accounts, _FakeHasura.holds, _FakeHasura.transactions = snapshot
+            raise
+
+
+class PostJournalTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.accounts = {
+            "client": {"id": "client", "available_balance": 20.0, "withheld_balance": 125.0},
+            "business": {"id": "business", "available_balance": 0.0, "withheld_balance": 0.0},
+        }
+        _FakeHasura.holds = {"hold-1": {"id": "hold-1", "status": "active"}}
+        _FakeHasura.transactions = {}
+        _FakeHasura.requests = []
+        patcher = patch.object(ledger_service, "HasuraClient", _FakeHasura)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _cancellation(self, fee=15.0, refund=85.0):
+        return [
+            LedgerPosting("client", fee, "fee", "fee", "order-1", label="fee debit"),
+            LedgerPosting("business", fee, "deposit", "fee", "order-1", label="fee credit"),
+            LedgerPosting("client", refund, "release", "refund", "order-1", label="client hold"),
+            LedgerPosting("client", 25.0, "release", "delivery", "order-1", label="delivery fees hold"),
+        ]
+
+    def test_postings_and_hold_commit_in_one_request(self):
+        result = post_journal(
+            self._cancellation(), "http://hasura", "secret",
+            hold_status=HoldStatusChange("hold-1", "cancelled", expected_status="active"),
+        )
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.hold_updated)
+        self.assertEqual([r.transaction_id for r in result.results], ["tx-1", "tx-2", "tx-3", "tx-4"])
+        self.assertEqual(len(_FakeHasura.requests), 1)
+        self.assertEqual(_FakeHasura.accounts["client"], {"id": "client", "available_balance": 115.0, "withheld_balance": 15.0})
+        self.assertEqual(_FakeHasura.accounts["business"]["available_balance"], 15.0)
+        self.assertEqual(_FakeHasura.holds["hold-1"]["status"], "cancelled")
+
+    def test_rejected_posting_aborts_the_whole_journal(self):
+        result = post_journal(
+            self._cancellation(refund=200.0), "http://hasura", "secret",
+            hold_status=HoldStatusChange("hold-1", "cancelled", expected_status="active"),
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.rejected, ["client hold"])
+        self.assertEqual([r.accepted for r in result.results], [True, True, False, True])
+        self.assertTrue(all(r.transaction_id is None for r in result.results))
+        self.assertEqual(_FakeHasura.accounts["client"], {"id": "client", "available_balance": 20.0, "withheld_balance": 125.0})
+        self.assertEqual(_FakeHasura.accounts["business"]["available_balance"], 0.0)
+        self.assertEqual(_FakeHasura.transactions, {})
+        self.assertEqual(_FakeHasura.holds["hold-1"]["status"], "active")
+        self.assertEqual(_FakeHasura.requests[1], ledger_service.JOURNAL_ACCOUNT_BALANCES_QUERY)
+
+    def test_redelivered_event_does_not_post_twice(self):
+        hold_status = HoldStatusChange("hold-1", "cancelled", expected_status="active")
+        self.assertTrue(post_journal(self._cancellation(), "http://hasura", "secret", hold_status=hold_status).success)
+
+        again = post_journal(self._cancellation(fee=0.5, refund=1.0), "http://hasura", "secret", hold_status=hold_status)
+
+        self.assertFalse(again.success)
+        self.assertTrue(again.hold_rejected)
+        self.assertEqual(_FakeHasura.accounts["client"], {"id": "client", "available_balance": 115.0, "withheld_balance": 15.0})
+        self.assertEqual(len(_FakeHasura.transactions), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import requests
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+sys.modules.setdefault("boto3", MagicMock())
+
+from rendasua_core_packages.notification_handler import nest_push_client
+from rendasua_core_packages.notification_handler.nest_push_client import NestPush, send_pushes_via_nest_api
+
+ENV = {"BACKEND_INTERNAL_API_BASE_URL": "https://api.test", "NOTIFICATIONS_INTERNAL_API_KEY": "internal"}
+
+
+class _FakeSession:
+    def __init__(self, status_code=200, raises=None):
+        self.status_code = status_code
+        self.raises = raises
+        self.posts = []
+
+    def post(self, url, json, headers, timeout):
+        self.posts.append((url, json))
+        if self.raises:
+            raise self.raises
+        results = [
+            {"userId": push["userId"], "success": push["userId"] != "u-bad", "error": "no tokens"}
+            for push in json["pushes"]
+        ]
+        return SimpleNamespace(status_code=self.status_code, text="Cannot POST",
+                               json=lambda: {"success": False, "results": results})
+
+
+class NestBulkPushTest(unittest.TestCase):
+    def setUp(self):
+        for target, value in (("_bulk_route_missing", False), ("_session", None)):
+            patcher = patch.object(nest_push_client, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.dict("os.environ", ENV)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _pushes(self, count):
+        return [NestPush(f"u{i}" if i != 3 else "u-bad", "New order nearby", "body", {"orderId": "o1"})
+                for i in range(count)]
+
+    def test_bulk_batches_with_per_user_results(self):
+        session = _FakeSession()
+        with patch.object(nest_push_client, "_get_session", return_value=session):
+            results = send_pushes_via_nest_api(self._pushes(150))
+
+        self.assertEqual([len(body["pushes"]) for _, body in session.posts], [100, 50])
+        self.assertTrue(session.posts[0][0].endswith("/api/notifications/internal/push-by-users"))
+        self.assertEqual(results[3], (False, "no tokens"))
+        self.assertEqual(sum(ok for ok, _ in results), 149)
+
+    def test_missing_bulk_route_falls_back_to_single_pushes(self):
+        session = _FakeSession(status_code=404)
+        singles = []
+
+        def fallback(chunk):
+            singles.extend(push.user_id for push in chunk)
+            return [(True, "")] * len(chunk)
+
+        with patch.object(nest_push_client, "_get_session", return_value=session):
+            first = send_pushes_via_nest_api(self._pushes(2), fallback=fallback)
+            second = send_pushes_via_nest_api(self._pushes(1), fallback=fallback)
+
+        # The route is probed once, then skipped for the rest of the container
+        self.assertEqual(len(session.posts), 1)
+        self.assertEqual(singles, ["u0", "u1", "u0"])
+        self.assertEqual(first + second, [(True, "")] * 3)
+
+    def test_transient_bulk_failure_falls_back_for_that_chunk_only(self):
+        session = _FakeSession(status_code=503)
+        singles = []
+
+        def fallback(chunk):
+            singles.extend(push.user_id for push in chunk)
+            return [(True, "")] * len(chunk)
+
+        with patch.object(nest_push_client, "_get_session", return_value=session):
+            first = send_pushes_via_nest_api(self._pushes(2), fallback=fallback)
+            second = send_pushes_via_nest_api(self._pushes(1), fallback=fallback)
+
+        # Bulk route is retried on the next call
+        self.assertEqual(len(session.posts), 2)
+        self.assertEqual(singles, ["u0", "u1", "u0"])
+        self.assertEqual(first + second, [(True, "")] * 3)
+        self.assertFalse(nest_push_client._bulk_route_missing)
+
+    def test_failure_after_delivery_may_have_started_is_not_resent(self):
+        def fallback(chunk):
+            raise AssertionError("chunk resent one by one")
+
+        for session in (_FakeSession(raises=requests.ReadTimeout("read timed out")), _FakeSession(status_code=500)):
+            with self.subTest(status=session.status_code, raises=session.raises):
+                with patch.object(nest_push_client, "_get_session", return_value=session):
+                    results = send_pushes_via_nest_api(self._pushes(2), fallback=fallback)
+                self.assertEqual(len(session.posts), 1)
+                self.assertEqual([ok for ok, _ in results], [False, False])
+
+    def test_connection_error_falls_back(self):
+        session = _FakeSession(raises=requests.ConnectTimeout("connect timed out"))
+        with patch.object(nest_push_client, "_get_session", return_value=session):
+            results = send_pushes_via_nest_api(self._pushes(2), fallback=lambda chunk: [(True, "")] * len(chunk))
+        self.assertEqual(results, [(True, "")] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
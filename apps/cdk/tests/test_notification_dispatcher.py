@@ -0,0 +1,74 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+sys.modules.setdefault("boto3", MagicMock())
+
+from rendasua_core_packages.notification_handler.dispatcher import NotificationDispatcher
+
+
+class NotificationDispatcherTest(unittest.TestCase):
+    def test_results_in_input_order_with_concurrency(self):
+        dispatcher = NotificationDispatcher(max_workers=8, channel_rates={"push": 0})
+        active = [0, 0]
+        lock = threading.Lock()
+
+        def push(n):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02 * (n % 3))
+            with lock:
+                active[0] -= 1
+            return n % 5 != 0, "" if n % 5 else "rejected"
+
+        def task(n):
+            return dispatcher.send("push", push, n)[0] and n
+
+        results = dispatcher.map(task, list(range(20)), default=False)
+
+        self.assertEqual(results, [n if n % 5 else False for n in range(20)])
+        self.assertGreater(active[1], 1)
+        self.assertLessEqual(active[1], 8)
+        stats = dispatcher.stats()["push"]
+        self.assertEqual((stats["sent"], stats["failed"], stats["errors"]), (16, 4, 0))
+
+    def test_rate_limit_and_task_errors(self):
+        dispatcher = NotificationDispatcher(max_workers=4, channel_rates={"email": 20})
+
+        def email(n):
+            if n == 3:
+                raise RuntimeError("boom")
+            return True, ""
+
+        started = time.monotonic()
+        results = dispatcher.map(lambda n: dispatcher.send("email", email, n)[0], list(range(30)))
+        elapsed = time.monotonic() - started
+
+        # 20-token burst, then 10 more at 20/s
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertEqual(results.count(True), 29)
+        self.assertEqual(dispatcher.stats()["email"]["errors"], 1)
+
+    def test_stats_since_snapshot_cover_one_batch(self):
+        dispatcher = NotificationDispatcher(max_workers=2, channel_rates={"push": 0})
+        dispatcher.map(lambda n: dispatcher.send("push", lambda: (True, "")), list(range(5)))
+        before = dispatcher.snapshot()
+        dispatcher.map(lambda n: dispatcher.send("push", lambda: (n != 0, "")), list(range(3)))
+        dispatcher.record("sms", True)
+
+        batch = dispatcher.stats(since=before)
+        self.assertEqual((batch["push"]["sent"], batch["push"]["failed"]), (2, 1))
+        self.assertEqual(batch["sms"]["sent"], 1)
+        self.assertEqual(dispatcher.stats()["push"]["sent"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import orders_service
+from rendasua_core_packages.hasura_client.orders_service import update_notification_statuses
+
+
+class _FakeHasura:
+    calls = []
+
+    def __init__(self, _config):
+        pass
+
+    def execute(self, query, variables=None):
+        if query != orders_service.UPDATE_NOTIFICATION_STATUSES_MANY_MUTATION:
+            raise AssertionError("unexpected query")
+        _FakeHasura.calls.append(variables["updates"])
+        return {"update_order_agent_notifications_many": [
+            {"affected_rows": len(update["where"]["id"]["_in"])} for update in variables["updates"]
+        ]}
+
+
+class UpdateNotificationStatusesTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.calls = []
+        patcher = patch.object(orders_service, "HasuraClient", _FakeHasura)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_mutation_grouped_by_outcome(self):
+        updated = update_notification_statuses(
+            [
+                ("n1", "complete", None),
+                ("n2", "complete", None),
+                ("n3", "skipped", "Order status changed to cancelled"),
+                ("n4", "complete", None),
+                ("n2", "complete", None),
+            ],
+            "http://hasura",
+            "secret",
+        )
+
+        self.assertEqual(updated, 4)
+        self.assertEqual(len(_FakeHasura.calls), 1)
+        updates = _FakeHasura.calls[0]
+        self.assertEqual([u["where"]["id"]["_in"] for u in updates], [["n1", "n2", "n4"], ["n3"]])
+        self.assertEqual(updates[1]["_set"]["status"], "skipped")
+        self.assertEqual(updates[0]["_set"]["processed_at"], updates[1]["_set"]["processed_at"])
+
+    def test_empty_batch_skips_round_trip(self):
+        self.assertEqual(update_notification_statuses([], "http://hasura", "secret"), 0)
+        self.assertEqual(_FakeHasura.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ sys.path.insert(0, str(LAMBDA_DIR))
 sys.modules.setdefault("boto3", MagicMock())
 
 import handler
+from rendasua_core_packages.hasura_client.ledger_service import JournalResult, PostingResult
 
 
 def _order(**overrides):
@@ -34,6 +35,7 @@ def _order(**overrides):
 def _hold(**overrides):
     defaults = {
         "id": "hold-123",
+        "status": "active",
         "client_hold_amount": 100.0,
         "agent_hold_amount": 0.0,
         "delivery_fees": 0.0,
@@ -48,7 +50,7 @@ class CancellationFinancialsTest(unittest.TestCase):
         with self._patch_cancellation_dependencies(
             order=_order(),
             hold=_hold(),
-            transaction_ids=[None],
+            rejected=["client hold"],
         ) as deps:
             result = handler.process_cancellation_financials(
                 "order-123", "business", "pending", "endpoint", "secret"
@@ -56,23 +58,76 @@ class CancellationFinancialsTest(unittest.TestCase):
 
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "Failed to release: client hold")
-        deps["update_order_hold_status"].assert_not_called()
+        self.assertFalse(deps["journal"].hold_updated)
 
     def test_successful_releases_cancel_hold(self):
         with self._patch_cancellation_dependencies(
             order=_order(),
             hold=_hold(delivery_fees=25.0),
-            transaction_ids=["client-release", "delivery-release"],
         ) as deps:
             result = handler.process_cancellation_financials(
                 "order-123", "business", "pending", "endpoint", "secret"
             )
 
         self.assertTrue(result["success"])
-        deps["update_order_hold_status"].assert_called_once_with(
-            "hold-123", "cancelled", "endpoint", "secret"
+        deps["post_journal"].assert_called_once()
+        postings = deps["post_journal"].call_args.args[0]
+        self.assertEqual([p.label for p in postings], ["client hold", "delivery fees hold"])
+        self.assertEqual([p.amount for p in postings], [100.0, 25.0])
+        hold_status = deps["post_journal"].call_args.kwargs["hold_status"]
+        self.assertEqual(
+            (hold_status.order_hold_id, hold_status.status, hold_status.expected_status),
+            ("hold-123", "cancelled", "active"),
         )
 
+    def test_redelivered_event_for_cancelled_hold_posts_nothing(self):
+        with self._patch_cancellation_dependencies(
+            order=_order(),
+            hold=_hold(status="cancelled", delivery_fees=25.0),
+        ) as deps:
+            result = handler.process_cancellation_financials(
+                "order-123", "client", "confirmed", "endpoint", "secret"
+            )
+
+        self.assertEqual(result, {"success": True, "cancellation_fee": 0.0})
+        deps["post_journal"].assert_not_called()
+
+    def test_client_fee_and_releases_are_one_journal(self):
+        order = _order(assigned_agent=SimpleNamespace(user_id="agent-user-123"))
+        hold = _hold(agent_hold_amount=40.0, delivery_fees=10.0)
+
+        with self._patch_cancellation_dependencies(order=order, hold=hold, cancellation_fee=15.0) as deps:
+            result = handler.process_cancellation_financials(
+                "order-123", "client", "confirmed", "endpoint", "secret"
+            )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["cancellation_fee"], 15.0)
+        postings = deps["post_journal"].call_args.args[0]
+        self.assertEqual(
+            [(p.label, p.transaction_type, p.amount) for p in postings],
+            [
+                ("agent hold", "release", 40.0),
+                (handler.CANCELLATION_FEE_DEBIT, "fee", 15.0),
+                (handler.CANCELLATION_FEE_CREDIT, "deposit", 15.0),
+                ("client hold", "release", 85.0),
+                ("delivery fees hold", "release", 10.0),
+            ],
+        )
+
+    def test_rejected_fee_reports_fee_failure(self):
+        with self._patch_cancellation_dependencies(
+            order=_order(),
+            hold=_hold(),
+            cancellation_fee=15.0,
+            rejected=[handler.CANCELLATION_FEE_DEBIT],
+        ):
+            result = handler.process_cancellation_financials(
+                "order-123", "client", "preparing", "endpoint", "secret"
+            )
+
+        self.assertEqual(result, {"success": False, "error": "Failed to process cancellation fee"})
+
     def test_missing_agent_account_does_not_cancel_hold(self):
         order = _order(assigned_agent=SimpleNamespace(user_id="agent-user-123"))
         hold = _hold(agent_hold_amount=40.0, client_hold_amount=0.0)
@@ -81,7 +136,6 @@ class CancellationFinancialsTest(unittest.TestCase):
             order=order,
             hold=hold,
             agent_account=None,
-            transaction_ids=[],
         ) as deps:
             result = handler.process_cancellation_financials(
                 "order-123", "business", "pending", "endpoint", "secret"
@@ -89,22 +143,38 @@ class CancellationFinancialsTest(unittest.TestCase):
 
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "Failed to release: agent hold")
-        deps["update_order_hold_status"].assert_not_called()
+        deps["post_journal"].assert_not_called()
 
     def _patch_cancellation_dependencies(
         self,
         order,
         hold,
-        transaction_ids,
+        rejected=(),
+        cancellation_fee=None,
         agent_account=SimpleNamespace(id="agent-account-123"),
     ):
         client_account = SimpleNamespace(id="client-account-123")
+        journal = JournalResult(success=False)
 
         def get_account(user_id, *_args, **_kwargs):
             if user_id == "agent-user-123":
                 return agent_account
             return client_account
 
+        def post_journal(postings, *_args, hold_status=None):
+            journal.results = [
+                PostingResult(
+                    posting=posting,
+                    transaction_id=None if rejected else f"tx-{index}",
+                    accepted=posting.label not in rejected,
+                )
+                for index, posting in enumerate(postings)
+            ]
+            journal.rejected = list(rejected)
+            journal.success = not rejected
+            journal.hold_updated = journal.success and hold_status is not None
+            return journal
+
         patches = {
             "get_complete_order_details": patch.object(
                 handler, "get_complete_order_details", return_value=order
@@ -115,22 +185,21 @@ class CancellationFinancialsTest(unittest.TestCase):
             "get_account_by_user_and_currency": patch.object(
                 handler, "get_account_by_user_and_currency", side_effect=get_account
             ),
-            "register_account_transaction": patch.object(
-                handler,
-                "register_account_transaction",
-                side_effect=transaction_ids,
+            "get_order_business_location_country": patch.object(
+                handler, "get_order_business_location_country", return_value="GA"
             ),
-            "update_order_hold_status": patch.object(
-                handler, "update_order_hold_status", return_value=True
+            "get_cancellation_fee_config": patch.object(
+                handler, "get_cancellation_fee_config", return_value=cancellation_fee
             ),
+            "post_journal": patch.object(handler, "post_journal", side_effect=post_journal),
         }
-        return _PatchGroup(patches)
+        return _PatchGroup(patches, extras={"journal": journal})
 
 
 class _PatchGroup:
-    def __init__(self, patches):
+    def __init__(self, patches, extras=None):
         self._patches = patches
-        self._mocks = {}
+        self._mocks = dict(extras or {})
 
     def __enter__(self):
         for name, dependency_patch in self._patches.items():
@@ -0,0 +1,131 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import commission_service, config_service, reference_data
+from rendasua_core_packages.hasura_client.reference_data import REFERENCE_DATA_QUERY, ReferenceDataCache
+
+CONFIGURATIONS = [
+    {"config_key": "cancellation_fee", "country_code": "GA", "status": "active", "number_value": 500},
+    {"config_key": "cancellation_fee", "country_code": "CM", "status": "inactive", "number_value": 700},
+    {"config_key": "verified_agent_base_delivery_commission", "country_code": None, "status": "active", "number_value": 85},
+    {"config_key": "unrelated", "country_code": None, "status": "active", "number_value": 1},
+]
+PARTNER = {
+    "id": "partner-1",
+    "user_id": "partner-user",
+    "company_name": "Partner",
+    "base_delivery_fee_commission": 5,
+    "per_km_delivery_fee_commission": 5,
+    "item_commission": 10,
+    "is_active": True,
+    "created_at": "2026-01-05T10:00:00+00:00",
+    "updated_at": "2026-01-05T10:00:00+00:00",
+}
+HQ_USER = {
+    "id": "hq-user",
+    "user_type_id": "business",
+    "identifier": "hq",
+    "first_name": "Renda",
+    "last_name": "Sua",
+    "email": "hq@rendasua.com",
+    "created_at": "2026-01-05T10:00:00+00:00",
+    "updated_at": "2026-01-05T10:00:00+00:00",
+}
+
+
+class _FakeClient:
+    def __init__(self, configurations=CONFIGURATIONS):
+        self.configurations = list(configurations)
+        self.requests = []
+        self.fail = False
+
+    def execute(self, query, variables=None):
+        self.requests.append(query)
+        if self.fail:
+            raise RuntimeError("Hasura unavailable")
+        if query == REFERENCE_DATA_QUERY:
+            return {"application_configurations": self.configurations, "partners": [PARTNER], "users": [HQ_USER]}
+        raise AssertionError(f"unexpected query: {query}")
+
+
+class ReferenceDataCacheTests(unittest.TestCase):
+    def test_loads_once_per_ttl_and_reloads_after_invalidate(self):
+        cache = ReferenceDataCache(ttl_seconds=300)
+        client = _FakeClient()
+
+        first = cache.get(client)
+        second = cache.get(client)
+        self.assertIs(first, second)
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual(first.config_number("cancellation_fee", "GA"), 500.0)
+        self.assertIsNone(first.config_number("cancellation_fee", "CM"))
+        self.assertEqual([partner.user_id for partner in first.partners], ["partner-user"])
+        self.assertEqual(first.hq_user.id, "hq-user")
+
+        cache.invalidate()
+        reloaded = cache.get(client)
+        self.assertEqual(len(client.requests), 2)
+        self.assertEqual(reloaded.version, first.version)
+
+        client.configurations[0] = dict(client.configurations[0], number_value=600)
+        changed = cache.get(client, force_refresh=True)
+        self.assertEqual(changed.version, first.version + 1)
+        self.assertEqual(changed.config_number("cancellation_fee", "GA"), 600.0)
+        self.assertEqual(cache.stats.as_dict()["loads"], 3)
+
+    def test_serves_stale_snapshot_when_reload_fails(self):
+        cache = ReferenceDataCache(ttl_seconds=0)
+        client = _FakeClient()
+        failing = _FakeClient()
+        failing.fail = True
+        self.assertIsNone(ReferenceDataCache(ttl_seconds=0).get(failing))
+
+        loaded = cache.get(client)
+        client.fail = True
+        self.assertIs(cache.get(client), loaded)
+        self.assertEqual(cache.stats.stale_served, 1)
+
+
+class ReferenceDataConsumerTests(unittest.TestCase):
+    def setUp(self):
+        self.client = _FakeClient()
+        patcher = patch.object(reference_data, "_cache", ReferenceDataCache(ttl_seconds=300))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cancellation_fee_and_commission_data_share_one_query(self):
+        with patch.object(config_service, "HasuraClient", return_value=self.client):
+            self.assertEqual(config_service.get_cancellation_fee_config("GA", "http://hasura", "secret"), 500.0)
+            self.assertIsNone(config_service.get_cancellation_fee_config("CM", "http://hasura", "secret"))
+
+        config, partners, hq_user = commission_service.get_commission_reference_data(self.client)
+
+        self.assertEqual(self.client.requests, [REFERENCE_DATA_QUERY])
+        self.assertEqual(config.verified_agent_base_delivery_commission, 85)
+        self.assertEqual(config.unverified_agent_base_delivery_commission, 50.0)
+        self.assertEqual(len(partners), 1)
+        self.assertEqual(hq_user.id, "hq-user")
+
+    def test_batched_fallback_defaults_malformed_rows(self):
+        self.client.fail = True
+        self.client.batch = lambda operations: [
+            {"application_configurations": [{"config_key": "verified_agent_base_delivery_commission", "number_value": 85}]},
+            {"partners": [dict(PARTNER, base_delivery_fee_commission=None)]},
+            {"users": [HQ_USER]},
+        ]
+
+        config, partners, hq_user = commission_service.get_commission_reference_data(self.client)
+
+        self.assertEqual(config.verified_agent_base_delivery_commission, 85)
+        self.assertEqual(partners, [])
+        self.assertEqual(hq_user.id, "hq-user")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+sys.modules.setdefault("boto3", MagicMock())
+
+from rendasua_core_packages.notification_handler import agent_proximity_notifications, resend_client
+from rendasua_core_packages.notification_handler.dispatcher import NotificationDispatcher
+from rendasua_core_packages.notification_handler.resend_client import (
+    ResendTemplateEmail,
+    send_resend_template_emails,
+)
+
+
+def _response(status_code, body, headers=None):
+    return SimpleNamespace(status_code=status_code, text=json.dumps(body), json=lambda: body, headers=headers or {})
+
+
+class ResendBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.posts = []
+        self.rate_limited = 0
+        self.sleeps = []
+        patcher = patch.object(resend_client.time, "sleep", side_effect=self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(resend_client.requests, "post", side_effect=self._post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _post(self, url, headers, data, timeout):
+        payload = json.loads(data)
+        self.posts.append((url, payload))
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return _response(429, {"message": "Too many requests"}, {"retry-after": "1"})
+        if url == resend_client.RESEND_EMAILS_URL:
+            ok = "bad" not in payload["to"][0]
+            return _response(200 if ok else 422, {"id": "single"} if ok else {"message": "invalid"})
+        if any(email["to"][0] == "reject-all@x.com" for email in payload):
+            return _response(500, {"message": "unavailable"})
+        errors = [{"index": i, "message": "invalid to"} for i, email in enumerate(payload) if "bad" in email["to"][0]]
+        return _response(200, {"data": [{"id": str(i)} for i in range(len(payload))], "errors": errors})
+
+    def test_batches_of_100_with_per_recipient_results(self):
+        emails = [ResendTemplateEmail(f"agent{i}@x.com", "tpl", {"n": i}) for i in range(230)]
+        emails[150] = ResendTemplateEmail("bad@x.com", "tpl", {})
+
+        results = send_resend_template_emails("key", "from@x.com", emails)
+
+        self.assertEqual([len(payload) for _, payload in self.posts], [100, 100, 30])
+        self.assertEqual(len(results), 230)
+        self.assertEqual(results[150], (False, "invalid to"))
+        self.assertEqual(sum(ok for ok, _ in results), 229)
+        self.assertEqual(self.posts[0][1][1]["template"]["variables"], {"n": "1"})
+
+    def test_rejected_batch_falls_back_to_single_sends(self):
+        emails = [
+            ResendTemplateEmail("a@x.com", "tpl", {}),
+            ResendTemplateEmail("reject-all@x.com", "tpl", {}),
+            ResendTemplateEmail("bad@x.com", "tpl", {}),
+        ]
+        requests_made = []
+
+        results = send_resend_template_emails("key", "from@x.com", emails, before_request=lambda: requests_made.append(1))
+
+        self.assertEqual([url for url, _ in self.posts], [resend_client.RESEND_BATCH_URL] + [resend_client.RESEND_EMAILS_URL] * 3)
+        self.assertEqual([ok for ok, _ in results], [True, True, False])
+        self.assertEqual(len(requests_made), 4)
+
+    def test_rate_limited_batch_is_retried_not_split(self):
+        emails = [ResendTemplateEmail(f"agent{i}@x.com", "tpl", {}) for i in range(3)]
+
+        self.rate_limited = 1
+        results = send_resend_template_emails("key", "from@x.com", emails)
+        self.assertEqual(self.sleeps, [1.0])
+        self.assertEqual([url for url, _ in self.posts], [resend_client.RESEND_BATCH_URL] * 2)
+        self.assertEqual(results, [(True, "")] * 3)
+
+        self.posts.clear()
+        self.rate_limited = 2
+        results = send_resend_template_emails("key", "from@x.com", emails)
+        self.assertEqual([url for url, _ in self.posts], [resend_client.RESEND_BATCH_URL] * 2)
+        self.assertEqual([ok for ok, _ in results], [False] * 3)
+
+    def test_aggregated_summaries_map_results_back_to_agents(self):
+        def agent(agent_id, email=None, phone=None):
+            user = SimpleNamespace(id=agent_id, email=email, phone_number=phone, preferred_language="en",
+                                   first_name="A", last_name="B")
+            return SimpleNamespace(agent_id=agent_id, agent=SimpleNamespace(user=user))
+
+        agents = [agent("a1", "a1@x.com"), agent("a2", phone="+241"), agent("a3", "bad@x.com"), agent("a4")]
+        sms = []
+        with patch.object(agent_proximity_notifications, "get_resend_api_key", return_value="key"), \
+             patch.object(agent_proximity_notifications, "send_sms_via_nest_api",
+                          side_effect=lambda to, body: (sms.append(to) or True, "")), \
+             patch.object(agent_proximity_notifications, "get_notification_dispatcher",
+                          return_value=NotificationDispatcher(max_workers=2, channel_rates={})):
+            sent = agent_proximity_notifications.send_aggregated_notifications_to_agents(
+                agents, {"a1": 2, "a2": 1, "a3": 1, "a4": 1}, 5, "dev", "tpl-en", "tpl-fr"
+            )
+
+        self.assertEqual(sent, 2)
+        self.assertEqual(sms, ["+241"])
+        self.assertEqual(len(self.posts), 1)
+        self.assertEqual([email["to"][0] for email in self.posts[0][1]], ["a1@x.com", "bad@x.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.hasura_client import road_distance
+from rendasua_core_packages.hasura_client.road_distance import RoadDistanceService
+from rendasua_core_packages.utilities import calculate_haversine_distance
+
+
+class _FakeHasura:
+    """google_distance_cache held in memory."""
+
+    rows = {}
+    queries = 0
+
+    def __init__(self, _config):
+        pass
+
+    def execute(self, query, variables=None):
+        if query == road_distance.DISTANCE_CACHE_QUERY:
+            _FakeHasura.queries += 1
+            return {"google_distance_cache": [
+                {**row, "expires_at": "2999-01-01T00:00:00+00:00"}
+                for (origin, destination), row in self.rows.items()
+                if origin in variables["originIds"] and destination in variables["destinationIds"]
+            ]}
+        if query == road_distance.INSERT_DISTANCE_CACHE_MUTATION:
+            for entry in variables["entries"]:
+                self.rows[(entry["origin_address_id"], entry["destination_address_id"])] = entry
+            return {"insert_google_distance_cache": {"affected_rows": len(variables["entries"])}}
+        raise AssertionError("unexpected query")
+
+
+class RoadDistanceServiceTest(unittest.TestCase):
+    def setUp(self):
+        _FakeHasura.rows = {}
+        _FakeHasura.queries = 0
+        self.requests = []
+
+        def fake_row(origin, destinations, _key):
+            self.requests.append((origin, list(destinations)))
+            elements = []
+            for lat, lng in destinations:
+                if lat > 5:
+                    elements.append({"status": "ZERO_RESULTS"})
+                else:
+                    elements.append({
+                        "status": "OK",
+                        "distance": {"value": 12345, "text": "12.3 km"},
+                        "duration": {"value": 900, "text": "15 mins"},
+                    })
+            return elements, "OK"
+
+        for target, replacement in (("HasuraClient", _FakeHasura), ("request_distance_row", fake_row)):
+            patcher = patch.object(road_distance, target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_uncached_pairs_fall_back_to_haversine(self):
+        service = RoadDistanceService(max_entries=100, ttl_seconds=600)
+        result = service.distance((0.39, 9.45), (0.45, 9.50), "http://hasura", "secret")
+        self.assertFalse(result.is_road)
+        self.assertAlmostEqual(result.distance_km, calculate_haversine_distance(0.39, 9.45, 0.45, 9.50))
+        self.assertEqual(self.requests, [])
+
+    def test_fill_one_request_per_origin_then_serves_from_cache(self):
+        service = RoadDistanceService(max_entries=1000, ttl_seconds=600, cell_decimals=2)
+        origins = [(0.391, 9.452), (0.392, 9.451), (0.5, 9.6)]  # first two share a cell
+        destinations = [(0.40 + i * 0.01, 9.40) for i in range(30)] + [(6.0, 9.0)]
+
+        fetched = service.fill(origins, destinations, "key", "http://hasura", "secret")
+
+        # 2 origin cells x 31 destination cells, 25 destinations per request
+        self.assertEqual(fetched, 62)
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(len(_FakeHasura.rows), 62)
+        self.assertEqual(service.fill(origins, destinations, "key", "http://hasura", "secret"), 0)
+
+        roads = service.distances(origins[1], destinations, "http://hasura", "secret")
+        self.assertTrue(all(road.source == "memory" for road in roads[:30]))
+        self.assertEqual(roads[0].distance_km, 12.345)
+        self.assertEqual(roads[0].duration_seconds, 900)
+        # No road route: straight-line fallback
+        self.assertFalse(roads[30].is_road)
+
+        # A cold container reads the same pairs from google_distance_cache
+        cold = RoadDistanceService(max_entries=1000, ttl_seconds=600, cell_decimals=2)
+        roads = cold.distances(origins[0], destinations[:5], "http://hasura", "secret")
+        self.assertTrue(all(road.source == "hasura" for road in roads))
+        self.assertEqual(cold.stats.db_hits, 5)
+        self.assertEqual(len(self.requests), 4)
+
+    def test_cell_ids_are_stable_uuids(self):
+        service = RoadDistanceService(cell_decimals=2)
+        self.assertEqual(service.cell_id((0.391, 9.452)), service.cell_id((0.389, 9.448)))
+        self.assertNotEqual(service.cell_id((0.391, 9.452)), service.cell_id((0.401, 9.452)))
+        self.assertEqual(len(service.cell_id((0.0, 0.0))), 36)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+sys.modules.setdefault("boto3", MagicMock())
+
+from rendasua_core_packages.secrets_manager import client
+from rendasua_core_packages.secrets_manager.client import SecretsCache
+
+SECRET = "development-rendasua-backend-secrets"
+
+
+class SecretsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = [1000.0]
+        self.fetches = []
+        self.refreshed = threading.Event()
+
+        def fake_fetch(secret_name):
+            self.fetches.append(secret_name)
+            self.refreshed.set()
+            return {"HASURA_GRAPHQL_ADMIN_SECRET": f"secret-{len(self.fetches)}", "GOOGLE_MAPS_API_KEY": "maps"}
+
+        time_patch = patch.object(client.time, "monotonic", side_effect=lambda: self.clock[0])
+        fetch_patch = patch.object(client, "_fetch_secret", side_effect=fake_fetch)
+        cache_patch = patch.object(client, "_cache", SecretsCache(ttl_seconds=300, refresh_ahead_seconds=60))
+        for patcher in (time_patch, fetch_patch, cache_patch):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_one_fetch_per_ttl_across_helpers(self):
+        self.assertEqual(client.get_hasura_admin_secret("development"), "secret-1")
+        self.assertEqual(client.get_google_maps_api_key("development"), "maps")
+        client.get_secret(SECRET)["HASURA_GRAPHQL_ADMIN_SECRET"] = "mutated"
+        self.assertEqual(client.get_hasura_admin_secret("development"), "secret-1")
+        self.assertEqual(self.fetches, [SECRET])
+
+        self.clock[0] += 301
+        self.assertEqual(client.get_hasura_admin_secret("development"), "secret-2")
+        self.assertEqual(len(self.fetches), 2)
+
+    def test_refresh_ahead_serves_cached_value(self):
+        client.get_secret(SECRET)
+        self.refreshed.clear()
+        self.clock[0] += 250
+
+        self.assertEqual(client.get_secret(SECRET)["HASURA_GRAPHQL_ADMIN_SECRET"], "secret-1")
+        self.assertTrue(self.refreshed.wait(2))
+        for thread in threading.enumerate():
+            if thread.name.startswith("secret-refresh"):
+                thread.join(2)
+        self.assertEqual(client.get_secret(SECRET)["HASURA_GRAPHQL_ADMIN_SECRET"], "secret-2")
+        self.assertEqual(client.get_secrets_cache().stats.background_refreshes, 1)
+
+    def test_invalidate_and_force_refresh(self):
+        client.get_secret(SECRET)
+        client.invalidate_secret(SECRET)
+        client.get_secret(SECRET)
+        client.get_secret(SECRET, force_refresh=True)
+        self.assertEqual(len(self.fetches), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
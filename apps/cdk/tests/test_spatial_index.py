@@ -0,0 +1,68 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+CORE_PACKAGES_DIR = WORKSPACE_ROOT / "apps/cdk/src/core-packages"
+sys.path.insert(0, str(CORE_PACKAGES_DIR))
+
+from rendasua_core_packages.utilities import GeoGridIndex, calculate_haversine_distance
+
+
+def _brute_force(points, lat, lon, radius_km):
+    hits = []
+    for key, (p_lat, p_lon) in points.items():
+        distance = calculate_haversine_distance(lat, lon, p_lat, p_lon)
+        if distance <= radius_km:
+            hits.append(key)
+    return sorted(hits)
+
+
+class GeoGridIndexTest(unittest.TestCase):
+    def test_radius_query_matches_brute_force(self):
+        rng = random.Random(7)
+        points = {
+            f"agent-{i}": (rng.uniform(-2.0, 2.0), rng.uniform(8.0, 12.0))
+            for i in range(500)
+        }
+        index = GeoGridIndex.from_points(
+            (key, lat, lon) for key, (lat, lon) in points.items()
+        )
+
+        for _ in range(20):
+            lat, lon = rng.uniform(-2.0, 2.0), rng.uniform(8.0, 12.0)
+            for radius in (5.0, 20.0, 80.0):
+                matches = index.query_radius(lat, lon, radius)
+                self.assertEqual(
+                    sorted(key for key, _ in matches),
+                    _brute_force(points, lat, lon, radius),
+                )
+                distances = [distance for _, distance in matches]
+                self.assertEqual(distances, sorted(distances))
+
+    def test_query_wraps_across_antimeridian(self):
+        index = GeoGridIndex.from_points([("east", 0.0, 179.95), ("west", 0.0, -179.95)])
+        keys = {key for key, _ in index.query_radius(0.0, 180.0, 20.0)}
+        self.assertEqual(keys, {"east", "west"})
+
+    def test_move_and_remove_update_results(self):
+        index = GeoGridIndex()
+        index.insert("a", 0.39, 9.45, value={"name": "A"})
+
+        self.assertEqual([k for k, _ in index.query_radius(0.39, 9.45, 1.0)], ["a"])
+        self.assertEqual(index.value("a"), {"name": "A"})
+
+        self.assertTrue(index.move("a", 4.05, 9.70))
+        self.assertFalse(index.move("a", 4.05, 9.70))
+        self.assertEqual(index.query_radius(0.39, 9.45, 1.0), [])
+        self.assertEqual([k for k, _ in index.query_radius(4.05, 9.70, 1.0)], ["a"])
+
+        self.assertTrue(index.remove("a"))
+        self.assertFalse(index.remove("a"))
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query_radius(4.05, 9.70, 1.0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
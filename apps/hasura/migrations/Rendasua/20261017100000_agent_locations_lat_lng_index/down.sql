@@ -0,0 +1 @@
+DROP INDEX IF EXISTS public.idx_agent_locations_latitude_longitude;
@@ -0,0 +1,5 @@
+-- Support bounding-box prefilters on agent location (latitude/longitude ranges)
+-- used by location_service.get_agent_locations_near to fetch only agents near
+-- a set of centre points.
+CREATE INDEX IF NOT EXISTS idx_agent_locations_latitude_longitude
+    ON public.agent_locations (latitude, longitude);
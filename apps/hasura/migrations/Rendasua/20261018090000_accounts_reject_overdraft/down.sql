@@ -0,0 +1,2 @@
+DROP TRIGGER IF EXISTS accounts_reject_overdraft ON public.accounts;
+DROP FUNCTION IF EXISTS public.accounts_reject_overdraft();
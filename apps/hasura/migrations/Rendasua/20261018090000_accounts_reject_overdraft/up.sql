@@ -0,0 +1,26 @@
+-- Reject any balance update that would overdraw an account, inside the
+-- database transaction. Same rule as the sufficient-funds checks in the
+-- backend and the Lambdas: a balance may only go below zero by not
+-- decreasing (credits to an already negative balance still apply).
+-- Raising aborts the whole Hasura mutation, so a ledger mutation (balance
+-- _inc + account_transactions insert + hold status) commits all-or-nothing.
+-- The 'insufficient_funds' prefix is matched by rendasua_core_packages.
+CREATE OR REPLACE FUNCTION public.accounts_reject_overdraft()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF (NEW.available_balance < 0 AND NEW.available_balance < OLD.available_balance)
+     OR (NEW.withheld_balance < 0 AND NEW.withheld_balance < OLD.withheld_balance) THEN
+    RAISE EXCEPTION 'insufficient_funds: account % (available %, withheld %)',
+      NEW.id, OLD.available_balance, OLD.withheld_balance;
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS accounts_reject_overdraft ON public.accounts;
+CREATE TRIGGER accounts_reject_overdraft
+    BEFORE UPDATE OF available_balance, withheld_balance ON public.accounts
+    FOR EACH ROW
+    EXECUTE FUNCTION public.accounts_reject_overdraft();
@@ -0,0 +1,2 @@
+DROP TABLE IF EXISTS public.order_hold_status_transitions;
+DROP FUNCTION IF EXISTS public.apply_order_hold_status_transition();
@@ -0,0 +1,41 @@
+-- Guarded order hold status changes that can abort a Hasura mutation.
+-- A where-guarded update_order_holds that matches nothing does not fail,
+-- so ledger journals insert a transition row instead: the trigger moves
+-- the hold from from_status (any status when NULL) to to_status, or raises
+-- when the hold is no longer in from_status, rolling back the postings of
+-- the same mutation. The rows double as an audit trail of hold changes.
+-- The 'order_hold_status_conflict' prefix is matched by rendasua_core_packages.
+CREATE TABLE public.order_hold_status_transitions (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    order_hold_id UUID NOT NULL REFERENCES public.order_holds(id) ON DELETE CASCADE,
+    from_status order_hold_status_enum,
+    to_status order_hold_status_enum NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_order_hold_status_transitions_order_hold_id
+    ON public.order_hold_status_transitions(order_hold_id);
+
+CREATE OR REPLACE FUNCTION public.apply_order_hold_status_transition()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE public.order_holds
+  SET status = NEW.to_status
+  WHERE id = NEW.order_hold_id
+    AND (NEW.from_status IS NULL OR status = NEW.from_status);
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'order_hold_status_conflict: hold % is not %',
+      NEW.order_hold_id, COALESCE(NEW.from_status::text, 'present');
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER apply_order_hold_status_transition
+    BEFORE INSERT ON public.order_hold_status_transitions
+    FOR EACH ROW
+    EXECUTE FUNCTION public.apply_order_hold_status_transition();
+
+COMMENT ON TABLE public.order_hold_status_transitions IS 'Guarded order hold status changes; inserting a row applies it or aborts the transaction';